@@ -1,39 +1,42 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
 import pathlib
 from logging.handlers import TimedRotatingFileHandler
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
-from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+if TYPE_CHECKING:
+    from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+    from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 
-from dbt_metricflow.cli.dbt_connectors.adapter_backed_client import AdapterBackedSqlClient
-from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts, dbtProjectMetadata
-from metricflow.engine.metricflow_engine import MetricFlowEngine
-from metricflow.protocols.sql_client import SqlClient
+    from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts, dbtProjectMetadata
+    from metricflow.engine.metricflow_engine import MetricFlowEngine
+    from metricflow.protocols.sql_client import SqlClient
 
 logger = logging.getLogger(__name__)
 
 
 class CLIContext:
-    """Context for MetricFlow CLI."""
+    """Context for MetricFlow CLI.
+
+    The modules for the dbt project, the semantic manifest, and the engine take a while to import, so they are imported
+    when they are first needed. This keeps commands that don't need them (e.g. `mf --help`) fast.
+    """
 
     def __init__(self) -> None:
         """Initialize the CLI context for executing commands.
 
-        The dbt_artifacts construct must be loaded in order for logging configuration to work correctly.
+        The dbt project is loaded when it's first needed, and logging is configured after that as the dbt project
+        metadata is needed to find the log file path.
         """
         self.verbose = False
-        self._dbt_project_metadata: dbtProjectMetadata = dbtProjectMetadata.load_from_project_path(pathlib.Path.cwd())
+        self._dbt_project_metadata: Optional[dbtProjectMetadata] = None
         self._dbt_artifacts: Optional[dbtArtifacts] = None
         self._mf: Optional[MetricFlowEngine] = None
         self._sql_client: Optional[SqlClient] = None
         self._semantic_manifest: Optional[SemanticManifest] = None
         self._semantic_manifest_lookup: Optional[SemanticManifestLookup] = None
-        # self.log_file_path invokes the dbtRunner. If this is done after the configure_logging call all of the
-        # dbt CLI logging configuration could be overridden, resulting in lots of things printing to console
-        self._configure_logging(log_file_path=self.log_file_path)
 
     def _configure_logging(self, log_file_path: pathlib.Path) -> None:
         """Initialize the logging spec for the CLI.
@@ -69,13 +72,22 @@ class CLIContext:
     @property
     def dbt_project_metadata(self) -> dbtProjectMetadata:
         """Property accessor for dbt project metadata, useful in cases where the full manifest load is not needed."""
+        if self._dbt_project_metadata is None:
+            from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtProjectMetadata
+
+            self._dbt_project_metadata = dbtProjectMetadata.load_from_project_path(pathlib.Path.cwd())
+            # self.log_file_path invokes the dbtRunner. If this is done after the configure_logging call all of the
+            # dbt CLI logging configuration could be overridden, resulting in lots of things printing to console
+            self._configure_logging(log_file_path=self.log_file_path)
         return self._dbt_project_metadata
 
     @property
     def dbt_artifacts(self) -> dbtArtifacts:
         """Property accessor for all dbt artifacts, used for powering the sql client (among other things)."""
         if self._dbt_artifacts is None:
-            self._dbt_artifacts = dbtArtifacts.load_from_project_metadata(self._dbt_project_metadata)
+            from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+
+            self._dbt_artifacts = dbtArtifacts.load_from_project_metadata(self.dbt_project_metadata)
         return self._dbt_artifacts
 
     @property
@@ -84,12 +96,14 @@ class CLIContext:
         # The dbt Project.log_path attribute is currently sourced from the final runtime config value accessible
         # through the CLI state flags. As such, it will deviate from the default based on the DBT_LOG_PATH environment
         # variable. Should this behavior change, we will need to update this call.
-        return pathlib.Path(self._dbt_project_metadata.project.log_path, "metricflow.log")
+        return pathlib.Path(self.dbt_project_metadata.project.log_path, "metricflow.log")
 
     @property
     def sql_client(self) -> SqlClient:
         """Property accessor for the sql_client class used in the CLI."""
         if self._sql_client is None:
+            from dbt_metricflow.cli.dbt_connectors.adapter_backed_client import AdapterBackedSqlClient
+
             self._sql_client = AdapterBackedSqlClient(self.dbt_artifacts.adapter)
 
         return self._sql_client
@@ -123,6 +137,8 @@ class CLIContext:
     @property
     def mf(self) -> MetricFlowEngine:  # noqa: D102
         if self._mf is None:
+            from metricflow.engine.metricflow_engine import MetricFlowEngine
+
             self._mf = MetricFlowEngine(
                 semantic_manifest_lookup=self.semantic_manifest_lookup,
                 sql_client=self.sql_client,
@@ -131,8 +147,21 @@ class CLIContext:
         return self._mf
 
     def _build_semantic_manifest_lookup(self) -> None:
-        """Get the path to the models and create a corresponding SemanticManifestLookup."""
-        self._semantic_manifest_lookup = SemanticManifestLookup(self.semantic_manifest)
+        """Get the path to the models and create a corresponding SemanticManifestLookup.
+
+        The indexes of the lookup are cached in a snapshot in the same directory as the parsed semantic manifest.
+        """
+        from metricflow_semantics.model.semantic_manifest_snapshot import load_semantic_manifest_lookup
+
+        from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+
+        self._semantic_manifest_lookup = load_semantic_manifest_lookup(
+            semantic_manifest=self.semantic_manifest,
+            manifest_hash=self.dbt_artifacts.semantic_manifest_hash,
+            snapshot_dir=dbtArtifacts.semantic_manifest_cache_dir_from_dbt_project_root(
+                self.dbt_project_metadata.project_path
+            ),
+        )
 
     @property
     def semantic_manifest_lookup(self) -> SemanticManifestLookup:  # noqa: D102
@@ -141,6 +170,19 @@ class CLIContext:
         assert self._semantic_manifest_lookup is not None
         return self._semantic_manifest_lookup
 
+    def reload_semantic_manifest(self) -> None:
+        """Reload the semantic manifest from the dbt project, keeping the connections to the data warehouse."""
+        from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+
+        semantic_manifest, semantic_manifest_hash = dbtArtifacts.load_semantic_manifest_from_dbt_project_root(
+            self.dbt_project_metadata.project_path
+        )
+        self._dbt_artifacts = dataclasses.replace(
+            self.dbt_artifacts, semantic_manifest=semantic_manifest, semantic_manifest_hash=semantic_manifest_hash
+        )
+        self._semantic_manifest_lookup = None
+        self._mf = None
+
     @property
     def semantic_manifest(self) -> SemanticManifest:
         """Retrieve the semantic manifest from the dbt project root."""
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import datetime
 import enum
 import logging
+import re
 import time
+from typing import Iterator
 
 from dbt.adapters.base import BaseAdapter
+from dbt.adapters.sql import SQLConnectionManager
 from dbt_common.exceptions.base import DbtDatabaseError
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from metricflow_semantics.errors.error_classes import SqlBindParametersNotSupportedError
@@ -12,9 +16,10 @@ from metricflow_semantics.mf_logging.formatting import indent
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.random_id import random_id
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
+from metricflow_semantics.sql.sql_column_type import SqlColumnType
 
 from metricflow.data_table.mf_table import MetricFlowDataTable
-from metricflow.protocols.sql_client import SqlEngine
+from metricflow.protocols.sql_client import DEFAULT_QUERY_BATCH_SIZE, SqlEngine
 from metricflow.sql.render.big_query import BigQuerySqlQueryPlanRenderer
 from metricflow.sql.render.databricks import DatabricksSqlQueryPlanRenderer
 from metricflow.sql.render.duckdb_renderer import DuckDbSqlQueryPlanRenderer
@@ -24,6 +29,7 @@ from metricflow.sql.render.snowflake import SnowflakeSqlQueryPlanRenderer
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
 from metricflow.sql.render.trino import TrinoSqlQueryPlanRenderer
 from metricflow.sql_request.sql_request_attributes import SqlRequestId
+from metricflow.telemetry.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +38,14 @@ logger = logging.getLogger(__name__)
 DATABRICKS_SQL_WAREHOUSE_EXPLAIN_PLAN_ERROR_KEY = "Error occurred during query planning"
 DATABRICKS_CLUSTER_EXPLAIN_PLAN_ERROR_KEY = "org.apache.spark.sql.AnalysisException"
 
+# Matches bind parameter placeholders like `:key`, but not casts like `::timestamp`. String literals, quoted
+# identifiers, and comments are matched as a whole (without the `key` group) so that placeholder-like text in them
+# (e.g. '10:30') is not replaced.
+_BIND_PARAMETER_PLACEHOLDER_PATTERN = re.compile(
+    r"'(?:[^']|'')*'" r'|"(?:[^"]|"")*"' r"|`[^`]*`" r"|--[^\n]*" r"|/\*.*?\*/" r"|(?<![:\w]):(?P<key>[A-Za-z_]\w*)",
+    re.DOTALL,
+)
+
 
 class SupportedAdapterTypes(enum.Enum):
     """Enumeration of supported dbt adapter types."""
@@ -92,6 +106,9 @@ class AdapterBackedSqlClient:
     needs while delegating all connection state management and warehouse communication work to an underlying
     dbt adapter instance. This relies on BaseAdapter, rather than SQLAdapter, because BigQuery is an instance
     of the more generic BaseAdapter class.
+
+    dbt adapters don't have a common interface for bind parameters, so placeholders in the form `:key` are replaced
+    with the values rendered as SQL literals before the statement is sent to the adapter.
     """
 
     def __init__(self, adapter: BaseAdapter):
@@ -137,27 +154,71 @@ class AdapterBackedSqlClient:
         """
         start = time.time()
         request_id = SqlRequestId(f"mf_rid__{random_id()}")
-        if sql_bind_parameters.param_dict:
-            raise SqlBindParametersNotSupportedError(
-                f"Invalid execute statement - we do not support queries with bind parameters through dbt adapters! "
-                f"Bind params: {sql_bind_parameters.param_dict}"
-            )
         logger.info(AdapterBackedSqlClient._format_run_query_log_message(stmt, sql_bind_parameters))
-        with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
+        stmt = AdapterBackedSqlClient._replace_bind_parameter_placeholders(stmt, sql_bind_parameters)
+        with trace_span("execute_sql"), self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
             # returns a Tuple[AdapterResponse, agate.Table] but the decorator converts it to Any
             result = self._adapter.execute(sql=stmt, auto_begin=True, fetch=True)
             logger.info(f"Query returned from dbt Adapter with response {result[0]}")
 
-        agate_data = result[1]
-        rows = [row.values() for row in agate_data.rows]
-        data_table = MetricFlowDataTable.create_from_rows(
-            column_names=agate_data.column_names,
-            rows=rows,
-        )
+        with trace_span("materialize_data_table"):
+            agate_data = result[1]
+            rows = [row.values() for row in agate_data.rows]
+            data_table = MetricFlowDataTable.create_from_trusted_rows(
+                column_names=agate_data.column_names,
+                rows=rows,
+            )
         stop = time.time()
         logger.info(f"Finished running the query in {stop - start:.2f}s with {data_table.row_count} row(s) returned")
         return data_table
 
+    def query_iter(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+    ) -> Iterator[MetricFlowDataTable]:
+        """Query statement; results are returned as DataTables with up to `batch_size` rows each.
+
+        For adapters that use a DB-API cursor (i.e. adapters with a SQLConnectionManager), rows are fetched from the
+        cursor one batch at a time so that only one batch is kept in memory. For other adapters (e.g. BigQuery), the
+        full result is fetched and then split into batches.
+
+        Args:
+            stmt: The SQL query statement to run. This should produce output via a SELECT
+            sql_bind_parameters: The parameter replacement mapping for filling in concrete values for SQL query
+            parameters.
+            batch_size: The maximum number of rows in each returned DataTable.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be >= 1. Got: {batch_size}")
+        connection_manager = self._adapter.connections
+        if not isinstance(connection_manager, SQLConnectionManager):
+            data_table = self.query(stmt, sql_bind_parameters)
+            yield from data_table.split_into_batches(batch_size)
+            return
+
+        start = time.time()
+        request_id = SqlRequestId(f"mf_rid__{random_id()}")
+        logger.info(AdapterBackedSqlClient._format_run_query_log_message(stmt, sql_bind_parameters))
+        stmt = AdapterBackedSqlClient._replace_bind_parameter_placeholders(stmt, sql_bind_parameters)
+        row_count = 0
+        with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
+            _, cursor = connection_manager.add_query(sql=stmt, auto_begin=True)
+            column_names = tuple(column[0] for column in cursor.description)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                # Return an empty table for an empty result so that the column names are available.
+                if len(rows) == 0 and row_count > 0:
+                    break
+                row_count += len(rows)
+                yield MetricFlowDataTable.create_from_trusted_rows(column_names=column_names, rows=rows)
+                if len(rows) < batch_size:
+                    break
+
+        stop = time.time()
+        logger.info(f"Finished running the query in {stop - start:.2f}s with {row_count} row(s) returned")
+
     def execute(
         self,
         stmt: str,
@@ -170,15 +231,11 @@ class AdapterBackedSqlClient:
             sql_bind_parameters: The parameter replacement mapping for filling in
                 concrete values for SQL query parameters.
         """
-        if sql_bind_parameters.param_dict:
-            raise SqlBindParametersNotSupportedError(
-                f"Invalid execute statement - we do not support execute commands with bind parameters through dbt "
-                f"adapters! Bind params: {SqlBindParameters.param_dict}"
-            )
         start = time.time()
         request_id = SqlRequestId(f"mf_rid__{random_id()}")
         logger.info(AdapterBackedSqlClient._format_run_query_log_message(stmt, sql_bind_parameters))
-        with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
+        stmt = AdapterBackedSqlClient._replace_bind_parameter_placeholders(stmt, sql_bind_parameters)
+        with trace_span("execute_sql"), self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
             result = self._adapter.execute(stmt, auto_begin=True, fetch=False)
             # Calls to execute often involve some amount of DDL so we commit here
             self._adapter.commit_if_has_connection()
@@ -207,6 +264,7 @@ class AdapterBackedSqlClient:
             f"\n\n{indent(stmt)}\n"
             + (f"\nwith parameters: {dict(sql_bind_parameters.param_dict)}" if sql_bind_parameters.param_dict else "")
         )
+        stmt = AdapterBackedSqlClient._replace_bind_parameter_placeholders(stmt, sql_bind_parameters)
         request_id = SqlRequestId(f"mf_rid__{random_id()}")
         connection_name = f"MetricFlow_dry_run_request_{request_id}"
         # TODO - consolidate to self._adapter.validate_sql() when all implementations will work from within MetricFlow
@@ -250,8 +308,54 @@ class AdapterBackedSqlClient:
 
     def render_bind_parameter_key(self, bind_parameter_key: str) -> str:
         """Wrap execution parameter key with syntax accepted by engine."""
-        raise SqlBindParametersNotSupportedError(
-            "We do not support queries with bind parameters through dbt adapters, so we do not have rendering enabled!"
+        return self._sql_query_plan_renderer.expr_renderer.render_bind_parameter_key(bind_parameter_key)
+
+    @staticmethod
+    def _render_bind_parameter_value(value: SqlColumnType) -> str:
+        """Render the value of a bind parameter as a SQL literal."""
+        # bool is a subclass of int, so it needs to be checked first.
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        elif isinstance(value, (int, float)):
+            return repr(value)
+        elif isinstance(value, (datetime.datetime, datetime.date)):
+            return f"'{value.isoformat()}'"
+        elif isinstance(value, str):
+            # Engines differ in how backslashes are handled in string literals, so those can't be safely escaped.
+            if "\\" in value:
+                raise SqlBindParametersNotSupportedError(
+                    f"Bind parameter values with backslashes are not supported through dbt adapters. Got: {value!r}"
+                )
+            escaped_value = value.replace("'", "''")
+            return f"'{escaped_value}'"
+
+        raise SqlBindParametersNotSupportedError(f"Unhandled bind parameter type: {type(value)}")
+
+    @staticmethod
+    def _replace_bind_parameter_placeholders(stmt: str, sql_bind_parameters: SqlBindParameters) -> str:
+        """Replace the placeholders (e.g. `:key`) in the statement with the values of the bind parameters.
+
+        dbt adapters don't share an interface for passing bind parameters to the driver, so the values are rendered as
+        SQL literals. Placeholders in string literals, quoted identifiers, and comments are left as is.
+        """
+        param_dict = sql_bind_parameters.param_dict
+        if len(param_dict) == 0:
+            return stmt
+
+        placeholder_keys = {
+            match.group("key") for match in _BIND_PARAMETER_PLACEHOLDER_PATTERN.finditer(stmt) if match.group("key")
+        }
+        missing_keys = set(param_dict) - placeholder_keys
+        if missing_keys:
+            raise SqlBindParametersNotSupportedError(
+                f"The statement does not contain placeholders for bind parameters: {sorted(missing_keys)}"
+            )
+
+        rendered_values = {
+            key: AdapterBackedSqlClient._render_bind_parameter_value(value) for key, value in param_dict.items()
+        }
+        return _BIND_PARAMETER_PLACEHOLDER_PATTERN.sub(
+            lambda match: rendered_values.get(match.group("key") or "", match.group(0)), stmt
         )
 
     @staticmethod
@@ -3,7 +3,7 @@ from __future__ import annotations
 import dataclasses
 import logging
 from pathlib import Path
-from typing import List, Type
+from typing import List, Tuple, Type
 
 from dbt.adapters.base.impl import BaseAdapter
 from dbt.adapters.factory import get_adapter_by_type
@@ -15,6 +15,7 @@ from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
 from metricflow_semantics.errors.error_classes import ModelCreationException
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.model.dbt_manifest_parser import parse_manifest_from_dbt_generated_manifest
+from metricflow_semantics.model.snapshot_file import hash_semantic_manifest_json
 from typing_extensions import Self
 
 logger = logging.getLogger(__name__)
@@ -76,6 +77,8 @@ class dbtArtifacts:
     project: Project
     adapter: BaseAdapter
     semantic_manifest: SemanticManifest
+    # The hash of the semantic_manifest JSON, which keys the snapshots built from it.
+    semantic_manifest_hash: str
 
     @classmethod
     def load_from_project_metadata(cls: Type[Self], project_metadata: dbtProjectMetadata) -> Self:
@@ -85,7 +88,7 @@ class dbtArtifacts:
         # from get_adapter here rather than spinning up a full RuntimeConfig instance
         # TODO: Move to a fully supported interface when one becomes available
         adapter = get_adapter_by_type(project_metadata.profile.credentials.type)
-        semantic_manifest = dbtArtifacts.build_semantic_manifest_from_dbt_project_root(
+        semantic_manifest, semantic_manifest_hash = dbtArtifacts.load_semantic_manifest_from_dbt_project_root(
             project_root=project_metadata.project_path
         )
         return cls(
@@ -93,13 +96,42 @@ class dbtArtifacts:
             project=project_metadata.project,
             adapter=adapter,
             semantic_manifest=semantic_manifest,
+            semantic_manifest_hash=semantic_manifest_hash,
         )
 
     @staticmethod
-    def build_semantic_manifest_from_dbt_project_root(project_root: Path) -> SemanticManifest:
-        """In the dbt project root, retrieve the manifest path and parse the SemanticManifest."""
+    def semantic_manifest_path_from_dbt_project_root(project_root: Path) -> Path:
+        """Return the path of the semantic_manifest JSON generated in the dbt project root."""
         DEFAULT_TARGET_PATH = "target/semantic_manifest.json"
-        full_path_to_manifest = Path(project_root, DEFAULT_TARGET_PATH).resolve()
+        return Path(project_root, DEFAULT_TARGET_PATH).resolve()
+
+    @staticmethod
+    def semantic_manifest_cache_dir_from_dbt_project_root(project_root: Path) -> Path:
+        """Return the path of the directory for the snapshots of the parsed semantic manifest and its indexes."""
+        DEFAULT_CACHE_PATH = "target/metricflow_cache"
+        return Path(project_root, DEFAULT_CACHE_PATH).resolve()
+
+    @staticmethod
+    def build_semantic_manifest_from_dbt_project_root(project_root: Path, use_cache: bool = True) -> SemanticManifest:
+        """In the dbt project root, retrieve the manifest path and parse the SemanticManifest.
+
+        If `use_cache` is set, the parsed manifest is cached in the target directory, so later calls for the same
+        semantic_manifest JSON skip parsing.
+        """
+        semantic_manifest, _ = dbtArtifacts.load_semantic_manifest_from_dbt_project_root(
+            project_root=project_root, use_cache=use_cache
+        )
+        return semantic_manifest
+
+    @staticmethod
+    def load_semantic_manifest_from_dbt_project_root(
+        project_root: Path, use_cache: bool = True
+    ) -> Tuple[SemanticManifest, str]:
+        """Similar to `build_semantic_manifest_from_dbt_project_root`, but also returns the hash of the JSON.
+
+        The hash is computed once here and can be passed on to other snapshots built from the same manifest.
+        """
+        full_path_to_manifest = dbtArtifacts.semantic_manifest_path_from_dbt_project_root(project_root)
         if not full_path_to_manifest.exists():
             raise ModelCreationException(
                 f"Unable to find {full_path_to_manifest}\n"
@@ -110,6 +142,14 @@ class dbtArtifacts:
         try:
             with open(full_path_to_manifest, "r") as file:
                 raw_contents = file.read()
-                return parse_manifest_from_dbt_generated_manifest(manifest_json_string=raw_contents)
+            semantic_manifest_hash = hash_semantic_manifest_json(raw_contents)
+            semantic_manifest = parse_manifest_from_dbt_generated_manifest(
+                manifest_json_string=raw_contents,
+                cache_dir=(
+                    dbtArtifacts.semantic_manifest_cache_dir_from_dbt_project_root(project_root) if use_cache else None
+                ),
+                manifest_hash=semantic_manifest_hash,
+            )
+            return semantic_manifest, semantic_manifest_hash
         except Exception as e:
             raise ModelCreationException from e
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import csv as csv_module
 import datetime as dt
 import logging
 import pathlib
@@ -11,22 +10,16 @@ import textwrap
 import time
 import warnings
 from importlib.metadata import version as pkg_version
-from typing import Callable, List, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
 
 import click
-import jinja2
-from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
-from dbt_semantic_interfaces.validations.semantic_manifest_validator import SemanticManifestValidator
-from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
 from halo import Halo
-from metricflow_semantics.dag.dag_visualization import display_dag_as_svg
-from update_checker import UpdateChecker
 
 import dbt_metricflow.cli.custom_click_types as click_custom
 from dbt_metricflow.cli import PACKAGE_NAME
 from dbt_metricflow.cli.cli_context import CLIContext
 from dbt_metricflow.cli.constants import DEFAULT_RESULT_DECIMAL_PLACES, MAX_LIST_OBJECT_ELEMENTS
-from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+from dbt_metricflow.cli.server_client import create_server_socket_dir, server_socket_path, stop_server
 from dbt_metricflow.cli.tutorial import (
     dbtMetricFlowTutorialHelper,
 )
@@ -37,10 +30,17 @@ from dbt_metricflow.cli.utils import (
     query_options,
     start_end_time_options,
 )
-from metricflow.engine.metricflow_engine import MetricFlowExplainResult, MetricFlowQueryRequest, MetricFlowQueryResult
 from metricflow.telemetry.models import TelemetryLevel
 from metricflow.telemetry.reporter import TelemetryReporter, log_call
-from metricflow.validation.data_warehouse_model_validator import DataWarehouseModelValidator
+
+# Modules that take a while to import (e.g. the engine and the dbt adapters) are imported in the commands that use
+# them, so that the CLI starts quickly. `test_cli_import_time.py` checks that these are not imported at startup.
+if TYPE_CHECKING:
+    from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+    from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
+
+    from metricflow.engine.metricflow_engine import MetricFlowExplainResult, MetricFlowQueryResult
+    from metricflow.validation.data_warehouse_model_validator import DataWarehouseModelValidator
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +48,13 @@ pass_config = click.make_pass_decorator(CLIContext, ensure=True)
 _telemetry_reporter = TelemetryReporter(report_levels_higher_or_equal_to=TelemetryLevel.USAGE)
 _telemetry_reporter.add_python_log_handler()
 
+_DATAFLOW_PLAN_TEMPLATE = textwrap.dedent(
+    """\
+    Metric Dataflow Plan:
+        {{ plan_text | indent(4) }}
+    """
+)
+
 
 @click.group()
 @click.option("-v", "--verbose", is_flag=True)
@@ -63,6 +70,8 @@ def cli(cfg: CLIContext, verbose: bool) -> None:  # noqa: D103
 
     cfg.verbose = verbose
 
+    from update_checker import UpdateChecker
+
     checker = UpdateChecker()
     result = checker.check(PACKAGE_NAME, pkg_version(PACKAGE_NAME))
     # result is None when an update was not found or a failure occurred
@@ -270,6 +279,11 @@ def query(
     saved_query: Optional[str] = None,
 ) -> None:
     """Create a new query with MetricFlow and assembles a MetricFlowQueryResult."""
+    from metricflow_semantics.dag.dag_visualization import display_dag_as_svg
+    from metricflow_semantics.jinja_templates import compiled_jinja_template
+
+    from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+
     start = time.time()
     spinner = Halo(text="Initiating query…", spinner="dots")
     spinner.start()
@@ -289,6 +303,9 @@ def query(
 
     if explain:
         explain_result = cfg.mf.explain(mf_request=mf_request)
+    elif csv is not None:
+        # Write the results in batches so that large results don't need to fit in memory.
+        query_result = cfg.mf.query_to_csv_file(mf_request=mf_request, csv_file=csv.open())
     else:
         query_result = cfg.mf.query(mf_request=mf_request)
 
@@ -305,15 +322,9 @@ def query(
             click.echo("🔎 Generated Dataflow Plan + SQL (remove --explain to see data):")
             click.echo(
                 textwrap.indent(
-                    jinja2.Template(
-                        textwrap.dedent(
-                            """\
-                            Metric Dataflow Plan:
-                                {{ plan_text | indent(4) }}
-                            """
-                        ),
-                        undefined=jinja2.StrictUndefined,
-                    ).render(plan_text=explain_result.dataflow_plan.structure_text()),
+                    compiled_jinja_template(_DATAFLOW_PLAN_TEMPLATE).render(
+                        plan_text=explain_result.dataflow_plan.structure_text()
+                    ),
                     prefix="-- ",
                 )
             )
@@ -333,23 +344,18 @@ def query(
 
     assert query_result
     df = query_result.result_df
+    if csv is not None:
+        click.echo(f"🖨 Successfully written query output to {csv.name}")
     # Show the data if returned successfully
-    if df is not None:
+    elif df is not None:
         if df.row_count == 0:
             click.echo("🕳 Successful MQL query returned an empty result set.")
-        elif csv is not None:
-            # csv is a LazyFile that is file-like that works in this case.
-            csv_writer = csv_module.writer(csv)
-            csv_writer.writerow(df.column_names)
-            for row in df.rows:
-                csv_writer.writerow(row)
-            click.echo(f"🖨 Successfully written query output to {csv.name}")
         else:
             click.echo(df.text_format(decimals))
-        if display_plans:
-            temp_path = tempfile.mkdtemp()
-            svg_path = display_dag_as_svg(query_result.dataflow_plan, temp_path)
-            click.echo(f"Plan SVG saved to: {svg_path}")
+    if display_plans and (csv is not None or df is not None):
+        temp_path = tempfile.mkdtemp()
+        svg_path = display_dag_as_svg(query_result.dataflow_plan, temp_path)
+        click.echo(f"Plan SVG saved to: {svg_path}")
 
 
 @cli.group()
@@ -566,6 +572,8 @@ def _data_warehouse_validations_runner(
     dw_validator: DataWarehouseModelValidator, manifest: SemanticManifest, timeout: Optional[int]
 ) -> SemanticManifestValidationResults:
     """Helper which calls the individual data warehouse validations to run and prints collected issues."""
+    from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
+
     semantic_model_results = _run_dw_validations(
         dw_validator.validate_semantic_models, manifest=manifest, validation_type="semantic models", timeout=timeout
     )
@@ -620,6 +628,13 @@ def validate_configs(
     semantic_validation_workers: int = 1,
 ) -> None:
     """Perform validations against the defined model configurations."""
+    from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+    from dbt_semantic_interfaces.validations.semantic_manifest_validator import SemanticManifestValidator
+    from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
+
+    from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+    from metricflow.validation.data_warehouse_model_validator import DataWarehouseModelValidator
+
     cfg.verbose = True
 
     if not show_all:
@@ -667,5 +682,53 @@ def validate_configs(
         exit(1)
 
 
+@cli.group()
+@pass_config
+def server(cfg: CLIContext) -> None:
+    """Run a local server that keeps the project loaded to reduce the latency of `query` and `list` commands."""
+
+
+@server.command()
+@pass_config
+@log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+def start(cfg: CLIContext) -> None:
+    """Start the server for the dbt project in the current directory. This runs until the server is stopped.
+
+    While the server is running, `query` and `list` commands run in the project directory are run by the server. The
+    semantic manifest is reloaded when it changes.
+    """
+    from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+    from dbt_metricflow.cli.server import MetricFlowServer
+
+    project_root = cfg.dbt_project_metadata.project_path
+    spinner = Halo(text="Loading the dbt project and the semantic manifest...", spinner="dots")
+    spinner.start()
+    # Initialize the engine and the connection to the data warehouse before handling requests.
+    cfg.mf
+    spinner.succeed("Loaded the dbt project and the semantic manifest.")
+
+    create_server_socket_dir()
+    socket_path = server_socket_path(project_root)
+    metricflow_server = MetricFlowServer(
+        cli_context=cfg,
+        socket_path=socket_path,
+        commands={"query": query, "list": list},
+        semantic_manifest_path=dbtArtifacts.semantic_manifest_path_from_dbt_project_root(project_root),
+    )
+    click.echo(f"🚀 Server is running on {socket_path}. Run `mf server stop` to stop it.")
+    metricflow_server.serve()
+    click.echo("Server stopped.")
+
+
+@server.command()
+@pass_config
+def stop(cfg: CLIContext) -> None:
+    """Stop the server for the dbt project in the current directory."""
+    if stop_server(cfg.dbt_project_metadata.project_path):
+        click.echo("Server stopped.")
+    else:
+        click.echo("Server is not running.")
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import logging
+import os
+import pathlib
+import socket
+import socketserver
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import click
+
+from dbt_metricflow.cli.cli_context import CLIContext
+from dbt_metricflow.cli.server_client import send_server_request
+
+logger = logging.getLogger(__name__)
+
+
+class MetricFlowServer:
+    """Runs CLI commands with a context that's kept loaded between commands.
+
+    Creating the context for a command (i.e. loading the dbt project, parsing the semantic manifest, and initializing
+    the engine) takes much longer than planning a query, so this reduces the latency of each command to the time it
+    takes to plan and run the query. The server listens on a Unix socket, and requests are handled one at a time.
+
+    Before each request, the semantic manifest is reloaded if the file has changed.
+    """
+
+    def __init__(
+        self,
+        cli_context: CLIContext,
+        socket_path: pathlib.Path,
+        commands: Mapping[str, click.Command],
+        semantic_manifest_path: Optional[pathlib.Path] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            cli_context: The context that's used for all commands.
+            socket_path: The path of the Unix socket to listen on.
+            commands: The commands that can be run, keyed by name.
+            semantic_manifest_path: If specified, the semantic manifest is reloaded when this file changes.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("The server requires Unix sockets, which are not supported on this platform.")
+        self._cli_context = cli_context
+        self._socket_path = socket_path
+        self._commands = commands
+        self._semantic_manifest_path = semantic_manifest_path
+        self._semantic_manifest_file_state = self._get_semantic_manifest_file_state()
+        self._stop_requested = False
+
+    def _get_semantic_manifest_file_state(self) -> Optional[Tuple[int, int]]:
+        """Return the modification time and the size of the semantic manifest file to detect changes."""
+        if self._semantic_manifest_path is None or not self._semantic_manifest_path.exists():
+            return None
+        file_stat = self._semantic_manifest_path.stat()
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def _reload_semantic_manifest_if_changed(self) -> None:
+        semantic_manifest_file_state = self._get_semantic_manifest_file_state()
+        if semantic_manifest_file_state == self._semantic_manifest_file_state:
+            return
+        logger.info(f"Reloading the semantic manifest as {self._semantic_manifest_path} has changed")
+        self._cli_context.reload_semantic_manifest()
+        self._semantic_manifest_file_state = semantic_manifest_file_state
+
+    def handle_request(self, request: Mapping[str, object]) -> Dict[str, object]:
+        """Handle a request from a client and return the response."""
+        request_type = request.get("type")
+        if request_type == "status":
+            return {"output": "", "exit_code": 0}
+        if request_type == "stop":
+            self._stop_requested = True
+            return {"output": "", "exit_code": 0}
+        if request_type != "run":
+            return {"output": f"Unknown request type: {request_type}\n", "exit_code": 1}
+
+        args = request.get("args")
+        if not isinstance(args, list) or len(args) == 0 or not all(isinstance(arg, str) for arg in args):
+            return {"output": f"Expected a non-empty list of arguments. Got: {args}\n", "exit_code": 1}
+        command = self._commands.get(args[0])
+        if command is None:
+            return {"output": f"The command {args[0]!r} can't be run by the server.\n", "exit_code": 1}
+
+        try:
+            self._reload_semantic_manifest_if_changed()
+        except Exception as e:
+            logger.exception("Unable to reload the semantic manifest")
+            return {"output": f"Unable to reload the semantic manifest: {e}\n", "exit_code": 1}
+
+        logger.info(f"Running command: {args}")
+        output, exit_code = self._run_command(command, args)
+        return {"output": output, "exit_code": exit_code}
+
+    def _run_command(self, command: click.Command, args: Sequence[str]) -> Tuple[str, int]:
+        """Run the command the way Click's standalone mode does, and return its output and exit code.
+
+        The output to stdout and stderr is captured as one string. This is safe as requests are handled one at a time.
+        """
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            try:
+                with command.make_context(f"mf {args[0]}", list(args[1:]), obj=self._cli_context) as click_context:
+                    command.invoke(click_context)
+                exit_code = 0
+            except click.exceptions.Exit as e:
+                exit_code = e.exit_code
+            except click.ClickException as e:
+                e.show()
+                exit_code = e.exit_code
+            except click.Abort:
+                click.echo("Aborted!", err=True)
+                exit_code = 1
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    exit_code = e.code
+                elif e.code is None:
+                    exit_code = 0
+                else:
+                    click.echo(e.code, err=True)
+                    exit_code = 1
+            except Exception as e:
+                logger.exception(f"Command {args} failed")
+                click.echo(f"Command failed: {e}", err=True)
+                exit_code = 1
+        return output.getvalue(), exit_code
+
+    def serve(self) -> None:
+        """Handle requests until a stop request is received."""
+        if send_server_request(self._socket_path, {"type": "status"}) is not None:
+            raise RuntimeError(f"A server is already running with the socket {self._socket_path}")
+        # A socket file may remain if a previous server did not shut down cleanly.
+        if self._socket_path.exists():
+            self._socket_path.unlink()
+
+        metricflow_server = self
+
+        class _RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                request_line = self.rfile.readline()
+                if not request_line:
+                    return
+                # Let the client know that the request is being handled, so it waits for the response.
+                self.wfile.write(b"\n")
+                self.wfile.flush()
+                try:
+                    response = metricflow_server.handle_request(json.loads(request_line))
+                except Exception as e:
+                    logger.exception("Unable to handle the request")
+                    response = {"output": f"Unable to handle the request: {e}\n", "exit_code": 1}
+                self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        # Other users should not be able to run commands with this user's credentials, so the socket is created with
+        # permissions that only allow access by this user.
+        previous_umask = os.umask(0o177)
+        try:
+            unix_stream_server = socketserver.UnixStreamServer(str(self._socket_path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+        with unix_stream_server:
+            logger.info(f"Listening on {self._socket_path}")
+            try:
+                while not self._stop_requested:
+                    unix_stream_server.handle_request()
+            finally:
+                self._socket_path.unlink(missing_ok=True)
+                logger.info("Stopped the server")
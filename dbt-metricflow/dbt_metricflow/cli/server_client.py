@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import socket
+import stat
+import sys
+import tempfile
+from typing import Dict, Optional, Sequence
+
+# This module is the entry point for the CLI, so it should only import modules that load quickly. Otherwise, commands
+# that are run by the server would not be faster.
+
+# The names of the commands that are run by the server, if one is running for the project.
+SERVER_COMMAND_NAMES = frozenset(("query", "list"))
+
+# How long the client waits to connect to the server and for the server to accept a request. If the server does not
+# respond in time (e.g. it's busy with another request), the command is run without the server.
+SERVER_CONNECT_TIMEOUT_SECONDS = 1.0
+
+
+def _unix_sockets_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def server_socket_dir() -> pathlib.Path:
+    """Return the directory for the sockets of the servers of the current user.
+
+    This is in `$XDG_RUNTIME_DIR` if it's set, as that's already only accessible to the user. Otherwise, it's a
+    directory in the temp directory that's named after the user ID. See `create_server_socket_dir`.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return pathlib.Path(runtime_dir, "metricflow")
+    return pathlib.Path(tempfile.gettempdir(), f"metricflow-{os.getuid()}")
+
+
+def create_server_socket_dir() -> pathlib.Path:
+    """Create the directory from `server_socket_dir` and return it.
+
+    The directory is only accessible to the current user. Since the name of the directory is predictable, an error is
+    raised if it already exists and is not a directory that's owned by and only accessible to the current user.
+    """
+    if not _unix_sockets_supported():
+        raise RuntimeError("The server requires Unix sockets, which are not supported on this platform.")
+    socket_dir = server_socket_dir()
+    socket_dir.mkdir(mode=0o700, exist_ok=True)
+    # lstat() so that a symlink planted by another user is not followed.
+    socket_dir_stat = os.lstat(socket_dir)
+    if (
+        not stat.S_ISDIR(socket_dir_stat.st_mode)
+        or socket_dir_stat.st_uid != os.getuid()
+        or stat.S_IMODE(socket_dir_stat.st_mode) & 0o077 != 0
+    ):
+        raise PermissionError(
+            f"The server socket directory {socket_dir} must be a directory that's owned by and only accessible to the "
+            f"current user."
+        )
+    return socket_dir
+
+
+def server_socket_path(project_root: pathlib.Path) -> pathlib.Path:
+    """Return the path of the socket for the server for the dbt project.
+
+    The socket is not in the project directory as the length of a socket path is limited to about 100 characters.
+    """
+    project_root_hash = hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()[:16]
+    return server_socket_dir() / f"{project_root_hash}.sock"
+
+
+def _is_owned_by_current_user(path: pathlib.Path) -> bool:
+    try:
+        return os.stat(path).st_uid == os.getuid()
+    except FileNotFoundError:
+        return False
+
+
+def send_server_request(socket_path: pathlib.Path, request: Dict[str, object]) -> Optional[Dict[str, object]]:
+    """Send the request to the server and return the response.
+
+    Returns None if the server is not running, if the socket is not owned by the current user, or if the server does
+    not accept the request within `SERVER_CONNECT_TIMEOUT_SECONDS`.
+
+    Requests and responses are sent as a line of JSON. The server sends an empty line when it starts handling a
+    request, after which the client waits for the response without a timeout as a query can take any amount of time.
+    """
+    if not _unix_sockets_supported():
+        return None
+    # Requests include the arguments of the command, and the server runs it with the credentials of its user, so only
+    # send requests to a server that runs as the current user.
+    if not _is_owned_by_current_user(socket_path) or not _is_owned_by_current_user(socket_path.parent):
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        client_socket.settimeout(SERVER_CONNECT_TIMEOUT_SECONDS)
+        try:
+            client_socket.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError, socket.timeout):
+            return None
+        with client_socket.makefile("rwb") as socket_file:
+            try:
+                socket_file.write(json.dumps(request).encode() + b"\n")
+                socket_file.flush()
+                accepted_line = socket_file.readline()
+            except socket.timeout:
+                return None
+            if not accepted_line:
+                raise ConnectionError(f"The server at {socket_path} closed the connection without accepting a request")
+            client_socket.settimeout(None)
+            response_line = socket_file.readline()
+    if not response_line:
+        raise ConnectionError(f"The server at {socket_path} closed the connection without a response")
+    return json.loads(response_line)
+
+
+def run_with_server(project_root: pathlib.Path, args: Sequence[str]) -> Optional[int]:
+    """Run the CLI command with the server for the project and return the exit code.
+
+    Returns None if the command can't be run by the server, or if the server is not running.
+    """
+    if not _unix_sockets_supported() or len(args) == 0 or args[0] not in SERVER_COMMAND_NAMES:
+        return None
+    response = send_server_request(server_socket_path(project_root), {"type": "run", "args": list(args)})
+    if response is None:
+        return None
+    sys.stdout.write(str(response["output"]))
+    sys.stdout.flush()
+    exit_code = response["exit_code"]
+    assert isinstance(exit_code, int), f"Expected an int exit code. Got: {exit_code}"
+    return exit_code
+
+
+def stop_server(project_root: pathlib.Path) -> bool:
+    """Stop the server for the project. Returns false if the server is not running."""
+    if not _unix_sockets_supported():
+        return False
+    return send_server_request(server_socket_path(project_root), {"type": "stop"}) is not None
+
+
+def main() -> None:
+    """Entry point for the CLI that runs commands with the server for the project if one is running."""
+    exit_code = run_with_server(pathlib.Path.cwd(), sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from dbt_metricflow.cli.main import cli
+
+    cli()
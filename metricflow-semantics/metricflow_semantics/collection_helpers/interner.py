@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import dataclasses
+import operator
+from typing import Callable, Dict, Hashable, TypeVar, cast
+
+HashableT = TypeVar("HashableT", bound=Hashable)
+
+
+class Interner:
+    """Maps equal values to a single, canonical instance (i.e. hash-consing).
+
+    This reduces memory usage when many equal objects are created (e.g. the same linkable element for every measure in
+    a semantic model), and allows equality checks between canonical instances to short-circuit on identity.
+
+    Values of different types are stored together, so values should not be equal to values of other types.
+    Concurrent calls to `intern()` for equal values may return different instances, so callers should only rely on
+    equality for correctness.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self._values: Dict[Hashable, Hashable] = {}
+
+    def intern(self, value: HashableT) -> HashableT:
+        """Return the canonical instance that is equal to the given value, storing the value if there's none yet."""
+        return cast(HashableT, self._values.setdefault(value, value))
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._values)
+
+
+class CachedHashDataclass:
+    """Mixin for frozen dataclasses that caches the hash of the instance.
+
+    The hash of a dataclass is computed from all fields on every call, which is expensive for nested dataclasses that
+    are frequently used as dictionary keys. Since the `dataclass` decorator replaces an inherited `__hash__`, the
+    dataclass needs to define `__hash__` to return `_get_cached_hash()`.
+
+    The hash of a string differs between processes, so the cached hash is not pickled.
+    """
+
+    def _get_cached_hash(self) -> int:
+        instance_dict = self.__dict__
+        cached_hash = instance_dict.get(_CACHED_HASH_ATTRIBUTE_NAME)
+        if cached_hash is None:
+            instance_type = type(self)
+            field_getter = _TYPE_TO_FIELD_GETTER.get(instance_type)
+            if field_getter is None:
+                field_getter = operator.attrgetter(
+                    *(field.name for field in dataclasses.fields(self))  # type: ignore[arg-type]
+                )
+                _TYPE_TO_FIELD_GETTER[instance_type] = field_getter
+            cached_hash = hash(field_getter(self))
+            instance_dict[_CACHED_HASH_ATTRIBUTE_NAME] = cached_hash
+        return cached_hash
+
+    def __getstate__(self) -> Dict[str, object]:  # noqa: D105
+        state = dict(self.__dict__)
+        state.pop(_CACHED_HASH_ATTRIBUTE_NAME, None)
+        return state
+
+
+_CACHED_HASH_ATTRIBUTE_NAME = "_cached_hash"
+# Getters for the values of the fields of the dataclasses that use `CachedHashDataclass`.
+_TYPE_TO_FIELD_GETTER: Dict[type, Callable[[object], object]] = {}
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of the counters for a cache."""
+
+    size: int
+    max_size: int
+    hit_count: int
+    miss_count: int
+    eviction_count: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits, or 0 if there have been no lookups."""
+        lookup_count = self.hit_count + self.miss_count
+        if lookup_count == 0:
+            return 0.0
+        return self.hit_count / lookup_count
+
+
+class LruCache(Generic[KeyT, ValueT]):
+    """A thread-safe, size-bounded cache that evicts the least-recently used entry when full.
+
+    A `max_size` of 0 disables the cache (i.e. nothing is stored).
+    """
+
+    def __init__(self, max_size: int) -> None:  # noqa: D107
+        if max_size < 0:
+            raise ValueError(f"max_size should be >= 0. Got: {max_size}")
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._key_to_value: OrderedDict[KeyT, ValueT] = OrderedDict()
+        self._hit_count = 0
+        self._miss_count = 0
+        self._eviction_count = 0
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """Return the value associated with the key, or None if it's not in the cache."""
+        with self._lock:
+            value = self._key_to_value.get(key)
+            if value is None:
+                self._miss_count += 1
+                return None
+            self._key_to_value.move_to_end(key)
+            self._hit_count += 1
+            return value
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        """Associate the value with the key, evicting the least-recently used entry if the cache is full."""
+        if self._max_size == 0:
+            return
+        with self._lock:
+            self._key_to_value[key] = value
+            self._key_to_value.move_to_end(key)
+            while len(self._key_to_value) > self._max_size:
+                self._key_to_value.popitem(last=False)
+                self._eviction_count += 1
+
+    def clear(self) -> None:
+        """Remove all entries from the cache. The counters are not reset."""
+        with self._lock:
+            self._key_to_value.clear()
+
+    @property
+    def stats(self) -> CacheStats:  # noqa: D102
+        with self._lock:
+            return CacheStats(
+                size=len(self._key_to_value),
+                max_size=self._max_size,
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                eviction_count=self._eviction_count,
+            )
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._key_to_value)
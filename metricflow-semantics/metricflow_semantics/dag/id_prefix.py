@@ -81,6 +81,7 @@ class StaticIdPrefix(IdPrefix, Enum, metaclass=EnumMetaClassHelper):
     EXEC_NODE_READ_SQL_QUERY = "rsq"
     EXEC_NODE_NOOP = "noop"
     EXEC_NODE_WRITE_TO_TABLE = "wtt"
+    EXEC_NODE_WRITE_TO_CSV_FILE = "wtcf"
 
     # Group by item resolution
     GROUP_BY_ITEM_RESOLUTION_DAG = "gbir"
@@ -9,12 +9,12 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Generic, Optional, Sequence, Tuple, TypeVar
 
-import jinja2
 from typing_extensions import override
 
 from metricflow_semantics.dag.dag_to_text import MetricFlowDagTextFormatter
 from metricflow_semantics.dag.id_prefix import IdPrefix
 from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
+from metricflow_semantics.jinja_templates import compiled_jinja_template
 from metricflow_semantics.mf_logging.pretty_formattable import MetricFlowPrettyFormattable
 from metricflow_semantics.visitor import VisitorOutputT
 
@@ -129,6 +129,24 @@ class DagNode(MetricFlowPrettyFormattable, Generic[DagNodeT], ABC):
         return f"{self.__class__.__name__}(node_id={self.node_id.id_str})"
 
 
+# Formatting here: https://graphviz.org/doc/info/shapes.html#html
+_GRAPHVIZ_LABEL_TEMPLATE = textwrap.dedent(
+    """\
+    <<TABLE BORDER="0" CELLPADDING="1" CELLSPACING="0">
+     <TR>
+       <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP" COLSPAN="2"><FONT point-size="{{ title_size }}">{{ title }}</FONT></TD>
+     </TR>
+     {%- for key, value in properties %}
+     <TR>
+       <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ key }}</FONT></TD>
+       <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ value }}</FONT></TD>
+     </TR>
+     {%- endfor %}
+    </TABLE>>
+    """
+)
+
+
 def make_graphviz_label(
     title: str, properties: Sequence[DisplayedProperty], title_font_size: int = 12, property_font_size: int = 6
 ) -> str:
@@ -143,25 +161,7 @@ def make_graphviz_label(
         lines = [html.escape(x) for x in textwrap.wrap(str(displayed_property.value), width=40)]
         formatted_properties.append(DisplayedProperty(displayed_property.key, "<BR/>".join(lines)))
 
-    return jinja2.Template(
-        # Formatting here: https://graphviz.org/doc/info/shapes.html#html
-        textwrap.dedent(
-            """\
-            <<TABLE BORDER="0" CELLPADDING="1" CELLSPACING="0">
-             <TR>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP" COLSPAN="2"><FONT point-size="{{ title_size }}">{{ title }}</FONT></TD>
-             </TR>
-             {%- for key, value in properties %}
-             <TR>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ key }}</FONT></TD>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ value }}</FONT></TD>
-             </TR>
-             {%- endfor %}
-            </TABLE>>
-            """
-        ),
-        undefined=jinja2.StrictUndefined,
-    ).render(
+    return compiled_jinja_template(_GRAPHVIZ_LABEL_TEMPLATE).render(
         title=title,
         title_size=title_font_size,
         property_size=property_font_size,
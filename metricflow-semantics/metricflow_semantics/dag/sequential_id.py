@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterator, Optional
 
 from typing_extensions import override
 
@@ -25,15 +27,42 @@ class SequentialId:
         return self.str_value
 
 
+class _IdNumberSpace:
+    """Tracks the next index to use for each prefix within a scope created by `SequentialIdGenerator.id_number_space`.
+
+    A scope is only visible to the context (i.e. thread or asyncio task) that created it, so it does not need a lock.
+    """
+
+    def __init__(self, start_value: int) -> None:  # noqa: D107
+        self._start_value = start_value
+        self._prefix_to_next_value: Dict[IdPrefix, int] = {}
+
+    def create_next_id(self, id_prefix: IdPrefix) -> SequentialId:  # noqa: D102
+        index = self._prefix_to_next_value.get(id_prefix, self._start_value)
+        self._prefix_to_next_value[id_prefix] = index + 1
+        return SequentialId(id_prefix, index)
+
+
 class SequentialIdGenerator:
-    """Generates sequential ID values based on a prefix."""
+    """Generates sequential ID values based on a prefix.
+
+    By default, IDs are drawn from process-wide state. To generate consistent IDs without interference from other
+    threads (e.g. when planning queries concurrently), use `id_number_space()` to create a context-local scope.
+    """
 
     _default_start_value = 0
     _state_lock = threading.Lock()
     _prefix_to_next_value: Dict[IdPrefix, int] = {}
+    _scoped_number_space: ContextVar[Optional[_IdNumberSpace]] = ContextVar(
+        "sequential_id_generator_number_space", default=None
+    )
 
     @classmethod
     def create_next_id(cls, id_prefix: IdPrefix) -> SequentialId:  # noqa: D102
+        number_space = cls._scoped_number_space.get()
+        if number_space is not None:
+            return number_space.create_next_id(id_prefix)
+
         with cls._state_lock:
             if id_prefix not in cls._prefix_to_next_value:
                 cls._prefix_to_next_value[id_prefix] = cls._default_start_value
@@ -42,9 +71,27 @@ class SequentialIdGenerator:
 
             return SequentialId(id_prefix, index)
 
+    @classmethod
+    @contextmanager
+    def id_number_space(cls, start_value: int = 0) -> Iterator[None]:
+        """Within this context, generate IDs from a new numbering that starts at the given value.
+
+        The numbering is stored in a context variable, so it only applies to the current thread / asyncio task and
+        does not change the numbering seen by other threads. Scopes can be nested - the previous numbering is restored
+        on exit.
+        """
+        token = cls._scoped_number_space.set(_IdNumberSpace(start_value))
+        try:
+            yield None
+        finally:
+            cls._scoped_number_space.reset(token)
+
     @classmethod
     def reset(cls, default_start_value: int = 0) -> None:
-        """Resets the numbering of the generated IDs so that it starts at the given value."""
+        """Resets the numbering of the generated IDs so that it starts at the given value.
+
+        This modifies process-wide state, so prefer `id_number_space()` when other threads may be generating IDs.
+        """
         with cls._state_lock:
             cls._prefix_to_next_value = {}
             cls._default_start_value = default_start_value
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import functools
+
+import jinja2
+
+
+@functools.lru_cache(maxsize=None)
+def compiled_jinja_template(template_str: str, strict_undefined: bool = True) -> jinja2.Template:
+    """Return the compiled template for the given string.
+
+    Compiling a template is much more expensive than rendering it, so templates used for frequently-rendered text (e.g.
+    the `structure_text()` of each node in a plan) are compiled once and shared. Only use this with fixed template
+    strings (e.g. module-level constants) as the compiled templates are never evicted.
+
+    Args:
+        template_str: The template source.
+        strict_undefined: Raise an exception if the template references an undefined variable.
+    """
+    if strict_undefined:
+        return jinja2.Template(template_str, undefined=jinja2.StrictUndefined)
+    return jinja2.Template(template_str)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Optional, Union
+
+from metricflow_semantics.mf_logging.pretty_print import mf_pformat_many
+
+logger = logging.getLogger(__name__)
+
+
+class LazyFormat:
+    """Lazily formats the given objects into a string representation for logging.
+
+    The `logging` module only converts the message to a string if a log record is emitted, so wrapping an expensive
+    message (e.g. the `structure_text()` of a plan) in this class skips formatting when the log level is disabled.
+
+    e.g.
+        logger.debug(LazyFormat(lambda: f"Generated plan: {plan.structure_text()}"))
+        logger.debug(LazyFormat("Evaluated candidate node", node=node, evaluation=evaluation))
+
+    Keyword arguments are formatted with `mf_pformat_many()`. The result is cached, so the message is only formatted
+    once even if multiple handlers emit the record.
+    """
+
+    __slots__ = ("_message", "_kwargs", "_str_value")
+
+    def __init__(self, message: Union[str, Callable[[], str]], **kwargs: Any) -> None:  # type: ignore[misc]
+        """Initializer.
+
+        Args:
+            message: The message or a function that returns the message.
+            **kwargs: Objects to pretty-format after the message. Strings are included as-is.
+        """
+        self._message = message
+        self._kwargs = kwargs
+        self._str_value: Optional[str] = None
+
+    def _format(self) -> str:
+        message = self._message() if callable(self._message) else self._message
+        if len(self._kwargs) > 0:
+            return mf_pformat_many(message, self._kwargs, preserve_raw_strings=True)
+        return message
+
+    def __str__(self) -> str:  # noqa: D105
+        if self._str_value is None:
+            # Since this is used in logging calls, wrap with except so that a bug here doesn't result in something
+            # breaking.
+            try:
+                self._str_value = self._format()
+            except Exception:
+                logger.exception("Error formatting a lazily-formatted log message.")
+                self._str_value = repr(self._message)
+        return self._str_value
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{self.__class__.__name__}({self._message!r})"
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import logging
+from pathlib import Path
+from typing import Optional
+
 from dbt_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
 )
@@ -17,11 +21,56 @@ from dbt_semantic_interfaces.transformations.semantic_manifest_transformer impor
     PydanticSemanticManifestTransformer,
 )
 
+from metricflow_semantics.model.snapshot_file import (
+    SnapshotFileHeader,
+    hash_semantic_manifest_json,
+    read_snapshot_file,
+    write_snapshot_file,
+)
 from metricflow_semantics.model.transformations.dedupe_metric_input_measures import DedupeMetricInputMeasuresRule
 
+logger = logging.getLogger(__name__)
+
+# Increment when the transformations change so that previously cached manifests are not used.
+MANIFEST_SNAPSHOT_FORMAT_VERSION = 2
+MANIFEST_SNAPSHOT_FILE_NAME = "semantic_manifest.snapshot"
+
+
+def parse_manifest_from_dbt_generated_manifest(
+    manifest_json_string: str, cache_dir: Optional[Path] = None, manifest_hash: Optional[str] = None
+) -> PydanticSemanticManifest:
+    """Parse a PydanticSemanticManifest given the generated semantic_manifest json from dbt.
+
+    If `cache_dir` is specified, the transformed manifest is stored in a snapshot in that directory that's keyed by the
+    hash of the JSON. Later calls with the same JSON load it from there to skip the validation of the JSON and the
+    transformations.
+
+    Args:
+        manifest_json_string: the contents of the semantic_manifest JSON.
+        cache_dir: the directory for the snapshot of the transformed manifest.
+        manifest_hash: the result of `hash_semantic_manifest_json` for the JSON, if the caller already computed it.
+    """
+    if cache_dir is None:
+        return _parse_and_transform_manifest(manifest_json_string)
+
+    snapshot_path = cache_dir / MANIFEST_SNAPSHOT_FILE_NAME
+    header = SnapshotFileHeader.create(
+        snapshot_name="semantic_manifest",
+        format_version=MANIFEST_SNAPSHOT_FORMAT_VERSION,
+        manifest_hash=manifest_hash or hash_semantic_manifest_json(manifest_json_string),
+    )
+    cached_manifest = read_snapshot_file(snapshot_path, header)
+    if isinstance(cached_manifest, PydanticSemanticManifest):
+        return cached_manifest
+    if cached_manifest is not None:
+        logger.error(f"Got unexpected type {type(cached_manifest)} from the cached manifest at {snapshot_path}")
+
+    semantic_manifest = _parse_and_transform_manifest(manifest_json_string)
+    write_snapshot_file(snapshot_path, header, semantic_manifest)
+    return semantic_manifest
+
 
-def parse_manifest_from_dbt_generated_manifest(manifest_json_string: str) -> PydanticSemanticManifest:
-    """Parse a PydanticSemanticManifest given the generated semantic_manifest json from dbt."""
+def _parse_and_transform_manifest(manifest_json_string: str) -> PydanticSemanticManifest:
     raw_model = PydanticSemanticManifest.parse_raw(manifest_json_string)
     # The serialized object in the dbt project does not have all transformations applied to it at
     # this time, which causes failures with input measure resolution.
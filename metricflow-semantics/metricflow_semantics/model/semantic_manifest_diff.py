@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Set
+
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+from dbt_semantic_interfaces.references import MetricReference, SemanticModelReference
+
+
+@dataclass(frozen=True)
+class SemanticManifestDiff:
+    """Describes the semantic models and metrics that differ between two versions of a semantic manifest."""
+
+    added_semantic_models: FrozenSet[SemanticModelReference]
+    removed_semantic_models: FrozenSet[SemanticModelReference]
+    changed_semantic_models: FrozenSet[SemanticModelReference]
+    added_metrics: FrozenSet[MetricReference]
+    removed_metrics: FrozenSet[MetricReference]
+    changed_metrics: FrozenSet[MetricReference]
+
+    @staticmethod
+    def create(old_manifest: SemanticManifest, new_manifest: SemanticManifest) -> SemanticManifestDiff:
+        """Compare the semantic models and metrics of the two manifests by name and by value."""
+        old_semantic_models = {
+            semantic_model.reference: semantic_model for semantic_model in old_manifest.semantic_models
+        }
+        new_semantic_models = {
+            semantic_model.reference: semantic_model for semantic_model in new_manifest.semantic_models
+        }
+        old_metrics = {MetricReference(metric.name): metric for metric in old_manifest.metrics}
+        new_metrics = {MetricReference(metric.name): metric for metric in new_manifest.metrics}
+
+        return SemanticManifestDiff(
+            added_semantic_models=frozenset(new_semantic_models.keys() - old_semantic_models.keys()),
+            removed_semantic_models=frozenset(old_semantic_models.keys() - new_semantic_models.keys()),
+            changed_semantic_models=frozenset(
+                reference
+                for reference in old_semantic_models.keys() & new_semantic_models.keys()
+                if old_semantic_models[reference] != new_semantic_models[reference]
+            ),
+            added_metrics=frozenset(new_metrics.keys() - old_metrics.keys()),
+            removed_metrics=frozenset(old_metrics.keys() - new_metrics.keys()),
+            changed_metrics=frozenset(
+                reference
+                for reference in old_metrics.keys() & new_metrics.keys()
+                if old_metrics[reference] != new_metrics[reference]
+            ),
+        )
+
+    @property
+    def modified_semantic_models(self) -> FrozenSet[SemanticModelReference]:
+        """The semantic models that were added, removed, or changed."""
+        return self.added_semantic_models.union(self.removed_semantic_models, self.changed_semantic_models)
+
+    @property
+    def modified_metrics(self) -> FrozenSet[MetricReference]:
+        """The metrics that were added, removed, or changed."""
+        return self.added_metrics.union(self.removed_metrics, self.changed_metrics)
+
+
+def semantic_models_within_join_distance(
+    semantic_manifest: SemanticManifest,
+    semantic_model_references: FrozenSet[SemanticModelReference],
+    max_entity_links: int,
+) -> FrozenSet[SemanticModelReference]:
+    """Return the semantic models that can be joined to / from the given ones with at most `max_entity_links` joins.
+
+    Two semantic models are considered joinable if they share an entity name. This is a superset of the valid joins,
+    so the result includes every semantic model whose joined elements could involve one of the given models.
+    """
+    entity_name_to_semantic_models: Dict[str, Set[SemanticModelReference]] = defaultdict(set)
+    semantic_model_to_entity_names: Dict[SemanticModelReference, Set[str]] = defaultdict(set)
+    for semantic_model in semantic_manifest.semantic_models:
+        for entity in semantic_model.entities:
+            entity_name_to_semantic_models[entity.reference.element_name].add(semantic_model.reference)
+            semantic_model_to_entity_names[semantic_model.reference].add(entity.reference.element_name)
+
+    visited: Set[SemanticModelReference] = set(semantic_model_references)
+    frontier: Set[SemanticModelReference] = set(semantic_model_references)
+    for _ in range(max_entity_links):
+        next_frontier: Set[SemanticModelReference] = set()
+        for semantic_model_reference in frontier:
+            for entity_name in semantic_model_to_entity_names[semantic_model_reference]:
+                next_frontier.update(entity_name_to_semantic_models[entity_name])
+        frontier = next_frontier - visited
+        if len(frontier) == 0:
+            break
+        visited.update(frontier)
+
+    return frozenset(visited)
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Mapping, Optional
 
 from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+from dbt_semantic_interfaces.references import MeasureReference
 
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
+from metricflow_semantics.model.semantics.linkable_element_set import LinkableElementSet
+from metricflow_semantics.model.semantics.linkable_spec_resolver import ValidLinkableSpecIndexes
 from metricflow_semantics.model.semantics.metric_lookup import MetricLookup
 from metricflow_semantics.model.semantics.semantic_model_lookup import SemanticModelLookup
 
@@ -13,10 +19,55 @@ logger = logging.getLogger(__name__)
 class SemanticManifestLookup:
     """Adds semantics information to the user configured model."""
 
-    def __init__(self, semantic_manifest: SemanticManifest) -> None:  # noqa: D107
+    def __init__(
+        self,
+        semantic_manifest: SemanticManifest,
+        linkable_spec_indexes: Optional[ValidLinkableSpecIndexes] = None,
+        reusable_measure_linkable_element_sets: Optional[Mapping[MeasureReference, LinkableElementSet]] = None,
+        lazy_linkable_spec_indexes: bool = False,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            semantic_manifest: the manifest to look up.
+            linkable_spec_indexes: indexes previously built for the same manifest (e.g. loaded from a snapshot by
+            `load_semantic_manifest_lookup`). If not provided, they are built from the manifest.
+            reusable_measure_linkable_element_sets: linkable elements for measures that are unaffected by a change to
+            the manifest. See `update()`.
+            lazy_linkable_spec_indexes: build the group-by-item indexes on first access instead of in the
+            initializer. This is useful for processes that only query a few metrics. See `MetricLookup.warm_up()`.
+        """
         self._semantic_manifest = semantic_manifest
+        self._lazy_linkable_spec_indexes = lazy_linkable_spec_indexes
         self._semantic_model_lookup = SemanticModelLookup(semantic_manifest)
-        self._metric_lookup = MetricLookup(self._semantic_manifest, self._semantic_model_lookup)
+        self._metric_lookup = MetricLookup(
+            self._semantic_manifest,
+            self._semantic_model_lookup,
+            linkable_spec_indexes=linkable_spec_indexes,
+            reusable_measure_linkable_element_sets=reusable_measure_linkable_element_sets,
+            lazy_linkable_spec_indexes=lazy_linkable_spec_indexes,
+        )
+
+    def update(self, semantic_manifest: SemanticManifest) -> SemanticManifestLookup:
+        """Create a lookup for a new version of the manifest, reusing what is unaffected by the changes.
+
+        This is intended for reloading the manifest after a few semantic models or metrics were edited. The
+        linkable elements for measures are only rebuilt if a modified semantic model is within the join distance of
+        the measure's semantic model.
+        """
+        start_time = time.time()
+        manifest_diff = SemanticManifestDiff.create(
+            old_manifest=self._semantic_manifest, new_manifest=semantic_manifest
+        )
+        updated_lookup = SemanticManifestLookup(
+            semantic_manifest,
+            reusable_measure_linkable_element_sets=self._metric_lookup.get_reusable_measure_linkable_element_sets(
+                semantic_manifest=semantic_manifest, manifest_diff=manifest_diff
+            ),
+            lazy_linkable_spec_indexes=self._lazy_linkable_spec_indexes,
+        )
+        logger.info(f"Updating the semantic manifest lookup took: {time.time() - start_time:.2f}s")
+        return updated_lookup
 
     @property
     def semantic_manifest(self) -> SemanticManifest:  # noqa: D102
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.model.semantics.linkable_spec_resolver import ValidLinkableSpecIndexes
+from metricflow_semantics.model.snapshot_file import SnapshotFileHeader, read_snapshot_file, write_snapshot_file
+
+logger = logging.getLogger(__name__)
+
+# Increment when the layout of the indexes changes.
+INDEX_SNAPSHOT_FORMAT_VERSION = 4
+INDEX_SNAPSHOT_FILE_NAME = "semantic_manifest_indexes.snapshot"
+
+
+def load_semantic_manifest_lookup(
+    semantic_manifest: SemanticManifest, manifest_hash: str, snapshot_dir: Path
+) -> SemanticManifestLookup:
+    """Create a SemanticManifestLookup, using the snapshot of its indexes in `snapshot_dir` if it is up to date.
+
+    Building the group-by-item indexes for a large manifest can take a long time, and is otherwise repeated on every
+    process start. If the snapshot is missing or stale, the indexes are built and a new snapshot is written.
+
+    Args:
+        semantic_manifest: the manifest to create the lookup for.
+        manifest_hash: the hash of the manifest JSON that `semantic_manifest` was parsed from.
+        snapshot_dir: the directory for the snapshot.
+    """
+    snapshot_path = snapshot_dir / INDEX_SNAPSHOT_FILE_NAME
+    header = SnapshotFileHeader.create(
+        snapshot_name="semantic_manifest_indexes",
+        format_version=INDEX_SNAPSHOT_FORMAT_VERSION,
+        manifest_hash=manifest_hash,
+    )
+
+    linkable_spec_indexes = read_snapshot_file(snapshot_path, header)
+    if isinstance(linkable_spec_indexes, ValidLinkableSpecIndexes):
+        return SemanticManifestLookup(semantic_manifest, linkable_spec_indexes=linkable_spec_indexes)
+    if linkable_spec_indexes is not None:
+        logger.warning(f"Semantic manifest index snapshot at {str(snapshot_path)!r} has unexpected contents")
+
+    semantic_manifest_lookup = SemanticManifestLookup(semantic_manifest)
+    write_snapshot_file(snapshot_path, header, semantic_manifest_lookup.metric_lookup.linkable_spec_indexes)
+    return semantic_manifest_lookup
@@ -23,6 +23,7 @@ from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
 from typing_extensions import override
 
 from metricflow_semantics.assert_one_arg import assert_exactly_one_arg_set
+from metricflow_semantics.collection_helpers.interner import CachedHashDataclass
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
 from metricflow_semantics.model.semantic_model_derivation import SemanticModelDerivation
 from metricflow_semantics.workarounds.reference import sorted_semantic_model_references
@@ -58,7 +59,7 @@ class LinkableElementType(Enum):
 
 
 @dataclass(frozen=True)
-class ElementPathKey:
+class ElementPathKey(CachedHashDataclass):
     """A key that can uniquely identify an element and the joins used to realize the element."""
 
     element_name: str
@@ -88,6 +89,9 @@ class ElementPathKey:
             self.entity_links
         ), f"Duplicate found in `entity_links`: {self.entity_links}."
 
+    def __hash__(self) -> int:  # noqa: D105
+        return self._get_cached_hash()
+
 
 @dataclass(frozen=True)
 class SemanticModelJoinPathElement(SerializableDataclass):
@@ -98,7 +102,7 @@ class SemanticModelJoinPathElement(SerializableDataclass):
 
 
 @dataclass(frozen=True)
-class LinkableElement(SemanticModelDerivation, SerializableDataclass, ABC):
+class LinkableElement(SemanticModelDerivation, CachedHashDataclass, SerializableDataclass, ABC):
     """An entity / dimension that may have been joined by entities."""
 
     properties: Tuple[LinkableElementProperty, ...]
@@ -110,6 +114,9 @@ class LinkableElement(SemanticModelDerivation, SerializableDataclass, ABC):
 
         assert self.properties == tuple(sorted(self.properties)), f"Properties are not sorted: {self.properties}"
 
+    def __hash__(self) -> int:  # noqa: D105
+        return self._get_cached_hash()
+
     @cached_property
     def property_set(self) -> FrozenSet[LinkableElementProperty]:  # noqa: D102
         return frozenset(self.properties)
@@ -182,7 +189,10 @@ class LinkableDimension(LinkableElement, SerializableDataclass):
             else LinkableElementType.TIME_DIMENSION
         )
 
-    @property
+    def __hash__(self) -> int:  # noqa: D105
+        return self._get_cached_hash()
+
+    @cached_property
     def path_key(self) -> ElementPathKey:  # noqa: D102
         return ElementPathKey(
             element_name=self.element_name,
@@ -257,7 +267,10 @@ class LinkableEntity(LinkableElement, SerializableDataclass):
     def element_type(self) -> LinkableElementType:
         return LinkableElementType.ENTITY
 
-    @property
+    def __hash__(self) -> int:  # noqa: D105
+        return self._get_cached_hash()
+
+    @cached_property
     def path_key(self) -> ElementPathKey:  # noqa: D102
         return ElementPathKey(
             element_name=self.element_name, element_type=self.element_type, entity_links=self.entity_links
@@ -317,7 +330,10 @@ class LinkableMetric(LinkableElement, SerializableDataclass):
     def element_name(self) -> str:  # noqa: D102
         return self.reference.element_name
 
-    @property
+    def __hash__(self) -> int:  # noqa: D105
+        return self._get_cached_hash()
+
+    @cached_property
     def path_key(self) -> ElementPathKey:  # noqa: D102
         return ElementPathKey(
             element_name=self.element_name,
@@ -406,7 +422,7 @@ class LinkableElementUnion(SerializableDataclass):
 
 
 @dataclass(frozen=True)
-class SemanticModelJoinPath(SemanticModelDerivation, SerializableDataclass):
+class SemanticModelJoinPath(SemanticModelDerivation, CachedHashDataclass, SerializableDataclass):
     """Describes a series of joins between the measure semantic model, and other semantic models by entity.
 
     For example:
@@ -419,6 +435,9 @@ class SemanticModelJoinPath(SemanticModelDerivation, SerializableDataclass):
     left_semantic_model_reference: SemanticModelReference
     path_elements: Tuple[SemanticModelJoinPathElement, ...] = ()
 
+    def __hash__(self) -> int:  # noqa: D105
+        return self._get_cached_hash()
+
     @property
     def last_path_element(self) -> SemanticModelJoinPathElement:  # noqa: D102
         assert len(self.path_elements) > 0
@@ -433,7 +452,7 @@ class SemanticModelJoinPath(SemanticModelDerivation, SerializableDataclass):
     def last_entity_link(self) -> EntityReference:  # noqa: D102
         return self.last_path_element.join_on_entity
 
-    @property
+    @cached_property
     def entity_links(self) -> Tuple[EntityReference, ...]:  # noqa: D102
         return tuple(path_element.join_on_entity for path_element in self.path_elements)
 
@@ -4,7 +4,8 @@ import logging
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.references import SemanticModelReference
@@ -24,6 +25,7 @@ from metricflow_semantics.specs.dimension_spec import DimensionSpec
 from metricflow_semantics.specs.entity_spec import EntitySpec
 from metricflow_semantics.specs.group_by_metric_spec import GroupByMetricSpec
 from metricflow_semantics.specs.instance_spec import InstanceSpec, LinkableInstanceSpec
+from metricflow_semantics.specs.linkable_spec_index import LinkableSpecIndex
 from metricflow_semantics.specs.patterns.spec_pattern import SpecPattern
 from metricflow_semantics.specs.time_dimension_spec import TimeDimensionSpec
 
@@ -97,6 +99,36 @@ class LinkableElementSet(SemanticModelDerivation):
                         linkable_dimension.time_granularity is not None
                     ), f"{path_key} has a dimension without the time granularity set: {linkable_dimension}"
 
+    @staticmethod
+    def create_from_elements(
+        linkable_dimensions: Iterable[LinkableDimension] = (),
+        linkable_entities: Iterable[LinkableEntity] = (),
+        linkable_metrics: Iterable[LinkableMetric] = (),
+    ) -> LinkableElementSet:
+        """Create a set from the given elements, keeping the order of elements with the same path key."""
+        key_to_linkable_dimensions: Dict[ElementPathKey, List[LinkableDimension]] = defaultdict(list)
+        key_to_linkable_entities: Dict[ElementPathKey, List[LinkableEntity]] = defaultdict(list)
+        key_to_linkable_metrics: Dict[ElementPathKey, List[LinkableMetric]] = defaultdict(list)
+
+        for linkable_dimension in linkable_dimensions:
+            key_to_linkable_dimensions[linkable_dimension.path_key].append(linkable_dimension)
+        for linkable_entity in linkable_entities:
+            key_to_linkable_entities[linkable_entity.path_key].append(linkable_entity)
+        for linkable_metric in linkable_metrics:
+            key_to_linkable_metrics[linkable_metric.path_key].append(linkable_metric)
+
+        return LinkableElementSet(
+            path_key_to_linkable_dimensions={
+                path_key: tuple(dimensions) for path_key, dimensions in key_to_linkable_dimensions.items()
+            },
+            path_key_to_linkable_entities={
+                path_key: tuple(entities) for path_key, entities in key_to_linkable_entities.items()
+            },
+            path_key_to_linkable_metrics={
+                path_key: tuple(metrics) for path_key, metrics in key_to_linkable_metrics.items()
+            },
+        )
+
     @staticmethod
     def merge_by_path_key(linkable_element_sets: Sequence[LinkableElementSet]) -> LinkableElementSet:
         """Combine multiple sets together by the path key.
@@ -332,14 +364,35 @@ class LinkableElementSet(SemanticModelDerivation):
         """Converts the items in a `LinkableElementSet` to their corresponding spec objects."""
         specs: List[LinkableInstanceSpec] = []
 
-        for path_key in (
+        for path_key in self._path_keys:
+            specs.append(LinkableElementSet._path_key_to_spec(path_key))
+
+        return specs
+
+    @property
+    def _path_keys(self) -> Sequence[ElementPathKey]:
+        """The path keys of all elements in the same order as `specs`."""
+        return (
             tuple(self.path_key_to_linkable_dimensions.keys())
             + tuple(self.path_key_to_linkable_entities.keys())
             + tuple(self.path_key_to_linkable_metrics.keys())
-        ):
-            specs.append(LinkableElementSet._path_key_to_spec(path_key))
+        )
 
-        return specs
+    @cached_property
+    def _spec_index(self) -> _LinkableElementSetSpecIndex:
+        """An index of the specs used to filter by spec patterns.
+
+        This is cached as the same set is filtered many times during query resolution e.g. the elements for a measure
+        are filtered by the pattern for each group-by-item in a query.
+        """
+        path_keys = tuple(self._path_keys)
+        specs = tuple(LinkableElementSet._path_key_to_spec(path_key) for path_key in path_keys)
+        spec_to_positions: Dict[InstanceSpec, List[int]] = defaultdict(list)
+        for position, spec in enumerate(specs):
+            spec_to_positions[spec].append(position)
+        return _LinkableElementSetSpecIndex(
+            path_keys=path_keys, spec_index=LinkableSpecIndex(specs), spec_to_positions=spec_to_positions
+        )
 
     @staticmethod
     def _path_key_to_spec(path_key: ElementPathKey) -> LinkableInstanceSpec:
@@ -381,29 +434,38 @@ class LinkableElementSet(SemanticModelDerivation):
         Returns a new set consisting of the elements in the `LinkableElementSet` that have a corresponding spec that
         match all the given spec patterns.
         """
-        start_time = time.time()
+        if len(spec_patterns) == 0:
+            return self
 
-        # Spec patterns need all specs to match properly e.g. `MinimumTimeGrainPattern`.
-        matching_specs: Sequence[InstanceSpec] = self.specs
+        start_time = time.time()
 
-        for spec_pattern in spec_patterns:
+        # Spec patterns need all specs to match properly e.g. `MinimumTimeGrainPattern`. The first pattern is matched
+        # using the index, which avoids a scan of all specs for patterns that specify the element name.
+        spec_index = self._spec_index
+        matching_specs: Sequence[InstanceSpec] = spec_patterns[0].match_indexed(spec_index.spec_index)
+        for spec_pattern in spec_patterns[1:]:
             matching_specs = spec_pattern.match(matching_specs)
-        specs_to_include = set(matching_specs)
+
+        positions_to_include: Set[int] = set()
+        for spec in matching_specs:
+            positions_to_include.update(spec_index.spec_to_positions.get(spec, ()))
 
         path_key_to_linkable_dimensions: Dict[ElementPathKey, Tuple[LinkableDimension, ...]] = {}
         path_key_to_linkable_entities: Dict[ElementPathKey, Tuple[LinkableEntity, ...]] = {}
         path_key_to_linkable_metrics: Dict[ElementPathKey, Tuple[LinkableMetric, ...]] = {}
 
-        for path_key, linkable_dimensions in self.path_key_to_linkable_dimensions.items():
-            if LinkableElementSet._path_key_to_spec(path_key) in specs_to_include:
+        # Add the elements in the order of the original set so that the result is the same as filtering the
+        # dictionaries.
+        for position in sorted(positions_to_include):
+            path_key = spec_index.path_keys[position]
+            linkable_dimensions = self.path_key_to_linkable_dimensions.get(path_key)
+            if linkable_dimensions is not None:
                 path_key_to_linkable_dimensions[path_key] = linkable_dimensions
-
-        for path_key, linkable_entities in self.path_key_to_linkable_entities.items():
-            if LinkableElementSet._path_key_to_spec(path_key) in specs_to_include:
+            linkable_entities = self.path_key_to_linkable_entities.get(path_key)
+            if linkable_entities is not None:
                 path_key_to_linkable_entities[path_key] = linkable_entities
-
-        for path_key, linkable_metrics in self.path_key_to_linkable_metrics.items():
-            if LinkableElementSet._path_key_to_spec(path_key) in specs_to_include:
+            linkable_metrics = self.path_key_to_linkable_metrics.get(path_key)
+            if linkable_metrics is not None:
                 path_key_to_linkable_metrics[path_key] = linkable_metrics
 
         filtered_elements = LinkableElementSet(
@@ -413,3 +475,18 @@ class LinkableElementSet(SemanticModelDerivation):
         )
         logger.info(f"Filtering valid linkable elements took: {time.time() - start_time:.2f}s")
         return filtered_elements
+
+
+@dataclass(frozen=True)
+class _LinkableElementSetSpecIndex:
+    """Maps the specs of a `LinkableElementSet` back to the elements.
+
+    Attributes:
+        path_keys: The path keys of the elements in the same order as `LinkableElementSet.specs`.
+        spec_index: The index of the specs.
+        spec_to_positions: The positions in `path_keys` of the elements that correspond to a spec.
+    """
+
+    path_keys: Tuple[ElementPathKey, ...]
+    spec_index: LinkableSpecIndex
+    spec_to_positions: Dict[InstanceSpec, List[int]]
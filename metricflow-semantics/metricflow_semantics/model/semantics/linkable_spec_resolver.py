@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import itertools
 import logging
+import threading
 import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.protocols.dimension import Dimension, DimensionType
@@ -22,9 +39,11 @@ from dbt_semantic_interfaces.type_enums.date_part import DatePart
 from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
 from dbt_semantic_interfaces.validations.unique_valid_name import MetricFlowReservedKeywords
 
+from metricflow_semantics.collection_helpers.interner import Interner
 from metricflow_semantics.errors.error_classes import UnknownMetricLinkingError
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff, semantic_models_within_join_distance
 from metricflow_semantics.model.semantic_model_derivation import SemanticModelDerivation
 from metricflow_semantics.model.semantics.linkable_element import (
     ElementPathKey,
@@ -48,57 +67,208 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
 
-def _generate_linkable_time_dimensions(
-    semantic_model_origin: SemanticModelReference,
-    dimension: Dimension,
-    entity_links: Tuple[EntityReference, ...],
-    join_path: SemanticModelJoinPath,
-    with_properties: FrozenSet[LinkableElementProperty],
-) -> Sequence[LinkableDimension]:
-    """Generates different versions of the given dimension, but at other valid time granularities."""
-    linkable_dimensions = []
-
-    defined_time_granularity = (
-        dimension.type_params.time_granularity if dimension.type_params else DEFAULT_TIME_GRANULARITY
-    )
-    for time_granularity in TimeGranularity:
-        if time_granularity < defined_time_granularity:
-            continue
-        properties = set(with_properties)
-        if time_granularity != defined_time_granularity:
-            properties.add(LinkableElementProperty.DERIVED_TIME_GRANULARITY)
-
-        linkable_dimensions.append(
-            LinkableDimension.create(
-                defined_in_semantic_model=semantic_model_origin,
-                element_name=dimension.reference.element_name,
-                dimension_type=DimensionType.TIME,
-                entity_links=entity_links,
-                join_path=join_path,
-                time_granularity=time_granularity,
-                date_part=None,
-                properties=tuple(sorted(properties)),
-            )
+
+class _BuildOnceMemo(Generic[KeyT, ValueT]):
+    """Memoizes values that are built on first access, building the value for each key at most once.
+
+    Each key has its own lock, so values for different keys can be built at the same time, while a concurrent request
+    for a key that is being built waits for that build instead of repeating it.
+    """
+
+    def __init__(self, values: Optional[Mapping[KeyT, ValueT]] = None) -> None:  # noqa: D107
+        self._values: Dict[KeyT, ValueT] = dict(values or {})
+        self._key_locks: Dict[KeyT, threading.Lock] = {}
+        self._key_locks_lock = threading.Lock()
+
+    def get_or_build(self, key: KeyT, build: Callable[[KeyT], ValueT]) -> ValueT:
+        """Return the value for the key, calling `build` to create it if it hasn't been built yet."""
+        # Reading a key from a dict is atomic, so a built value can be returned without locking.
+        value = self._values.get(key)
+        if value is not None:
+            return value
+
+        with self._key_locks_lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self._values.get(key)
+            if value is None:
+                value = build(key)
+                self._values[key] = value
+        with self._key_locks_lock:
+            self._key_locks.pop(key, None)
+        return value
+
+    def built_values(self) -> Dict[KeyT, ValueT]:
+        """Return a copy of the values that have been built so far."""
+        return dict(self._values)
+
+
+@dataclass(frozen=True)
+class _LinkableDimensionTemplate:
+    """The fields of a `LinkableDimension` that don't depend on the join path used to reach the dimension."""
+
+    properties: Tuple[LinkableElementProperty, ...]
+    defined_in_semantic_model: SemanticModelReference
+    element_name: str
+    dimension_type: DimensionType
+    time_granularity: Optional[TimeGranularity]
+    date_part: Optional[DatePart]
+
+    def create_linkable_dimension(  # noqa: D102
+        self, entity_links: Tuple[EntityReference, ...], join_path: SemanticModelJoinPath
+    ) -> LinkableDimension:
+        return LinkableDimension(
+            properties=self.properties,
+            defined_in_semantic_model=self.defined_in_semantic_model,
+            element_name=self.element_name,
+            dimension_type=self.dimension_type,
+            entity_links=entity_links,
+            join_path=join_path,
+            time_granularity=self.time_granularity,
+            date_part=self.date_part,
         )
 
-        # Add the time dimension aggregated to a different date part.
-        for date_part in DatePart:
-            if time_granularity.to_int() <= date_part.to_int():
-                linkable_dimensions.append(
-                    LinkableDimension.create(
-                        defined_in_semantic_model=semantic_model_origin,
+
+@dataclass(frozen=True)
+class _LinkableEntityTemplate:
+    """The fields of a `LinkableEntity` that don't depend on the join path used to reach the entity."""
+
+    properties: Tuple[LinkableElementProperty, ...]
+    defined_in_semantic_model: SemanticModelReference
+    entity_reference: EntityReference
+
+    def create_linkable_entity(  # noqa: D102
+        self, entity_links: Tuple[EntityReference, ...], join_path: SemanticModelJoinPath
+    ) -> LinkableEntity:
+        return LinkableEntity(
+            properties=self.properties,
+            defined_in_semantic_model=self.defined_in_semantic_model,
+            element_name=self.entity_reference.element_name,
+            entity_links=entity_links,
+            join_path=join_path,
+        )
+
+
+@dataclass(frozen=True)
+class _SemanticModelElementTemplates:
+    """Templates for the dimensions and entities of a semantic model, in the order they are defined.
+
+    The elements that can be reached through different join paths ending in the same semantic model only differ in the
+    entity links and the join path, so the templates are generated once per semantic model.
+    """
+
+    dimension_templates: Tuple[_LinkableDimensionTemplate, ...]
+    entity_templates: Tuple[_LinkableEntityTemplate, ...]
+
+    @staticmethod
+    def create(
+        semantic_model: SemanticModel, with_properties: FrozenSet[LinkableElementProperty]
+    ) -> _SemanticModelElementTemplates:
+        """Create templates for the elements in the semantic model with the given properties.
+
+        Time dimensions have one template per valid time granularity and date part.
+        """
+        dimension_templates: List[_LinkableDimensionTemplate] = []
+        for dimension in semantic_model.dimensions:
+            dimension_type = dimension.type
+            if dimension_type is DimensionType.CATEGORICAL:
+                dimension_templates.append(
+                    _LinkableDimensionTemplate(
+                        properties=tuple(sorted(with_properties)),
+                        defined_in_semantic_model=semantic_model.reference,
                         element_name=dimension.reference.element_name,
-                        dimension_type=DimensionType.TIME,
-                        entity_links=entity_links,
-                        join_path=join_path,
-                        time_granularity=time_granularity,
-                        date_part=date_part,
-                        properties=frozenset(properties),
+                        dimension_type=DimensionType.CATEGORICAL,
+                        time_granularity=None,
+                        date_part=None,
+                    )
+                )
+            elif dimension_type is DimensionType.TIME:
+                dimension_templates.extend(
+                    _SemanticModelElementTemplates._create_time_dimension_templates(
+                        semantic_model_origin=semantic_model.reference,
+                        dimension=dimension,
+                        with_properties=with_properties,
                     )
                 )
+            else:
+                assert_values_exhausted(dimension_type)
+
+        entity_properties = tuple(sorted(with_properties.union({LinkableElementProperty.ENTITY})))
+        return _SemanticModelElementTemplates(
+            dimension_templates=tuple(dimension_templates),
+            entity_templates=tuple(
+                _LinkableEntityTemplate(
+                    properties=entity_properties,
+                    defined_in_semantic_model=semantic_model.reference,
+                    entity_reference=entity.reference,
+                )
+                for entity in semantic_model.entities
+            ),
+        )
+
+    @staticmethod
+    def _create_time_dimension_templates(
+        semantic_model_origin: SemanticModelReference,
+        dimension: Dimension,
+        with_properties: FrozenSet[LinkableElementProperty],
+    ) -> Sequence[_LinkableDimensionTemplate]:
+        """Generates different versions of the given dimension, but at other valid time granularities."""
+        dimension_templates = []
+
+        defined_time_granularity = (
+            dimension.type_params.time_granularity if dimension.type_params else DEFAULT_TIME_GRANULARITY
+        )
+        for time_granularity in TimeGranularity:
+            if time_granularity < defined_time_granularity:
+                continue
+            properties = set(with_properties)
+            if time_granularity != defined_time_granularity:
+                properties.add(LinkableElementProperty.DERIVED_TIME_GRANULARITY)
+            sorted_properties = tuple(sorted(properties))
+
+            dimension_templates.append(
+                _LinkableDimensionTemplate(
+                    properties=sorted_properties,
+                    defined_in_semantic_model=semantic_model_origin,
+                    element_name=dimension.reference.element_name,
+                    dimension_type=DimensionType.TIME,
+                    time_granularity=time_granularity,
+                    date_part=None,
+                )
+            )
+
+            # Add the time dimension aggregated to a different date part.
+            for date_part in DatePart:
+                if time_granularity.to_int() <= date_part.to_int():
+                    dimension_templates.append(
+                        _LinkableDimensionTemplate(
+                            properties=sorted_properties,
+                            defined_in_semantic_model=semantic_model_origin,
+                            element_name=dimension.reference.element_name,
+                            dimension_type=DimensionType.TIME,
+                            time_granularity=time_granularity,
+                            date_part=date_part,
+                        )
+                    )
+
+        return dimension_templates
 
-    return linkable_dimensions
+
+@dataclass(frozen=True)
+class ValidLinkableSpecIndexes:
+    """The indexes that ValidLinkableSpecResolver precomputes from the semantic manifest.
+
+    Building these is the slow part of initializing the resolver, so they can be saved and passed back in to skip
+    the computation for the same manifest. See `load_semantic_manifest_lookup`.
+    """
+
+    measure_to_linkable_element_set: Dict[MeasureReference, LinkableElementSet]
+    metric_to_linkable_element_sets: Dict[str, List[LinkableElementSet]]
+    joinable_metrics_for_entities: Dict[EntityReference, Set[MetricSubqueryJoinPathElement]]
+    no_metric_linkable_element_set: LinkableElementSet
 
 
 class ValidLinkableSpecResolver:
@@ -112,6 +282,9 @@ class ValidLinkableSpecResolver:
         semantic_manifest: SemanticManifest,
         semantic_model_lookup: SemanticModelLookup,
         max_entity_links: int,
+        indexes: Optional[ValidLinkableSpecIndexes] = None,
+        reusable_measure_linkable_element_sets: Optional[Mapping[MeasureReference, LinkableElementSet]] = None,
+        lazy: bool = False,
     ) -> None:
         """Constructor.
 
@@ -119,6 +292,13 @@ class ValidLinkableSpecResolver:
             semantic_manifest: the model to use.
             semantic_model_lookup: used to look up entities for a semantic model.
             max_entity_links: the maximum number of joins to do when computing valid elements.
+            indexes: indexes previously built for the same manifest. If provided, they are used instead of building
+            them again.
+            reusable_measure_linkable_element_sets: linkable element sets for measures that are known to be the same
+            in this manifest. See `get_reusable_measure_linkable_element_sets()`.
+            lazy: if set, the indexes are built on first access instead of in the constructor. The elements for a
+            metric or a measure are computed when it is first queried, and the metrics that can be joined to an entity
+            are computed when one of the semantic models with the entity is first queried. See `warm_up()`.
         """
         self._semantic_manifest = semantic_manifest
         self._semantic_model_lookup = semantic_model_lookup
@@ -138,105 +318,344 @@ class ValidLinkableSpecResolver:
             for entity in semantic_model.entities:
                 self._entity_to_semantic_model[entity.reference.element_name].append(semantic_model)
 
-        self._metric_to_linkable_element_sets: Dict[str, List[LinkableElementSet]] = {}
         self._metric_references_to_metrics: Dict[MetricReference, Metric] = {}
-        self._joinable_metrics_for_entities: Dict[EntityReference, Set[MetricSubqueryJoinPathElement]] = defaultdict(
-            set
+        for metric in self._semantic_manifest.metrics:
+            self._metric_references_to_metrics[MetricReference(metric.name)] = metric
+
+        # The same metric_time elements and join paths are generated for many measures, so they are interned to share a
+        # single instance between the indexes.
+        self._interner = Interner()
+
+        # The indexes below are memoized on first access. Independent entries (e.g. the elements for different metrics)
+        # can be built concurrently. An entry only depends on entries further down in this list, so the per-entry locks
+        # are always acquired in the same order.
+        self._no_metric_linkable_element_set_lock = threading.Lock()
+        self._no_metric_linkable_element_set: Optional[LinkableElementSet] = None
+        # The metrics that can be joined to each entity. Building this for an entity only requires the entities that
+        # can be joined to each metric, so the full sets of elements for the metrics are not built.
+        self._joinable_metrics_for_entities: _BuildOnceMemo[
+            EntityReference, Set[MetricSubqueryJoinPathElement]
+        ] = _BuildOnceMemo()
+        self._metric_to_linkable_entity_set: _BuildOnceMemo[str, LinkableElementSet] = _BuildOnceMemo()
+        self._measure_to_linkable_entity_set: _BuildOnceMemo[MeasureReference, LinkableElementSet] = _BuildOnceMemo()
+        self._metric_to_linkable_element_sets: _BuildOnceMemo[str, List[LinkableElementSet]] = _BuildOnceMemo()
+        # The linkable elements for a measure before filtering for the metric type. These don't include linkable
+        # metrics, as those depend on the entities of all metrics.
+        self._measure_to_linkable_element_set: _BuildOnceMemo[MeasureReference, LinkableElementSet] = _BuildOnceMemo(
+            reusable_measure_linkable_element_sets
         )
 
+        # Memoized intermediate results that are shared by the measures in a semantic model and by the join paths that
+        # end in the same semantic model. Computing the same entry concurrently is harmless, so these are not locked.
+        self._element_templates: Dict[
+            Tuple[SemanticModelReference, FrozenSet[LinkableElementProperty]], _SemanticModelElementTemplates
+        ] = {}
+        self._semantic_model_to_local_elements: Dict[SemanticModelReference, LinkableElementSet] = {}
+        self._semantic_model_to_join_paths: Dict[SemanticModelReference, Sequence[SemanticModelJoinPath]] = {}
+        self._semantic_model_to_joined_elements: Dict[SemanticModelReference, LinkableElementSet] = {}
+        self._semantic_model_to_joined_entities: Dict[SemanticModelReference, LinkableElementSet] = {}
+        self._joinable_metrics_for_semantic_model: Dict[
+            Tuple[SemanticModelReference, SemanticModelJoinPath], LinkableElementSet
+        ] = {}
+
+        if indexes is not None:
+            self._measure_to_linkable_element_set = _BuildOnceMemo(indexes.measure_to_linkable_element_set)
+            self._metric_to_linkable_element_sets = _BuildOnceMemo(indexes.metric_to_linkable_element_sets)
+            # The index only has the entities that some metric can be joined to.
+            self._joinable_metrics_for_entities = _BuildOnceMemo(
+                {
+                    entity_reference: indexes.joinable_metrics_for_entities.get(entity_reference, set())
+                    for entity_reference in self._all_entity_references()
+                }
+            )
+            self._no_metric_linkable_element_set = indexes.no_metric_linkable_element_set
+            return
+
+        if lazy:
+            return
+
         start_time = time.time()
         for metric in self._semantic_manifest.metrics:
-            self._metric_references_to_metrics[MetricReference(metric.name)] = metric
-            linkable_sets_for_measure = []
-            for measure in metric.measure_references:
-                # Cumulative metrics currently can't be queried by other time granularities.
-                if metric.type is MetricType.CUMULATIVE:
-                    linkable_sets_for_measure.append(
-                        self._get_linkable_element_set_for_measure(measure).filter(
-                            with_any_of=LinkableElementProperty.all_properties(),
-                            # Use filter() here becasue `without_all_of` param is only available on that method.
-                            without_all_of=frozenset(
-                                {
-                                    LinkableElementProperty.METRIC_TIME,
-                                    LinkableElementProperty.DERIVED_TIME_GRANULARITY,
-                                }
-                            ),
-                        )
+            self._get_metric_linkable_element_sets(metric.name)
+        self._get_no_metric_linkable_element_set()
+        logger.info(f"Building valid group-by-item indexes took: {time.time() - start_time:.2f}s")
+
+    @property
+    def indexes(self) -> ValidLinkableSpecIndexes:
+        """The precomputed indexes, which can be passed to the constructor to skip building them.
+
+        In lazy mode, this builds any indexes that haven't been accessed yet.
+        """
+        for metric in self._semantic_manifest.metrics:
+            self._get_metric_linkable_element_sets(metric.name)
+        joinable_metrics_for_entities: Dict[EntityReference, Set[MetricSubqueryJoinPathElement]] = {}
+        for entity_reference in self._all_entity_references():
+            joinable_metrics = self._get_joinable_metrics_for_entity(entity_reference)
+            if joinable_metrics:
+                joinable_metrics_for_entities[entity_reference] = joinable_metrics
+        return ValidLinkableSpecIndexes(
+            measure_to_linkable_element_set=self._measure_to_linkable_element_set.built_values(),
+            metric_to_linkable_element_sets=self._metric_to_linkable_element_sets.built_values(),
+            joinable_metrics_for_entities=joinable_metrics_for_entities,
+            no_metric_linkable_element_set=self._get_no_metric_linkable_element_set(),
+        )
+
+    @property
+    def built_metric_names(self) -> FrozenSet[str]:
+        """The names of the metrics for which the linkable elements have been built. Shows what a lazy resolver built."""
+        return frozenset(self._metric_to_linkable_element_sets.built_values())
+
+    @property
+    def built_measure_references(self) -> FrozenSet[MeasureReference]:
+        """The measures for which the linkable elements have been built. Shows what a lazy resolver built."""
+        return frozenset(self._measure_to_linkable_element_set.built_values())
+
+    def warm_up(self, executor: Executor) -> Sequence[Future[None]]:
+        """Build the indexes in the background using the given executor.
+
+        One task is submitted per metric, followed by one for the elements for queries without metrics. Tasks for
+        different metrics don't wait for each other, and a query that runs concurrently only waits for the entries
+        that it needs and that are being built at that time.
+        """
+        futures: List[Future[None]] = []
+        for metric in self._semantic_manifest.metrics:
+            futures.append(executor.submit(self._warm_up_metric, metric.name))
+        futures.append(executor.submit(self._warm_up_no_metric_linkable_element_set))
+        return futures
+
+    def _warm_up_metric(self, metric_name: str) -> None:
+        self._get_metric_linkable_element_sets(metric_name)
+
+    def _warm_up_no_metric_linkable_element_set(self) -> None:
+        self._get_no_metric_linkable_element_set()
+
+    def _all_entity_references(self) -> Sequence[EntityReference]:
+        return tuple(EntityReference(entity_name) for entity_name in self._entity_to_semantic_model)
+
+    def _measures_for_metric_linkable_elements(self, metric: Metric) -> Sequence[MeasureReference]:
+        """Returns the measures of the metric that define the elements that the metric can be queried with."""
+        if metric.type is MetricType.CONVERSION:
+            conversion_type_params = metric.type_params.conversion_type_params
+            assert conversion_type_params, "A conversion metric should have type_params.conversion_type_params defined."
+            # Only can query against the base measure's linkable elements as it joins everything back to the base
+            # measure data set so there is no way of getting the conversion elements
+            return tuple(
+                measure
+                for measure in metric.measure_references
+                if measure == conversion_type_params.base_measure.measure_reference
+            )
+        elif (
+            metric.type is MetricType.SIMPLE
+            or metric.type is MetricType.DERIVED
+            or metric.type is MetricType.RATIO
+            or metric.type is MetricType.CUMULATIVE
+        ):
+            return tuple(metric.measure_references)
+        else:
+            assert_values_exhausted(metric.type)
+
+    def _get_metric_linkable_element_sets(self, metric_name: str) -> Optional[Sequence[LinkableElementSet]]:
+        """Returns the linkable element sets for each of the measures of the metric, or None for an unknown metric."""
+        if MetricReference(metric_name) not in self._metric_references_to_metrics:
+            return None
+        return self._metric_to_linkable_element_sets.get_or_build(metric_name, self._build_metric_linkable_element_sets)
+
+    def _build_metric_linkable_element_sets(self, metric_name: str) -> List[LinkableElementSet]:
+        metric = self._metric_references_to_metrics[MetricReference(metric_name)]
+        linkable_sets_for_measure = []
+        for measure in self._measures_for_metric_linkable_elements(metric):
+            # Cumulative metrics currently can't be queried by other time granularities.
+            if metric.type is MetricType.CUMULATIVE:
+                linkable_sets_for_measure.append(
+                    self._get_unfiltered_linkable_element_set_for_measure(measure).filter(
+                        with_any_of=LinkableElementProperty.all_properties(),
+                        # Use filter() here becasue `without_all_of` param is only available on that method.
+                        without_all_of=frozenset(
+                            {
+                                LinkableElementProperty.METRIC_TIME,
+                                LinkableElementProperty.DERIVED_TIME_GRANULARITY,
+                            }
+                        ),
                     )
-                elif (
-                    metric.type is MetricType.SIMPLE
-                    or metric.type is MetricType.DERIVED
-                    or metric.type is MetricType.RATIO
-                ):
-                    linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
-                elif metric.type is MetricType.CONVERSION:
-                    conversion_type_params = metric.type_params.conversion_type_params
-                    assert (
-                        conversion_type_params
-                    ), "A conversion metric should have type_params.conversion_type_params defined."
-                    if measure == conversion_type_params.base_measure.measure_reference:
-                        # Only can query against the base measure's linkable elements
-                        # as it joins everything back to the base measure data set so
-                        # there is no way of getting the conversion elements
-                        linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
-                else:
-                    assert_values_exhausted(metric.type)
-
-            self._metric_to_linkable_element_sets[metric.name] = linkable_sets_for_measure
-
-        # Populate storage dicts with linkable metrics. This loop must happen after the one above so that
-        # _metric_to_linkable_element_sets is populated with entities and dimensions.
-        linkable_metrics_start_time = time.time()
+                )
+            else:
+                linkable_sets_for_measure.append(self._get_unfiltered_linkable_element_set_for_measure(measure))
+        return linkable_sets_for_measure
+
+    def _get_metric_linkable_entity_set(self, metric: Metric) -> LinkableElementSet:
+        """Returns the entities that the metric can be queried with.
+
+        This is the same as the entities in `get_linkable_elements_for_metrics()` for the metric, but only the
+        entities are built for the measures of the metric. The filter for cumulative metrics only removes metric_time
+        elements, so it doesn't apply here.
+        """
+        return self._metric_to_linkable_entity_set.get_or_build(metric.name, self._build_metric_linkable_entity_set)
+
+    def _build_metric_linkable_entity_set(self, metric_name: str) -> LinkableElementSet:
+        metric = self._metric_references_to_metrics[MetricReference(metric_name)]
+        return LinkableElementSet.intersection_by_path_key(
+            [
+                self._measure_to_linkable_entity_set.get_or_build(
+                    measure, self._build_measure_linkable_entity_set
+                ).only_unique_path_keys.filter(with_any_of=LinkableElementProperty.all_properties())
+                for measure in self._measures_for_metric_linkable_elements(metric)
+            ]
+        )
+
+    def _build_measure_linkable_entity_set(self, measure_reference: MeasureReference) -> LinkableElementSet:
+        """Returns the entities in `_get_unfiltered_linkable_element_set_for_measure()` without building the rest."""
+        measure_semantic_model = self._get_semantic_model_for_measure(measure_reference)
+        return LinkableElementSet.merge_by_path_key(
+            (
+                LinkableElementSet(
+                    path_key_to_linkable_entities=self._get_elements_in_semantic_model(
+                        measure_semantic_model
+                    ).path_key_to_linkable_entities
+                ),
+                self._get_joined_entities(measure_semantic_model),
+            )
+        )
+
+    def _get_joinable_metrics_for_entity(self, entity_reference: EntityReference) -> Set[MetricSubqueryJoinPathElement]:
+        """Returns the metrics that can be joined to the entity."""
+        return self._joinable_metrics_for_entities.get_or_build(
+            entity_reference, self._build_joinable_metrics_for_entity
+        )
+
+    def _build_joinable_metrics_for_entity(
+        self, entity_reference: EntityReference
+    ) -> Set[MetricSubqueryJoinPathElement]:
+        # A metric can only be joined to the entity if one of its measures is in a semantic model that's within
+        # `max_entity_links` joins of a semantic model with the entity, so other metrics can be skipped.
+        semantic_models_near_entity = semantic_models_within_join_distance(
+            semantic_manifest=self._semantic_manifest,
+            semantic_model_references=frozenset(
+                semantic_model.reference
+                for semantic_model in self._entity_to_semantic_model[entity_reference.element_name]
+            ),
+            max_entity_links=self._max_entity_links,
+        )
+
+        joinable_metrics: Set[MetricSubqueryJoinPathElement] = set()
         for metric in self._semantic_manifest.metrics:
-            # Cumulative metrics and time offset metrics require grouping by metric_time, which is not yet available for
-            # linkable metrics. So skip those.
+            # Cumulative metrics and time offset metrics require grouping by metric_time, which is not yet
+            # available for linkable metrics. So skip those.
             if self._metric_requires_metric_time(metric):
                 continue
-            metric_reference = MetricReference(metric.name)
-            linkable_element_set_for_metric = self.get_linkable_elements_for_metrics([metric_reference])
             defined_from_semantic_models = tuple(
                 self._semantic_model_lookup.get_semantic_model_for_measure(input_measure.measure_reference).reference
                 for input_measure in metric.input_measures
             )
-            for linkable_entities in linkable_element_set_for_metric.path_key_to_linkable_entities.values():
+            if not any(
+                semantic_model_reference in semantic_models_near_entity
+                for semantic_model_reference in defined_from_semantic_models
+            ):
+                continue
+            metric_reference = MetricReference(metric.name)
+            for linkable_entities in self._get_metric_linkable_entity_set(
+                metric
+            ).path_key_to_linkable_entities.values():
                 for linkable_entity in linkable_entities:
+                    if linkable_entity.reference != entity_reference:
+                        continue
                     # TODO: some users encounter a situation in which the entity reference is in the entity links. Debug why.
                     if linkable_entity.reference in linkable_entity.entity_links:
                         logger.info(f"Found entity reference in entity links for linkable entity: {linkable_entity}")
                         continue
-                    metric_subquery_join_path_element = MetricSubqueryJoinPathElement(
-                        metric_reference=metric_reference,
-                        derived_from_semantic_models=defined_from_semantic_models,
-                        join_on_entity=linkable_entity.reference,
-                        entity_links=linkable_entity.entity_links,
-                        metric_to_entity_join_path=(linkable_entity.join_path if linkable_entity.join_path else None),
-                    )
-                    self._joinable_metrics_for_entities[linkable_entity.reference].add(
-                        metric_subquery_join_path_element
+                    joinable_metrics.add(
+                        MetricSubqueryJoinPathElement(
+                            metric_reference=metric_reference,
+                            derived_from_semantic_models=defined_from_semantic_models,
+                            join_on_entity=linkable_entity.reference,
+                            entity_links=linkable_entity.entity_links,
+                            metric_to_entity_join_path=(
+                                linkable_entity.join_path if linkable_entity.join_path else None
+                            ),
+                        )
                     )
                     # TODO: update _metric_to_linkable_element_sets to have linkable metrics
+        return joinable_metrics
+
+    def _get_no_metric_linkable_element_set(self) -> LinkableElementSet:
+        """Returns the elements that can be queried without metrics."""
+        if self._no_metric_linkable_element_set is not None:
+            return self._no_metric_linkable_element_set
+
+        with self._no_metric_linkable_element_set_lock:
+            if self._no_metric_linkable_element_set is not None:
+                return self._no_metric_linkable_element_set
+
+            # If no metrics are specified, the query interface supports querying distinct values for dimensions,
+            # entities, and group by metrics.
+            linkable_element_sets_for_no_metrics_queries: List[LinkableElementSet] = []
+            for semantic_model in self._semantic_manifest.semantic_models:
+                linkable_element_sets_for_no_metrics_queries.append(
+                    self.get_joinable_metrics_for_semantic_model(
+                        semantic_model, SemanticModelJoinPath(left_semantic_model_reference=semantic_model.reference)
+                    )
+                )
 
-        # If no metrics are specified, the query interface supports querying distinct values for dimensions, entities,
-        # and group by metrics.
-        linkable_element_sets_for_no_metrics_queries: List[LinkableElementSet] = []
-        # Temp: separate loop to track latency for linkable metrics. TODO: combine with loop below.
-        for semantic_model in semantic_manifest.semantic_models:
-            linkable_element_sets_for_no_metrics_queries.append(
-                self.get_joinable_metrics_for_semantic_model(
-                    semantic_model, SemanticModelJoinPath(left_semantic_model_reference=semantic_model.reference)
+            for semantic_model in self._semantic_manifest.semantic_models:
+                linkable_element_sets_for_no_metrics_queries.append(
+                    self._get_elements_in_semantic_model(semantic_model)
                 )
+
+            metric_time_elements_for_no_metrics = self._get_metric_time_elements(measure_reference=None)
+            self._no_metric_linkable_element_set = LinkableElementSet.merge_by_path_key(
+                linkable_element_sets_for_no_metrics_queries + [metric_time_elements_for_no_metrics]
             )
-        logger.info(f"Building valid linkable metrics took: {time.time() - linkable_metrics_start_time:.2f}s")
+            return self._no_metric_linkable_element_set
+
+    def get_reusable_measure_linkable_element_sets(
+        self, semantic_manifest: SemanticManifest, manifest_diff: SemanticManifestDiff
+    ) -> Dict[MeasureReference, LinkableElementSet]:
+        """Return the linkable element sets for measures that are unaffected by a change to the manifest.
 
-        for semantic_model in semantic_manifest.semantic_models:
-            linkable_element_sets_for_no_metrics_queries.append(self._get_elements_in_semantic_model(semantic_model))
+        The elements for a measure only depend on the semantic models that are within `max_entity_links` joins of the
+        measure's semantic model, so the sets for measures in semantic models that are not within that distance of a
+        modified semantic model (in either version of the manifest) can be reused.
 
-        metric_time_elements_for_no_metrics = self._get_metric_time_elements(measure_reference=None)
-        self._no_metric_linkable_element_set = LinkableElementSet.merge_by_path_key(
-            linkable_element_sets_for_no_metrics_queries + [metric_time_elements_for_no_metrics]
+        Args:
+            semantic_manifest: the new version of the manifest.
+            manifest_diff: the difference between the manifest of this resolver and the new version.
+        """
+        modified_semantic_models = manifest_diff.modified_semantic_models
+        affected_semantic_models = semantic_models_within_join_distance(
+            semantic_manifest=self._semantic_manifest,
+            semantic_model_references=modified_semantic_models,
+            max_entity_links=self._max_entity_links,
+        ).union(
+            semantic_models_within_join_distance(
+                semantic_manifest=semantic_manifest,
+                semantic_model_references=modified_semantic_models,
+                max_entity_links=self._max_entity_links,
+            )
         )
 
-        logger.info(f"Building valid group-by-item indexes took: {time.time() - start_time:.2f}s")
+        measure_to_linkable_element_set = self._measure_to_linkable_element_set.built_values()
+
+        reusable_sets: Dict[MeasureReference, LinkableElementSet] = {}
+        for measure_reference, linkable_element_set in measure_to_linkable_element_set.items():
+            semantic_model = self._semantic_model_lookup.get_semantic_model_for_measure(measure_reference)
+            if semantic_model.reference not in affected_semantic_models:
+                reusable_sets[measure_reference] = linkable_element_set
+
+        logger.info(
+            f"Reusing linkable elements for {len(reusable_sets)} of {len(measure_to_linkable_element_set)} "
+            f"measures after changes to {len(modified_semantic_models)} semantic models"
+        )
+        return reusable_sets
+
+    def _get_unfiltered_linkable_element_set_for_measure(
+        self, measure_reference: MeasureReference
+    ) -> LinkableElementSet:
+        """Returns the elements for a measure while building the indexes, computing them once per measure."""
+        return self._measure_to_linkable_element_set.get_or_build(
+            measure_reference,
+            lambda measure_reference: self._get_linkable_element_set_for_measure(
+                measure_reference, include_linkable_metrics=False
+            ),
+        )
 
     def _metric_requires_metric_time(self, metric: Metric) -> bool:
         """Checks if the metric can only be queried with metric_time. Also checks input metrics.
@@ -301,24 +720,40 @@ class ValidLinkableSpecResolver:
             # The result's properties = properties.union(frozenset({LinkableElementProperty.MULTI_HOP}))
             return LinkableElementSet()
 
-        path_key_to_linkable_metrics: Dict[ElementPathKey, Tuple[LinkableMetric, ...]] = {}
+        memo_key = (semantic_model.reference, using_join_path)
+        result = self._joinable_metrics_for_semantic_model.get(memo_key)
+        if result is not None:
+            return result
+
+        linkable_metrics: List[LinkableMetric] = []
         for entity_reference in [entity.reference for entity in semantic_model.entities]:
             # Avoid creating an entity link cycle.
             if join_path_has_path_links and entity_reference in using_join_path.entity_links:
                 continue
-            for metric_subquery_join_path_element in self._joinable_metrics_for_entities[entity_reference]:
-                linkable_metric = LinkableMetric.create(
-                    properties=properties,
-                    join_path=SemanticModelToMetricSubqueryJoinPath(
-                        metric_subquery_join_path_element=metric_subquery_join_path_element,
-                        semantic_model_join_path=using_join_path,
-                    ),
+            for metric_subquery_join_path_element in self._get_joinable_metrics_for_entity(entity_reference):
+                linkable_metrics.append(
+                    LinkableMetric.create(
+                        properties=properties,
+                        join_path=SemanticModelToMetricSubqueryJoinPath(
+                            metric_subquery_join_path_element=metric_subquery_join_path_element,
+                            semantic_model_join_path=using_join_path,
+                        ),
+                    )
                 )
-                path_key_to_linkable_metrics[linkable_metric.path_key] = path_key_to_linkable_metrics.get(
-                    linkable_metric.path_key, ()
-                ) + (linkable_metric,)
 
-        return LinkableElementSet(path_key_to_linkable_metrics=path_key_to_linkable_metrics)
+        result = LinkableElementSet.create_from_elements(linkable_metrics=linkable_metrics)
+        self._joinable_metrics_for_semantic_model[memo_key] = result
+        return result
+
+    def _get_element_templates(
+        self, semantic_model: SemanticModel, with_properties: FrozenSet[LinkableElementProperty]
+    ) -> _SemanticModelElementTemplates:
+        memo_key = (semantic_model.reference, with_properties)
+        element_templates = self._element_templates.get(memo_key)
+        if element_templates is None:
+            element_templates = _SemanticModelElementTemplates.create(semantic_model, with_properties)
+            self._element_templates[memo_key] = element_templates
+        return element_templates
 
     def _get_elements_in_semantic_model(self, semantic_model: SemanticModel) -> LinkableElementSet:
         """Gets the elements in the semantic model, without requiring any joins.
@@ -326,84 +761,40 @@ class ValidLinkableSpecResolver:
         Elements related to metric_time are handled separately in _get_metric_time_elements().
         Linkable metrics are not considered local to the semantic model since they always require a join.
         """
-        linkable_dimensions = []
+        result = self._semantic_model_to_local_elements.get(semantic_model.reference)
+        if result is not None:
+            return result
+
+        element_templates = self._get_element_templates(semantic_model, frozenset({LinkableElementProperty.LOCAL}))
+        entity_links_for_local_elements = tuple(
+            self._interner.intern((entity_link,))
+            for entity_link in self._semantic_model_lookup.entity_links_for_local_elements(semantic_model)
+        )
+        join_path = self._interner.intern(SemanticModelJoinPath(left_semantic_model_reference=semantic_model.reference))
+
         linkable_entities = []
-        for entity in semantic_model.entities:
-            linkable_entities.append(
-                LinkableEntity.create(
-                    defined_in_semantic_model=semantic_model.reference,
-                    element_name=entity.reference.element_name,
-                    entity_links=(),
-                    join_path=SemanticModelJoinPath(
-                        left_semantic_model_reference=semantic_model.reference,
-                    ),
-                    properties=frozenset({LinkableElementProperty.LOCAL, LinkableElementProperty.ENTITY}),
-                )
-            )
-            for entity_link in self._semantic_model_lookup.entity_links_for_local_elements(semantic_model):
+        for entity_template in element_templates.entity_templates:
+            linkable_entities.append(entity_template.create_linkable_entity(entity_links=(), join_path=join_path))
+            for entity_links in entity_links_for_local_elements:
                 # Avoid creating "booking_id__booking_id"
-                if entity_link == entity.reference:
+                if entity_links[0] == entity_template.entity_reference:
                     continue
                 linkable_entities.append(
-                    LinkableEntity.create(
-                        defined_in_semantic_model=semantic_model.reference,
-                        element_name=entity.reference.element_name,
-                        entity_links=(entity_link,),
-                        join_path=SemanticModelJoinPath(
-                            left_semantic_model_reference=semantic_model.reference,
-                        ),
-                        properties=frozenset({LinkableElementProperty.LOCAL, LinkableElementProperty.ENTITY}),
-                    )
+                    entity_template.create_linkable_entity(entity_links=entity_links, join_path=join_path)
                 )
 
-        for entity_link in self._semantic_model_lookup.entity_links_for_local_elements(semantic_model):
-            dimension_properties = frozenset({LinkableElementProperty.LOCAL})
-            for dimension in semantic_model.dimensions:
-                dimension_type = dimension.type
-                if dimension_type is DimensionType.CATEGORICAL:
-                    linkable_dimensions.append(
-                        LinkableDimension.create(
-                            defined_in_semantic_model=semantic_model.reference,
-                            element_name=dimension.reference.element_name,
-                            dimension_type=DimensionType.CATEGORICAL,
-                            entity_links=(entity_link,),
-                            join_path=SemanticModelJoinPath(
-                                left_semantic_model_reference=semantic_model.reference,
-                            ),
-                            properties=dimension_properties,
-                            time_granularity=None,
-                            date_part=None,
-                        )
-                    )
-                elif dimension_type is DimensionType.TIME:
-                    linkable_dimensions.extend(
-                        _generate_linkable_time_dimensions(
-                            semantic_model_origin=semantic_model.reference,
-                            dimension=dimension,
-                            entity_links=(entity_link,),
-                            join_path=SemanticModelJoinPath(
-                                left_semantic_model_reference=semantic_model.reference,
-                            ),
-                            with_properties=dimension_properties,
-                        )
-                    )
-                else:
-                    assert_values_exhausted(dimension_type)
-
-        path_key_to_linkable_dimensions: Dict[ElementPathKey, Tuple[LinkableDimension, ...]] = {}
-        for linkable_dimension in linkable_dimensions:
-            path_key_to_linkable_dimensions[linkable_dimension.path_key] = path_key_to_linkable_dimensions.get(
-                linkable_dimension.path_key, ()
-            ) + (linkable_dimension,)
-        path_key_to_linkable_entities: Dict[ElementPathKey, Tuple[LinkableEntity, ...]] = {}
-        for linkable_entity in linkable_entities:
-            path_key_to_linkable_entities[linkable_entity.path_key] = path_key_to_linkable_entities.get(
-                linkable_entity.path_key, ()
-            ) + (linkable_entity,)
-        return LinkableElementSet(
-            path_key_to_linkable_dimensions=path_key_to_linkable_dimensions,
-            path_key_to_linkable_entities=path_key_to_linkable_entities,
+        linkable_dimensions = []
+        for entity_links in entity_links_for_local_elements:
+            for dimension_template in element_templates.dimension_templates:
+                linkable_dimensions.append(
+                    dimension_template.create_linkable_dimension(entity_links=entity_links, join_path=join_path)
+                )
+
+        result = LinkableElementSet.create_from_elements(
+            linkable_dimensions=linkable_dimensions, linkable_entities=linkable_entities
         )
+        self._semantic_model_to_local_elements[semantic_model.reference] = result
+        return result
 
     def _get_semantic_models_with_joinable_entity(
         self,
@@ -481,6 +872,17 @@ class ValidLinkableSpecResolver:
                 if min_time_spine_granularity.is_smaller_than_or_equal(time_granularity)
             )
 
+        defined_in_semantic_model = measure_semantic_model.reference if measure_semantic_model else None
+        join_path = self._interner.intern(
+            SemanticModelJoinPath(
+                left_semantic_model_reference=(
+                    measure_semantic_model.reference
+                    if measure_semantic_model
+                    else SemanticModelDerivation.VIRTUAL_SEMANTIC_MODEL_REFERENCE
+                ),
+            )
+        )
+
         # For each of the possible time granularities, create a LinkableDimension.
         path_key_to_linkable_dimensions: Dict[ElementPathKey, List[LinkableDimension]] = defaultdict(list)
         for time_granularity in possible_metric_time_granularities:
@@ -500,32 +902,28 @@ class ValidLinkableSpecResolver:
                     date_part=date_part,
                 )
                 path_key_to_linkable_dimensions[path_key].append(
-                    LinkableDimension.create(
-                        defined_in_semantic_model=measure_semantic_model.reference if measure_semantic_model else None,
-                        element_name=MetricFlowReservedKeywords.METRIC_TIME.value,
-                        dimension_type=DimensionType.TIME,
-                        entity_links=(),
-                        join_path=SemanticModelJoinPath(
-                            left_semantic_model_reference=(
-                                measure_semantic_model.reference
-                                if measure_semantic_model
-                                else SemanticModelDerivation.VIRTUAL_SEMANTIC_MODEL_REFERENCE
+                    self._interner.intern(
+                        LinkableDimension.create(
+                            defined_in_semantic_model=defined_in_semantic_model,
+                            element_name=MetricFlowReservedKeywords.METRIC_TIME.value,
+                            dimension_type=DimensionType.TIME,
+                            entity_links=(),
+                            join_path=join_path,
+                            # Anything that's not at the base time granularity of the measure's aggregation time
+                            # dimension should be considered derived.
+                            properties=(
+                                frozenset({LinkableElementProperty.METRIC_TIME})
+                                if time_granularity is defined_granularity and date_part is None
+                                else frozenset(
+                                    {
+                                        LinkableElementProperty.METRIC_TIME,
+                                        LinkableElementProperty.DERIVED_TIME_GRANULARITY,
+                                    }
+                                )
                             ),
-                        ),
-                        # Anything that's not at the base time granularity of the measure's aggregation time dimension
-                        # should be considered derived.
-                        properties=(
-                            frozenset({LinkableElementProperty.METRIC_TIME})
-                            if time_granularity is defined_granularity and date_part is None
-                            else frozenset(
-                                {
-                                    LinkableElementProperty.METRIC_TIME,
-                                    LinkableElementProperty.DERIVED_TIME_GRANULARITY,
-                                }
-                            )
-                        ),
-                        time_granularity=time_granularity,
-                        date_part=date_part,
+                            time_granularity=time_granularity,
+                            date_part=date_part,
+                        )
                     )
                 )
 
@@ -538,7 +936,40 @@ class ValidLinkableSpecResolver:
 
     def _get_joined_elements(self, measure_semantic_model: SemanticModel) -> LinkableElementSet:
         """Get the elements that can be generated by joining other models to the given model."""
-        # Create single-hop elements
+        result = self._semantic_model_to_joined_elements.get(measure_semantic_model.reference)
+        if result is None:
+            result = LinkableElementSet.merge_by_path_key(
+                [
+                    self.create_linkable_element_set_from_join_path(join_path)
+                    for join_path in self._get_join_paths(measure_semantic_model)
+                ]
+            )
+            self._semantic_model_to_joined_elements[measure_semantic_model.reference] = result
+        return result
+
+    def _get_joined_entities(self, measure_semantic_model: SemanticModel) -> LinkableElementSet:
+        """Get the entities in `_get_joined_elements()`, without creating the other elements."""
+        result = self._semantic_model_to_joined_entities.get(measure_semantic_model.reference)
+        if result is None:
+            result = LinkableElementSet.merge_by_path_key(
+                [
+                    self._create_linkable_entity_set_from_join_path(join_path)
+                    for join_path in self._get_join_paths(measure_semantic_model)
+                ]
+            )
+            self._semantic_model_to_joined_entities[measure_semantic_model.reference] = result
+        return result
+
+    def _get_join_paths(self, measure_semantic_model: SemanticModel) -> Sequence[SemanticModelJoinPath]:
+        """Get the paths for joining other models to the given model, ordered by the number of joins."""
+        result = self._semantic_model_to_join_paths.get(measure_semantic_model.reference)
+        if result is None:
+            result = self._create_join_paths(measure_semantic_model)
+            self._semantic_model_to_join_paths[measure_semantic_model.reference] = result
+        return result
+
+    def _create_join_paths(self, measure_semantic_model: SemanticModel) -> Sequence[SemanticModelJoinPath]:
+        # Create single-hop paths
         join_paths = []
         for entity in measure_semantic_model.entities:
             semantic_models = self._get_semantic_models_with_joinable_entity(
@@ -549,20 +980,18 @@ class ValidLinkableSpecResolver:
                 if semantic_model.name == measure_semantic_model.name:
                     continue
                 join_paths.append(
-                    SemanticModelJoinPath.from_single_element(
-                        left_semantic_model_reference=measure_semantic_model.reference,
-                        right_semantic_model_reference=semantic_model.reference,
-                        join_on_entity=entity.reference,
+                    self._interner.intern(
+                        SemanticModelJoinPath.from_single_element(
+                            left_semantic_model_reference=measure_semantic_model.reference,
+                            right_semantic_model_reference=semantic_model.reference,
+                            join_on_entity=entity.reference,
+                        )
                     )
                 )
-        single_hop_elements = LinkableElementSet.merge_by_path_key(
-            [self.create_linkable_element_set_from_join_path(join_path) for join_path in join_paths]
-        )
-
-        # Create multi-hop elements. At each iteration, we generate the list of valid elements based on the current join
-        # path, extend all paths to include the next valid semantic model, then repeat.
-        multi_hop_elements = LinkableElementSet()
+        all_join_paths = list(join_paths)
 
+        # Create multi-hop paths. At each iteration, extend all paths to include the next valid semantic model, then
+        # repeat.
         for _ in range(self._max_entity_links - 1):
             new_join_paths: List[SemanticModelJoinPath] = []
             for join_path in join_paths:
@@ -575,29 +1004,29 @@ class ValidLinkableSpecResolver:
             if len(new_join_paths) == 0:
                 break
 
-            multi_hop_elements = LinkableElementSet.merge_by_path_key(
-                (multi_hop_elements,)
-                + tuple(
-                    self.create_linkable_element_set_from_join_path(new_join_path) for new_join_path in new_join_paths
-                )
-            )
+            all_join_paths.extend(new_join_paths)
             join_paths = new_join_paths
 
-        return LinkableElementSet.merge_by_path_key((single_hop_elements, multi_hop_elements))
+        return all_join_paths
 
     def _get_linkable_element_set_for_measure(
         self,
         measure_reference: MeasureReference,
         with_any_of: FrozenSet[LinkableElementProperty] = LinkableElementProperty.all_properties(),
         without_any_of: FrozenSet[LinkableElementProperty] = frozenset(),
+        include_linkable_metrics: bool = True,
     ) -> LinkableElementSet:
         """See get_linkable_element_set_for_measure()."""
         measure_semantic_model = self._get_semantic_model_for_measure(measure_reference)
 
         elements_in_semantic_model = self._get_elements_in_semantic_model(measure_semantic_model)
-        metrics_linked_to_semantic_model = self.get_joinable_metrics_for_semantic_model(
-            semantic_model=measure_semantic_model,
-            using_join_path=SemanticModelJoinPath(left_semantic_model_reference=measure_semantic_model.reference),
+        metrics_linked_to_semantic_model = (
+            self.get_joinable_metrics_for_semantic_model(
+                semantic_model=measure_semantic_model,
+                using_join_path=SemanticModelJoinPath(left_semantic_model_reference=measure_semantic_model.reference),
+            )
+            if include_linkable_metrics
+            else LinkableElementSet()
         )
         metric_time_elements = self._get_metric_time_elements(measure_reference)
         joined_elements = self._get_joined_elements(measure_semantic_model)
@@ -636,7 +1065,7 @@ class ValidLinkableSpecResolver:
 
         A distinct group-by-item values query does not include any metrics.
         """
-        return self._no_metric_linkable_element_set.filter(with_any_of=with_any_of, without_any_of=without_any_of)
+        return self._get_no_metric_linkable_element_set().filter(with_any_of=with_any_of, without_any_of=without_any_of)
 
     def get_linkable_elements_for_metrics(
         self,
@@ -647,7 +1076,7 @@ class ValidLinkableSpecResolver:
         """Gets the valid linkable elements that are common to all requested metrics."""
         linkable_element_sets = []
         for metric_reference in metric_references:
-            element_sets = self._metric_to_linkable_element_sets.get(metric_reference.element_name)
+            element_sets = self._get_metric_linkable_element_sets(metric_reference.element_name)
             if not element_sets:
                 raise UnknownMetricLinkingError(f"Unknown metric: {metric_reference} in element set")
 
@@ -704,7 +1133,7 @@ class ValidLinkableSpecResolver:
                         ),
                     ),
                 )
-                new_join_paths.append(new_join_path)
+                new_join_paths.append(self._interner.intern(new_join_path))
 
         return new_join_paths
 
@@ -713,71 +1142,47 @@ class ValidLinkableSpecResolver:
         join_path: SemanticModelJoinPath,
     ) -> LinkableElementSet:
         """Given the current path, generate the respective linkable elements from the last semantic model in the path."""
+        semantic_model, element_templates = self._get_join_path_element_templates(join_path)
+        entity_links = join_path.entity_links
+        joinable_metrics = self.get_joinable_metrics_for_semantic_model(
+            semantic_model=semantic_model, using_join_path=join_path
+        )
+        return LinkableElementSet.create_from_elements(
+            linkable_dimensions=(
+                dimension_template.create_linkable_dimension(entity_links=entity_links, join_path=join_path)
+                for dimension_template in element_templates.dimension_templates
+            ),
+            linkable_entities=self._create_linkable_entities_from_join_path(join_path, element_templates),
+            linkable_metrics=itertools.chain.from_iterable(joinable_metrics.path_key_to_linkable_metrics.values()),
+        )
+
+    def _create_linkable_entity_set_from_join_path(self, join_path: SemanticModelJoinPath) -> LinkableElementSet:
+        """Similar to `create_linkable_element_set_from_join_path()`, but only generates the entities."""
+        _, element_templates = self._get_join_path_element_templates(join_path)
+        return LinkableElementSet.create_from_elements(
+            linkable_entities=self._create_linkable_entities_from_join_path(join_path, element_templates)
+        )
+
+    def _get_join_path_element_templates(
+        self, join_path: SemanticModelJoinPath
+    ) -> Tuple[SemanticModel, _SemanticModelElementTemplates]:
+        """Returns the last semantic model in the path and the templates for the elements reached through the path."""
         properties = frozenset({LinkableElementProperty.JOINED})
         if len(join_path.path_elements) > 1:
             properties = properties.union({LinkableElementProperty.MULTI_HOP})
 
         semantic_model = self._semantic_model_lookup.get_by_reference(join_path.last_semantic_model_reference)
         assert semantic_model
+        return semantic_model, self._get_element_templates(semantic_model, properties)
 
-        linkable_dimensions: List[LinkableDimension] = []
-        linkable_entities: List[LinkableEntity] = []
-
-        for dimension in semantic_model.dimensions:
-            dimension_type = dimension.type
-            if dimension_type == DimensionType.CATEGORICAL:
-                linkable_dimensions.append(
-                    LinkableDimension.create(
-                        defined_in_semantic_model=semantic_model.reference,
-                        element_name=dimension.reference.element_name,
-                        dimension_type=DimensionType.CATEGORICAL,
-                        entity_links=join_path.entity_links,
-                        join_path=join_path,
-                        properties=properties,
-                        time_granularity=None,
-                        date_part=None,
-                    )
-                )
-            elif dimension_type == DimensionType.TIME:
-                linkable_dimensions.extend(
-                    _generate_linkable_time_dimensions(
-                        semantic_model_origin=semantic_model.reference,
-                        dimension=dimension,
-                        entity_links=join_path.entity_links,
-                        join_path=join_path,
-                        with_properties=properties,
-                    )
-                )
-            else:
-                raise RuntimeError(f"Unhandled type: {dimension_type}")
-
-        for entity in semantic_model.entities:
+    @staticmethod
+    def _create_linkable_entities_from_join_path(
+        join_path: SemanticModelJoinPath, element_templates: _SemanticModelElementTemplates
+    ) -> Sequence[LinkableEntity]:
+        entity_links = join_path.entity_links
+        return tuple(
+            entity_template.create_linkable_entity(entity_links=entity_links, join_path=join_path)
+            for entity_template in element_templates.entity_templates
             # Avoid creating "booking_id__booking_id"
-            if entity.reference != join_path.last_entity_link:
-                linkable_entities.append(
-                    LinkableEntity.create(
-                        defined_in_semantic_model=semantic_model.reference,
-                        element_name=entity.reference.element_name,
-                        entity_links=join_path.entity_links,
-                        join_path=join_path,
-                        properties=properties.union({LinkableElementProperty.ENTITY}),
-                    )
-                )
-
-        path_key_to_linkable_dimensions: Dict[ElementPathKey, Tuple[LinkableDimension, ...]] = {}
-        for linkable_dimension in linkable_dimensions:
-            path_key_to_linkable_dimensions[linkable_dimension.path_key] = path_key_to_linkable_dimensions.get(
-                linkable_dimension.path_key, ()
-            ) + (linkable_dimension,)
-        path_key_to_linkable_entities: Dict[ElementPathKey, Tuple[LinkableEntity, ...]] = {}
-        for linkable_entity in linkable_entities:
-            path_key_to_linkable_entities[linkable_entity.path_key] = path_key_to_linkable_entities.get(
-                linkable_entity.path_key, ()
-            ) + (linkable_entity,)
-        return LinkableElementSet(
-            path_key_to_linkable_dimensions=path_key_to_linkable_dimensions,
-            path_key_to_linkable_entities=path_key_to_linkable_entities,
-            path_key_to_linkable_metrics=self.get_joinable_metrics_for_semantic_model(
-                semantic_model=semantic_model, using_join_path=join_path
-            ).path_key_to_linkable_metrics,
+            if entity_template.entity_reference != join_path.last_entity_link
         )
@@ -3,7 +3,8 @@ from __future__ import annotations
 import functools
 import logging
 import time
-from typing import Dict, FrozenSet, Optional, Sequence, Set
+from concurrent.futures import Executor, Future
+from typing import Dict, FrozenSet, Mapping, Optional, Sequence, Set
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.protocols.metric import Metric, MetricInputMeasure, MetricType
@@ -13,8 +14,10 @@ from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
 
 from metricflow_semantics.errors.error_classes import DuplicateMetricError, MetricNotFoundError, NonExistentMeasureError
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
 from metricflow_semantics.model.semantics.linkable_element_set import LinkableElementSet
 from metricflow_semantics.model.semantics.linkable_spec_resolver import (
+    ValidLinkableSpecIndexes,
     ValidLinkableSpecResolver,
 )
 from metricflow_semantics.model.semantics.semantic_model_join_evaluator import MAX_JOIN_HOPS
@@ -27,12 +30,22 @@ logger = logging.getLogger(__name__)
 class MetricLookup:
     """Tracks semantic information for metrics by linking them to semantic models."""
 
-    def __init__(self, semantic_manifest: SemanticManifest, semantic_model_lookup: SemanticModelLookup) -> None:
+    def __init__(
+        self,
+        semantic_manifest: SemanticManifest,
+        semantic_model_lookup: SemanticModelLookup,
+        linkable_spec_indexes: Optional[ValidLinkableSpecIndexes] = None,
+        reusable_measure_linkable_element_sets: Optional[Mapping[MeasureReference, LinkableElementSet]] = None,
+        lazy_linkable_spec_indexes: bool = False,
+    ) -> None:
         """Initializer.
 
         Args:
             semantic_manifest: used to fetch and load the metrics and initialize the linkable spec resolver
             semantic_model_lookup: provides access to semantic model metadata for various lookup operations
+            linkable_spec_indexes: indexes previously built for the same manifest, used to skip building them
+            reusable_measure_linkable_element_sets: linkable elements for measures that are unaffected by a change
+            lazy_linkable_spec_indexes: build the indexes of the linkable spec resolver on first access
         """
         self._metrics: Dict[MetricReference, Metric] = {}
         self._semantic_model_lookup = semantic_model_lookup
@@ -44,6 +57,29 @@ class MetricLookup:
             semantic_manifest=semantic_manifest,
             semantic_model_lookup=semantic_model_lookup,
             max_entity_links=MAX_JOIN_HOPS,
+            indexes=linkable_spec_indexes,
+            reusable_measure_linkable_element_sets=reusable_measure_linkable_element_sets,
+            lazy=lazy_linkable_spec_indexes,
+        )
+
+    @property
+    def linkable_spec_indexes(self) -> ValidLinkableSpecIndexes:
+        """The indexes built by the linkable spec resolver."""
+        return self._linkable_spec_resolver.indexes
+
+    def warm_up(self, executor: Executor) -> Sequence[Future[None]]:
+        """Build the indexes of a lazy resolver in the background. See `ValidLinkableSpecResolver.warm_up`."""
+        return self._linkable_spec_resolver.warm_up(executor)
+
+    def get_reusable_measure_linkable_element_sets(
+        self, semantic_manifest: SemanticManifest, manifest_diff: SemanticManifestDiff
+    ) -> Dict[MeasureReference, LinkableElementSet]:
+        """Return the measure element sets that can be reused for the new manifest.
+
+        See `ValidLinkableSpecResolver.get_reusable_measure_linkable_element_sets`.
+        """
+        return self._linkable_spec_resolver.get_reusable_measure_linkable_element_sets(
+            semantic_manifest=semantic_manifest, manifest_diff=manifest_diff
         )
 
     @functools.lru_cache
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as pkg_version
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# The packages with the code that's used to build the objects in a snapshot.
+_SNAPSHOT_PACKAGE_NAMES = ("dbt-semantic-interfaces", "metricflow-semantics")
+
+
+def hash_semantic_manifest_json(manifest_json_string: str) -> str:
+    """Return the hash of the semantic manifest JSON that snapshots built from it are keyed on."""
+    return hashlib.sha256(manifest_json_string.encode()).hexdigest()
+
+
+def _package_versions() -> Tuple[Tuple[str, str], ...]:
+    package_versions = []
+    for package_name in _SNAPSHOT_PACKAGE_NAMES:
+        try:
+            package_version = pkg_version(package_name)
+        except PackageNotFoundError:
+            package_version = "unknown"
+        package_versions.append((package_name, package_version))
+    return tuple(package_versions)
+
+
+@dataclass(frozen=True)
+class SnapshotFileHeader:
+    """Identifies the manifest and the code that the object in a snapshot file was built with.
+
+    The header is written before the object so that a stale snapshot can be rejected without reading the rest.
+    """
+
+    snapshot_name: str
+    format_version: int
+    package_versions: Tuple[Tuple[str, str], ...]
+    manifest_hash: str
+
+    @staticmethod
+    def create(snapshot_name: str, format_version: int, manifest_hash: str) -> SnapshotFileHeader:
+        """Create a header for the current versions of the packages.
+
+        Args:
+            snapshot_name: the kind of object in the snapshot.
+            format_version: incremented when the layout of the object, or how it's built, changes.
+            manifest_hash: the hash of the manifest JSON from `hash_semantic_manifest_json`.
+        """
+        return SnapshotFileHeader(
+            snapshot_name=snapshot_name,
+            format_version=format_version,
+            package_versions=_package_versions(),
+            manifest_hash=manifest_hash,
+        )
+
+
+def write_snapshot_file(snapshot_path: Path, header: SnapshotFileHeader, snapshot_object: object) -> None:
+    """Write the header and the object to the snapshot file.
+
+    The file is replaced atomically, so that concurrent readers never see a partial file. Errors are logged as the
+    snapshot is only used to skip recomputing the object.
+    """
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=snapshot_path.parent, prefix=snapshot_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(snapshot_object, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, snapshot_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    except Exception:
+        logger.warning(f"Unable to write the snapshot to {str(snapshot_path)!r}", exc_info=True)
+        return
+    logger.info(f"Wrote the snapshot to {str(snapshot_path)!r}")
+
+
+def read_snapshot_file(snapshot_path: Path, expected_header: SnapshotFileHeader) -> Optional[object]:
+    """Read the object in the snapshot file.
+
+    Returns None if there is no snapshot, if it can't be read, or if its header doesn't match the expected one. The
+    caller should check the type of the returned object.
+    """
+    try:
+        with open(snapshot_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            header = pickle.load(buffer)
+            if header != expected_header:
+                logger.info(f"Ignoring stale snapshot at {str(snapshot_path)!r}")
+                return None
+            snapshot_object = pickle.load(buffer)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning(f"Unable to read the snapshot at {str(snapshot_path)!r}", exc_info=True)
+        return None
+
+    logger.info(f"Read the snapshot at {str(snapshot_path)!r}")
+    return snapshot_object
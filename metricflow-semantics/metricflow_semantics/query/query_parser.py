@@ -18,6 +18,7 @@ from metricflow_semantics.assert_one_arg import assert_at_most_one_arg_set
 from metricflow_semantics.filters.merge_where import merge_to_single_where_filter
 from metricflow_semantics.filters.time_constraint import TimeRangeConstraint
 from metricflow_semantics.mf_logging.formatting import indent
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.mf_logging.runtime import log_runtime
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
@@ -416,20 +417,24 @@ class MetricFlowQueryParser:
                 )
 
             logger.info(
-                "Converted group-by-item input:\n"
-                + indent(f"Input: {repr(group_by_name)}")
-                + "\n"
-                + indent(f"Resolver Input: {mf_pformat(resolver_input_for_group_by_item)}")
+                LazyFormat(
+                    lambda: "Converted group-by-item input:\n"
+                    + indent(f"Input: {repr(group_by_name)}")
+                    + "\n"
+                    + indent(f"Resolver Input: {mf_pformat(resolver_input_for_group_by_item)}")
+                )
             )
 
         for group_by_parameter in group_by:
             resolver_input_for_group_by_parameter = group_by_parameter.query_resolver_input
             resolver_inputs_for_group_by_items.append(resolver_input_for_group_by_parameter)
             logger.info(
-                "Converted group-by-item input:\n"
-                + indent(f"Input: {repr(group_by_parameter)}")
-                + "\n"
-                + indent(f"Resolver Input: {mf_pformat(resolver_input_for_group_by_parameter)}")
+                LazyFormat(
+                    lambda: "Converted group-by-item input:\n"
+                    + indent(f"Input: {repr(group_by_parameter)}")
+                    + "\n"
+                    + indent(f"Resolver Input: {mf_pformat(resolver_input_for_group_by_parameter)}")
+                )
             )
 
         where_filters: List[PydanticWhereFilter] = []
@@ -467,11 +472,11 @@ class MetricFlowQueryParser:
             min_max_only=resolver_input_for_min_max_only,
         )
 
-        logger.info("Resolver input for query is:\n" + indent(mf_pformat(resolver_input_for_query)))
+        logger.info(LazyFormat(lambda: "Resolver input for query is:\n" + indent(mf_pformat(resolver_input_for_query))))
 
         query_resolution = query_resolver.resolve_query(resolver_input_for_query)
 
-        logger.info("Query resolution is:\n" + indent(mf_pformat(query_resolution)))
+        logger.info(LazyFormat(lambda: "Query resolution is:\n" + indent(mf_pformat(query_resolution))))
 
         self._raise_exception_if_there_are_errors(
             input_to_issue_set=query_resolution.input_to_issue_set.merge(
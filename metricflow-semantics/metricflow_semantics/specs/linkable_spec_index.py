@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import cached_property
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.references import EntityReference
+
+from metricflow_semantics.specs.instance_spec import InstanceSpec, LinkableInstanceSpec
+from metricflow_semantics.specs.spec_set import InstanceSpecSet, group_specs_by_type
+
+
+class LinkableSpecGroupIndex:
+    """Hash lookups for a group of linkable specs of the same type, e.g. all dimension specs.
+
+    The order of the specs is preserved in the results, so lookups return the same specs in the same order as a scan
+    of the group.
+    """
+
+    def __init__(self, specs: Sequence[LinkableInstanceSpec]) -> None:  # noqa: D107
+        self._element_name_to_specs: Dict[str, List[LinkableInstanceSpec]] = defaultdict(list)
+        self._entity_link_suffix_to_min_length: Dict[Tuple[EntityReference, ...], int] = {}
+
+        for spec in specs:
+            self._element_name_to_specs[spec.element_name].append(spec)
+            entity_links = spec.entity_links
+            entity_link_count = len(entity_links)
+            # An empty suffix only matches specs without entity links. See `EntityLinkPattern`.
+            suffixes = (
+                (entity_links[-suffix_length:] for suffix_length in range(1, entity_link_count + 1))
+                if entity_link_count > 0
+                else ((),)
+            )
+            for suffix in suffixes:
+                min_length = self._entity_link_suffix_to_min_length.get(suffix)
+                if min_length is None or entity_link_count < min_length:
+                    self._entity_link_suffix_to_min_length[suffix] = entity_link_count
+
+    def specs_with_element_name(self, element_name: str) -> Sequence[LinkableInstanceSpec]:
+        """Return the specs with the given element name."""
+        return self._element_name_to_specs.get(element_name, ())
+
+    def min_entity_link_count(self, entity_link_suffix: Tuple[EntityReference, ...]) -> Optional[int]:
+        """Return the fewest entity links of the specs with entity links ending in the given suffix.
+
+        Returns None if there are no such specs.
+        """
+        return self._entity_link_suffix_to_min_length.get(entity_link_suffix)
+
+
+class LinkableSpecIndex:
+    """An index over candidate specs that allows spec patterns to find matches without scanning all candidates.
+
+    The index for each type of spec is built on first use. See `SpecPattern.match_indexed()`.
+    """
+
+    def __init__(self, specs: Sequence[InstanceSpec]) -> None:  # noqa: D107
+        self._specs = specs
+
+    @property
+    def specs(self) -> Sequence[InstanceSpec]:
+        """The specs in the index in the original order."""
+        return self._specs
+
+    @cached_property
+    def spec_set(self) -> InstanceSpecSet:
+        """The specs in the index grouped by type."""
+        return group_specs_by_type(self._specs)
+
+    @cached_property
+    def dimension_index(self) -> LinkableSpecGroupIndex:  # noqa: D102
+        return LinkableSpecGroupIndex(self.spec_set.dimension_specs)
+
+    @cached_property
+    def time_dimension_index(self) -> LinkableSpecGroupIndex:  # noqa: D102
+        return LinkableSpecGroupIndex(self.spec_set.time_dimension_specs)
+
+    @cached_property
+    def entity_index(self) -> LinkableSpecGroupIndex:  # noqa: D102
+        return LinkableSpecGroupIndex(self.spec_set.entity_specs)
+
+    @cached_property
+    def group_by_metric_index(self) -> LinkableSpecGroupIndex:  # noqa: D102
+        return LinkableSpecGroupIndex(self.spec_set.group_by_metric_specs)
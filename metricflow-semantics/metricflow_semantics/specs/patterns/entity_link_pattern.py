@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from enum import Enum
+from itertools import chain
 from typing import Any, List, Optional, Sequence, Tuple
 
 from dbt_semantic_interfaces.references import EntityReference
@@ -12,6 +13,7 @@ from more_itertools import is_sorted
 from typing_extensions import override
 
 from metricflow_semantics.specs.instance_spec import InstanceSpec, LinkableInstanceSpec
+from metricflow_semantics.specs.linkable_spec_index import LinkableSpecGroupIndex, LinkableSpecIndex
 from metricflow_semantics.specs.patterns.spec_pattern import SpecPattern
 from metricflow_semantics.specs.spec_set import group_specs_by_type
 
@@ -92,16 +94,16 @@ class EntityLinkPattern(SpecPattern):
 
     parameter_set: EntityLinkPatternParameterSet
 
-    def _match_entity_links(self, candidate_specs: Sequence[LinkableInstanceSpec]) -> Sequence[LinkableInstanceSpec]:
+    def _entity_links_match(self, candidate_spec: LinkableInstanceSpec) -> bool:
         assert self.parameter_set.entity_links is not None
         num_links_to_check = len(self.parameter_set.entity_links)
+        return (
+            self.parameter_set.entity_links[-num_links_to_check:] == candidate_spec.entity_links[-num_links_to_check:]
+        )
+
+    def _match_entity_links(self, candidate_specs: Sequence[LinkableInstanceSpec]) -> Sequence[LinkableInstanceSpec]:
         matching_specs: Sequence[LinkableInstanceSpec] = tuple(
-            candidate_spec
-            for candidate_spec in candidate_specs
-            if (
-                self.parameter_set.entity_links[-num_links_to_check:]
-                == candidate_spec.entity_links[-num_links_to_check:]
-            )
+            candidate_spec for candidate_spec in candidate_specs if self._entity_links_match(candidate_spec)
         )
 
         if len(matching_specs) <= 1:
@@ -121,6 +123,60 @@ class EntityLinkPattern(SpecPattern):
         if ParameterSetField.ENTITY_LINKS in self.parameter_set.fields_to_compare:
             filtered_candidate_specs = self._match_entity_links(filtered_candidate_specs)
 
+        return self._match_other_fields(filtered_candidate_specs)
+
+    def _group_indexes(self, spec_index: LinkableSpecIndex) -> Sequence[LinkableSpecGroupIndex]:
+        """Return the indexes for the types of specs that this pattern matches, in the order used by match()."""
+        return (
+            spec_index.dimension_index,
+            spec_index.time_dimension_index,
+            spec_index.entity_index,
+            spec_index.group_by_metric_index,
+        )
+
+    @override
+    def match_indexed(self, spec_index: LinkableSpecIndex) -> Sequence[LinkableInstanceSpec]:
+        if (
+            ParameterSetField.ELEMENT_NAME not in self.parameter_set.fields_to_compare
+            or self.parameter_set.element_name is None
+        ):
+            return self.match(spec_index.specs)
+
+        group_indexes = self._group_indexes(spec_index)
+        candidate_specs: Sequence[LinkableInstanceSpec] = tuple(
+            chain.from_iterable(
+                group_index.specs_with_element_name(self.parameter_set.element_name) for group_index in group_indexes
+            )
+        )
+
+        if ParameterSetField.ENTITY_LINKS in self.parameter_set.fields_to_compare:
+            assert self.parameter_set.entity_links is not None
+            # Like in _match_entity_links(), only the specs with the shortest entity link path are kept, and that
+            # length is determined by all candidates with matching entity links - not only the ones with a matching
+            # name.
+            min_entity_link_counts = tuple(
+                min_entity_link_count
+                for min_entity_link_count in (
+                    group_index.min_entity_link_count(self.parameter_set.entity_links) for group_index in group_indexes
+                )
+                if min_entity_link_count is not None
+            )
+            if len(min_entity_link_counts) == 0:
+                return ()
+            shortest_entity_link_length = min(min_entity_link_counts)
+            candidate_specs = tuple(
+                candidate_spec
+                for candidate_spec in candidate_specs
+                if len(candidate_spec.entity_links) == shortest_entity_link_length
+                and self._entity_links_match(candidate_spec)
+            )
+
+        return self._match_other_fields(candidate_specs)
+
+    def _match_other_fields(
+        self, filtered_candidate_specs: Sequence[LinkableInstanceSpec]
+    ) -> Sequence[LinkableInstanceSpec]:
+        """Match the fields other than the entity links, which are handled separately as they can partially match."""
         other_keys_to_check = set(
             field_to_compare.value for field_to_compare in self.parameter_set.fields_to_compare
         ).difference({ParameterSetField.ENTITY_LINKS.value})
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
     from metricflow_semantics.specs.instance_spec import InstanceSpec
+    from metricflow_semantics.specs.linkable_spec_index import LinkableSpecIndex
 
 
 class SpecPattern(ABC):
@@ -18,6 +19,14 @@ class SpecPattern(ABC):
         """Given candidate specs, return the ones that match this pattern."""
         raise NotImplementedError
 
+    def match_indexed(self, spec_index: LinkableSpecIndex) -> Sequence[InstanceSpec]:
+        """Similar to match(), but the candidate specs are provided as an index.
+
+        Patterns that can use the index to avoid scanning all candidates should override this. The result should be
+        the same as `match(spec_index.specs)`.
+        """
+        return self.match(spec_index.specs)
+
     def matches_any(self, candidate_specs: Sequence[InstanceSpec]) -> bool:
         """Returns true if this spec matches any of the given specs."""
         return len(self.match(candidate_specs)) > 0
@@ -14,6 +14,7 @@ from typing_extensions import override
 
 from metricflow_semantics.naming.linkable_spec_name import StructuredLinkableSpecName
 from metricflow_semantics.specs.instance_spec import InstanceSpec, LinkableInstanceSpec
+from metricflow_semantics.specs.linkable_spec_index import LinkableSpecGroupIndex, LinkableSpecIndex
 from metricflow_semantics.specs.patterns.entity_link_pattern import (
     EntityLinkPattern,
     EntityLinkPatternParameterSet,
@@ -35,6 +36,10 @@ class DimensionPattern(EntityLinkPattern):
         filtered_specs: Sequence[LinkableInstanceSpec] = spec_set.dimension_specs + spec_set.time_dimension_specs
         return super().match(filtered_specs)
 
+    @override
+    def _group_indexes(self, spec_index: LinkableSpecIndex) -> Sequence[LinkableSpecGroupIndex]:
+        return (spec_index.dimension_index, spec_index.time_dimension_index)
+
     @staticmethod
     def from_call_parameter_set(  # noqa: D102
         dimension_call_parameter_set: DimensionCallParameterSet,
@@ -63,6 +68,10 @@ class TimeDimensionPattern(EntityLinkPattern):
         spec_set = group_specs_by_type(candidate_specs)
         return super().match(spec_set.time_dimension_specs)
 
+    @override
+    def _group_indexes(self, spec_index: LinkableSpecIndex) -> Sequence[LinkableSpecGroupIndex]:
+        return (spec_index.time_dimension_index,)
+
     @staticmethod
     def from_call_parameter_set(
         time_dimension_call_parameter_set: TimeDimensionCallParameterSet,
@@ -104,6 +113,10 @@ class EntityPattern(EntityLinkPattern):
         spec_set = group_specs_by_type(candidate_specs)
         return super().match(spec_set.entity_specs)
 
+    @override
+    def _group_indexes(self, spec_index: LinkableSpecIndex) -> Sequence[LinkableSpecGroupIndex]:
+        return (spec_index.entity_index,)
+
     @staticmethod
     def from_call_parameter_set(entity_call_parameter_set: EntityCallParameterSet) -> EntityPattern:  # noqa: D102
         return EntityPattern(
@@ -127,6 +140,10 @@ class GroupByMetricPattern(EntityLinkPattern):
         spec_set = group_specs_by_type(candidate_specs)
         return super().match(spec_set.group_by_metric_specs)
 
+    @override
+    def _group_indexes(self, spec_index: LinkableSpecIndex) -> Sequence[LinkableSpecGroupIndex]:
+        return (spec_index.group_by_metric_index,)
+
     @staticmethod
     def from_call_parameter_set(  # noqa: D102
         metric_call_parameter_set: MetricCallParameterSet,
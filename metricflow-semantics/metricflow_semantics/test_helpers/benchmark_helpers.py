@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class BenchmarkTimer:
+    """Records the durations of the steps in a benchmark test and logs them.
+
+    Benchmark tests are marked with `pytest.mark.slow`, so they're skipped by default, and the results are logged at
+    the INFO level. To see the results, run them with e.g. `pytest -m slow --log-cli-level=INFO <test file>`.
+
+    Benchmarks should not assert on the durations as those vary between machines.
+    """
+
+    def __init__(self, benchmark_name: str) -> None:  # noqa: D107
+        self._benchmark_name = benchmark_name
+        self._step_durations: Dict[str, float] = {}
+
+    @contextmanager
+    def time(self, step_name: str) -> Iterator[None]:
+        """Record the duration of the enclosed code block as the duration of the given step."""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._step_durations[step_name] = time.perf_counter() - start_time
+
+    def duration(self, step_name: str) -> float:
+        """Return the duration of the step in seconds."""
+        return self._step_durations[step_name]
+
+    def log_results(self, description: str) -> None:
+        """Log the description of the results followed by the durations of the steps."""
+        step_duration_lines = tuple(
+            f"    {step_name}: {step_duration:.3f}s" for step_name, step_duration in self._step_durations.items()
+        )
+        logger.info("\n".join((f"{self._benchmark_name}: {description}",) + step_duration_lines))
@@ -3,10 +3,12 @@ from __future__ import annotations
 import pathlib
 from typing import Dict, Optional
 
+from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimension
 from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
 from dbt_semantic_interfaces.parsing.dir_to_model import (
     parse_directory_of_yaml_files_to_semantic_manifest,
 )
+from dbt_semantic_interfaces.type_enums import DimensionType
 from dbt_semantic_interfaces.validations.semantic_manifest_validator import SemanticManifestValidator
 
 
@@ -24,3 +26,21 @@ def load_semantic_manifest(
         return build_result.semantic_manifest
     except Exception as e:
         raise RuntimeError(f"Error while loading semantic manifest: {yaml_file_directory}") from e
+
+
+def add_synthetic_categorical_dimensions(
+    semantic_manifest: PydanticSemanticManifest, semantic_model_name: str, dimension_count: int
+) -> PydanticSemanticManifest:
+    """Return a copy of the manifest with categorical dimensions added to the given semantic model.
+
+    This is useful for benchmarks that need a large manifest. The dimensions are named `synthetic_dimension_<i>`.
+    """
+    new_manifest = semantic_manifest.copy(deep=True)
+    for semantic_model in new_manifest.semantic_models:
+        if semantic_model.name == semantic_model_name:
+            semantic_model.dimensions = list(semantic_model.dimensions) + [
+                PydanticDimension(name=f"synthetic_dimension_{i}", type=DimensionType.CATEGORICAL)
+                for i in range(dimension_count)
+            ]
+            return new_manifest
+    raise ValueError(f"Semantic model {semantic_model_name!r} not found in the manifest")
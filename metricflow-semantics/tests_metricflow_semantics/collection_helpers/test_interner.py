@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pickle
+from dataclasses import dataclass
+from typing import Tuple
+
+from metricflow_semantics.collection_helpers.interner import CachedHashDataclass, Interner
+
+
+@dataclass(frozen=True)
+class _ExampleDataclass(CachedHashDataclass):
+    name: str
+    values: Tuple[int, ...]
+
+    def __hash__(self) -> int:  # noqa: D105
+        return self._get_cached_hash()
+
+
+def test_interner() -> None:  # noqa: D103
+    interner = Interner()
+    value = _ExampleDataclass(name="a", values=(1, 2))
+    assert interner.intern(value) is value
+    assert interner.intern(_ExampleDataclass(name="a", values=(1, 2))) is value
+    assert interner.intern(_ExampleDataclass(name="b", values=(1, 2))) is not value
+    assert len(interner) == 2
+
+
+def test_cached_hash() -> None:  # noqa: D103
+    value = _ExampleDataclass(name="a", values=(1, 2))
+    assert hash(value) == hash(value) == hash(_ExampleDataclass(name="a", values=(1, 2)))
+    assert value == _ExampleDataclass(name="a", values=(1, 2))
+    assert value != _ExampleDataclass(name="a", values=(1,))
+
+    # The cached hash is not pickled as it may differ between processes.
+    unpickled_value = pickle.loads(pickle.dumps(value))
+    assert "_cached_hash" not in unpickled_value.__dict__
+    assert unpickled_value == value
+    assert hash(unpickled_value) == hash(value)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from metricflow_semantics.collection_helpers.lru_cache import LruCache
+
+
+def test_lru_cache_eviction() -> None:  # noqa: D103
+    cache: LruCache[str, int] = LruCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Access "a" so that "b" becomes the least-recently used entry.
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.stats
+    assert stats.size == 2
+    assert stats.hit_count == 3
+    assert stats.miss_count == 1
+    assert stats.eviction_count == 1
+
+
+def test_disabled_lru_cache() -> None:  # noqa: D103
+    cache: LruCache[str, int] = LruCache(max_size=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, List
+
+from metricflow_semantics.dag.id_prefix import StaticIdPrefix
+from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
+
+
+def test_id_number_space() -> None:  # noqa: D103
+    prefix = StaticIdPrefix.SUB_QUERY
+    SequentialIdGenerator.create_next_id(prefix)
+    with SequentialIdGenerator.id_number_space(100):
+        assert SequentialIdGenerator.create_next_id(prefix).index == 100
+        with SequentialIdGenerator.id_number_space(0):
+            assert SequentialIdGenerator.create_next_id(prefix).index == 0
+        assert SequentialIdGenerator.create_next_id(prefix).index == 101
+
+    # The process-wide numbering should continue from where it left off.
+    assert SequentialIdGenerator.create_next_id(prefix).index == 1
+
+
+def test_id_number_space_is_thread_local() -> None:
+    """Check that threads using their own number space generate the same IDs."""
+    thread_count = 8
+    ids_per_thread = 1000
+    barrier = threading.Barrier(thread_count)
+    thread_index_to_ids: Dict[int, List[str]] = {}
+
+    def _generate_ids(thread_index: int) -> None:
+        with SequentialIdGenerator.id_number_space(0):
+            barrier.wait()
+            thread_index_to_ids[thread_index] = [
+                SequentialIdGenerator.create_next_id(StaticIdPrefix.SUB_QUERY).str_value for _ in range(ids_per_thread)
+            ]
+
+    threads = [threading.Thread(target=_generate_ids, args=(i,)) for i in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    expected_ids = [f"{StaticIdPrefix.SUB_QUERY.str_value}_{i}" for i in range(ids_per_thread)]
+    assert len(thread_index_to_ids) == thread_count
+    for ids in thread_index_to_ids.values():
+        assert ids == expected_ids
@@ -25,6 +25,14 @@ def pytest_addoption(parser: _pytest.config.argparsing.Parser) -> None:
     add_display_snapshots_cli_flag(parser)
 
 
+def pytest_configure(config: _pytest.config.Config) -> None:
+    """Hook as specified by the pytest API for configuration."""
+    config.addinivalue_line(
+        name="markers",
+        line="slow: mark tests as taking a long time to run.",
+    )
+
+
 @pytest.fixture(scope="session")
 def mf_test_configuration(  # noqa: D103
     request: FixtureRequest,
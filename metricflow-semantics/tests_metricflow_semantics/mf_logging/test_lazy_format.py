@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import logging
+from typing import List
+
+from _pytest.logging import LogCaptureFixture
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+
+logger = logging.getLogger(__name__)
+
+
+def test_not_formatted_when_level_disabled(caplog: LogCaptureFixture) -> None:  # noqa: D103
+    calls: List[str] = []
+
+    def _create_message() -> str:
+        calls.append("called")
+        return "expensive message"
+
+    with caplog.at_level(logging.INFO, logger=__name__):
+        logger.debug(LazyFormat(_create_message))
+        assert calls == []
+        assert caplog.messages == []
+
+        logger.info(LazyFormat(_create_message))
+        assert calls == ["called"]
+        assert caplog.messages == ["expensive message"]
+
+
+def test_formatted_once() -> None:  # noqa: D103
+    calls: List[str] = []
+
+    def _create_message() -> str:
+        calls.append("called")
+        return "message"
+
+    lazy_format = LazyFormat(_create_message)
+    assert str(lazy_format) == str(lazy_format) == "message"
+    assert calls == ["called"]
+
+
+def test_format_with_kwargs() -> None:  # noqa: D103
+    assert str(LazyFormat("Found items:", items=(1, 2), description="line0\nline1")) == (
+        "Found items:\n\nitems:\n  (1, 2)\n\ndescription:\n  line0\n  line1"
+    )
+
+
+def test_exception_while_formatting() -> None:
+    """Tests that an error while formatting the message doesn't result in an exception in the logging call."""
+
+    def _create_message() -> str:
+        raise RuntimeError("Error for testing")
+
+    assert "_create_message" in str(LazyFormat(_create_message))
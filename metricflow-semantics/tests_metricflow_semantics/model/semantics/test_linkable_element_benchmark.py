@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import gc
+import logging
+import tracemalloc
+from typing import List
+
+import pytest
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.model.semantics.linkable_element import LinkableElement
+from metricflow_semantics.test_helpers.benchmark_helpers import BenchmarkTimer
+from metricflow_semantics.test_helpers.manifest_helpers import add_synthetic_categorical_dimensions
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.slow
+def test_linkable_element_benchmark(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Measures the time and memory used to build the group-by-item indexes for a manifest with 1k dimensions."""
+    benchmark_timer = BenchmarkTimer("test_linkable_element_benchmark")
+    semantic_manifest = add_synthetic_categorical_dimensions(
+        simple_semantic_manifest, semantic_model_name="listings_latest", dimension_count=1000
+    )
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with benchmark_timer.time("build_indexes"):
+            semantic_manifest_lookup = SemanticManifestLookup(semantic_manifest)
+        gc.collect()
+        retained_size, peak_size = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    linkable_spec_indexes = semantic_manifest_lookup.metric_lookup.linkable_spec_indexes
+    linkable_elements: List[LinkableElement] = []
+    for linkable_element_sets in linkable_spec_indexes.metric_to_linkable_element_sets.values():
+        for linkable_element_set in linkable_element_sets:
+            for linkable_dimensions in linkable_element_set.path_key_to_linkable_dimensions.values():
+                linkable_elements.extend(linkable_dimensions)
+            for linkable_entities in linkable_element_set.path_key_to_linkable_entities.values():
+                linkable_elements.extend(linkable_entities)
+            for linkable_metrics in linkable_element_set.path_key_to_linkable_metrics.values():
+                linkable_elements.extend(linkable_metrics)
+    distinct_object_count = len({id(linkable_element) for linkable_element in linkable_elements})
+
+    benchmark_timer.log_results(
+        f"Building the indexes retained {retained_size / 2**20:.1f} MiB (peak {peak_size / 2**20:.1f} MiB). The "
+        f"element sets for metrics contain {len(linkable_elements)} elements, of which {distinct_object_count} are "
+        f"distinct objects."
+    )
+    assert distinct_object_count == len(set(linkable_elements))
@@ -219,6 +219,25 @@ def _linkable_set_with_uniques_and_duplicates() -> LinkableElementSet:
     )
 
 
+def test_create_from_elements() -> None:
+    """Tests that creating a set from elements groups them by path key, keeping the order of ambiguous elements."""
+    linkable_set = LinkableElementSet.create_from_elements(
+        linkable_dimensions=(
+            _categorical_dimension,
+            _time_dimension,
+            _ambiguous_categorical_dimension,
+            _ambiguous_categorical_dimension_with_join_path,
+        ),
+        linkable_entities=(_base_entity, _ambiguous_entity, _ambiguous_entity_with_join_path),
+        linkable_metrics=(_base_metric, _ambiguous_metric, _ambiguous_metric_with_join_path),
+    )
+    assert linkable_set == _linkable_set_with_uniques_and_duplicates()
+    assert linkable_set.path_key_to_linkable_entities[_ambiguous_entity.path_key] == (
+        _ambiguous_entity,
+        _ambiguous_entity_with_join_path,
+    )
+
+
 def test_linkable_elements_for_path_key() -> None:
     """Tests accessing the linkable element tuples for a given path key.
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -202,3 +203,75 @@ def test_linkable_element_set_as_spec_set(
         set_id="set0",
         spec_set=linkable_spec_set,
     )
+
+
+def _create_lazy_resolver(semantic_manifest_lookup: SemanticManifestLookup) -> ValidLinkableSpecResolver:
+    return ValidLinkableSpecResolver(
+        semantic_manifest=semantic_manifest_lookup.semantic_manifest,
+        semantic_model_lookup=semantic_manifest_lookup.semantic_model_lookup,
+        max_entity_links=MAX_JOIN_HOPS,
+        lazy=True,
+    )
+
+
+def test_lazy_resolver_matches_eager_resolver(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    simple_model_spec_resolver: ValidLinkableSpecResolver,
+) -> None:
+    lazy_resolver = _create_lazy_resolver(simple_semantic_manifest_lookup)
+
+    metric_references = (MetricReference(element_name="bookings"), MetricReference(element_name="views"))
+    assert lazy_resolver.get_linkable_elements_for_metrics(
+        metric_references
+    ) == simple_model_spec_resolver.get_linkable_elements_for_metrics(metric_references)
+    assert lazy_resolver.get_linkable_element_set_for_measure(
+        MeasureReference(element_name="listings"),
+        with_any_of=LinkableElementProperty.all_properties(),
+        without_any_of=frozenset(),
+    ) == simple_model_spec_resolver.get_linkable_element_set_for_measure(
+        MeasureReference(element_name="listings"),
+        with_any_of=LinkableElementProperty.all_properties(),
+        without_any_of=frozenset(),
+    )
+    assert lazy_resolver.indexes == simple_model_spec_resolver.indexes
+
+
+def test_lazy_resolver_only_builds_queried_elements(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    simple_model_spec_resolver: ValidLinkableSpecResolver,
+) -> None:
+    lazy_resolver = _create_lazy_resolver(simple_semantic_manifest_lookup)
+    bookings_measure = MeasureReference(element_name="bookings")
+
+    # Resolving the group-by-items for a query gets the elements for the measures of the metric, including the linkable
+    # metrics. Those require the metrics that can be joined to the entities of the measure's semantic model.
+    assert lazy_resolver.get_linkable_element_set_for_measure(
+        bookings_measure, with_any_of=LinkableElementProperty.all_properties(), without_any_of=frozenset()
+    ) == simple_model_spec_resolver.get_linkable_element_set_for_measure(
+        bookings_measure, with_any_of=LinkableElementProperty.all_properties(), without_any_of=frozenset()
+    )
+    assert lazy_resolver.built_metric_names == frozenset()
+    assert lazy_resolver.built_measure_references == frozenset()
+
+    metric_references = (MetricReference(element_name="bookings"),)
+    assert lazy_resolver.get_linkable_elements_for_metrics(
+        metric_references
+    ) == simple_model_spec_resolver.get_linkable_elements_for_metrics(metric_references)
+    assert lazy_resolver.built_metric_names == {"bookings"}
+    assert lazy_resolver.built_measure_references == {bookings_measure}
+
+
+def test_lazy_resolver_warm_up(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    simple_model_spec_resolver: ValidLinkableSpecResolver,
+) -> None:
+    lazy_resolver = _create_lazy_resolver(simple_semantic_manifest_lookup)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in lazy_resolver.warm_up(executor):
+            future.result()
+
+    assert lazy_resolver.get_linkable_elements_for_distinct_values_query(
+        with_any_of=LinkableElementProperty.all_properties(), without_any_of=frozenset()
+    ) == simple_model_spec_resolver.get_linkable_elements_for_distinct_values_query(
+        with_any_of=LinkableElementProperty.all_properties(), without_any_of=frozenset()
+    )
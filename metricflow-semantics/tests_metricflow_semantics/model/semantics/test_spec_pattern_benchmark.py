@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from dbt_semantic_interfaces.call_parameter_sets import DimensionCallParameterSet
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.references import DimensionReference, EntityReference, MeasureReference
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.specs.patterns.typed_patterns import DimensionPattern
+from metricflow_semantics.test_helpers.benchmark_helpers import BenchmarkTimer
+from metricflow_semantics.test_helpers.manifest_helpers import add_synthetic_categorical_dimensions
+
+logger = logging.getLogger(__name__)
+
+_ADDED_DIMENSION_COUNT = 1000
+
+
+@pytest.mark.slow
+def test_spec_pattern_benchmark(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Compares matching dimension patterns with and without the spec index for a manifest with 1k dimensions."""
+    benchmark_timer = BenchmarkTimer("test_spec_pattern_benchmark")
+    semantic_manifest_lookup = SemanticManifestLookup(
+        add_synthetic_categorical_dimensions(
+            simple_semantic_manifest, semantic_model_name="listings_latest", dimension_count=_ADDED_DIMENSION_COUNT
+        )
+    )
+    linkable_element_set = semantic_manifest_lookup.metric_lookup.linkable_elements_for_measure(
+        MeasureReference("bookings")
+    )
+    specs = linkable_element_set.specs
+    patterns = tuple(
+        DimensionPattern.from_call_parameter_set(
+            DimensionCallParameterSet(
+                entity_path=(EntityReference("listing"),),
+                dimension_reference=DimensionReference(element_name=f"synthetic_dimension_{i}"),
+            )
+        )
+        for i in range(0, _ADDED_DIMENSION_COUNT, 10)
+    )
+
+    with benchmark_timer.time("scan_candidates"):
+        scanned_matches = tuple(tuple(pattern.match(specs)) for pattern in patterns)
+
+    with benchmark_timer.time("filter_with_index"):
+        filtered_sets = tuple(linkable_element_set.filter_by_spec_patterns((pattern,)) for pattern in patterns)
+
+    benchmark_timer.log_results(f"Matched {len(patterns)} patterns against {len(specs)} candidate specs.")
+    for scanned_match, filtered_set in zip(scanned_matches, filtered_sets):
+        assert len(scanned_match) == 1
+        assert tuple(filtered_set.specs) == scanned_match
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantics.model.dbt_manifest_parser import parse_manifest_from_dbt_generated_manifest
+
+
+def test_manifest_cache(simple_semantic_manifest: PydanticSemanticManifest, tmp_path: Path) -> None:
+    """Check that the parsed manifest is cached and that the cache is keyed by the JSON."""
+    manifest_json = simple_semantic_manifest.json()
+    expected_manifest = parse_manifest_from_dbt_generated_manifest(manifest_json)
+
+    assert parse_manifest_from_dbt_generated_manifest(manifest_json, cache_dir=tmp_path) == expected_manifest
+    (cache_file_path,) = tmp_path.iterdir()
+    cache_file_bytes = cache_file_path.read_bytes()
+    assert parse_manifest_from_dbt_generated_manifest(manifest_json, cache_dir=tmp_path) == expected_manifest
+    assert cache_file_path.read_bytes() == cache_file_bytes
+
+    # A different manifest should replace the previously cached one.
+    modified_manifest = simple_semantic_manifest.copy(deep=True)
+    modified_manifest.metrics = modified_manifest.metrics[:1]
+    modified_manifest_json = modified_manifest.json()
+    assert parse_manifest_from_dbt_generated_manifest(
+        modified_manifest_json, cache_dir=tmp_path
+    ) == parse_manifest_from_dbt_generated_manifest(modified_manifest_json)
+    assert list(tmp_path.iterdir()) == [cache_file_path]
+    assert cache_file_path.read_bytes() != cache_file_bytes
+
+
+def test_invalid_manifest_cache(simple_semantic_manifest: PydanticSemanticManifest, tmp_path: Path) -> None:
+    """Check that the manifest is parsed if the cached manifest can't be loaded."""
+    manifest_json = simple_semantic_manifest.json()
+    parse_manifest_from_dbt_generated_manifest(manifest_json, cache_dir=tmp_path)
+    (cache_file_path,) = tmp_path.iterdir()
+    cache_file_path.write_bytes(b"invalid")
+
+    assert parse_manifest_from_dbt_generated_manifest(
+        manifest_json, cache_dir=tmp_path
+    ) == parse_manifest_from_dbt_generated_manifest(manifest_json)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantics.model.dbt_manifest_parser import parse_manifest_from_dbt_generated_manifest
+from metricflow_semantics.test_helpers.benchmark_helpers import BenchmarkTimer
+from metricflow_semantics.test_helpers.manifest_helpers import add_synthetic_categorical_dimensions
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.slow
+def test_manifest_load_benchmark(simple_semantic_manifest: PydanticSemanticManifest, tmp_path: Path) -> None:
+    """Measures the time to load a manifest with 5k dimensions with and without the cache."""
+    benchmark_timer = BenchmarkTimer("test_manifest_load_benchmark")
+    semantic_manifest = add_synthetic_categorical_dimensions(
+        simple_semantic_manifest, semantic_model_name="listings_latest", dimension_count=5000
+    )
+    manifest_json = semantic_manifest.json()
+
+    with benchmark_timer.time("load_without_cache"):
+        cold_load_manifest = parse_manifest_from_dbt_generated_manifest(manifest_json, cache_dir=tmp_path)
+
+    with benchmark_timer.time("load_with_cache"):
+        warm_load_manifest = parse_manifest_from_dbt_generated_manifest(manifest_json, cache_dir=tmp_path)
+
+    benchmark_timer.log_results(f"Loaded a {len(manifest_json) / 2**20:.1f} MiB manifest.")
+    assert warm_load_manifest == cold_load_manifest
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dbt_semantic_interfaces.implementations.elements.entity import PydanticEntity
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.references import MetricReference, SemanticModelReference
+from dbt_semantic_interfaces.type_enums import DimensionType, EntityType
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff, semantic_models_within_join_distance
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.model.semantics.semantic_model_join_evaluator import MAX_JOIN_HOPS
+
+
+def _remove_a_categorical_dimension(
+    semantic_manifest: PydanticSemanticManifest, semantic_model_name: str
+) -> PydanticSemanticManifest:
+    new_manifest = semantic_manifest.copy(deep=True)
+    for i, semantic_model in enumerate(new_manifest.semantic_models):
+        if semantic_model.name != semantic_model_name:
+            continue
+        categorical_dimensions = [
+            dimension for dimension in semantic_model.dimensions if dimension.type is DimensionType.CATEGORICAL
+        ]
+        assert len(categorical_dimensions) > 0
+        new_manifest.semantic_models[i] = semantic_model.copy(
+            update={
+                "dimensions": [
+                    dimension for dimension in semantic_model.dimensions if dimension != categorical_dimensions[0]
+                ]
+            }
+        )
+        return new_manifest
+    raise AssertionError(f"{semantic_model_name} not found")
+
+
+def test_diff(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D103
+    new_manifest = _remove_a_categorical_dimension(simple_semantic_manifest, "listings_latest")
+    new_manifest.metrics = [metric for metric in new_manifest.metrics if metric.name != "bookings"]
+
+    diff = SemanticManifestDiff.create(old_manifest=simple_semantic_manifest, new_manifest=new_manifest)
+    assert diff.modified_semantic_models == {SemanticModelReference("listings_latest")}
+    assert diff.changed_semantic_models == {SemanticModelReference("listings_latest")}
+    assert diff.modified_metrics == {MetricReference("bookings")}
+    assert diff.removed_metrics == {MetricReference("bookings")}
+
+    unchanged_diff = SemanticManifestDiff.create(
+        old_manifest=simple_semantic_manifest, new_manifest=simple_semantic_manifest.copy(deep=True)
+    )
+    assert len(unchanged_diff.modified_semantic_models) == 0
+    assert len(unchanged_diff.modified_metrics) == 0
+
+
+def test_semantic_models_within_join_distance(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    listings = frozenset({SemanticModelReference("listings_latest")})
+    assert semantic_models_within_join_distance(simple_semantic_manifest, listings, max_entity_links=0) == listings
+
+    one_hop = semantic_models_within_join_distance(simple_semantic_manifest, listings, max_entity_links=1)
+    two_hops = semantic_models_within_join_distance(simple_semantic_manifest, listings, max_entity_links=2)
+    assert listings < one_hop <= two_hops
+
+
+def _check_updated_lookup_matches_rebuilt_lookup(
+    old_manifest: PydanticSemanticManifest,
+    old_lookup: SemanticManifestLookup,
+    new_manifest: PydanticSemanticManifest,
+    changed_semantic_model: SemanticModelReference,
+) -> int:
+    """Check that updating the lookup gives the same results as building it from scratch.
+
+    Returns the number of measures with element sets that were reused from the old lookup.
+    """
+    updated_lookup = old_lookup.update(new_manifest)
+    rebuilt_lookup = SemanticManifestLookup(new_manifest)
+
+    reusable_sets = old_lookup.metric_lookup.get_reusable_measure_linkable_element_sets(
+        semantic_manifest=new_manifest,
+        manifest_diff=SemanticManifestDiff.create(old_manifest=old_manifest, new_manifest=new_manifest),
+    )
+    affected_semantic_models = semantic_models_within_join_distance(
+        new_manifest, frozenset({changed_semantic_model}), max_entity_links=MAX_JOIN_HOPS
+    )
+    for measure_reference in reusable_sets:
+        semantic_model = rebuilt_lookup.semantic_model_lookup.get_semantic_model_for_measure(measure_reference)
+        assert semantic_model.reference not in affected_semantic_models
+
+    for metric in new_manifest.metrics:
+        metric_references = (MetricReference(metric.name),)
+        assert updated_lookup.metric_lookup.linkable_elements_for_metrics(
+            metric_references
+        ) == rebuilt_lookup.metric_lookup.linkable_elements_for_metrics(metric_references)
+
+    assert (
+        updated_lookup.metric_lookup.linkable_elements_for_no_metrics_query()
+        == rebuilt_lookup.metric_lookup.linkable_elements_for_no_metrics_query()
+    )
+    return len(reusable_sets)
+
+
+def test_updated_lookup_matches_rebuilt_lookup(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+) -> None:
+    _check_updated_lookup_matches_rebuilt_lookup(
+        old_manifest=simple_semantic_manifest,
+        old_lookup=simple_semantic_manifest_lookup,
+        new_manifest=_remove_a_categorical_dimension(simple_semantic_manifest, "listings_latest"),
+        changed_semantic_model=SemanticModelReference("listings_latest"),
+    )
+
+
+def test_updated_lookup_with_isolated_change(
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+) -> None:
+    """Check an update where the element sets of the measures that can't join to the changed model are reused."""
+    new_manifest = simple_semantic_manifest.copy(deep=True)
+    listings_latest = next(
+        semantic_model for semantic_model in new_manifest.semantic_models if semantic_model.name == "listings_latest"
+    )
+    # A semantic model with an entity that's not in other semantic models can't be joined to them.
+    new_manifest.semantic_models.append(
+        listings_latest.copy(
+            update={
+                "name": "isolated_listings",
+                "measures": [],
+                "entities": [PydanticEntity(name="isolated_listing", type=EntityType.PRIMARY, expr="listing_id")],
+            }
+        )
+    )
+
+    reusable_set_count = _check_updated_lookup_matches_rebuilt_lookup(
+        old_manifest=simple_semantic_manifest,
+        old_lookup=simple_semantic_manifest_lookup,
+        new_manifest=new_manifest,
+        changed_semantic_model=SemanticModelReference("isolated_listings"),
+    )
+    assert reusable_set_count > 0
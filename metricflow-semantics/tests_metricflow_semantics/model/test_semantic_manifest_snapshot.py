@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.references import MetricReference
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.model.semantic_manifest_snapshot import (
+    INDEX_SNAPSHOT_FILE_NAME,
+    load_semantic_manifest_lookup,
+)
+from metricflow_semantics.model.snapshot_file import hash_semantic_manifest_json
+
+
+def test_snapshot_round_trip(  # noqa: D103
+    tmp_path: Path,
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+) -> None:
+    manifest_hash = hash_semantic_manifest_json(simple_semantic_manifest.json())
+    snapshot_path = tmp_path / INDEX_SNAPSHOT_FILE_NAME
+    assert not snapshot_path.exists()
+
+    load_semantic_manifest_lookup(simple_semantic_manifest, manifest_hash, tmp_path)
+    assert snapshot_path.exists()
+    snapshot_bytes = snapshot_path.read_bytes()
+
+    loaded_lookup = load_semantic_manifest_lookup(simple_semantic_manifest, manifest_hash, tmp_path)
+    # The snapshot is not rewritten when it is up to date.
+    assert snapshot_path.read_bytes() == snapshot_bytes
+    assert (
+        loaded_lookup.metric_lookup.linkable_spec_indexes
+        == simple_semantic_manifest_lookup.metric_lookup.linkable_spec_indexes
+    )
+    metric_references = (MetricReference("bookings"), MetricReference("views"))
+    assert loaded_lookup.metric_lookup.linkable_elements_for_metrics(
+        metric_references
+    ) == simple_semantic_manifest_lookup.metric_lookup.linkable_elements_for_metrics(metric_references)
+    assert (
+        loaded_lookup.metric_lookup.linkable_elements_for_no_metrics_query()
+        == simple_semantic_manifest_lookup.metric_lookup.linkable_elements_for_no_metrics_query()
+    )
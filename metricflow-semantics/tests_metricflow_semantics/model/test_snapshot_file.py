@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from metricflow_semantics.model.snapshot_file import (
+    SnapshotFileHeader,
+    hash_semantic_manifest_json,
+    read_snapshot_file,
+    write_snapshot_file,
+)
+
+
+def _create_header(manifest_json: str) -> SnapshotFileHeader:
+    return SnapshotFileHeader.create(
+        snapshot_name="test", format_version=1, manifest_hash=hash_semantic_manifest_json(manifest_json)
+    )
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:  # noqa: D103
+    snapshot_path = tmp_path / "test.snapshot"
+    header = _create_header("{}")
+    assert read_snapshot_file(snapshot_path, header) is None
+
+    write_snapshot_file(snapshot_path, header, {"key": "value"})
+    assert read_snapshot_file(snapshot_path, header) == {"key": "value"}
+    assert list(tmp_path.iterdir()) == [snapshot_path]
+
+
+def test_stale_snapshot_is_ignored(tmp_path: Path) -> None:  # noqa: D103
+    snapshot_path = tmp_path / "test.snapshot"
+    write_snapshot_file(snapshot_path, _create_header("{}"), {"key": "value"})
+
+    assert read_snapshot_file(snapshot_path, _create_header("{} ")) is None
+    assert (
+        read_snapshot_file(snapshot_path, SnapshotFileHeader.create("other", 1, hash_semantic_manifest_json("{}")))
+        is None
+    )
+    assert (
+        read_snapshot_file(snapshot_path, SnapshotFileHeader.create("test", 2, hash_semantic_manifest_json("{}")))
+        is None
+    )
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path: Path) -> None:  # noqa: D103
+    snapshot_path = tmp_path / "test.snapshot"
+    header = _create_header("{}")
+    snapshot_path.write_bytes(b"not a snapshot")
+    assert read_snapshot_file(snapshot_path, header) is None
+
+    snapshot_path.write_bytes(b"")
+    assert read_snapshot_file(snapshot_path, header) is None
+
+    # A new snapshot replaces the unreadable one.
+    write_snapshot_file(snapshot_path, header, {"key": "value"})
+    assert read_snapshot_file(snapshot_path, header) == {"key": "value"}
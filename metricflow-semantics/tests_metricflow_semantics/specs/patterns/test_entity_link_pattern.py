@@ -13,6 +13,7 @@ from metricflow_semantics.specs.dimension_spec import DimensionSpec
 from metricflow_semantics.specs.entity_spec import EntitySpec
 from metricflow_semantics.specs.group_by_metric_spec import GroupByMetricSpec
 from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
+from metricflow_semantics.specs.linkable_spec_index import LinkableSpecIndex
 from metricflow_semantics.specs.patterns.entity_link_pattern import (
     EntityLinkPattern,
     EntityLinkPatternParameterSet,
@@ -219,3 +220,55 @@ def test_time_dimension_date_part_match(specs: Sequence[LinkableInstanceSpec]) -
             date_part=DatePart.YEAR,
         ),
     )
+
+
+def test_match_indexed() -> None:
+    """Tests that matching with an index gives the same result as matching the candidates."""
+    specs: Sequence[LinkableInstanceSpec] = (
+        DimensionSpec(element_name="country", entity_links=(EntityReference("booking"), EntityReference("listing"))),
+        DimensionSpec(element_name="country", entity_links=(EntityReference("listing"),)),
+        DimensionSpec(element_name="capacity", entity_links=(EntityReference("listing"),)),
+        DimensionSpec(element_name="is_instant", entity_links=(EntityReference("user"), EntityReference("booking"))),
+        DimensionSpec(element_name="is_instant", entity_links=()),
+        MTD_SPEC_WEEK,
+        MTD_SPEC_MONTH,
+        EntitySpec(element_name="listing", entity_links=(EntityReference("booking"),)),
+    )
+    spec_index = LinkableSpecIndex(specs)
+
+    parameter_sets = (
+        EntityLinkPatternParameterSet.from_parameters(
+            fields_to_compare=(ParameterSetField.ELEMENT_NAME, ParameterSetField.ENTITY_LINKS),
+            element_name="country",
+            entity_links=(EntityReference("listing"),),
+        ),
+        # The shortest entity link path is determined by all specs with matching entity links.
+        EntityLinkPatternParameterSet.from_parameters(
+            fields_to_compare=(ParameterSetField.ELEMENT_NAME, ParameterSetField.ENTITY_LINKS),
+            element_name="is_instant",
+            entity_links=(EntityReference("booking"),),
+        ),
+        EntityLinkPatternParameterSet.from_parameters(
+            fields_to_compare=(ParameterSetField.ELEMENT_NAME, ParameterSetField.ENTITY_LINKS),
+            element_name="is_instant",
+            entity_links=(),
+        ),
+        EntityLinkPatternParameterSet.from_parameters(
+            fields_to_compare=(ParameterSetField.ELEMENT_NAME, ParameterSetField.TIME_GRANULARITY),
+            element_name=METRIC_TIME_ELEMENT_NAME,
+            time_granularity=TimeGranularity.MONTH,
+        ),
+        EntityLinkPatternParameterSet.from_parameters(
+            fields_to_compare=(ParameterSetField.ENTITY_LINKS,),
+            entity_links=(EntityReference("listing"),),
+        ),
+        EntityLinkPatternParameterSet.from_parameters(
+            fields_to_compare=(ParameterSetField.ELEMENT_NAME, ParameterSetField.ENTITY_LINKS),
+            element_name="does_not_exist",
+            entity_links=(EntityReference("listing"),),
+        ),
+    )
+
+    for parameter_set in parameter_sets:
+        pattern = EntityLinkPattern(parameter_set)
+        assert tuple(pattern.match_indexed(spec_index)) == tuple(pattern.match(specs)), str(parameter_set)
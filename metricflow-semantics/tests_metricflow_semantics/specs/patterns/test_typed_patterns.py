@@ -22,6 +22,7 @@ from metricflow_semantics.specs.dimension_spec import DimensionSpec
 from metricflow_semantics.specs.entity_spec import EntitySpec
 from metricflow_semantics.specs.group_by_metric_spec import GroupByMetricSpec
 from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
+from metricflow_semantics.specs.linkable_spec_index import LinkableSpecIndex
 from metricflow_semantics.specs.patterns.typed_patterns import (
     DimensionPattern,
     EntityPattern,
@@ -164,3 +165,37 @@ def test_group_by_metric_pattern(specs: Sequence[LinkableInstanceSpec]) -> None:
             metric_subquery_entity_links=(EntityReference("listing"),),
         ),
     )
+
+
+def test_match_indexed(specs: Sequence[LinkableInstanceSpec]) -> None:
+    """Tests that matching with an index gives the same result as matching the candidates."""
+    patterns = (
+        DimensionPattern.from_call_parameter_set(
+            DimensionCallParameterSet(
+                entity_path=(EntityReference("booking"), EntityReference("listing")),
+                dimension_reference=DimensionReference(element_name="common_name"),
+            )
+        ),
+        TimeDimensionPattern.from_call_parameter_set(
+            TimeDimensionCallParameterSet(
+                entity_path=(EntityReference("listing"),),
+                time_dimension_reference=TimeDimensionReference(element_name="common_name"),
+                date_part=DatePart.MONTH,
+            )
+        ),
+        EntityPattern.from_call_parameter_set(
+            EntityCallParameterSet(
+                entity_path=(EntityReference("booking"), EntityReference("listing")),
+                entity_reference=EntityReference(element_name="common_name"),
+            )
+        ),
+        GroupByMetricPattern.from_call_parameter_set(
+            MetricCallParameterSet(
+                group_by=(EntityReference("listing"),),
+                metric_reference=MetricReference(element_name="bookings"),
+            )
+        ),
+    )
+    spec_index = LinkableSpecIndex(specs)
+    for pattern in patterns:
+        assert tuple(pattern.match_indexed(spec_index)) == tuple(pattern.match(specs)), str(pattern)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import jinja2
+import pytest
+from metricflow_semantics.jinja_templates import compiled_jinja_template
+
+
+def test_compiled_template_is_shared() -> None:  # noqa: D103
+    template = compiled_jinja_template("Hello {{ name }}")
+    assert compiled_jinja_template("Hello {{ name }}") is template
+    assert template.render(name="world") == "Hello world"
+
+
+def test_undefined_variables() -> None:  # noqa: D103
+    with pytest.raises(jinja2.exceptions.UndefinedError):
+        compiled_jinja_template("Hello {{ name }}").render()
+
+    assert compiled_jinja_template("Hello {{ name }}", strict_undefined=False).render() == "Hello "
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import array
+import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from metricflow_semantics.mf_logging.pretty_print import mf_pformat_many
+
+from metricflow.data_table.column_types import CellValue
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+# The `array` type code used to store values for a given column type. Datetimes are stored as the number of
+# microseconds since the epoch.
+_COLUMN_TYPE_TO_ARRAY_TYPE_CODE: Dict[Type[CellValue], str] = {
+    int: "q",
+    float: "d",
+    bool: "B",
+    datetime.datetime: "q",
+}
+
+TypedValues = Union["array.array[int]", "array.array[float]"]
+
+
+class ColumnData:
+    """The values in a column of a `MetricFlowDataTable`.
+
+    Columns of int / float / bool / datetime values are stored in an `array.array` with a validity bitmap for nulls.
+    The bitmap uses the Arrow layout: bit `i` (least-significant bit first) is set if the value at index `i` is not
+    null, and no bitmap is kept if there are no nulls. Null values have a placeholder of 0 in the array. This keeps
+    the memory per cell at the size of the underlying C type, and allows NumPy / Arrow arrays to be created without
+    copying the values.
+
+    Other columns (e.g. strings) are stored as a tuple of the values.
+    """
+
+    __slots__ = ("_column_type", "_values", "_validity_bitmap", "_row_count")
+
+    def __init__(
+        self,
+        column_type: Type[CellValue],
+        values: Union[TypedValues, Tuple[CellValue, ...]],
+        validity_bitmap: Optional[bytes] = None,
+    ) -> None:
+        """Initializer. Use `create()` to create this from a sequence of values."""
+        self._column_type = column_type
+        self._values = values
+        self._validity_bitmap = validity_bitmap
+        self._row_count = len(values)
+
+    @staticmethod
+    def create(column_type: Type[CellValue], values: Sequence[CellValue], validate: bool = True) -> ColumnData:
+        """Create the column from the values.
+
+        Args:
+            column_type: The type of the values in the column.
+            values: The values in the column.
+            validate: Check that the values are of the given type (and that datetimes don't have a time zone). This
+            can be skipped if the caller has already checked that the values are either None or exactly of the given
+            type.
+        """
+        for row_index, cell_value in enumerate(values if validate else ()):
+            assert cell_value is None or isinstance(cell_value, column_type), mf_pformat_many(
+                "Cell value type mismatch.",
+                {
+                    "row_index": row_index,
+                    "expected_cell_value_type": column_type,
+                    "actual_cell_value_type": type(cell_value),
+                    "cell_value": cell_value,
+                },
+            )
+            # Check that datetimes don't have a timezone set.
+            if isinstance(cell_value, datetime.datetime):
+                assert cell_value.tzinfo is None, mf_pformat_many(
+                    "Time zone provided for datetime.",
+                    {
+                        "row_index": row_index,
+                        "cell_value": cell_value,
+                    },
+                )
+
+        type_code = _COLUMN_TYPE_TO_ARRAY_TYPE_CODE.get(column_type)
+        # Subclasses (e.g. a `bool` in an `int` column) can't be stored in the array without losing the type.
+        if type_code is None or (
+            validate and any(value is not None and type(value) is not column_type for value in values)
+        ):
+            return ColumnData(column_type=column_type, values=tuple(values))
+
+        storage_values: Iterable[Union[int, float]]
+        if column_type is datetime.datetime:
+            storage_values = (
+                (value - _EPOCH) // _ONE_MICROSECOND if isinstance(value, datetime.datetime) else 0 for value in values
+            )
+        else:
+            storage_values = (value if isinstance(value, (int, float)) else 0 for value in values)
+
+        try:
+            typed_values: TypedValues = array.array(type_code, storage_values)
+        except OverflowError:
+            # e.g. an int that doesn't fit in 64 bits.
+            return ColumnData(column_type=column_type, values=tuple(values))
+
+        validity_bitmap: Optional[bytes] = None
+        if any(value is None for value in values):
+            bitmap = bytearray((len(values) + 7) // 8)
+            for row_index, value in enumerate(values):
+                if value is not None:
+                    bitmap[row_index >> 3] |= 1 << (row_index & 7)
+            validity_bitmap = bytes(bitmap)
+
+        return ColumnData(column_type=column_type, values=typed_values, validity_bitmap=validity_bitmap)
+
+    @property
+    def column_type(self) -> Type[CellValue]:  # noqa: D102
+        return self._column_type
+
+    @property
+    def null_count(self) -> int:  # noqa: D102
+        return sum(1 for value in self if value is None)
+
+    def _is_valid(self, row_index: int) -> bool:
+        validity_bitmap = self._validity_bitmap
+        return validity_bitmap is None or bool(validity_bitmap[row_index >> 3] & (1 << (row_index & 7)))
+
+    def _convert_stored_value(self, stored_value: Union[int, float]) -> CellValue:
+        if self._column_type is datetime.datetime:
+            return _EPOCH + datetime.timedelta(microseconds=stored_value)
+        elif self._column_type is bool:
+            return bool(stored_value)
+        return stored_value
+
+    def __len__(self) -> int:  # noqa: D105
+        return self._row_count
+
+    def __getitem__(self, row_index: int) -> CellValue:  # noqa: D105
+        values = self._values
+        if isinstance(values, tuple):
+            return values[row_index]
+        if row_index < 0:
+            row_index += self._row_count
+        stored_value = values[row_index]
+        if not self._is_valid(row_index):
+            return None
+        return self._convert_stored_value(stored_value)
+
+    def __iter__(self) -> Iterator[CellValue]:  # noqa: D105
+        values = self._values
+        if isinstance(values, tuple):
+            return iter(values)
+        if self._validity_bitmap is None and (self._column_type is int or self._column_type is float):
+            return iter(values)
+        return (
+            self._convert_stored_value(value) if self._is_valid(row_index) else None
+            for row_index, value in enumerate(values)
+        )
+
+    def take(self, row_indexes: Sequence[int]) -> ColumnData:
+        """Return a column with the values at the given indexes, in the given order."""
+        values = self._values
+        if isinstance(values, tuple):
+            return ColumnData(column_type=self._column_type, values=tuple(values[i] for i in row_indexes))
+        if self._validity_bitmap is None:
+            return ColumnData(
+                column_type=self._column_type,
+                values=array.array(values.typecode, [values[i] for i in row_indexes]),
+            )
+        return ColumnData.create(column_type=self._column_type, values=[self[i] for i in row_indexes])
+
+    def slice(self, start_index: int, end_index: int) -> ColumnData:
+        """Return a column with the values in the range [start_index, end_index)."""
+        values = self._values
+        if isinstance(values, tuple) or self._validity_bitmap is None:
+            return ColumnData(column_type=self._column_type, values=values[start_index:end_index])
+        return self.take(range(start_index, min(end_index, self._row_count)))
+
+    def to_list(self) -> List[CellValue]:  # noqa: D102
+        return list(self)
+
+    def to_numpy(self) -> numpy.ndarray:
+        """Return the values as a NumPy array.
+
+        Numeric and datetime columns are returned as views of the underlying buffer without copying. If the column
+        contains nulls, a masked array is returned. Other columns are returned as arrays of objects.
+        """
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("Exporting to NumPy requires the `numpy` package to be installed.") from e
+
+        values = self._values
+        if isinstance(values, tuple):
+            return numpy.array(values, dtype=object)
+
+        if self._column_type is datetime.datetime:
+            dtype = "datetime64[us]"
+        elif self._column_type is bool:
+            dtype = "bool"
+        elif self._column_type is int:
+            dtype = "int64"
+        else:
+            dtype = "float64"
+        data = numpy.frombuffer(values, dtype=dtype) if self._row_count > 0 else numpy.array([], dtype=dtype)
+
+        validity_bitmap = self._validity_bitmap
+        if validity_bitmap is None:
+            return data
+        is_valid = numpy.unpackbits(numpy.frombuffer(validity_bitmap, dtype=numpy.uint8), bitorder="little")
+        return numpy.ma.MaskedArray(data, mask=~is_valid[: self._row_count].astype(bool))
+
+    def to_arrow(self) -> pyarrow.Array:
+        """Return the values as an Arrow array.
+
+        Int, float, and datetime columns use the underlying buffers without copying.
+        """
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError("Exporting to Arrow requires the `pyarrow` package to be installed.") from e
+
+        values = self._values
+        if self._column_type is type(None):
+            return pyarrow.nulls(self._row_count)
+        if isinstance(values, tuple) or self._column_type is bool:
+            # Arrow stores booleans as bits, so those need to be converted.
+            return pyarrow.array(list(self))
+
+        if self._column_type is datetime.datetime:
+            arrow_type = pyarrow.timestamp("us")
+        elif self._column_type is int:
+            arrow_type = pyarrow.int64()
+        else:
+            arrow_type = pyarrow.float64()
+
+        validity_bitmap = self._validity_bitmap
+        return pyarrow.Array.from_buffers(
+            arrow_type,
+            self._row_count,
+            [
+                pyarrow.py_buffer(validity_bitmap) if validity_bitmap is not None else None,
+                pyarrow.py_buffer(values),
+            ],
+        )
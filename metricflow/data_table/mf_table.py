@@ -3,9 +3,11 @@ from __future__ import annotations
 import datetime
 import itertools
 import logging
+import warnings
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
 
 import tabulate
 from metricflow_semantics.mf_logging.formatting import indent
@@ -14,17 +16,26 @@ from typing_extensions import Self
 
 from metricflow.data_table.column_types import CellValue, InputCellValue, row_cell_types
 from metricflow.data_table.mf_column import ColumnDescription
+from metricflow.data_table.mf_column_data import ColumnData
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True, eq=False)
+@dataclass(frozen=True, eq=False, init=False)
 class MetricFlowDataTable:
     """Container for tabular data stored in memory.
 
     This is feature-limited and is used to pass tabular data for tests and the CLI. The only data types that are
     supported are described by `CellValue`.
 
+    The data is stored by column (see `ColumnData`). `rows` provides a row-oriented view for compatibility, but
+    column-oriented access (e.g. `column_values_iterator`, `to_numpy`, `to_arrow`) avoids creating the row tuples.
+    The rows are created on the first access of `rows` and kept for later accesses.
+
     When constructing the table, additional input types (as described by `InputCellValue`) can be used, but those
     additional types will be converted into one of the `CellValue` types.
 
@@ -32,41 +43,90 @@ class MetricFlowDataTable:
     """
 
     column_descriptions: Tuple[ColumnDescription, ...]
-    rows: Tuple[Tuple[CellValue, ...], ...]
+    column_data: Tuple[ColumnData, ...]
+
+    def __init__(
+        self,
+        column_descriptions: Tuple[ColumnDescription, ...],
+        column_data: Optional[Tuple[ColumnData, ...]] = None,
+        rows: Optional[Tuple[Tuple[CellValue, ...], ...]] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            column_descriptions: The descriptions of the columns.
+            column_data: The values of the columns.
+            rows: Deprecated - use `create_from_rows` instead. The values of the table as rows. Either this or
+            `column_data` should be specified.
+        """
+        if rows is not None:
+            if column_data is not None:
+                raise ValueError("Only one of `column_data` and `rows` should be specified.")
+            warnings.warn(
+                "Creating a `MetricFlowDataTable` with `rows` is deprecated. Use `create_from_rows` instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            column_data = MetricFlowDataTable._column_data_from_rows(column_descriptions, rows)
+        elif column_data is None:
+            raise ValueError("One of `column_data` and `rows` should be specified.")
+
+        object.__setattr__(self, "column_descriptions", column_descriptions)
+        object.__setattr__(self, "column_data", column_data)
+        self._check_column_data()
 
-    def __post_init__(self) -> None:  # noqa: D105
-        expected_column_count = self.column_count
-        for row_index, row in enumerate(self.rows):
-            # Check that the number of columns in the rows match.
+    @staticmethod
+    def _column_data_from_rows(
+        column_descriptions: Tuple[ColumnDescription, ...], rows: Tuple[Tuple[CellValue, ...], ...]
+    ) -> Tuple[ColumnData, ...]:
+        expected_column_count = len(column_descriptions)
+        for row_index, row in enumerate(rows):
             row_column_count = len(row)
             assert row_column_count == expected_column_count, (
                 f"Row at index {row_index} has {row_column_count} columns instead of {expected_column_count}. "
                 f"Row is:"
                 f"\n{indent(mf_pformat(row))}"
             )
-            # Check that the type of the object in the rows match.
-            for column_index, cell_value in enumerate(row):
-                expected_cell_value_type = self.column_descriptions[column_index].column_type
-                assert cell_value is None or isinstance(cell_value, expected_cell_value_type), mf_pformat_many(
-                    "Cell value type mismatch.",
-                    {
-                        "row_index": row_index,
-                        "column_index": column_index,
-                        "expected_cell_value_type": expected_cell_value_type,
-                        "actual_cell_value_type": type(cell_value),
-                        "cell_value": cell_value,
-                    },
-                )
-                # Check that datetimes don't have a timezone set.
-                if isinstance(cell_value, datetime.datetime):
-                    assert cell_value.tzinfo is None, mf_pformat_many(
-                        "Time zone provided for datetime.",
-                        {
-                            "row_index": row_index,
-                            "column_index": column_index,
-                            "cell_value": cell_value,
-                        },
-                    )
+        column_values: Sequence[Sequence[CellValue]] = tuple(zip(*rows))
+        if len(column_values) == 0:
+            column_values = tuple(() for _ in column_descriptions)
+        return tuple(
+            ColumnData.create(column_type=column_description.column_type, values=values)
+            for column_description, values in zip(column_descriptions, column_values)
+        )
+
+    def _check_column_data(self) -> None:
+        assert len(self.column_data) == len(self.column_descriptions), (
+            f"There are {len(self.column_data)} columns of data, but {len(self.column_descriptions)} column "
+            f"descriptions."
+        )
+        expected_row_count = self.row_count
+        for column_index, (column_description, column_data) in enumerate(
+            zip(self.column_descriptions, self.column_data)
+        ):
+            assert (
+                len(column_data) == expected_row_count
+            ), f"Column at index {column_index} has {len(column_data)} rows instead of {expected_row_count}."
+            assert column_data.column_type is column_description.column_type, mf_pformat_many(
+                "Column type mismatch.",
+                {
+                    "column_index": column_index,
+                    "expected_column_type": column_description.column_type,
+                    "actual_column_type": column_data.column_type,
+                },
+            )
+
+    @staticmethod
+    def create_from_columns(  # noqa: D102
+        column_descriptions: Sequence[ColumnDescription], column_values: Sequence[Sequence[CellValue]]
+    ) -> MetricFlowDataTable:
+        return MetricFlowDataTable(
+            column_descriptions=tuple(column_descriptions),
+            column_data=tuple(
+                ColumnData.create(column_type=column_description.column_type, values=values)
+                for column_description, values in itertools.zip_longest(column_descriptions, column_values)
+            ),
+        )
 
     @property
     def column_count(self) -> int:  # noqa: D102
@@ -74,7 +134,14 @@ class MetricFlowDataTable:
 
     @property
     def row_count(self) -> int:  # noqa: D102
-        return len(self.rows)
+        if len(self.column_data) == 0:
+            return 0
+        return len(self.column_data[0])
+
+    @cached_property
+    def rows(self) -> Tuple[Tuple[CellValue, ...], ...]:
+        """Return the data as a tuple of rows. Prefer column access to avoid creating the rows."""
+        return tuple(zip(*self.column_data))
 
     def column_name_index(self, column_name: str) -> int:
         """Return the index of the column that matches the given name. Raises `ValueError` if the name is invalid."""
@@ -92,23 +159,13 @@ class MetricFlowDataTable:
 
     def column_values_iterator(self, column_index: int) -> Iterator[CellValue]:
         """Returns an iterator for values of the column at the tiven index."""
-        return (row[column_index] for row in self.rows)
+        return iter(self.column_data[column_index])
 
     def _sorted_by_column_name(self) -> MetricFlowDataTable:  # noqa: D102
-        new_rows: List[List[CellValue]] = [[] for _ in range(self.row_count)]
-        sorted_column_names = sorted(self.column_names)
-        for column_name in sorted_column_names:
-            old_column_index = self.column_name_index(column_name)
-            for row_index, cell_value in enumerate(self.column_values_iterator(old_column_index)):
-                new_rows[row_index].append(cell_value)
-
+        sorted_column_indexes = tuple(self.column_name_index(column_name) for column_name in sorted(self.column_names))
         return MetricFlowDataTable(
-            column_descriptions=tuple(
-                self.column_descriptions[self.column_name_index(column_name)] for column_name in sorted_column_names
-            ),
-            rows=tuple(
-                tuple(row_dict[column_index] for column_index in range(self.column_count)) for row_dict in new_rows
-            ),
+            column_descriptions=tuple(self.column_descriptions[column_index] for column_index in sorted_column_indexes),
+            column_data=tuple(self.column_data[column_index] for column_index in sorted_column_indexes),
         )
 
     def _sorted_by_row(self) -> MetricFlowDataTable:  # noqa: D102
@@ -117,12 +174,11 @@ class MetricFlowDataTable:
                 return cell.isoformat()
             return str(cell)
 
-        def _row_sort_key(row: Tuple[CellValue, ...]) -> Tuple[str, ...]:
-            return tuple(_cell_sort_key(cell) for cell in row)
-
+        row_sort_keys = tuple(zip(*(tuple(map(_cell_sort_key, column_data)) for column_data in self.column_data)))
+        sorted_row_indexes = sorted(range(self.row_count), key=row_sort_keys.__getitem__)
         return MetricFlowDataTable(
             column_descriptions=self.column_descriptions,
-            rows=tuple(sorted((row for row in self.rows), key=_row_sort_key)),
+            column_data=tuple(column_data.take(sorted_row_indexes) for column_data in self.column_data),
         )
 
     def sorted(self) -> MetricFlowDataTable:
@@ -131,22 +187,17 @@ class MetricFlowDataTable:
 
     def text_format(self, float_decimals: int = 2) -> str:
         """Return a text version of this table that is suitable for printing."""
-        str_rows: List[List[str]] = []
-        for row in self.rows:
-            str_row: List[str] = []
-            for cell_value in row:
-                if isinstance(cell_value, float):
-                    str_row.append(f"{cell_value:.{float_decimals}f}")
-                    continue
-
-                if isinstance(cell_value, datetime.datetime):
-                    str_row.append(cell_value.isoformat())
-                    continue
-
-                str_row.append(str(cell_value))
-            str_rows.append(str_row)
+
+        def _cell_text(cell_value: CellValue) -> str:
+            if isinstance(cell_value, float):
+                return f"{cell_value:.{float_decimals}f}"
+            if isinstance(cell_value, datetime.datetime):
+                return cell_value.isoformat()
+            return str(cell_value)
+
+        str_columns = tuple(tuple(map(_cell_text, column_data)) for column_data in self.column_data)
         return tabulate.tabulate(
-            tabular_data=tuple(tuple(str_row) for str_row in str_rows),
+            tabular_data=tuple(zip(*str_columns)),
             headers=tuple(column_description.column_name for column_description in self.column_descriptions),
         )
 
@@ -156,11 +207,44 @@ class MetricFlowDataTable:
             column_descriptions=tuple(
                 column_description.with_lower_case_column_name() for column_description in self.column_descriptions
             ),
-            rows=self.rows,
+            column_data=self.column_data,
         )
 
     def get_cell_value(self, row_index: int, column_index: int) -> CellValue:  # noqa: D102
-        return self.rows[row_index][column_index]
+        return self.column_data[column_index][row_index]
+
+    def split_into_batches(self, batch_size: int) -> Iterator[MetricFlowDataTable]:
+        """Return tables with the same columns as this and up to `batch_size` rows. An empty table returns itself."""
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be >= 1. Got: {batch_size}")
+        if self.row_count <= batch_size:
+            yield self
+            return
+        for start_index in range(0, self.row_count, batch_size):
+            yield MetricFlowDataTable(
+                column_descriptions=self.column_descriptions,
+                column_data=tuple(
+                    column_data.slice(start_index, start_index + batch_size) for column_data in self.column_data
+                ),
+            )
+
+    def to_numpy(self) -> Dict[str, numpy.ndarray]:
+        """Return a dictionary from the column name to the values as a NumPy array. See `ColumnData.to_numpy`."""
+        return {
+            column_description.column_name: column_data.to_numpy()
+            for column_description, column_data in zip(self.column_descriptions, self.column_data)
+        }
+
+    def to_arrow(self) -> pyarrow.Table:
+        """Return the data as an Arrow table. See `ColumnData.to_arrow`."""
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError("Exporting to Arrow requires the `pyarrow` package to be installed.") from e
+
+        return pyarrow.Table.from_arrays(
+            [column_data.to_arrow() for column_data in self.column_data], names=list(self.column_names)
+        )
 
     @staticmethod
     def create_from_rows(  # noqa: D102
@@ -171,6 +255,48 @@ class MetricFlowDataTable:
             builder.add_row(row)
         return builder.build()
 
+    @staticmethod
+    def create_from_trusted_rows(
+        column_names: Sequence[str], rows: Iterable[Sequence[InputCellValue]]
+    ) -> MetricFlowDataTable:
+        """Create a table from rows that come from a trusted source, like the results from a `SqlClient`.
+
+        Compared to `create_from_rows`, this skips the row-by-row validation that produces more detailed error
+        messages. The rows are transposed into columns, and the column types are inferred while the values are
+        converted to the supported types. An exception is still raised if the rows have a different number of values
+        than the number of columns, or if a column has values of different types.
+        """
+        rows = rows if isinstance(rows, (list, tuple)) else tuple(rows)
+        column_count = len(column_names)
+        if any(row_length != column_count for row_length in set(map(len, rows))):
+            raise ValueError(f"Input rows should all have {column_count} columns. Column names are: {column_names}")
+
+        column_values: Sequence[Sequence[InputCellValue]] = tuple(zip(*rows))
+        if len(column_values) == 0:
+            column_values = tuple(() for _ in range(column_count))
+
+        column_descriptions: List[ColumnDescription] = []
+        column_data: List[ColumnData] = []
+        for column_name, values in zip(column_names, column_values):
+            cell_types = set(map(type, values))
+            if not cell_types.issubset(_CELL_TYPES_WITHOUT_CONVERSION):
+                values = tuple(map(_convert_to_supported_type, values))
+                cell_types = set(map(type, values))
+            cell_types.discard(type(None))
+            if len(cell_types) > 1:
+                raise ValueError(
+                    f"Column {repr(column_name)} has values of different types: "
+                    f"{sorted(cell_type.__name__ for cell_type in cell_types)}"
+                )
+            column_type: Type[CellValue] = cell_types.pop() if len(cell_types) == 1 else type(None)
+            column_descriptions.append(ColumnDescription(column_name=column_name, column_type=column_type))
+            column_data.append(
+                # The values were checked to be of a single supported type above.
+                ColumnData.create(column_type=column_type, values=values, validate=False)  # type: ignore[arg-type]
+            )
+
+        return MetricFlowDataTable(column_descriptions=tuple(column_descriptions), column_data=tuple(column_data))
+
 
 class _MetricFlowDataTableBuilder:
     """Helps build `MetricFlowDataTable`, one row at a time.
@@ -221,42 +347,20 @@ class _MetricFlowDataTableBuilder:
 
         final_column_types = column_types_so_far
 
-        return MetricFlowDataTable(
+        column_values: Sequence[Sequence[CellValue]] = tuple(zip(*self._rows))
+        if len(column_values) == 0:
+            column_values = tuple(() for _ in self._column_names)
+        return MetricFlowDataTable.create_from_columns(
             column_descriptions=tuple(
                 ColumnDescription(column_name=column_name, column_type=column_type)
                 for column_name, column_type in itertools.zip_longest(self._column_names, final_column_types)
             ),
-            rows=tuple(self._rows),
+            column_values=column_values,
         )
 
     def _convert_row_to_supported_types(self, row: Sequence[InputCellValue]) -> Sequence[CellValue]:
         """Since only a limited set of types are supported, convert the input type to the supported type."""
-        updated_row: List[CellValue] = []
-        for cell_value in row:
-            if (
-                cell_value is None
-                or isinstance(cell_value, float)
-                or isinstance(cell_value, bool)
-                or isinstance(cell_value, int)
-                or isinstance(cell_value, str)
-            ):
-                updated_row.append(cell_value)
-                continue
-
-            if isinstance(cell_value, datetime.datetime):
-                updated_row.append(cell_value.replace(tzinfo=None))
-                continue
-
-            if isinstance(cell_value, Decimal):
-                updated_row.append(float(cell_value))
-                continue
-
-            if isinstance(cell_value, datetime.date):
-                updated_row.append(datetime.datetime.combine(cell_value, datetime.datetime.min.time()))
-                continue
-
-            raise ValueError(f"Row cell has unexpected type: {repr(cell_value)}")
-        return updated_row
+        return tuple(_convert_to_supported_type(cell_value) for cell_value in row)
 
     def add_row(self, row: Sequence[InputCellValue], parse_strings: bool = False) -> Self:  # noqa: D102
         row = tuple(row)
@@ -272,3 +376,30 @@ class _MetricFlowDataTableBuilder:
 
     def build(self) -> MetricFlowDataTable:  # noqa: D102
         return self._build_table_from_rows()
+
+
+# Cell types that can be stored as-is. `datetime` is not included since the timezone needs to be removed.
+_CELL_TYPES_WITHOUT_CONVERSION = frozenset((type(None), float, bool, int, str))
+
+
+def _convert_to_supported_type(cell_value: InputCellValue) -> CellValue:
+    """Since only a limited set of types are supported, convert the input type to the supported type."""
+    if (
+        cell_value is None
+        or isinstance(cell_value, float)
+        or isinstance(cell_value, bool)
+        or isinstance(cell_value, int)
+        or isinstance(cell_value, str)
+    ):
+        return cell_value
+
+    if isinstance(cell_value, datetime.datetime):
+        return cell_value.replace(tzinfo=None)
+
+    if isinstance(cell_value, Decimal):
+        return float(cell_value)
+
+    if isinstance(cell_value, datetime.date):
+        return datetime.datetime.combine(cell_value, datetime.datetime.min.time())
+
+    raise ValueError(f"Row cell has unexpected type: {repr(cell_value)}")
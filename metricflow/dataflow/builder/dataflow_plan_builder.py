@@ -23,6 +23,7 @@ from metricflow_semantics.dag.mf_dag import DagId
 from metricflow_semantics.errors.error_classes import UnableToSatisfyQueryError
 from metricflow_semantics.filters.time_constraint import TimeRangeConstraint
 from metricflow_semantics.mf_logging.formatting import indent
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.mf_logging.runtime import log_runtime
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
@@ -92,6 +93,7 @@ from metricflow.plan_conversion.node_processor import (
     PredicatePushdownState,
     PreJoinNodeProcessor,
 )
+from metricflow.telemetry.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -233,10 +235,13 @@ class DataflowPlanBuilder:
         for optimizer in optimizer_factory.get_optimizers(optimizations):
             logger.info(f"Applying {optimizer.__class__.__name__}")
             try:
-                plan = optimizer.optimize(plan)
+                with trace_span("optimize_dataflow_plan", optimizer=optimizer.__class__.__name__):
+                    plan = optimizer.optimize(plan)
                 logger.info(
-                    f"After applying {optimizer.__class__.__name__}, the dataflow plan is:\n"
-                    f"{indent(plan.structure_text())}"
+                    LazyFormat(
+                        lambda: f"After applying {optimizer.__class__.__name__}, the dataflow plan is:\n"
+                        f"{indent(plan.structure_text())}"
+                    )
                 )
             except Exception:
                 logger.exception(f"Got an exception applying {optimizer.__class__.__name__}")
@@ -275,13 +280,15 @@ class DataflowPlanBuilder:
             predicate_pushdown_state=time_range_only_pushdown_state,
             linkable_spec_set=base_required_linkable_specs,
         )
-        logger.info(f"Recipe for base measure aggregation:\n{mf_pformat(base_measure_recipe)}")
+        logger.info(LazyFormat(lambda: f"Recipe for base measure aggregation:\n{mf_pformat(base_measure_recipe)}"))
         conversion_measure_recipe = self._find_dataflow_recipe(
             measure_spec_properties=self._build_measure_spec_properties([conversion_measure_spec.measure_spec]),
             predicate_pushdown_state=disabled_pushdown_state,
             linkable_spec_set=LinkableSpecSet(),
         )
-        logger.info(f"Recipe for conversion measure aggregation:\n{mf_pformat(conversion_measure_recipe)}")
+        logger.info(
+            LazyFormat(lambda: f"Recipe for conversion measure aggregation:\n{mf_pformat(conversion_measure_recipe)}")
+        )
         if base_measure_recipe is None:
             raise UnableToSatisfyQueryError(
                 f"Unable to join all items in request. Measure: {base_measure_spec.measure_spec}; Specs to join: {base_required_linkable_specs}"
@@ -402,10 +409,12 @@ class DataflowPlanBuilder:
         )
         entity_spec = EntitySpec.from_name(conversion_type_params.entity)
         logger.info(
-            f"For conversion metric {metric_spec},\n"
-            f"base_measure is:\n{mf_pformat(base_measure)}\n"
-            f"conversion_measure is:\n{mf_pformat(conversion_measure)}\n"
-            f"entity is:\n{mf_pformat(entity_spec)}"
+            LazyFormat(
+                lambda: f"For conversion metric {metric_spec},\n"
+                f"base_measure is:\n{mf_pformat(base_measure)}\n"
+                f"conversion_measure is:\n{mf_pformat(conversion_measure)}\n"
+                f"entity is:\n{mf_pformat(entity_spec)}"
+            )
         )
 
         aggregated_measures_node = self._build_aggregated_conversion_node(
@@ -524,9 +533,11 @@ class DataflowPlanBuilder:
             descendent_filter_specs=metric_spec.filter_specs,
         )
         logger.info(
-            f"For\n{indent(mf_pformat(metric_spec))}"
-            f"\nneeded measure is:"
-            f"\n{indent(mf_pformat(metric_input_measure_spec))}"
+            LazyFormat(
+                lambda: f"For\n{indent(mf_pformat(metric_spec))}"
+                f"\nneeded measure is:"
+                f"\n{indent(mf_pformat(metric_input_measure_spec))}"
+            )
         )
 
         aggregated_measures_node = self.build_aggregated_measure(
@@ -556,7 +567,10 @@ class DataflowPlanBuilder:
             filter_spec_factory=filter_spec_factory,
         )
         logger.info(
-            f"For {metric.type} metric: {metric_spec}, needed metrics are:\n" f"{mf_pformat(metric_input_specs)}"
+            LazyFormat(
+                lambda: f"For {metric.type} metric: {metric_spec}, needed metrics are:\n"
+                f"{mf_pformat(metric_input_specs)}"
+            )
         )
 
         required_linkable_specs, extraneous_linkable_specs = self.__get_required_and_extraneous_linkable_specs(
@@ -718,7 +732,7 @@ class DataflowPlanBuilder:
         output_nodes: List[DataflowPlanNode] = []
 
         for metric_spec in metric_specs:
-            logger.info(f"Generating compute metrics node for:\n{indent(mf_pformat(metric_spec))}")
+            logger.info(LazyFormat(lambda: f"Generating compute metrics node for:\n{indent(mf_pformat(metric_spec))}"))
             self._metric_lookup.get_metric(metric_spec.reference)
 
             output_nodes.append(
@@ -1011,9 +1025,11 @@ class DataflowPlanBuilder:
                 )
             )
             logger.info(
-                f"After adding multi-hop nodes, there are {len(candidate_nodes_for_right_side_of_join)} candidate "
-                f"nodes for the right side of the join:\n"
-                f"{mf_pformat(candidate_nodes_for_right_side_of_join)}"
+                LazyFormat(
+                    lambda: f"After adding multi-hop nodes, there are {len(candidate_nodes_for_right_side_of_join)} "
+                    f"candidate nodes for the right side of the join:\n"
+                    f"{mf_pformat(candidate_nodes_for_right_side_of_join)}"
+                )
             )
 
         # If there are MetricGroupBys in the requested linkable specs, build source nodes to satisfy them.
@@ -1050,15 +1066,20 @@ class DataflowPlanBuilder:
                 ]
                 if missing_specs:
                     logger.debug(
-                        f"Skipping evaluation for:\n"
-                        f"{indent(node.structure_text())}"
-                        f"since it does not have all of the measure specs:\n"
-                        f"{indent(mf_pformat(missing_specs))}"
+                        LazyFormat(
+                            lambda: f"Skipping evaluation for:\n"
+                            f"{indent(node.structure_text())}"
+                            f"since it does not have all of the measure specs:\n"
+                            f"{indent(mf_pformat(missing_specs))}"
+                        )
                     )
                     continue
 
             logger.debug(
-                f"Evaluating candidate node for the left side of the join:\n{indent(mf_pformat(node.structure_text()))}"
+                LazyFormat(
+                    lambda: "Evaluating candidate node for the left side of the join:\n"
+                    + indent(mf_pformat(node.structure_text()))
+                )
             )
 
             start_time = time.time()
@@ -1067,12 +1088,15 @@ class DataflowPlanBuilder:
                 required_linkable_specs=list(linkable_specs),
                 default_join_type=default_join_type,
             )
-            logger.info(f"Evaluation of {node} took {time.time() - start_time:.2f}s")
+            evaluation_runtime = time.time() - start_time
+            logger.info(LazyFormat(lambda: f"Evaluation of {node} took {evaluation_runtime:.2f}s"))
 
             logger.info(
-                "Evaluation for source node:"
-                + indent(f"\nnode:\n{indent(node.structure_text())}")
-                + indent(f"\nevaluation:\n{indent(mf_pformat(evaluation))}")
+                LazyFormat(
+                    lambda: "Evaluation for source node:"
+                    + indent(f"\nnode:\n{indent(node.structure_text())}")
+                    + indent(f"\nevaluation:\n{indent(mf_pformat(evaluation))}")
+                )
             )
 
             if len(evaluation.unjoinable_linkable_specs) > 0:
@@ -1103,10 +1127,12 @@ class DataflowPlanBuilder:
             evaluation = node_to_evaluation[node_with_lowest_cost_plan]
 
             logger.info(
-                "Lowest cost plan is:"
-                + indent(f"\nnode:\n{indent(node_with_lowest_cost_plan.structure_text())}")
-                + indent(f"\nevaluation:\n{indent(mf_pformat(evaluation))}")
-                + indent(f"\njoins: {len(node_to_evaluation[node_with_lowest_cost_plan].join_recipes)}")
+                LazyFormat(
+                    lambda: "Lowest cost plan is:"
+                    + indent(f"\nnode:\n{indent(node_with_lowest_cost_plan.structure_text())}")
+                    + indent(f"\nevaluation:\n{indent(mf_pformat(evaluation))}")
+                    + indent(f"\njoins: {len(node_to_evaluation[node_with_lowest_cost_plan].join_recipes)}")
+                )
             )
 
             # Nodes containing the linkable instances will be joined to the source node, so these
@@ -1321,9 +1347,11 @@ class DataflowPlanBuilder:
         measure_spec = metric_input_measure_spec.measure_spec
 
         logger.info(
-            f"Building aggregated measure: {measure_spec} with input measure filters:\n"
-            f"{mf_pformat(metric_input_measure_spec.filter_specs)}\n"
-            f"and  filters:\n{mf_pformat(metric_input_measure_spec.filter_specs)}"
+            LazyFormat(
+                lambda: f"Building aggregated measure: {measure_spec} with input measure filters:\n"
+                f"{mf_pformat(metric_input_measure_spec.filter_specs)}\n"
+                f"and  filters:\n{mf_pformat(metric_input_measure_spec.filter_specs)}"
+            )
         )
 
         return self._build_aggregated_measure_from_measure_source_node(
@@ -1410,9 +1438,11 @@ class DataflowPlanBuilder:
 
         if measure_recipe is None:
             logger.info(
-                "Looking for a recipe to get:"
-                + indent(f"\nmeasure_specs:\n{mf_pformat([measure_spec])}")
-                + indent(f"\nevaluation:\n{mf_pformat(required_linkable_specs)}")
+                LazyFormat(
+                    lambda: "Looking for a recipe to get:"
+                    + indent(f"\nmeasure_specs:\n{mf_pformat([measure_spec])}")
+                    + indent(f"\nevaluation:\n{mf_pformat(required_linkable_specs)}")
+                )
             )
             measure_time_constraint = (
                 (cumulative_metric_adjusted_time_constraint or predicate_pushdown_state.time_range_constraint)
@@ -1438,7 +1468,7 @@ class DataflowPlanBuilder:
                 f"took {time.time() - find_recipe_start_time:.2f}s"
             )
 
-        logger.info(f"Using recipe:\n{indent(mf_pformat(measure_recipe))}")
+        logger.info(LazyFormat(lambda: f"Using recipe:\n{indent(mf_pformat(measure_recipe))}"))
 
         if measure_recipe is None:
             raise UnableToSatisfyQueryError(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Dict, Optional, Sequence
 
+from metricflow_semantics.collection_helpers.lru_cache import CacheStats, LruCache
 from metricflow_semantics.dag.id_prefix import StaticIdPrefix
 from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
 from metricflow_semantics.mf_logging.runtime import log_block_runtime
@@ -59,42 +60,90 @@ class DataflowPlanNodeOutputDataSetResolver(DataflowToSqlQueryPlanConverter):
     The logic to figure the dataset output by a node is the same as DataflowToSqlQueryPlanConverter because the same
     information is needed for generating SQL queries, so inheriting from that. We may want to look later at making
     another class to have better separation of concerns.
+
+    The output data sets are cached in two tiers. The nodes passed to `cache_output_data_sets` (generally the source
+    nodes) are pinned and are never evicted. Other nodes are generally created for a specific query, so they are cached
+    in a size-bounded LRU cache to avoid growing memory usage in a long-running process.
     """
 
+    DEFAULT_QUERY_NODE_CACHE_MAX_SIZE = 1000
+
     def __init__(  # noqa: D107
         self,
         column_association_resolver: ColumnAssociationResolver,
         semantic_manifest_lookup: SemanticManifestLookup,
-        _node_to_output_data_set: Optional[Dict[DataflowPlanNode, SqlDataSet]] = None,
+        query_node_cache_max_size: int = DEFAULT_QUERY_NODE_CACHE_MAX_SIZE,
+        _pinned_node_to_output_data_set: Optional[Dict[DataflowPlanNode, SqlDataSet]] = None,
     ) -> None:
-        self._node_to_output_data_set: Dict[DataflowPlanNode, SqlDataSet] = _node_to_output_data_set or {}
+        self._pinned_node_to_output_data_set: Dict[DataflowPlanNode, SqlDataSet] = (
+            _pinned_node_to_output_data_set if _pinned_node_to_output_data_set is not None else {}
+        )
+        # Set when the pinned dictionary is shared with a copy, in which case it's copied before the next write.
+        self._pinned_node_to_output_data_set_is_shared = _pinned_node_to_output_data_set is not None
+        self._query_node_cache: LruCache[DataflowPlanNode, SqlDataSet] = LruCache(max_size=query_node_cache_max_size)
         super().__init__(
             column_association_resolver=column_association_resolver,
             semantic_manifest_lookup=semantic_manifest_lookup,
         )
 
     def get_output_data_set(self, node: DataflowPlanNode) -> SqlDataSet:
-        """Cached since this will be called repeatedly during the computation of multiple metrics.
+        """Cached since this will be called repeatedly during the computation of multiple metrics."""
+        data_set = self._pinned_node_to_output_data_set.get(node)
+        if data_set is not None:
+            return data_set
 
-        # TODO: The cache needs to be pruned, but has not yet been an issue.
-        """
-        if node not in self._node_to_output_data_set:
-            self._node_to_output_data_set[node] = node.accept(self)
+        data_set = self._query_node_cache.get(node)
+        if data_set is None:
+            data_set = node.accept(self)
+            self._query_node_cache.set(node, data_set)
+        return data_set
 
-        return self._node_to_output_data_set[node]
+    @override
+    def _convert_node(self, node: DataflowPlanNode) -> SqlDataSet:
+        """Use the cache for the parents of a node as well, so that shared nodes are only converted once."""
+        return self.get_output_data_set(node)
 
     def cache_output_data_sets(self, nodes: Sequence[DataflowPlanNode]) -> None:
-        """Cache the output of the given nodes for consistent retrieval with `get_output_data_set`."""
+        """Cache the output of the given nodes for consistent retrieval with `get_output_data_set`.
+
+        The outputs of these nodes are pinned in the cache, so this should be used for nodes that are used across
+        queries (e.g. source nodes).
+        """
         with log_block_runtime(f"cache_output_data_sets for {len(nodes)} nodes"):
+            if self._pinned_node_to_output_data_set_is_shared:
+                self._pinned_node_to_output_data_set = dict(self._pinned_node_to_output_data_set)
+                self._pinned_node_to_output_data_set_is_shared = False
             for node in nodes:
-                self.get_output_data_set(node)
+                if node in self._pinned_node_to_output_data_set:
+                    continue
+                # Pinned outputs are not also stored in the LRU cache.
+                data_set = self._query_node_cache.get(node)
+                if data_set is None:
+                    data_set = node.accept(self)
+                self._pinned_node_to_output_data_set[node] = data_set
+
+    @property
+    def pinned_node_count(self) -> int:
+        """The number of nodes with outputs pinned in the cache."""
+        return len(self._pinned_node_to_output_data_set)
+
+    @property
+    def query_node_cache_stats(self) -> CacheStats:
+        """Counters for the cache of outputs for nodes that are not pinned."""
+        return self._query_node_cache.stats
 
     def copy(self) -> DataflowPlanNodeOutputDataSetResolver:
-        """Return a copy of this with the same nodes cached."""
+        """Return a copy of this with the same nodes pinned in the cache.
+
+        The pinned outputs are shared with the copy until either one pins additional nodes. The cache of outputs for
+        other nodes is not copied.
+        """
+        self._pinned_node_to_output_data_set_is_shared = True
         return DataflowPlanNodeOutputDataSetResolver(
             column_association_resolver=self.column_association_resolver,
             semantic_manifest_lookup=self._semantic_manifest_lookup,
-            _node_to_output_data_set=dict(self._node_to_output_data_set),
+            query_node_cache_max_size=self._query_node_cache.stats.max_size,
+            _pinned_node_to_output_data_set=self._pinned_node_to_output_data_set,
         )
 
     @override
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import textwrap
 from dataclasses import dataclass
 from typing import Optional, Sequence
 
-import jinja2
 from dbt_semantic_interfaces.references import SemanticModelReference
 from metricflow_semantics.dag.id_prefix import IdPrefix, StaticIdPrefix
 from metricflow_semantics.dag.mf_dag import DisplayedProperty
@@ -52,13 +50,7 @@ class ReadSqlSourceNode(DataflowPlanNode):
         return self.data_set.semantic_model_reference
 
     def __str__(self) -> str:  # noqa: D105
-        return jinja2.Template(
-            textwrap.dedent(
-                """\
-                <{{ class_name }} data_set={{ data_set }} />
-                """
-            )
-        ).render(class_name=self.__class__.__name__, data_set=str(self.data_set))
+        return f"<{self.__class__.__name__} data_set={self.data_set} />"
 
     @property
     def description(self) -> str:  # noqa: D102
@@ -1,20 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
 import datetime
+import functools
 import logging
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import FrozenSet, List, Optional, Sequence, Tuple
+from types import TracebackType
+from typing import Callable, ContextManager, FrozenSet, Iterator, List, Optional, Sequence, TextIO, Tuple, Type, TypeVar
 
 from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimensionTypeParams
 from dbt_semantic_interfaces.implementations.filters.where_filter import PydanticWhereFilter
 from dbt_semantic_interfaces.references import EntityReference, MeasureReference, MetricReference
-from dbt_semantic_interfaces.type_enums import DimensionType
+from dbt_semantic_interfaces.type_enums import DimensionType, MetricType
+from metricflow_semantics.collection_helpers.lru_cache import CacheStats, LruCache
 from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
 from metricflow_semantics.errors.error_classes import ExecutionException
 from metricflow_semantics.filters.time_constraint import TimeRangeConstraint
 from metricflow_semantics.mf_logging.formatting import indent
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
@@ -30,6 +39,7 @@ from metricflow_semantics.specs.dunder_column_association_resolver import Dunder
 from metricflow_semantics.specs.query_param_implementations import SavedQueryParameter
 from metricflow_semantics.specs.query_spec import MetricFlowQuerySpec
 from metricflow_semantics.specs.spec_set import InstanceSpecSet
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
 from metricflow_semantics.sql.sql_table import SqlTable
 from metricflow_semantics.time.time_source import TimeSource
 from metricflow_semantics.time.time_spine_source import TimeSpineSource
@@ -49,18 +59,44 @@ from metricflow.execution.convert_to_execution_plan import ConvertToExecutionPla
 from metricflow.execution.dataflow_to_execution import (
     DataflowToExecutionPlanConverter,
 )
-from metricflow.execution.execution_plan import ExecutionPlan, SqlQuery
-from metricflow.execution.executor import SequentialPlanExecutor
-from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.execution.execution_plan import (
+    ExecutionPlan,
+    ExecutionPlanTask,
+    SelectSqlQueryToCsvFileTask,
+    SqlQuery,
+    TaskExecutionResult,
+)
+from metricflow.execution.executor import (
+    AsyncPlanExecutor,
+    ExecutionPlanExecutor,
+    ExecutionResults,
+    SequentialPlanExecutor,
+)
+from metricflow.execution.thread_pool_sql_client import ThreadPoolAsyncSqlClient
+from metricflow.plan_conversion.dataflow_to_sql import (
+    TIME_RANGE_CONSTRAINT_END_BIND_PARAMETER_KEY,
+    TIME_RANGE_CONSTRAINT_START_BIND_PARAMETER_KEY,
+    DataflowToSqlQueryPlanConverter,
+    time_range_constraint_bind_parameters,
+)
+from metricflow.protocols.sql_client import DEFAULT_QUERY_BATCH_SIZE, AsyncSqlClient, SqlClient
 from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
 from metricflow.telemetry.models import TelemetryLevel
-from metricflow.telemetry.reporter import TelemetryReporter, log_call
+from metricflow.telemetry.reporter import TelemetryReporter, log_async_call, log_call
+from metricflow.telemetry.tracing import (
+    TraceRecorder,
+    TraceSpan,
+    TraceSpanExporter,
+    add_trace_span_attributes,
+    trace_span,
+)
 
 logger = logging.getLogger(__name__)
 _telemetry_reporter = TelemetryReporter(report_levels_higher_or_equal_to=TelemetryLevel.USAGE)
 _telemetry_reporter.add_python_log_handler()
 
+ResultT = TypeVar("ResultT")
+
 
 @dataclass(frozen=True)
 class MetricFlowRequestId:
@@ -152,25 +188,88 @@ class MetricFlowQueryRequest:
         )
 
 
+@dataclass(frozen=True)
+class _PlanCacheKey:
+    """Hashable form of the fields in a `MetricFlowQueryRequest` that affect the generated plan.
+
+    The request ID is excluded so that repeated queries map to the same key.
+    """
+
+    saved_query_name: Optional[str]
+    metric_names: Optional[Tuple[str, ...]]
+    metrics: Optional[Tuple[MetricQueryParameter, ...]]
+    group_by_names: Optional[Tuple[str, ...]]
+    group_by: Optional[Tuple[GroupByParameter, ...]]
+    limit: Optional[int]
+    time_constraint_start: Optional[datetime.datetime]
+    time_constraint_end: Optional[datetime.datetime]
+    where_constraint: Optional[str]
+    order_by_names: Optional[Tuple[str, ...]]
+    order_by: Optional[Tuple[OrderByQueryParameter, ...]]
+    min_max_only: bool
+    sql_optimization_level: SqlQueryOptimizationLevel
+    dataflow_plan_optimizations: FrozenSet[DataflowPlanOptimization]
+    query_type: MetricFlowQueryType
+
+    @staticmethod
+    def from_request(mf_request: MetricFlowQueryRequest) -> Optional[_PlanCacheKey]:
+        """Return the key for the request, or None if the request contains parameters that can't be hashed."""
+        key = _PlanCacheKey(
+            saved_query_name=mf_request.saved_query_name,
+            metric_names=tuple(mf_request.metric_names) if mf_request.metric_names is not None else None,
+            metrics=tuple(mf_request.metrics) if mf_request.metrics is not None else None,
+            group_by_names=tuple(mf_request.group_by_names) if mf_request.group_by_names is not None else None,
+            group_by=tuple(mf_request.group_by) if mf_request.group_by is not None else None,
+            limit=mf_request.limit,
+            time_constraint_start=mf_request.time_constraint_start,
+            time_constraint_end=mf_request.time_constraint_end,
+            where_constraint=mf_request.where_constraint,
+            order_by_names=tuple(mf_request.order_by_names) if mf_request.order_by_names is not None else None,
+            order_by=tuple(mf_request.order_by) if mf_request.order_by is not None else None,
+            min_max_only=mf_request.min_max_only,
+            sql_optimization_level=mf_request.sql_optimization_level,
+            dataflow_plan_optimizations=frozenset(mf_request.dataflow_plan_optimizations),
+            query_type=mf_request.query_type,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # Query parameter objects passed in by callers may not be hashable.
+            return None
+        return key
+
+    def without_time_constraint(self) -> _PlanCacheKey:
+        """Return a key for the shape of the query i.e. the same request without the time constraint values."""
+        return dataclasses.replace(self, time_constraint_start=None, time_constraint_end=None)
+
+
 @dataclass(frozen=True)
 class MetricFlowQueryResult:
-    """The result of a query and context on how it was generated."""
+    """The result of a query and context on how it was generated.
+
+    trace has the time spent in each phase of the request (e.g. parsing, building the plan, running the SQL).
+    """
 
     query_spec: MetricFlowQuerySpec
     dataflow_plan: DataflowPlan
     sql: str
     result_df: Optional[MetricFlowDataTable] = None
     result_table: Optional[SqlTable] = None
+    trace: Optional[TraceSpan] = None
 
 
 @dataclass(frozen=True)
 class MetricFlowExplainResult:
-    """Returns plans for resolving a query."""
+    """Returns plans for resolving a query.
+
+    trace has the time spent in each phase of generating the plans.
+    """
 
     query_spec: MetricFlowQuerySpec
     dataflow_plan: DataflowPlan
     convert_to_execution_plan_result: ConvertToExecutionPlanResult
     output_table: Optional[SqlTable] = None
+    trace: Optional[TraceSpan] = None
 
     @property
     def rendered_sql(self) -> SqlQuery:
@@ -338,12 +437,29 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         query_parser: Optional[MetricFlowQueryParser] = None,
         column_association_resolver: Optional[ColumnAssociationResolver] = None,
         consistent_id_enumeration: Optional[bool] = True,
+        plan_cache_max_size: int = 1000,
+        plan_executor: Optional[ExecutionPlanExecutor] = None,
+        async_sql_client: Optional[AsyncSqlClient] = None,
+        trace_span_exporter: Optional[TraceSpanExporter] = None,
     ) -> None:
         """Initializer for MetricFlowEngine.
 
         consistent_id_enumeration can be set to True to reset the numbering of sequentially generated IDs on each query. This
         will help generate consistent SQL between queries as aliases will be the same.
 
+        plan_cache_max_size is the number of plans (i.e. `MetricFlowExplainResult`s) to keep for repeated requests. Set
+        to 0 to disable caching. This is also the number of SQL templates kept for `explain_parameterized_sql()`.
+
+        plan_executor runs the tasks in the execution plan for a query. By default, tasks are run one at a time. Use
+        `ParallelPlanExecutor` to run independent tasks concurrently.
+
+        async_sql_client runs the SQL for `aquery()`. By default, the calls to sql_client are run in a bounded pool of
+        threads that is created on the first call to `aquery()`. Call `close()` (or use the engine as a context
+        manager) to stop those threads. sql_client itself is not closed.
+
+        trace_span_exporter receives the trace of each query and explain request, in addition to the trace being
+        returned in the result. Use `OpenTelemetryTraceSpanExporter` to send the traces to OpenTelemetry.
+
         For direct calls to construct MetricFlowEngine, do not pass the following parameters,
         - time_source
         - column_association_resolver
@@ -352,84 +468,147 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         These parameters are mainly there to be overridden during tests.
         """
         self._reset_id_enumeration = consistent_id_enumeration
-        if self._reset_id_enumeration:
-            # Some of the objects that are created below use generated IDs. To avoid collision with IDs that are
-            # generated for queries, set the ID generation numbering to start at a high enough number.
-            logger.info(
-                f"For creating setup objects, setting numbering of generated IDs to start at: "
-                f"{MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_INITIALIZER}"
+        # Some of the objects that are created below use generated IDs. To avoid collision with IDs that are
+        # generated for queries, number those IDs starting at a high enough number.
+        with self._consistent_id_number_space(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_INITIALIZER):
+            self._semantic_manifest_lookup = semantic_manifest_lookup
+            self._sql_client = sql_client
+            self._column_association_resolver = column_association_resolver or (
+                DunderColumnAssociationResolver(semantic_manifest_lookup)
             )
-            SequentialIdGenerator.reset(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_INITIALIZER)
-        self._semantic_manifest_lookup = semantic_manifest_lookup
-        self._sql_client = sql_client
-        self._column_association_resolver = column_association_resolver or (
-            DunderColumnAssociationResolver(semantic_manifest_lookup)
-        )
-        self._time_source = time_source
-        self._time_spine_sources = TimeSpineSource.create_from_manifest(semantic_manifest_lookup.semantic_manifest)
-        self._source_data_sets: List[SemanticModelDataSet] = []
-        converter = SemanticModelToDataSetConverter(column_association_resolver=self._column_association_resolver)
-        for semantic_model in sorted(
-            self._semantic_manifest_lookup.semantic_manifest.semantic_models, key=lambda model: model.name
-        ):
-            data_set = converter.create_sql_source_data_set(semantic_model)
-            self._source_data_sets.append(data_set)
-            logger.info(f"Created source dataset from semantic model '{semantic_model.name}'")
+            self._time_source = time_source
+            self._time_spine_sources = TimeSpineSource.create_from_manifest(semantic_manifest_lookup.semantic_manifest)
+            self._source_data_sets: List[SemanticModelDataSet] = []
+            converter = SemanticModelToDataSetConverter(column_association_resolver=self._column_association_resolver)
+            for semantic_model in sorted(
+                self._semantic_manifest_lookup.semantic_manifest.semantic_models, key=lambda model: model.name
+            ):
+                data_set = converter.create_sql_source_data_set(semantic_model)
+                self._source_data_sets.append(data_set)
+                logger.info(f"Created source dataset from semantic model '{semantic_model.name}'")
+
+            source_node_builder = SourceNodeBuilder(
+                column_association_resolver=self._column_association_resolver,
+                semantic_manifest_lookup=self._semantic_manifest_lookup,
+            )
+            source_node_set = source_node_builder.create_from_data_sets(self._source_data_sets)
 
-        source_node_builder = SourceNodeBuilder(
-            column_association_resolver=self._column_association_resolver,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
-        )
-        source_node_set = source_node_builder.create_from_data_sets(self._source_data_sets)
+            node_output_resolver = DataflowPlanNodeOutputDataSetResolver(
+                column_association_resolver=self._column_association_resolver,
+                semantic_manifest_lookup=self._semantic_manifest_lookup,
+            )
+            node_output_resolver.cache_output_data_sets(source_node_set.all_nodes)
+
+            self._dataflow_plan_builder = DataflowPlanBuilder(
+                source_node_set=source_node_set,
+                semantic_manifest_lookup=self._semantic_manifest_lookup,
+                column_association_resolver=self._column_association_resolver,
+                node_output_resolver=node_output_resolver,
+                source_node_builder=source_node_builder,
+            )
+            self._to_sql_query_plan_converter = DataflowToSqlQueryPlanConverter(
+                column_association_resolver=self._column_association_resolver,
+                semantic_manifest_lookup=self._semantic_manifest_lookup,
+            )
+            self._to_execution_plan_converter = DataflowToExecutionPlanConverter(
+                sql_plan_converter=self._to_sql_query_plan_converter,
+                sql_plan_renderer=self._sql_client.sql_query_plan_renderer,
+                sql_client=sql_client,
+            )
+            self._to_parameterized_execution_plan_converter = DataflowToExecutionPlanConverter(
+                sql_plan_converter=DataflowToSqlQueryPlanConverter(
+                    column_association_resolver=self._column_association_resolver,
+                    semantic_manifest_lookup=self._semantic_manifest_lookup,
+                    bind_time_range_constraints=True,
+                ),
+                sql_plan_renderer=self._sql_client.sql_query_plan_renderer,
+                sql_client=sql_client,
+            )
+            self._executor = plan_executor or SequentialPlanExecutor()
+            self._async_sql_client = async_sql_client
+            # Created on the first call to `aquery()` as most uses of the engine don't need the thread pool.
+            self._async_executor: Optional[AsyncPlanExecutor] = None
+            self._thread_pool_async_sql_client: Optional[ThreadPoolAsyncSqlClient] = None
+            self._async_executor_lock = threading.Lock()
+
+            self._query_parser = query_parser or MetricFlowQueryParser(
+                semantic_manifest_lookup=self._semantic_manifest_lookup,
+            )
+        self._trace_span_exporter = trace_span_exporter
+        self._plan_cache: LruCache[_PlanCacheKey, MetricFlowExplainResult] = LruCache(max_size=plan_cache_max_size)
+        # Keyed by the shape of the query. The SQL has placeholders for the time range constraint.
+        self._sql_template_cache: LruCache[_PlanCacheKey, SqlQuery] = LruCache(max_size=plan_cache_max_size)
 
-        node_output_resolver = DataflowPlanNodeOutputDataSetResolver(
-            column_association_resolver=self._column_association_resolver,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
-        )
-        node_output_resolver.cache_output_data_sets(source_node_set.all_nodes)
-
-        self._dataflow_plan_builder = DataflowPlanBuilder(
-            source_node_set=source_node_set,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
-            column_association_resolver=self._column_association_resolver,
-            node_output_resolver=node_output_resolver,
-            source_node_builder=source_node_builder,
-        )
-        self._to_sql_query_plan_converter = DataflowToSqlQueryPlanConverter(
-            column_association_resolver=self._column_association_resolver,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
-        )
-        self._to_execution_plan_converter = DataflowToExecutionPlanConverter(
-            sql_plan_converter=self._to_sql_query_plan_converter,
-            sql_plan_renderer=self._sql_client.sql_query_plan_renderer,
-            sql_client=sql_client,
-        )
-        self._executor = SequentialPlanExecutor()
+    @property
+    def plan_cache_stats(self) -> CacheStats:
+        """Counters for the cache of plans that were generated for previous requests."""
+        return self._plan_cache.stats
 
-        self._query_parser = query_parser or MetricFlowQueryParser(
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
-        )
+    def clear_plan_cache(self) -> None:
+        """Remove all plans generated for previous requests.
 
-    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
-    def query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:  # noqa: D102
-        logger.info(f"Starting query request:\n{indent(mf_pformat(mf_request))}")
-        explain_result = self._create_execution_plan(mf_request)
-        execution_plan = explain_result.convert_to_execution_plan_result.execution_plan
+        This needs to be called when the semantic manifest that the engine uses changes.
+        """
+        logger.info("Clearing the plan cache")
+        self._plan_cache.clear()
+        self._sql_template_cache.clear()
 
-        if len(execution_plan.tasks) != 1:
-            raise NotImplementedError("Multiple tasks not yet supported.")
+    def _consistent_id_number_space(self, start_value: int) -> ContextManager[None]:
+        """Return a context where generated IDs are numbered from `start_value` if consistent enumeration is enabled.
 
-        task = execution_plan.tasks[0]
+        The numbering is local to the calling thread, so queries can be planned concurrently with the same engine and
+        still produce the same IDs (and SQL table aliases) as when they are planned sequentially.
+        """
+        if self._reset_id_enumeration:
+            return SequentialIdGenerator.id_number_space(start_value)
+        return contextlib.nullcontext()
+
+    @contextlib.contextmanager
+    def _record_trace(self, request_type: str, mf_request: MetricFlowQueryRequest) -> Iterator[TraceRecorder]:
+        """Record the time spent in each phase of the request, and pass the trace to the exporter when finished."""
+        trace_recorder = TraceRecorder(request_type, request_id=mf_request.request_id.mf_rid)
+        try:
+            with trace_recorder:
+                yield trace_recorder
+        finally:
+            logger.debug(
+                LazyFormat(lambda: f"Trace for the request is:\n{indent(trace_recorder.span.structure_text())}")
+            )
+            if self._trace_span_exporter is not None:
+                try:
+                    self._trace_span_exporter.export(trace_recorder.span)
+                except Exception:
+                    logger.exception(f"Unable to export the trace for request: {mf_request.request_id}")
 
-        logger.info(f"Sequentially running tasks in:\n" f"{execution_plan.structure_text()}")
-        execution_results = self._executor.execute_plan(execution_plan)
-        logger.info("Finished running tasks in execution plan")
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:  # noqa: D102
+        logger.info(LazyFormat(lambda: f"Starting query request:\n{indent(mf_pformat(mf_request))}"))
+        with self._record_trace("query", mf_request) as trace_recorder:
+            explain_result = self._create_execution_plan(mf_request)
+            task_execution_result = self._execute_plan(explain_result.convert_to_execution_plan_result.execution_plan)
+        return self._create_query_result(mf_request, explain_result, task_execution_result, trace_recorder.span)
 
-        if execution_results.contains_task_errors:
-            raise ExecutionException(f"Got errors while executing tasks:\n{execution_results.get_result(task.task_id)}")
+    @log_async_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    async def aquery(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:
+        """Similar to `query()`, but for use in an event loop as it does not block while the SQL is run.
 
-        task_execution_result = execution_results.get_result(task.task_id)
+        The plan for the query is generated in the default executor of the event loop.
+        """
+        logger.info(LazyFormat(lambda: f"Starting query request:\n{indent(mf_pformat(mf_request))}"))
+        with self._record_trace("query", mf_request) as trace_recorder:
+            explain_result = await self._run_in_executor(functools.partial(self._create_execution_plan, mf_request))
+            task_execution_result = await self._aexecute_plan(
+                explain_result.convert_to_execution_plan_result.execution_plan
+            )
+        return self._create_query_result(mf_request, explain_result, task_execution_result, trace_recorder.span)
 
+    @staticmethod
+    def _create_query_result(
+        mf_request: MetricFlowQueryRequest,
+        explain_result: MetricFlowExplainResult,
+        task_execution_result: TaskExecutionResult,
+        trace: TraceSpan,
+    ) -> MetricFlowQueryResult:
         assert task_execution_result.sql, "Task execution should have returned SQL that was run"
 
         logger.info(f"Finished query request: {mf_request.request_id}")
@@ -439,92 +618,311 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             sql=task_execution_result.sql,
             result_df=task_execution_result.df,
             result_table=explain_result.output_table,
+            trace=trace,
         )
 
+    @staticmethod
+    async def _run_in_executor(function: Callable[[], ResultT]) -> ResultT:
+        """Run the function in the default executor so that CPU-bound work (e.g. planning) doesn't block the loop.
+
+        The function is run with a copy of the current context so that spans are added to the current trace.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, contextvars.copy_context().run, function)
+
+    def _get_async_executor(self) -> AsyncPlanExecutor:
+        with self._async_executor_lock:
+            if self._async_executor is None:
+                async_sql_client = self._async_sql_client
+                if async_sql_client is None:
+                    self._thread_pool_async_sql_client = ThreadPoolAsyncSqlClient(self._sql_client)
+                    async_sql_client = self._thread_pool_async_sql_client
+                self._async_executor = AsyncPlanExecutor(async_sql_client)
+            return self._async_executor
+
+    def close(self) -> None:
+        """Stop the threads that were created to run SQL for `aquery()`. The SQL clients are not closed.
+
+        The threads are created again if `aquery()` is called after this.
+        """
+        with self._async_executor_lock:
+            if self._thread_pool_async_sql_client is not None:
+                self._thread_pool_async_sql_client.close_thread_pool()
+            self._thread_pool_async_sql_client = None
+            self._async_executor = None
+
+    def __enter__(self) -> MetricFlowEngine:  # noqa: D105
+        return self
+
+    def __exit__(  # noqa: D105
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def query_to_csv_file(
+        self,
+        mf_request: MetricFlowQueryRequest,
+        csv_file: TextIO,
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+    ) -> MetricFlowQueryResult:
+        """Run the query and write the results to a CSV file.
+
+        Rows are fetched and written `batch_size` rows at a time, so this can be used for results that are too large to
+        keep in memory. The returned result does not include the data.
+        """
+        logger.info(LazyFormat(lambda: f"Starting query request:\n{indent(mf_pformat(mf_request))}"))
+        with self._record_trace("query_to_csv_file", mf_request) as trace_recorder:
+            explain_result = self._create_execution_plan(mf_request)
+            write_to_csv_file_task = SelectSqlQueryToCsvFileTask.create(
+                sql_client=self._sql_client,
+                sql_query=explain_result.rendered_sql,
+                output_file=csv_file,
+                batch_size=batch_size,
+            )
+            task_execution_result = self._execute_plan(ExecutionPlan(leaf_tasks=(write_to_csv_file_task,)))
+        assert task_execution_result.sql, "Task execution should have returned SQL that was run"
+
+        logger.info(f"Finished query request: {mf_request.request_id}")
+        return MetricFlowQueryResult(
+            query_spec=explain_result.query_spec,
+            dataflow_plan=explain_result.dataflow_plan,
+            sql=task_execution_result.sql,
+            trace=trace_recorder.span,
+        )
+
+    def _execute_plan(self, execution_plan: ExecutionPlan) -> TaskExecutionResult:
+        """Run the tasks in the execution plan and return the result of the final task."""
+        final_task = self._get_final_task(execution_plan)
+
+        logger.info(LazyFormat(lambda: f"Running tasks in:\n" f"{execution_plan.structure_text()}"))
+        with trace_span("execute_plan"):
+            execution_results = self._executor.execute_plan(execution_plan)
+        logger.info("Finished running tasks in execution plan")
+
+        return self._get_task_result(final_task, execution_results)
+
+    async def _aexecute_plan(self, execution_plan: ExecutionPlan) -> TaskExecutionResult:
+        """Similar to `_execute_plan()`, but runs the tasks with the async executor."""
+        final_task = self._get_final_task(execution_plan)
+
+        logger.info(LazyFormat(lambda: f"Running tasks in:\n" f"{execution_plan.structure_text()}"))
+        with trace_span("execute_plan"):
+            execution_results = await self._get_async_executor().execute_plan(execution_plan)
+        logger.info("Finished running tasks in execution plan")
+
+        return self._get_task_result(final_task, execution_results)
+
+    @staticmethod
+    def _get_final_task(execution_plan: ExecutionPlan) -> ExecutionPlanTask:
+        """Return the task that produces the results of the query. Other tasks are prerequisites."""
+        if len(execution_plan.sink_nodes) != 1:
+            raise NotImplementedError(
+                f"Multiple final tasks in the execution plan not yet supported. Got: {execution_plan.sink_nodes}"
+            )
+        return execution_plan.sink_nodes[0]
+
+    @staticmethod
+    def _get_task_result(task: ExecutionPlanTask, execution_results: ExecutionResults) -> TaskExecutionResult:
+        """Return the result of the task, or raise an exception if any of the tasks had an error."""
+        if execution_results.contains_task_errors:
+            failed_task_results = {
+                task_id: result for task_id, result in execution_results.all_results().items() if result.errors
+            }
+            raise ExecutionException(f"Got errors while executing tasks:\n{mf_pformat(failed_task_results)}")
+
+        return execution_results.get_result(task.task_id)
+
     @property
     def all_time_constraint(self) -> TimeRangeConstraint:
         """TimeRangeConstraint representing the min & max dates supported."""
         return TimeRangeConstraint.all_time()
 
     def _create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
-        if self._reset_id_enumeration:
-            logger.info(
-                f"Setting ID generation to start at: {MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_QUERIES}"
+        plan_cache_key = _PlanCacheKey.from_request(mf_query_request)
+        if plan_cache_key is not None:
+            cached_explain_result = self._plan_cache.get(plan_cache_key)
+            add_trace_span_attributes(plan_cache_hit=str(cached_explain_result is not None).lower())
+            if cached_explain_result is not None:
+                logger.info(f"Using cached plan for request: {mf_query_request.request_id}")
+                return cached_explain_result
+
+        explain_result = self._build_execution_plan(mf_query_request)
+        if plan_cache_key is not None:
+            self._plan_cache.set(plan_cache_key, explain_result)
+        return explain_result
+
+    def _parse_query_request(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowQuerySpec:
+        with trace_span("parse_query"):
+            if mf_query_request.saved_query_name is not None:
+                if mf_query_request.metrics or mf_query_request.metric_names:
+                    raise InvalidQueryException("Metrics can't be specified with a saved query.")
+                if mf_query_request.group_by or mf_query_request.group_by_names:
+                    raise InvalidQueryException("Group by items can't be specified with a saved query.")
+                query_spec = self._query_parser.parse_and_validate_saved_query(
+                    saved_query_parameter=SavedQueryParameter(mf_query_request.saved_query_name),
+                    where_filter=(
+                        PydanticWhereFilter(where_sql_template=mf_query_request.where_constraint)
+                        if mf_query_request.where_constraint is not None
+                        else None
+                    ),
+                    limit=mf_query_request.limit,
+                    time_constraint_start=mf_query_request.time_constraint_start,
+                    time_constraint_end=mf_query_request.time_constraint_end,
+                    order_by_names=mf_query_request.order_by_names,
+                    order_by_parameters=mf_query_request.order_by,
+                ).query_spec
+            else:
+                query_spec = self._query_parser.parse_and_validate_query(
+                    metric_names=mf_query_request.metric_names,
+                    metrics=mf_query_request.metrics,
+                    group_by_names=mf_query_request.group_by_names,
+                    group_by=mf_query_request.group_by,
+                    limit=mf_query_request.limit,
+                    time_constraint_start=mf_query_request.time_constraint_start,
+                    time_constraint_end=mf_query_request.time_constraint_end,
+                    where_constraint_str=mf_query_request.where_constraint,
+                    order_by_names=mf_query_request.order_by_names,
+                    order_by=mf_query_request.order_by,
+                    min_max_only=mf_query_request.min_max_only,
+                ).query_spec
+            logger.info(LazyFormat(lambda: f"Query spec is:\n{mf_pformat(query_spec)}"))
+            return query_spec
+
+    def _build_execution_plan(
+        self, mf_query_request: MetricFlowQueryRequest, bind_time_range_constraint: bool = False
+    ) -> MetricFlowExplainResult:
+        with self._consistent_id_number_space(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_QUERIES):
+            query_spec = self._parse_query_request(mf_query_request)
+
+            output_selection_specs: Optional[InstanceSpecSet] = None
+            if mf_query_request.query_type == MetricFlowQueryType.DIMENSION_VALUES:
+                # Filter result by dimension columns if it's a dimension values query
+                if len(query_spec.entity_specs) > 0:
+                    raise InvalidQueryException("Querying dimension values for entities is not allowed.")
+                output_selection_specs = InstanceSpecSet(
+                    dimension_specs=query_spec.dimension_specs,
+                    time_dimension_specs=query_spec.time_dimension_specs,
+                )
+
+            with trace_span("build_dataflow_plan"):
+                if query_spec.metric_specs:
+                    dataflow_plan = self._dataflow_plan_builder.build_plan(
+                        query_spec=query_spec,
+                        output_selection_specs=output_selection_specs,
+                        optimizations=mf_query_request.dataflow_plan_optimizations,
+                    )
+                else:
+                    dataflow_plan = self._dataflow_plan_builder.build_plan_for_distinct_values(
+                        query_spec=query_spec, optimizations=mf_query_request.dataflow_plan_optimizations
+                    )
+
+            if len(dataflow_plan.sink_nodes) > 1:
+                raise NotImplementedError(
+                    f"Multiple output nodes in the dataflow plan not yet supported. "
+                    f"Got tasks: {dataflow_plan.sink_nodes}"
+                )
+
+            to_execution_plan_converter = (
+                self._to_parameterized_execution_plan_converter
+                if bind_time_range_constraint
+                else self._to_execution_plan_converter
             )
-            SequentialIdGenerator.reset(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_QUERIES)
-
-        if mf_query_request.saved_query_name is not None:
-            if mf_query_request.metrics or mf_query_request.metric_names:
-                raise InvalidQueryException("Metrics can't be specified with a saved query.")
-            if mf_query_request.group_by or mf_query_request.group_by_names:
-                raise InvalidQueryException("Group by items can't be specified with a saved query.")
-            query_spec = self._query_parser.parse_and_validate_saved_query(
-                saved_query_parameter=SavedQueryParameter(mf_query_request.saved_query_name),
-                where_filter=(
-                    PydanticWhereFilter(where_sql_template=mf_query_request.where_constraint)
-                    if mf_query_request.where_constraint is not None
-                    else None
-                ),
-                limit=mf_query_request.limit,
-                time_constraint_start=mf_query_request.time_constraint_start,
-                time_constraint_end=mf_query_request.time_constraint_end,
-                order_by_names=mf_query_request.order_by_names,
-                order_by_parameters=mf_query_request.order_by,
-            ).query_spec
-        else:
-            query_spec = self._query_parser.parse_and_validate_query(
-                metric_names=mf_query_request.metric_names,
-                metrics=mf_query_request.metrics,
-                group_by_names=mf_query_request.group_by_names,
-                group_by=mf_query_request.group_by,
-                limit=mf_query_request.limit,
-                time_constraint_start=mf_query_request.time_constraint_start,
-                time_constraint_end=mf_query_request.time_constraint_end,
-                where_constraint_str=mf_query_request.where_constraint,
-                order_by_names=mf_query_request.order_by_names,
-                order_by=mf_query_request.order_by,
-                min_max_only=mf_query_request.min_max_only,
-            ).query_spec
-        logger.info(f"Query spec is:\n{mf_pformat(query_spec)}")
-
-        output_selection_specs: Optional[InstanceSpecSet] = None
-        if mf_query_request.query_type == MetricFlowQueryType.DIMENSION_VALUES:
-            # Filter result by dimension columns if it's a dimension values query
-            if len(query_spec.entity_specs) > 0:
-                raise InvalidQueryException("Querying dimension values for entities is not allowed.")
-            output_selection_specs = InstanceSpecSet(
-                dimension_specs=query_spec.dimension_specs,
-                time_dimension_specs=query_spec.time_dimension_specs,
+            convert_to_execution_plan_result = to_execution_plan_converter.convert_to_execution_plan(
+                dataflow_plan, sql_optimization_level=mf_query_request.sql_optimization_level
             )
 
-        if query_spec.metric_specs:
-            dataflow_plan = self._dataflow_plan_builder.build_plan(
+            return MetricFlowExplainResult(
                 query_spec=query_spec,
-                output_selection_specs=output_selection_specs,
-                optimizations=mf_query_request.dataflow_plan_optimizations,
-            )
-        else:
-            dataflow_plan = self._dataflow_plan_builder.build_plan_for_distinct_values(
-                query_spec=query_spec, optimizations=mf_query_request.dataflow_plan_optimizations
+                dataflow_plan=dataflow_plan,
+                convert_to_execution_plan_result=convert_to_execution_plan_result,
             )
 
-        if len(dataflow_plan.sink_nodes) > 1:
-            raise NotImplementedError(
-                f"Multiple output nodes in the dataflow plan not yet supported. "
-                f"Got tasks: {dataflow_plan.sink_nodes}"
-            )
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:  # noqa: D102
+        return self._explain(mf_request)
+
+    @log_async_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    async def aexplain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        """Similar to `explain()`, for use along with `aquery()`.
+
+        The plan is generated in the default executor of the event loop so that the loop is not blocked.
+        """
+        return await self._run_in_executor(functools.partial(self._explain, mf_request))
+
+    def _explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        with self._record_trace("explain", mf_request) as trace_recorder:
+            explain_result = self._create_execution_plan(mf_request)
+        return dataclasses.replace(explain_result, trace=trace_recorder.span)
+
+    def explain_parameterized_sql(self, mf_request: MetricFlowQueryRequest) -> SqlQuery:
+        """Return the SQL for the request where the time constraint is passed in through bind parameters.
 
-        convert_to_execution_plan_result = self._to_execution_plan_converter.convert_to_execution_plan(dataflow_plan)
+        The SQL is generated once for each shape of query (i.e. the request without the time constraint) and is reused
+        with the time constraint of later requests bound to the placeholders. This is useful for clients that repeat a
+        query with different time ranges as only the query needs to be parsed. For requests without a time constraint,
+        or where the time constraint is adjusted within the query (e.g. for cumulative metrics), the returned SQL is
+        the same as the one from `explain()`.
+        """
+        plan_cache_key = _PlanCacheKey.from_request(mf_request)
+        if plan_cache_key is None or (
+            mf_request.time_constraint_start is None and mf_request.time_constraint_end is None
+        ):
+            return self._create_execution_plan(mf_request).rendered_sql
+
+        with self._consistent_id_number_space(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_QUERIES):
+            query_spec = self._parse_query_request(mf_request)
+        time_range_constraint = query_spec.time_range_constraint
+        if time_range_constraint is None or not self._time_range_constraint_can_be_bound(query_spec):
+            return self._create_execution_plan(mf_request).rendered_sql
+
+        template_cache_key = plan_cache_key.without_time_constraint()
+        sql_template = self._sql_template_cache.get(template_cache_key)
+        if sql_template is None:
+            sql_template = self._build_execution_plan(mf_request, bind_time_range_constraint=True).rendered_sql
+            template_keys = set(sql_template.bind_parameters.param_dict)
+            if not {
+                TIME_RANGE_CONSTRAINT_START_BIND_PARAMETER_KEY,
+                TIME_RANGE_CONSTRAINT_END_BIND_PARAMETER_KEY,
+            }.issubset(template_keys):
+                logger.info("The generated SQL does not contain placeholders for the time constraint")
+                return self._create_execution_plan(mf_request).rendered_sql
+            self._sql_template_cache.set(template_cache_key, sql_template)
+        else:
+            logger.info(f"Using cached SQL template for request: {mf_request.request_id}")
 
-        return MetricFlowExplainResult(
-            query_spec=query_spec,
-            dataflow_plan=dataflow_plan,
-            convert_to_execution_plan_result=convert_to_execution_plan_result,
+        param_dict = sql_template.bind_parameters.param_dict
+        param_dict.update(time_range_constraint_bind_parameters(time_range_constraint).param_dict)
+        return SqlQuery(
+            sql_query=sql_template.sql_query,
+            bind_parameters=SqlBindParameters.create_from_dict(param_dict),
         )
 
-    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
-    def explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:  # noqa: D102
-        return self._create_execution_plan(mf_request)
+    def _time_range_constraint_can_be_bound(self, query_spec: MetricFlowQuerySpec) -> bool:
+        """Returns true if the time range constraint of the query is used without adjustment in the generated SQL.
+
+        Cumulative metrics, conversion metrics, and time offsets adjust the time range constraint for their inputs, so
+        those values can't be computed from the query's time range constraint alone.
+        """
+        if query_spec.group_by_metric_specs:
+            return False
+        for spec_resolution in query_spec.filter_spec_resolution_lookup.spec_resolutions:
+            if spec_resolution.resolved_linkable_element_set.path_key_to_linkable_metrics:
+                return False
+
+        metric_lookup = self._semantic_manifest_lookup.metric_lookup
+        metric_references = [metric_spec.reference for metric_spec in query_spec.metric_specs]
+        while metric_references:
+            metric = metric_lookup.get_metric(metric_references.pop())
+            if metric.type is MetricType.CUMULATIVE or metric.type is MetricType.CONVERSION:
+                return False
+            for input_metric in metric.input_metrics:
+                if input_metric.offset_window is not None or input_metric.offset_to_grain is not None:
+                    return False
+                metric_references.append(input_metric.as_reference)
+        return True
 
     def get_measures_for_metrics(self, metric_names: List[str]) -> List[Measure]:  # noqa: D102
         metrics = self._semantic_manifest_lookup.metric_lookup.get_metrics(
@@ -732,7 +1130,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         assert not (
             get_group_by_values and group_by
         ), "Both get_group_by_values and group_by were set, but if a group by is specified you should only use one of these!"
-        return self._create_execution_plan(
+        return self._explain(
             MetricFlowQueryRequest.create_with_random_request_id(
                 metric_names=metric_names,
                 metrics=metrics,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from typing_extensions import override
 
 from metricflow.dataflow.dataflow_plan import (
@@ -38,7 +40,9 @@ from metricflow.execution.execution_plan import (
 from metricflow.plan_conversion.convert_to_sql_plan import ConvertToSqlPlanResult
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
 from metricflow.protocols.sql_client import SqlClient
+from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
 from metricflow.sql.render.sql_plan_renderer import SqlPlanRenderResult, SqlQueryPlanRenderer
+from metricflow.telemetry.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +55,7 @@ class DataflowToExecutionPlanConverter(DataflowPlanNodeVisitor[ConvertToExecutio
         sql_plan_converter: DataflowToSqlQueryPlanConverter,
         sql_plan_renderer: SqlQueryPlanRenderer,
         sql_client: SqlClient,
+        sql_optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4,
     ) -> None:
         """Constructor.
 
@@ -58,22 +63,27 @@ class DataflowToExecutionPlanConverter(DataflowPlanNodeVisitor[ConvertToExecutio
             sql_plan_converter: Converts a dataflow plan node to a SQL query plan
             sql_plan_renderer: Converts a SQL query plan to SQL text
             sql_client: The client to use for running queries.
+            sql_optimization_level: The level of optimization for the generated SQL.
         """
         self._sql_plan_converter = sql_plan_converter
         self._sql_plan_renderer = sql_plan_renderer
         self._sql_client = sql_client
+        self._sql_optimization_level = sql_optimization_level
 
     def _convert_to_sql_plan(self, node: DataflowPlanNode) -> ConvertToSqlPlanResult:
         logger.info(f"Generating SQL query plan from {node.node_id}")
-        result = self._sql_plan_converter.convert_to_sql_query_plan(
-            sql_engine_type=self._sql_client.sql_engine_type,
-            dataflow_plan_node=node,
-        )
-        logger.debug(f"Generated SQL query plan is:\n{result.sql_plan.structure_text()}")
+        with trace_span("convert_to_sql_query_plan", optimization_level=self._sql_optimization_level.name):
+            result = self._sql_plan_converter.convert_to_sql_query_plan(
+                sql_engine_type=self._sql_client.sql_engine_type,
+                dataflow_plan_node=node,
+                optimization_level=self._sql_optimization_level,
+            )
+        logger.debug(LazyFormat(lambda: f"Generated SQL query plan is:\n{result.sql_plan.structure_text()}"))
         return result
 
     def _render_sql(self, convert_to_sql_plan_result: ConvertToSqlPlanResult) -> SqlPlanRenderResult:
-        return self._sql_plan_renderer.render_sql_query_plan(convert_to_sql_plan_result.sql_plan)
+        with trace_span("render_sql"):
+            return self._sql_plan_renderer.render_sql_query_plan(convert_to_sql_plan_result.sql_plan)
 
     @override
     def visit_write_to_result_data_table_node(self, node: WriteToResultDataTableNode) -> ConvertToExecutionPlanResult:
@@ -115,9 +125,24 @@ class DataflowToExecutionPlanConverter(DataflowPlanNodeVisitor[ConvertToExecutio
             execution_plan=execution_plan,
         )
 
-    def convert_to_execution_plan(self, dataflow_plan: DataflowPlan) -> ConvertToExecutionPlanResult:
-        """Convert the dataflow plan to an execution plan."""
+    def convert_to_execution_plan(
+        self, dataflow_plan: DataflowPlan, sql_optimization_level: Optional[SqlQueryOptimizationLevel] = None
+    ) -> ConvertToExecutionPlanResult:
+        """Convert the dataflow plan to an execution plan.
+
+        Args:
+            dataflow_plan: The dataflow plan to convert.
+            sql_optimization_level: If specified, use this level of optimization for the generated SQL instead of
+            the one that was passed to the constructor.
+        """
         assert len(dataflow_plan.sink_nodes) == 1, "Only 1 sink node in the plan is currently supported."
+        if sql_optimization_level is not None and sql_optimization_level is not self._sql_optimization_level:
+            return DataflowToExecutionPlanConverter(
+                sql_plan_converter=self._sql_plan_converter,
+                sql_plan_renderer=self._sql_plan_renderer,
+                sql_client=self._sql_client,
+                sql_optimization_level=sql_optimization_level,
+            ).convert_to_execution_plan(dataflow_plan)
         return dataflow_plan.sink_nodes[0].accept(self)
 
     @override
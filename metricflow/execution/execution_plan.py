@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import csv
 import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import List, Optional, Sequence, TextIO, Tuple
 
 from metricflow_semantics.dag.id_prefix import IdPrefix, StaticIdPrefix
 from metricflow_semantics.dag.mf_dag import DagId, DagNode, DisplayedProperty, MetricFlowDag, NodeId
@@ -13,7 +16,7 @@ from metricflow_semantics.sql.sql_table import SqlTable
 from metricflow_semantics.visitor import Visitable
 
 from metricflow.data_table.mf_table import MetricFlowDataTable
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.protocols.sql_client import DEFAULT_QUERY_BATCH_SIZE, AsyncSqlClient, SqlClient
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +39,15 @@ class ExecutionPlanTask(DagNode["ExecutionPlanTask"], Visitable, ABC):
         """Execute the actions of this node."""
         raise NotImplementedError
 
+    async def execute_async(self, async_sql_client: AsyncSqlClient) -> TaskExecutionResult:
+        """Execute the actions of this node from an event loop, using the given client to run SQL.
+
+        By default, `execute()` is run in a thread of the default executor for the event loop. Tasks that run SQL
+        should override this to use the async client instead.
+        """
+        # Unlike asyncio tasks, functions run in an executor don't get a copy of the current context.
+        return await asyncio.get_running_loop().run_in_executor(None, contextvars.copy_context().run, self.execute)
+
     @property
     def task_id(self) -> NodeId:
         """Alias for node ID since the nodes represent a task."""
@@ -131,6 +143,25 @@ class SelectSqlQueryToDataTableTask(ExecutionPlanTask):
             df=df,
         )
 
+    async def execute_async(self, async_sql_client: AsyncSqlClient) -> TaskExecutionResult:  # noqa: D102
+        start_time = time.time()
+        sql_query = self.sql_query
+        assert sql_query is not None, f"{self.sql_query=} should have been set during creation."
+
+        df = await async_sql_client.query(
+            sql_query.sql_query,
+            sql_bind_parameters=sql_query.bind_parameters,
+        )
+
+        end_time = time.time()
+        return TaskExecutionResult(
+            start_time=start_time,
+            end_time=end_time,
+            sql=sql_query.sql_query,
+            bind_params=sql_query.bind_parameters,
+            df=df,
+        )
+
     def __repr__(self) -> str:  # noqa: D105
         return f"{self.__class__.__name__}(sql_query='{self.sql_query}')"
 
@@ -197,10 +228,107 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
         end_time = time.time()
         return TaskExecutionResult(start_time=start_time, end_time=end_time, sql=sql_query.sql_query)
 
+    async def execute_async(self, async_sql_client: AsyncSqlClient) -> TaskExecutionResult:  # noqa: D102
+        sql_query = self.sql_query
+        assert sql_query is not None, f"{self.sql_query=} should have been set during creation."
+        start_time = time.time()
+        logger.info(f"Dropping table {self.output_table} in case it already exists")
+        await async_sql_client.execute(f"DROP TABLE IF EXISTS {self.output_table.sql}")
+        logger.info(f"Creating table {self.output_table} using a query")
+        await async_sql_client.execute(
+            sql_query.sql_query,
+            sql_bind_parameters=sql_query.bind_parameters,
+        )
+
+        end_time = time.time()
+        return TaskExecutionResult(start_time=start_time, end_time=end_time, sql=sql_query.sql_query)
+
     def __repr__(self) -> str:  # noqa: D105
         return f"{self.__class__.__name__}(sql_query='{self.sql_query}', output_table={self.output_table})"
 
 
+@dataclass(frozen=True)
+class SelectSqlQueryToCsvFileTask(ExecutionPlanTask):
+    """A task that runs a SELECT and writes the result to a CSV file.
+
+    Rows are fetched and written in batches, so the memory used does not depend on the size of the result.
+
+    Attributes:
+        sql_client: The SQL client used to run the query.
+        sql_query: The SQL query to run.
+        output_file: The file where the results will be written.
+        batch_size: The number of rows to fetch and write at a time.
+    """
+
+    sql_client: SqlClient
+    output_file: TextIO
+    batch_size: int
+
+    @staticmethod
+    def create(  # noqa: D102
+        sql_client: SqlClient,
+        sql_query: SqlQuery,
+        output_file: TextIO,
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+        parent_nodes: Sequence[ExecutionPlanTask] = (),
+    ) -> SelectSqlQueryToCsvFileTask:
+        return SelectSqlQueryToCsvFileTask(
+            sql_client=sql_client,
+            sql_query=sql_query,
+            output_file=output_file,
+            batch_size=batch_size,
+            parent_nodes=tuple(parent_nodes),
+        )
+
+    @classmethod
+    def id_prefix(cls) -> IdPrefix:  # noqa: D102
+        return StaticIdPrefix.EXEC_NODE_WRITE_TO_CSV_FILE
+
+    @property
+    def description(self) -> str:  # noqa: D102
+        return "Run a query and write the results to a CSV file"
+
+    @property
+    def displayed_properties(self) -> Sequence[DisplayedProperty]:  # noqa: D102
+        sql_query = self.sql_query
+        assert sql_query is not None, f"{self.sql_query=} should have been set during creation."
+        return tuple(super().displayed_properties) + (
+            DisplayedProperty(key="sql_query", value=sql_query.sql_query),
+            DisplayedProperty(key="batch_size", value=self.batch_size),
+        )
+
+    def execute(self) -> TaskExecutionResult:  # noqa: D102
+        start_time = time.time()
+        sql_query = self.sql_query
+        assert sql_query is not None, f"{self.sql_query=} should have been set during creation."
+
+        csv_writer = csv.writer(self.output_file)
+        row_count = 0
+        for batch_index, data_table in enumerate(
+            self.sql_client.query_iter(
+                sql_query.sql_query,
+                sql_bind_parameters=sql_query.bind_parameters,
+                batch_size=self.batch_size,
+            )
+        ):
+            if batch_index == 0:
+                csv_writer.writerow(data_table.column_names)
+            csv_writer.writerows(data_table.rows)
+            row_count += data_table.row_count
+        logger.info(f"Wrote {row_count} row(s) to the CSV file")
+
+        end_time = time.time()
+        return TaskExecutionResult(
+            start_time=start_time,
+            end_time=end_time,
+            sql=sql_query.sql_query,
+            bind_params=sql_query.bind_parameters,
+        )
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{self.__class__.__name__}(sql_query='{self.sql_query}', batch_size={self.batch_size})"
+
+
 class ExecutionPlan(MetricFlowDag[ExecutionPlanTask]):
     """A DAG where the nodes are tasks, and parents represent prerequisite tasks."""
 
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Dict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
 
 from metricflow_semantics.dag.mf_dag import NodeId
 
-from metricflow.execution.execution_plan import ExecutionPlan, ExecutionPlanTask, TaskExecutionResult
+from metricflow.execution.execution_plan import (
+    ExecutionPlan,
+    ExecutionPlanTask,
+    TaskExecutionError,
+    TaskExecutionResult,
+)
+from metricflow.protocols.sql_client import AsyncSqlClient
+from metricflow.telemetry.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +72,8 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
         result = None
         logger.info(f"Started task ID: {current_task.node_id}")
         try:
-            result = current_task.execute()
+            with trace_span("execute_task", task_id=current_task.task_id.id_str):
+                result = current_task.execute()
             results.add_result(current_task.task_id, result)
         finally:
             if result:
@@ -80,3 +92,216 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
             self._execute_dfs(leaf_node, results)
 
         return results
+
+
+class ParallelPlanExecutor(ExecutionPlanExecutor):
+    """Execute tasks in the plan concurrently using a pool of threads.
+
+    A task is started once all of its parent tasks have finished successfully, so independent tasks (e.g. queries
+    for different metrics) can run at the same time. If a task fails or times out, tasks that have not started yet are
+    cancelled and no other tasks are started.
+
+    Tasks that are already running can't be interrupted, so the plan returns without waiting for those. Their queries
+    keep running in the worker threads (and in the data warehouse) until they finish, but their results are not
+    recorded after a failure.
+    """
+
+    def __init__(self, max_workers: int = 4, task_timeout_seconds: Optional[float] = None) -> None:
+        """Constructor.
+
+        Args:
+            max_workers: The maximum number of tasks to run at the same time.
+            task_timeout_seconds: If a task runs longer than this, it's recorded as failed with a timeout error. The
+                time is measured from when the task starts running in a worker thread, so time spent waiting for a free
+                worker doesn't count towards the timeout.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers should be >= 1. Got: {max_workers}")
+        self._max_workers = max_workers
+        self._task_timeout_seconds = task_timeout_seconds
+
+    @staticmethod
+    def _all_tasks(plan: ExecutionPlan) -> List[ExecutionPlanTask]:
+        """Return the tasks in the plan, with parents before children. Shared parents are only included once."""
+        tasks: List[ExecutionPlanTask] = []
+        visited_task_ids: Set[NodeId] = set()
+
+        def _add_tasks_dfs(task: ExecutionPlanTask) -> None:
+            if task.task_id in visited_task_ids:
+                return
+            visited_task_ids.add(task.task_id)
+            for parent_task in task.parent_nodes:
+                _add_tasks_dfs(parent_task)
+            tasks.append(task)
+
+        for sink_task in plan.sink_nodes:
+            _add_tasks_dfs(sink_task)
+        return tasks
+
+    @staticmethod
+    def _execute_task(task: ExecutionPlanTask, task_start_times: Dict[NodeId, float]) -> TaskExecutionResult:
+        # Setting a key in a dict is atomic, so the start time can be read from the thread that runs the plan.
+        task_start_times[task.task_id] = time.time()
+        logger.info(f"Started task ID: {task.node_id}")
+        with trace_span("execute_task", task_id=task.task_id.id_str):
+            result = task.execute()
+        runtime = f"{result.end_time - result.start_time:.2f}s"
+        if result.errors:
+            logger.info(f"Finished task ID: {task.node_id} with errors: {result.errors} in {runtime}")
+        else:
+            logger.info(f"Finished task ID: {task.node_id} successfully in {runtime}")
+        return result
+
+    def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D102
+        results = ExecutionResults()
+        pending_tasks = self._all_tasks(plan)
+        completed_task_ids: Set[NodeId] = set()
+        running_task_futures: Dict[Future[TaskExecutionResult], ExecutionPlanTask] = {}
+        # The time when each task started running in a worker thread. Set in the worker thread.
+        task_start_times: Dict[NodeId, float] = {}
+
+        thread_pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mf_task")
+        try:
+            while pending_tasks or running_task_futures:
+                # Start all tasks where the parents have finished.
+                ready_tasks = [
+                    task
+                    for task in pending_tasks
+                    if all(parent_task.task_id in completed_task_ids for parent_task in task.parent_nodes)
+                ]
+                for task in ready_tasks:
+                    pending_tasks.remove(task)
+                    # Run the task with a copy of the current context so that spans are added to the current trace.
+                    future = thread_pool.submit(
+                        contextvars.copy_context().run, ParallelPlanExecutor._execute_task, task, task_start_times
+                    )
+                    running_task_futures[future] = task
+
+                if not running_task_futures:
+                    raise RuntimeError(f"Unable to schedule tasks as the plan has a cycle. Remaining: {pending_tasks}")
+
+                wait_timeout: Optional[float] = None
+                if self._task_timeout_seconds is not None:
+                    # A task that hasn't started yet can't time out before the timeout has elapsed from now.
+                    current_time = time.time()
+                    earliest_start_time = min(
+                        task_start_times.get(task.task_id, current_time) for task in running_task_futures.values()
+                    )
+                    wait_timeout = max(0.0, earliest_start_time + self._task_timeout_seconds - current_time)
+
+                done_futures, _ = wait(running_task_futures, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+                failed = False
+                for future in done_futures:
+                    task = running_task_futures.pop(future)
+                    # If the task raised an exception, this re-raises it and the remaining tasks are cancelled below.
+                    result = future.result()
+                    results.add_result(task.task_id, result)
+                    if result.errors:
+                        failed = True
+                    else:
+                        completed_task_ids.add(task.task_id)
+
+                if self._task_timeout_seconds is not None:
+                    current_time = time.time()
+                    for future, task in tuple(running_task_futures.items()):
+                        start_time = task_start_times.get(task.task_id)
+                        if start_time is None or current_time - start_time < self._task_timeout_seconds:
+                            continue
+                        running_task_futures.pop(future)
+                        logger.info(
+                            f"Task ID: {task.node_id} timed out after {self._task_timeout_seconds}s. The task can't "
+                            f"be interrupted, so it will continue to run in the background until it finishes."
+                        )
+                        results.add_result(
+                            task.task_id,
+                            TaskExecutionResult(
+                                start_time=start_time,
+                                end_time=current_time,
+                                errors=(
+                                    TaskExecutionError(f"Task timed out after {self._task_timeout_seconds} seconds"),
+                                ),
+                            ),
+                        )
+                        failed = True
+
+                if failed:
+                    break
+        finally:
+            # Cancel the tasks that have been submitted but have not started. Running tasks can't be interrupted, so
+            # don't wait for those.
+            for future in running_task_futures:
+                future.cancel()
+            thread_pool.shutdown(wait=False)
+
+        return results
+
+
+class AsyncPlanExecutor:
+    """Execute tasks in the plan concurrently from an asyncio event loop.
+
+    Tasks run SQL with an `AsyncSqlClient`, so the event loop is not blocked while waiting for the data warehouse. As
+    with `ParallelPlanExecutor`, a task is started once all of its parent tasks have finished successfully, and if a
+    task fails, the other running tasks are cancelled and their results are not recorded.
+    """
+
+    def __init__(self, async_sql_client: AsyncSqlClient) -> None:
+        """Constructor.
+
+        Args:
+            async_sql_client: The client used by the tasks to run SQL.
+        """
+        self._async_sql_client = async_sql_client
+
+    async def _execute_task(self, task: ExecutionPlanTask) -> TaskExecutionResult:
+        logger.info(f"Started task ID: {task.node_id}")
+        with trace_span("execute_task", task_id=task.task_id.id_str):
+            result = await task.execute_async(self._async_sql_client)
+        runtime = f"{result.end_time - result.start_time:.2f}s"
+        if result.errors:
+            logger.info(f"Finished task ID: {task.node_id} with errors: {result.errors} in {runtime}")
+        else:
+            logger.info(f"Finished task ID: {task.node_id} successfully in {runtime}")
+        return result
+
+    async def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D102
+        results = ExecutionResults()
+        pending_tasks = ParallelPlanExecutor._all_tasks(plan)
+        completed_task_ids: Set[NodeId] = set()
+        running_task_futures: Dict[asyncio.Future[TaskExecutionResult], ExecutionPlanTask] = {}
+
+        try:
+            while pending_tasks or running_task_futures:
+                # Start all tasks where the parents have finished.
+                ready_tasks = [
+                    task
+                    for task in pending_tasks
+                    if all(parent_task.task_id in completed_task_ids for parent_task in task.parent_nodes)
+                ]
+                for task in ready_tasks:
+                    pending_tasks.remove(task)
+                    running_task_futures[asyncio.ensure_future(self._execute_task(task))] = task
+
+                if not running_task_futures:
+                    raise RuntimeError(f"Unable to schedule tasks as the plan has a cycle. Remaining: {pending_tasks}")
+
+                done_futures, _ = await asyncio.wait(running_task_futures, return_when=asyncio.FIRST_COMPLETED)
+
+                failed = False
+                for future in done_futures:
+                    task = running_task_futures.pop(future)
+                    # If the task raised an exception, this re-raises it and the remaining tasks are cancelled below.
+                    result = future.result()
+                    results.add_result(task.task_id, result)
+                    if result.errors:
+                        failed = True
+                    else:
+                        completed_task_ids.add(task.task_id)
+
+                if failed:
+                    break
+        finally:
+            for future in running_task_futures:
+                future.cancel()
+
+        return results
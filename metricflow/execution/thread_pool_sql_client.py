@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
+
+from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT")
+
+
+class ThreadPoolAsyncSqlClient:
+    """An `AsyncSqlClient` that runs the calls to a `SqlClient` (e.g. `AdapterBackedSqlClient`) in a pool of threads.
+
+    The pool has a fixed number of threads, so the number of calls that run at the same time is bounded. Additional
+    calls wait in the event loop until a thread is available.
+    """
+
+    def __init__(self, sql_client: SqlClient, max_workers: int = 4) -> None:
+        """Constructor.
+
+        Args:
+            sql_client: The client used to run the queries.
+            max_workers: The maximum number of calls to the client that can run at the same time.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers should be >= 1. Got: {max_workers}")
+        self._sql_client = sql_client
+        self._thread_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mf_sql_client")
+
+    @property
+    def sql_client(self) -> SqlClient:
+        """The client that's used to run the queries."""
+        return self._sql_client
+
+    @property
+    def sql_engine_type(self) -> SqlEngine:  # noqa: D102
+        return self._sql_client.sql_engine_type
+
+    @property
+    def sql_query_plan_renderer(self) -> SqlQueryPlanRenderer:  # noqa: D102
+        return self._sql_client.sql_query_plan_renderer
+
+    async def _run_in_thread_pool(self, function: Callable[[], ResultT]) -> ResultT:
+        # Run with a copy of the current context so that spans in the client are added to the current trace.
+        return await asyncio.get_running_loop().run_in_executor(
+            self._thread_pool, contextvars.copy_context().run, function
+        )
+
+    async def query(  # noqa: D102
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> MetricFlowDataTable:
+        return await self._run_in_thread_pool(
+            functools.partial(self._sql_client.query, stmt, sql_bind_parameters=sql_bind_parameters)
+        )
+
+    async def execute(  # noqa: D102
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> None:
+        await self._run_in_thread_pool(
+            functools.partial(self._sql_client.execute, stmt, sql_bind_parameters=sql_bind_parameters)
+        )
+
+    async def dry_run(  # noqa: D102
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> None:
+        await self._run_in_thread_pool(
+            functools.partial(self._sql_client.dry_run, stmt, sql_bind_parameters=sql_bind_parameters)
+        )
+
+    async def close(self) -> None:
+        """Close the wrapped client and stop the threads in the pool."""
+        await self._run_in_thread_pool(self._sql_client.close)
+        self.close_thread_pool()
+
+    def close_thread_pool(self) -> None:
+        """Stop the threads in the pool without closing the wrapped client. Running calls are allowed to finish."""
+        self._thread_pool.shutdown(wait=False)
+        logger.info("Closed the thread pool for the SQL client")
+
+    def render_bind_parameter_key(self, bind_parameter_key: str) -> str:  # noqa: D102
+        return self._sql_client.render_bind_parameter_key(bind_parameter_key)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 from collections import OrderedDict
-from typing import List, Optional, Sequence, Set, Tuple, Union
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.naming.keywords import METRIC_TIME_ELEMENT_NAME
@@ -14,7 +15,7 @@ from dbt_semantic_interfaces.type_enums.period_agg import PeriodAggregation
 from dbt_semantic_interfaces.validations.unique_valid_name import MetricFlowReservedKeywords
 from metricflow_semantics.aggregation_properties import AggregationState
 from metricflow_semantics.dag.id_prefix import StaticIdPrefix
-from metricflow_semantics.dag.mf_dag import DagId
+from metricflow_semantics.dag.mf_dag import DagId, NodeId
 from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
 from metricflow_semantics.filters.time_constraint import TimeRangeConstraint
 from metricflow_semantics.instances import (
@@ -26,6 +27,7 @@ from metricflow_semantics.instances import (
     TimeDimensionInstance,
 )
 from metricflow_semantics.mf_logging.formatting import indent
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow_semantics.specs.column_assoc import (
     ColumnAssociation,
@@ -38,6 +40,7 @@ from metricflow_semantics.specs.metadata_spec import MetadataSpec
 from metricflow_semantics.specs.metric_spec import MetricSpec
 from metricflow_semantics.specs.spec_set import InstanceSpecSet
 from metricflow_semantics.specs.time_dimension_spec import TimeDimensionSpec
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
 from metricflow_semantics.sql.sql_join_type import SqlJoinType
 from metricflow_semantics.time.time_constants import ISO8601_PYTHON_FORMAT
 from metricflow_semantics.time.time_spine_source import TIME_SPINE_DATA_SET_DESCRIPTION, TimeSpineSource
@@ -139,14 +142,40 @@ from metricflow.sql.sql_plan import (
     SqlSelectStatementNode,
     SqlTableFromClauseNode,
 )
+from metricflow.telemetry.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
 
+TIME_RANGE_CONSTRAINT_START_BIND_PARAMETER_KEY = "mf_time_constraint_start"
+TIME_RANGE_CONSTRAINT_END_BIND_PARAMETER_KEY = "mf_time_constraint_end"
+
+
+def time_range_constraint_bind_parameters(time_range_constraint: TimeRangeConstraint) -> SqlBindParameters:
+    """Return the values for the bind parameters used when time range constraints are rendered as bind parameters."""
+    return SqlBindParameters.create_from_dict(
+        {
+            TIME_RANGE_CONSTRAINT_START_BIND_PARAMETER_KEY: time_range_constraint.start_time.strftime(
+                ISO8601_PYTHON_FORMAT
+            ),
+            TIME_RANGE_CONSTRAINT_END_BIND_PARAMETER_KEY: time_range_constraint.end_time.strftime(
+                ISO8601_PYTHON_FORMAT
+            ),
+        }
+    )
+
+
 def _make_time_range_comparison_expr(
-    table_alias: str, column_alias: str, time_range_constraint: TimeRangeConstraint
+    table_alias: str,
+    column_alias: str,
+    time_range_constraint: TimeRangeConstraint,
+    use_bind_parameters: bool = False,
 ) -> SqlExpressionNode:
-    """Build an expression like "ds BETWEEN CAST('2020-01-01' AS TIMESTAMP) AND CAST('2020-01-02' AS TIMESTAMP)."""
+    """Build an expression like "ds BETWEEN CAST('2020-01-01' AS TIMESTAMP) AND CAST('2020-01-02' AS TIMESTAMP).
+
+    If use_bind_parameters is set, the start and end are bind parameters with the keys
+    TIME_RANGE_CONSTRAINT_START_BIND_PARAMETER_KEY and TIME_RANGE_CONSTRAINT_END_BIND_PARAMETER_KEY.
+    """
     # TODO: Update when adding < day granularity support.
     return SqlBetweenExpression.create(
         column_arg=SqlColumnReferenceExpression.create(
@@ -157,13 +186,22 @@ def _make_time_range_comparison_expr(
         ),
         start_expr=SqlStringLiteralExpression.create(
             literal_value=time_range_constraint.start_time.strftime(ISO8601_PYTHON_FORMAT),
+            bind_parameter_key=TIME_RANGE_CONSTRAINT_START_BIND_PARAMETER_KEY if use_bind_parameters else None,
         ),
         end_expr=SqlStringLiteralExpression.create(
             literal_value=time_range_constraint.end_time.strftime(ISO8601_PYTHON_FORMAT),
+            bind_parameter_key=TIME_RANGE_CONSTRAINT_END_BIND_PARAMETER_KEY if use_bind_parameters else None,
         ),
     )
 
 
+# The converter that is running `convert_to_sql_query_plan` and the data sets for the nodes that it has converted
+# during that call. This is a context variable as a converter may be used to convert different plans concurrently.
+_current_conversion_memo: ContextVar[
+    Optional[Tuple[DataflowToSqlQueryPlanConverter, Dict[NodeId, SqlDataSet]]]
+] = ContextVar("mf_dataflow_to_sql_conversion_memo", default=None)
+
+
 class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
     """Generates an SQL query plan from a node in the a metric dataflow plan."""
 
@@ -171,6 +209,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         self,
         column_association_resolver: ColumnAssociationResolver,
         semantic_manifest_lookup: SemanticManifestLookup,
+        bind_time_range_constraints: bool = False,
     ) -> None:
         """Constructor.
 
@@ -178,7 +217,11 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
             column_association_resolver: controls how columns for instances are generated and used between nested
             queries.
             semantic_manifest_lookup: Self-explanatory.
+            bind_time_range_constraints: Render the start / end of time range constraints as bind parameters (see
+            time_range_constraint_bind_parameters()) so that the SQL can be reused for different time ranges. The
+            plan should not contain different time range constraints (e.g. from cumulative metrics) when this is set.
         """
+        self._bind_time_range_constraints = bind_time_range_constraints
         self._column_association_resolver = column_association_resolver
         self._semantic_manifest_lookup = semantic_manifest_lookup
         self._metric_lookup = semantic_manifest_lookup.metric_lookup
@@ -197,7 +240,11 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         sql_query_plan_id: Optional[DagId] = None,
     ) -> ConvertToSqlPlanResult:
         """Create an SQL query plan that represents the computation up to the given dataflow plan node."""
-        data_set = dataflow_plan_node.accept(self)
+        token = _current_conversion_memo.set((self, {}))
+        try:
+            data_set = self._convert_node(dataflow_plan_node)
+        finally:
+            _current_conversion_memo.reset(token)
         sql_node: SqlQueryPlanNode = data_set.sql_node
         # TODO: Make this a more generally accessible attribute instead of checking against the
         # BigQuery-ness of the engine
@@ -207,17 +254,42 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
             optimization_level, use_column_alias_in_group_by=use_column_alias_in_group_by
         ):
             logger.info(f"Applying optimizer: {optimizer.__class__.__name__}")
-            sql_node = optimizer.optimize(sql_node)
+            with trace_span("optimize_sql_query_plan", optimizer=optimizer.__class__.__name__):
+                sql_node = optimizer.optimize(sql_node)
             logger.info(
-                f"After applying {optimizer.__class__.__name__}, the SQL query plan is:\n"
-                f"{indent(sql_node.structure_text())}"
+                LazyFormat(
+                    lambda: f"After applying {optimizer.__class__.__name__}, the SQL query plan is:\n"
+                    f"{indent(sql_node.structure_text())}"
+                )
             )
 
         return ConvertToSqlPlanResult(
             instance_set=data_set.instance_set,
-            sql_plan=SqlQueryPlan(render_node=sql_node, plan_id=sql_query_plan_id),
+            sql_plan=SqlQueryPlan(
+                render_node=sql_node,
+                plan_id=sql_query_plan_id,
+                render_common_table_expressions=optimization_level is SqlQueryOptimizationLevel.O5,
+            ),
         )
 
+    def _convert_node(self, node: DataflowPlanNode) -> SqlDataSet:
+        """Return the data set for the given node, converting it only once per call to `convert_to_sql_query_plan`.
+
+        Nodes in the dataflow plan can have multiple consumers (e.g. when the inputs of derived metrics are shared), so
+        without this, the sub-tree of a shared node would be converted for each path that leads to it.
+        """
+        conversion_memo = _current_conversion_memo.get()
+        if conversion_memo is None or conversion_memo[0] is not self:
+            return node.accept(self)
+
+        node_id_to_converted_data_set = conversion_memo[1]
+
+        data_set = node_id_to_converted_data_set.get(node.node_id)
+        if data_set is None:
+            data_set = node.accept(self)
+            node_id_to_converted_data_set[node.node_id] = data_set
+        return data_set
+
     def _next_unique_table_alias(self) -> str:
         """Return the next unique table alias to use in generating queries."""
         return SequentialIdGenerator.create_next_id(StaticIdPrefix.SUB_QUERY).str_value
@@ -298,6 +370,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
                         table_alias=time_spine_table_alias,
                         column_alias=time_spine_source.time_column_name,
                         time_range_constraint=time_range_constraint,
+                        use_bind_parameters=self._bind_time_range_constraints,
                     )
                     if time_range_constraint
                     else None
@@ -315,7 +388,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
     def visit_join_over_time_range_node(self, node: JoinOverTimeRangeNode) -> SqlDataSet:
         """Generate time range join SQL."""
         table_alias_to_instance_set: OrderedDict[str, InstanceSet] = OrderedDict()
-        input_data_set = node.parent_node.accept(self)
+        input_data_set = self._convert_node(node.parent_node)
         input_data_set_alias = self._next_unique_table_alias()
 
         # Find requested agg_time_dimensions in parent instance set.
@@ -394,7 +467,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
         # Convert the dataflow from the left node to a DataSet and add context for it to table_alias_to_instance_set
         # A DataSet is a bundle of the SQL query (in object form) and the MDO instances that the SQL query contains.
-        from_data_set = node.left_node.accept(self)
+        from_data_set = self._convert_node(node.left_node)
         from_data_set_alias = self._next_unique_table_alias()
         table_alias_to_instance_set[from_data_set_alias] = from_data_set.instance_set
 
@@ -408,7 +481,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
             join_on_entity = join_description.join_on_entity
 
             right_node_to_join: DataflowPlanNode = join_description.join_node
-            right_data_set: SqlDataSet = right_node_to_join.accept(self)
+            right_data_set: SqlDataSet = self._convert_node(right_node_to_join)
             right_data_set_alias = self._next_unique_table_alias()
 
             sql_join_desc = SqlQueryPlanJoinBuilder.make_base_output_join_description(
@@ -491,7 +564,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
         """
         # Get the data from the parent, and change measure instances to the aggregated state.
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         aggregated_instance_set = from_data_set.instance_set.transform(
             ChangeMeasureAggregationState(
                 {
@@ -552,7 +625,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
     def visit_compute_metrics_node(self, node: ComputeMetricsNode) -> SqlDataSet:
         """Generates the query that realizes the behavior of ComputeMetricsNode."""
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         from_data_set_alias = self._next_unique_table_alias()
 
         # TODO: Check that all measures for the metrics are in the input instance set
@@ -744,7 +817,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         return metric_expr
 
     def visit_order_by_limit_node(self, node: OrderByLimitNode) -> SqlDataSet:  # noqa: D102
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         output_instance_set = from_data_set.instance_set
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -784,10 +857,10 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
     def visit_write_to_result_data_table_node(self, node: WriteToResultDataTableNode) -> SqlDataSet:  # noqa: D102
         # Returning the parent-node SQL as an approximation since you can't write to a data_table via SQL.
-        return node.parent_node.accept(self)
+        return self._convert_node(node.parent_node)
 
     def visit_write_to_result_table_node(self, node: WriteToResultTableNode) -> SqlDataSet:  # noqa: D102
-        input_data_set: SqlDataSet = node.parent_node.accept(self)
+        input_data_set: SqlDataSet = self._convert_node(node.parent_node)
         input_instance_set: InstanceSet = input_data_set.instance_set
         return SqlDataSet(
             instance_set=input_instance_set,
@@ -799,7 +872,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
     def visit_filter_elements_node(self, node: FilterElementsNode) -> SqlDataSet:
         """Generates the query that realizes the behavior of FilterElementsNode."""
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         output_instance_set = from_data_set.instance_set.transform(FilterElements(node.include_specs))
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -826,7 +899,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
     def visit_where_constraint_node(self, node: WhereConstraintNode) -> SqlDataSet:
         """Adds where clause to SQL statement from parent node."""
-        parent_data_set: SqlDataSet = node.parent_node.accept(self)
+        parent_data_set: SqlDataSet = self._convert_node(node.parent_node)
         # Since we're copying the instance set from the parent to conveniently generate the output instance set for this
         # node, we'll need to change the column names.
         output_instance_set = parent_data_set.instance_set.transform(
@@ -897,7 +970,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         table_alias_to_instance_set: OrderedDict[str, InstanceSet] = OrderedDict()
 
         for parent_node in node.parent_nodes:
-            parent_sql_data_set = parent_node.accept(self)
+            parent_sql_data_set = self._convert_node(parent_node)
             table_alias = self._next_unique_table_alias()
             parent_data_sets.append(AnnotatedSqlDataSet(data_set=parent_sql_data_set, alias=table_alias))
             table_alias_to_instance_set[table_alias] = parent_sql_data_set.instance_set
@@ -981,7 +1054,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
 
         instead of this: DATE_TRUNC('month', ds) >= '2020-01-01' AND DATE_TRUNC('month', ds <= '2020-02-01')
         """
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
         from_data_set_alias = self._next_unique_table_alias()
 
         time_dimension_instances_for_metric_time = sorted(
@@ -1000,6 +1073,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
             table_alias=from_data_set_alias,
             column_alias=time_dimension_instance_for_metric_time.associated_column.column_name,
             time_range_constraint=node.time_range_constraint,
+            use_bind_parameters=self._bind_time_range_constraints,
         )
 
         output_instance_set = from_data_set.instance_set
@@ -1028,7 +1102,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         matching the one defined in the node will be passed. In addition, an additional time dimension instance for
         "metric time" will be included. See DataSet.metric_time_dimension_reference().
         """
-        input_data_set: SqlDataSet = node.parent_node.accept(self)
+        input_data_set: SqlDataSet = self._convert_node(node.parent_node)
 
         # Find which measures have an aggregation time dimension that is the same as the one specified in the node.
         # Only these measures will be in the output data set.
@@ -1116,7 +1190,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         specified dimension that is non-additive. Then that dataset would be joined with the input data
         on that dimension along with grouping by entities that are also passed in.
         """
-        from_data_set: SqlDataSet = node.parent_node.accept(self)
+        from_data_set: SqlDataSet = self._convert_node(node.parent_node)
 
         from_data_set_alias = self._next_unique_table_alias()
 
@@ -1225,7 +1299,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         )
 
     def visit_join_to_time_spine_node(self, node: JoinToTimeSpineNode) -> SqlDataSet:  # noqa: D102
-        parent_data_set = node.parent_node.accept(self)
+        parent_data_set = self._convert_node(node.parent_node)
         parent_alias = self._next_unique_table_alias()
 
         if node.use_custom_agg_time_dimension:
@@ -1399,7 +1473,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         )
 
     def visit_min_max_node(self, node: MinMaxNode) -> SqlDataSet:  # noqa: D102
-        parent_data_set = node.parent_node.accept(self)
+        parent_data_set = self._convert_node(node.parent_node)
         parent_table_alias = self._next_unique_table_alias()
         assert (
             len(parent_data_set.checked_sql_select_node.select_columns) == 1
@@ -1442,7 +1516,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         Builds a new dataset that is the same as the output dataset, but with an additional column
         that contains a randomly generated UUID.
         """
-        input_data_set: SqlDataSet = node.parent_node.accept(self)
+        input_data_set: SqlDataSet = self._convert_node(node.parent_node)
         input_data_set_alias = self._next_unique_table_alias()
 
         gen_uuid_spec = MetadataSpec.from_name(MetricFlowReservedKeywords.MF_INTERNAL_UUID.value)
@@ -1484,10 +1558,10 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         successful conversion. Duplication may exist in the result due to a single base event
         being able to link to multiple conversion events.
         """
-        base_data_set: SqlDataSet = node.base_node.accept(self)
+        base_data_set: SqlDataSet = self._convert_node(node.base_node)
         base_data_set_alias = self._next_unique_table_alias()
 
-        conversion_data_set: SqlDataSet = node.conversion_node.accept(self)
+        conversion_data_set: SqlDataSet = self._convert_node(node.conversion_node)
         conversion_data_set_alias = self._next_unique_table_alias()
 
         base_time_dimension_column_name = self._column_association_resolver.resolve_spec(
@@ -1636,7 +1710,7 @@ class DataflowToSqlQueryPlanConverter(DataflowPlanNodeVisitor[SqlDataSet]):
         )
 
     def visit_window_reaggregation_node(self, node: WindowReaggregationNode) -> SqlDataSet:  # noqa: D102
-        from_data_set = node.parent_node.accept(self)
+        from_data_set = self._convert_node(node.parent_node)
         parent_instance_set = from_data_set.instance_set  # remove order by col
         parent_data_set_alias = self._next_unique_table_alias()
 
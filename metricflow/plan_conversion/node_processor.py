@@ -8,6 +8,7 @@ from typing import Dict, FrozenSet, List, Optional, Sequence, Set
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.references import EntityReference, SemanticModelReference, TimeDimensionReference
 from metricflow_semantics.filters.time_constraint import TimeRangeConstraint
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.model.semantics.linkable_element import LinkableElementType
 from metricflow_semantics.model.semantics.semantic_model_join_evaluator import MAX_JOIN_HOPS
@@ -587,8 +588,10 @@ class PreJoinNodeProcessor:
                 multi_hop_join_candidate.node_with_multi_hop_elements
             )
             logger.debug(
-                f"Node {multi_hop_join_candidate.node_with_multi_hop_elements} has spec set:\n"
-                f"{mf_pformat(output_data_set.instance_set.spec_set)}"
+                LazyFormat(
+                    lambda: f"Node {multi_hop_join_candidate.node_with_multi_hop_elements} has spec set:\n"
+                    f"{mf_pformat(output_data_set.instance_set.spec_set)}"
+                )
             )
 
         return multi_hop_join_candidates
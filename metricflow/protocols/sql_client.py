@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from enum import Enum
-from typing import Protocol, Set
+from typing import Iterator, Protocol, Set
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
@@ -11,6 +11,9 @@ from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.data_table.mf_table import MetricFlowDataTable
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
 
+# The default number of rows in each batch returned by `SqlClient.query_iter`.
+DEFAULT_QUERY_BATCH_SIZE = 10000
+
 
 class SqlEngine(Enum):
     """Enumeration of supported SQL engines.
@@ -84,6 +87,20 @@ class SqlClient(Protocol):
         """Base query method, upon execution will run a query that returns a pandas DataTable."""
         raise NotImplementedError
 
+    @abstractmethod
+    def query_iter(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+    ) -> Iterator[MetricFlowDataTable]:
+        """Run a query and return the results as tables with up to `batch_size` rows each.
+
+        At least one table is returned (i.e. an empty table for an empty result) so that the columns are known. This
+        should be used for large results as rows can be processed without keeping the full result in memory.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def execute(
         self,
@@ -111,3 +128,60 @@ class SqlClient(Protocol):
     def render_bind_parameter_key(self, bind_parameter_key: str) -> str:
         """Wrap the bind parameter key with syntax accepted by engine."""
         raise NotImplementedError
+
+
+class AsyncSqlClient(Protocol):
+    """Interface for clients that run SQL queries from an asyncio event loop.
+
+    The methods that access the data warehouse are coroutines, so the event loop is not blocked while waiting for
+    results. Use `ThreadPoolAsyncSqlClient` to get one from a `SqlClient`.
+    """
+
+    @property
+    @abstractmethod
+    def sql_engine_type(self) -> SqlEngine:
+        """Enumerated value representing the underlying SqlEngine for this client."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def sql_query_plan_renderer(self) -> SqlQueryPlanRenderer:
+        """Dialect-specific SQL query plan renderer used for converting MetricFlow's query plan to executable SQL."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def query(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> MetricFlowDataTable:
+        """Run a query and return the results as a table."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def execute(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> None:
+        """Run a statement that does not return results."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def dry_run(
+        self,
+        stmt: str,
+        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+    ) -> None:
+        """Check that the statement is valid without running it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the connections / engines used by this client."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def render_bind_parameter_key(self, bind_parameter_key: str) -> str:
+        """Wrap the bind parameter key with syntax accepted by engine."""
+        raise NotImplementedError
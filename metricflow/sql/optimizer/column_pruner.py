@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from metricflow_semantics.dag.mf_dag import NodeId
 
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.sql_exprs import (
@@ -31,14 +33,33 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     def __init__(
         self,
         required_column_aliases: Set[str],
+        _pruned_nodes: Optional[Dict[Tuple[NodeId, FrozenSet[str]], SqlQueryPlanNode]] = None,
     ) -> None:
         """Constructor.
 
         Args:
             required_column_aliases: the columns aliases that should not be pruned from the SELECT statements that this
             visits.
+            _pruned_nodes: the result of pruning a node given the required columns. Shared with the visitors created for
+            the sources so that a node that is used in multiple places is only pruned once for the same columns.
         """
         self._required_column_aliases = required_column_aliases
+        self._pruned_nodes: Dict[Tuple[NodeId, FrozenSet[str]], SqlQueryPlanNode] = (
+            _pruned_nodes if _pruned_nodes is not None else {}
+        )
+
+    def _prune_source(self, node: SqlQueryPlanNode, required_column_aliases: Set[str]) -> SqlQueryPlanNode:
+        """Prune the columns in the given source that are not in `required_column_aliases`."""
+        key = (node.node_id, frozenset(required_column_aliases))
+        pruned_node = self._pruned_nodes.get(key)
+        if pruned_node is None:
+            pruned_node = node.accept(
+                SqlColumnPrunerVisitor(
+                    required_column_aliases=required_column_aliases, _pruned_nodes=self._pruned_nodes
+                )
+            )
+            self._pruned_nodes[key] = pruned_node
+        return pruned_node
 
     def _search_for_expressions(
         self, select_node: SqlSelectStatementNode, pruned_select_columns: Tuple[SqlSelectColumn, ...]
@@ -74,22 +95,24 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
         """Assume that you need all columns from the parent and prune the grandparents."""
         pruned_from_source: SqlQueryPlanNode
         if node.from_source.as_select_node:
-            from_visitor = SqlColumnPrunerVisitor(
-                required_column_aliases={x.column_alias for x in node.from_source.as_select_node.select_columns}
+            pruned_from_source = self._prune_source(
+                node.from_source,
+                required_column_aliases={x.column_alias for x in node.from_source.as_select_node.select_columns},
             )
-            pruned_from_source = node.from_source.as_select_node.accept(from_visitor)
         else:
             pruned_from_source = node.from_source
         pruned_join_descriptions: List[SqlJoinDescription] = []
         for join_description in node.join_descs:
             right_source_as_select_node = join_description.right_source.as_select_node
             if right_source_as_select_node:
-                right_source_visitor = SqlColumnPrunerVisitor(
-                    required_column_aliases={x.column_alias for x in right_source_as_select_node.select_columns}
-                )
                 pruned_join_descriptions.append(
                     SqlJoinDescription(
-                        right_source=join_description.right_source.accept(right_source_visitor),
+                        right_source=self._prune_source(
+                            join_description.right_source,
+                            required_column_aliases={
+                                x.column_alias for x in right_source_as_select_node.select_columns
+                            },
+                        ),
                         right_source_alias=join_description.right_source_alias,
                         on_condition=join_description.on_condition,
                         join_type=join_description.join_type,
@@ -160,18 +183,17 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
 
         # Once we know which column aliases are required from which source aliases, replace the sources with new SELECT
         # statements.
-        from_source_pruner = SqlColumnPrunerVisitor(
-            required_column_aliases=source_alias_to_required_column_alias[node.from_source_alias]
+        pruned_from_source = self._prune_source(
+            node.from_source, source_alias_to_required_column_alias[node.from_source_alias]
         )
-        pruned_from_source = node.from_source.accept(from_source_pruner)
         pruned_join_descriptions: List[SqlJoinDescription] = []
         for join_description in node.join_descs:
-            join_source_pruner = SqlColumnPrunerVisitor(
-                required_column_aliases=source_alias_to_required_column_alias[join_description.right_source_alias]
-            )
             pruned_join_descriptions.append(
                 SqlJoinDescription(
-                    right_source=join_description.right_source.accept(join_source_pruner),
+                    right_source=self._prune_source(
+                        join_description.right_source,
+                        source_alias_to_required_column_alias[join_description.right_source_alias],
+                    ),
                     right_source_alias=join_description.right_source_alias,
                     on_condition=join_description.on_condition,
                     join_type=join_description.join_type,
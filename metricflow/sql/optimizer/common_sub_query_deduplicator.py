@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+from typing import Dict, Hashable, Mapping, Optional, Tuple
+
+from metricflow_semantics.dag.mf_dag import NodeId
+
+from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
+from metricflow.sql.render.expr_renderer import DefaultSqlExpressionRenderer
+from metricflow.sql.sql_exprs import (
+    SqlColumnReference,
+    SqlColumnReferenceExpression,
+    SqlColumnReplacements,
+    SqlExpressionNode,
+)
+from metricflow.sql.sql_plan import (
+    SqlCreateTableAsNode,
+    SqlJoinDescription,
+    SqlQueryPlanNode,
+    SqlQueryPlanNodeVisitor,
+    SqlSelectQueryFromClauseNode,
+    SqlSelectStatementNode,
+    SqlTableFromClauseNode,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SqlCommonSubQueryDeduplicatorVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
+    """Visits the SQL query plan and replaces structurally identical nodes with a single instance.
+
+    Two SELECT statements are considered identical if they only differ by the aliases that they use for their sources,
+    as those aliases are not visible outside of the statement. Since the sources are de-duplicated first, identical
+    sources will be the same instance and can be compared by node ID.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self._expr_renderer = DefaultSqlExpressionRenderer()
+        self._node_id_to_result: Dict[NodeId, SqlQueryPlanNode] = {}
+        self._structure_key_to_node: Dict[Hashable, SqlQueryPlanNode] = {}
+
+    def _deduplicate(self, node: SqlQueryPlanNode) -> SqlQueryPlanNode:
+        result = self._node_id_to_result.get(node.node_id)
+        if result is None:
+            result = node.accept(self)
+            self._node_id_to_result[node.node_id] = result
+        return result
+
+    def _canonical_node(self, structure_key: Hashable, node: SqlQueryPlanNode) -> SqlQueryPlanNode:
+        """Return the first node seen with the given structure key, or the given node if it's the first one."""
+        return self._structure_key_to_node.setdefault(structure_key, node)
+
+    def _canonical_expr_sql(self, expr: Optional[SqlExpressionNode], alias_mapping: Mapping[str, str]) -> Hashable:
+        """Render the expression with the source aliases replaced by the canonical ones in `alias_mapping`.
+
+        Expressions that can't be rewritten (e.g. string expressions) are rendered as-is. Since any aliases in those will
+        differ between sub-queries, this means that the sub-queries won't be considered identical.
+        """
+        if expr is None:
+            return None
+        if expr.lineage.contains_ambiguous_exprs:
+            render_result = self._expr_renderer.render_sql_expr(expr)
+            return render_result.sql, render_result.bind_parameters.param_items
+
+        column_replacements: Dict[SqlColumnReference, SqlExpressionNode] = {}
+        for column_reference_expr in expr.lineage.column_reference_exprs:
+            column_reference = column_reference_expr.col_ref
+            canonical_alias = alias_mapping.get(column_reference.table_alias)
+            if canonical_alias is not None:
+                column_replacements[column_reference] = SqlColumnReferenceExpression.create(
+                    col_ref=SqlColumnReference(table_alias=canonical_alias, column_name=column_reference.column_name),
+                    should_render_table_alias=column_reference_expr.should_render_table_alias,
+                )
+        render_result = self._expr_renderer.render_sql_expr(
+            expr.rewrite(column_replacements=SqlColumnReplacements(column_replacements))
+        )
+        return render_result.sql, render_result.bind_parameters.param_items
+
+    def _structure_key(self, node: SqlSelectStatementNode) -> Hashable:
+        alias_mapping = {node.from_source_alias: "src0"}
+        for i, join_desc in enumerate(node.join_descs):
+            alias_mapping[join_desc.right_source_alias] = f"src{i + 1}"
+
+        return (
+            node.description,
+            tuple(
+                (self._canonical_expr_sql(select_column.expr, alias_mapping), select_column.column_alias)
+                for select_column in node.select_columns
+            ),
+            node.from_source.node_id,
+            tuple(
+                (
+                    join_desc.right_source.node_id,
+                    join_desc.join_type,
+                    self._canonical_expr_sql(join_desc.on_condition, alias_mapping),
+                )
+                for join_desc in node.join_descs
+            ),
+            tuple(
+                (self._canonical_expr_sql(group_by.expr, alias_mapping), group_by.column_alias)
+                for group_by in node.group_bys
+            ),
+            tuple(
+                (self._canonical_expr_sql(order_by.expr, alias_mapping), order_by.desc) for order_by in node.order_bys
+            ),
+            self._canonical_expr_sql(node.where, alias_mapping),
+            node.limit,
+            node.distinct,
+        )
+
+    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlQueryPlanNode:  # noqa: D102
+        from_source = self._deduplicate(node.from_source)
+        join_descs: Tuple[SqlJoinDescription, ...] = tuple(
+            SqlJoinDescription(
+                right_source=self._deduplicate(join_desc.right_source),
+                right_source_alias=join_desc.right_source_alias,
+                on_condition=join_desc.on_condition,
+                join_type=join_desc.join_type,
+            )
+            for join_desc in node.join_descs
+        )
+        if from_source is not node.from_source or any(
+            new_join_desc.right_source is not join_desc.right_source
+            for new_join_desc, join_desc in zip(join_descs, node.join_descs)
+        ):
+            node = SqlSelectStatementNode.create(
+                description=node.description,
+                select_columns=node.select_columns,
+                from_source=from_source,
+                from_source_alias=node.from_source_alias,
+                join_descs=join_descs,
+                group_bys=node.group_bys,
+                order_bys=node.order_bys,
+                where=node.where,
+                limit=node.limit,
+                distinct=node.distinct,
+            )
+        return self._canonical_node(self._structure_key(node), node)
+
+    def visit_table_from_clause_node(self, node: SqlTableFromClauseNode) -> SqlQueryPlanNode:  # noqa: D102
+        return self._canonical_node((SqlTableFromClauseNode, node.sql_table), node)
+
+    def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D102
+        return self._canonical_node((SqlSelectQueryFromClauseNode, node.select_query), node)
+
+    def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> SqlQueryPlanNode:  # noqa: D102
+        return SqlCreateTableAsNode.create(
+            sql_table=node.sql_table,
+            parent_node=self._deduplicate(node.parent_node),
+        )
+
+
+class SqlCommonSubQueryDeduplicator(SqlQueryPlanOptimizer):
+    """Replace sub-queries that are structurally identical with a single instance.
+
+    e.g. from
+
+    SELECT a.foo, b.bar
+    FROM (
+      SELECT foo, id FROM baz c
+    ) a
+    JOIN (
+      SELECT foo, id FROM baz d
+    ) b
+    ON a.id = b.id
+
+    to a plan where the sources for "a" and "b" are the same node. Renderers that support common table expressions
+    will then render the sub-query once in a WITH clause (see `DefaultSqlQueryPlanRenderer`).
+    """
+
+    def optimize(self, node: SqlQueryPlanNode) -> SqlQueryPlanNode:  # noqa: D102
+        return node.accept(SqlCommonSubQueryDeduplicatorVisitor())
@@ -4,6 +4,7 @@ from enum import Enum
 from typing import Sequence
 
 from metricflow.sql.optimizer.column_pruner import SqlColumnPrunerOptimizer
+from metricflow.sql.optimizer.common_sub_query_deduplicator import SqlCommonSubQueryDeduplicator
 from metricflow.sql.optimizer.rewriting_sub_query_reducer import SqlRewritingSubQueryReducer
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.optimizer.sub_query_reducer import SqlSubQueryReducer
@@ -18,6 +19,8 @@ class SqlQueryOptimizationLevel(Enum):
     O2 = "O2"
     O3 = "O3"
     O4 = "O4"
+    # Same as O4, but identical sub-queries are rendered once as a common table expression.
+    O5 = "O5"
 
 
 class SqlQueryOptimizerConfiguration:
@@ -42,3 +45,10 @@ class SqlQueryOptimizerConfiguration:
                 SqlRewritingSubQueryReducer(use_column_alias_in_group_bys=use_column_alias_in_group_by),
                 SqlTableAliasSimplifier(),
             )
+        elif level is SqlQueryOptimizationLevel.O5:
+            return (
+                SqlColumnPrunerOptimizer(),
+                SqlRewritingSubQueryReducer(use_column_alias_in_group_bys=use_column_alias_in_group_by),
+                SqlTableAliasSimplifier(),
+                SqlCommonSubQueryDeduplicator(),
+            )
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from metricflow_semantics.dag.mf_dag import NodeId
 from metricflow_semantics.mf_logging.formatting import indent
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.sql_exprs import (
@@ -88,6 +90,17 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
     Unlike SqlSubQueryReducerVisitor, this will re-write expressions to realize more reductions.
     """
 
+    def __init__(self) -> None:  # noqa: D107
+        # Nodes can be used as a source in multiple places, so keep the result to reduce them only once.
+        self._node_id_to_reduced_node: Dict[NodeId, SqlQueryPlanNode] = {}
+
+    def _reduce(self, node: SqlQueryPlanNode) -> SqlQueryPlanNode:
+        reduced_node = self._node_id_to_reduced_node.get(node.node_id)
+        if reduced_node is None:
+            reduced_node = node.accept(self)
+            self._node_id_to_reduced_node[node.node_id] = reduced_node
+        return reduced_node
+
     def _reduce_parents(
         self,
         node: SqlSelectStatementNode,
@@ -96,11 +109,11 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
         return SqlSelectStatementNode.create(
             description=node.description,
             select_columns=node.select_columns,
-            from_source=node.from_source.accept(self),
+            from_source=self._reduce(node.from_source),
             from_source_alias=node.from_source_alias,
             join_descs=tuple(
                 SqlJoinDescription(
-                    right_source=x.right_source.accept(self),
+                    right_source=self._reduce(x.right_source),
                     right_source_alias=x.right_source_alias,
                     on_condition=x.on_condition,
                     join_type=x.join_type,
@@ -709,7 +722,7 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
     def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> SqlQueryPlanNode:  # noqa: D102
         return SqlCreateTableAsNode.create(
             sql_table=node.sql_table,
-            parent_node=node.parent_node.accept(self),
+            parent_node=self._reduce(node.parent_node),
         )
 
 
@@ -740,7 +753,11 @@ class SqlGroupByRewritingVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
                     )
                 )
             else:
-                logger.info(f"Did not find matching select for {group_by} in:\n{indent(node.structure_text())}")
+                logger.info(
+                    LazyFormat(
+                        lambda: f"Did not find matching select for {group_by} in:\n{indent(node.structure_text())}"
+                    )
+                )
                 new_group_bys.append(group_by)
 
         return SqlSelectStatementNode.create(
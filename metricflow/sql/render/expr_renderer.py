@@ -7,9 +7,9 @@ from collections import namedtuple
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Collection, List, Optional
 
-import jinja2
 from dbt_semantic_interfaces.type_enums.date_part import DatePart
 from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
+from metricflow_semantics.jinja_templates import compiled_jinja_template
 from metricflow_semantics.mf_logging.formatting import indent
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
 from typing_extensions import override
@@ -44,6 +44,14 @@ from metricflow.sql.sql_plan import SqlSelectColumn
 if TYPE_CHECKING:
     from metricflow.protocols.sql_client import SqlEngine
 
+_MULTI_LINE_LOGICAL_ARG_TEMPLATE = textwrap.dedent(
+    """\
+    (
+      {{ arg_sql | indent(2) }}
+    )
+    """
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +101,10 @@ class SqlExpressionRenderer(SqlExpressionNodeVisitor[SqlExpressionRenderResult],
         """Whether or not this SQL renderer supports rendering the particular percentile function type."""
         return percentile_type in self.supported_percentile_function_types
 
+    def render_bind_parameter_key(self, bind_parameter_key: str) -> str:
+        """Render the placeholder for a bind parameter in the syntax accepted by the engine."""
+        return f":{bind_parameter_key}"
+
 
 class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
     """Renders the SQL query plan assuming ANSI SQL."""
@@ -187,7 +199,13 @@ class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
             bind_parameters=SqlBindParameters(),
         )
 
-    def visit_string_literal_expr(self, node: SqlStringLiteralExpression) -> SqlExpressionRenderResult:  # noqa: D102
+    def visit_string_literal_expr(self, node: SqlStringLiteralExpression) -> SqlExpressionRenderResult:
+        """Render a string literal like 'foo', or a placeholder like :foo_key if the literal should be bound."""
+        if node.bind_parameter_key is not None:
+            return SqlExpressionRenderResult(
+                sql=self.render_bind_parameter_key(node.bind_parameter_key),
+                bind_parameters=node.bind_parameters,
+            )
         return SqlExpressionRenderResult(
             sql=f"'{node.literal_value}'",
             bind_parameters=SqlBindParameters(),
@@ -241,15 +259,7 @@ class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
             return arg_rendered.sql if not requires_parenthesis else f"({arg_rendered.sql})"
         else:
             return (
-                jinja2.Template(
-                    textwrap.dedent(
-                        """\
-                    (
-                      {{ arg_sql | indent(2) }}
-                    )
-                    """
-                    )
-                )
+                compiled_jinja_template(_MULTI_LINE_LOGICAL_ARG_TEMPLATE, strict_undefined=False)
                 .render(arg_sql=arg_rendered.sql)
                 .rstrip()
             )
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameter, SqlBindParameters
+
+from metricflow.sql.render.rendering_constants import SqlRenderingConstants
+
+
+class IndentedSqlWriter:
+    """An output buffer for rendering SQL that keeps track of the indentation level.
+
+    Rendering a nested query by rendering each sub-query to a string and then indenting it copies the SQL of a
+    sub-query once for each level of nesting. Instead, the lines are written once to this buffer with the indentation
+    of the current level.
+
+    Lines are indented in the same way as `textwrap.indent()` i.e. lines that consist solely of whitespace are not
+    indented. The bind parameters for the SQL are also collected here so that they're merged once.
+    """
+
+    def __init__(self, indent_prefix: str = SqlRenderingConstants.INDENT) -> None:
+        """Initializer.
+
+        Args:
+            indent_prefix: The string that is added to the start of a line for each level of indentation.
+        """
+        self._indent_prefix = indent_prefix
+        self._current_prefix = ""
+        self._sql_parts: List[str] = []
+        self._has_lines = False
+        self._key_to_bind_parameter: Dict[str, SqlBindParameter] = {}
+
+    @contextmanager
+    def indented(self) -> Iterator[None]:
+        """Context manager that increases the indentation level of the lines written within it."""
+        previous_prefix = self._current_prefix
+        self._current_prefix = previous_prefix + self._indent_prefix
+        try:
+            yield
+        finally:
+            self._current_prefix = previous_prefix
+
+    def write_line(self, text: str) -> None:
+        """Write the text at the current indentation level, starting on a new line.
+
+        The text can span multiple lines, in which case each line is indented.
+        """
+        if self._has_lines:
+            self._sql_parts.append("\n")
+        self._has_lines = True
+
+        prefix = self._current_prefix
+        if len(prefix) == 0:
+            self._sql_parts.append(text)
+            return
+
+        for line in text.splitlines(keepends=True):
+            if line.strip():
+                self._sql_parts.append(prefix)
+            self._sql_parts.append(line)
+
+    def add_bind_parameters(self, bind_parameters: SqlBindParameters) -> None:
+        """Add the bind parameters that are needed for the written SQL.
+
+        Similar to `SqlBindParameters.combine()`, the order of the parameters is preserved and an exception is raised
+        if a key is used with different values.
+        """
+        for item in bind_parameters.param_items:
+            existing_item = self._key_to_bind_parameter.get(item.key)
+            if existing_item is None:
+                self._key_to_bind_parameter[item.key] = item
+            elif existing_item.value != item.value:
+                raise RuntimeError(
+                    f"Conflict with key {item.key} in combining parameters. "
+                    f"Existing value: {existing_item.value} Additional value: {item.value}"
+                )
+
+    @property
+    def sql(self) -> str:
+        """Return the SQL that has been written."""
+        return "".join(self._sql_parts)
+
+    @property
+    def bind_parameters(self) -> SqlBindParameters:
+        """Return the bind parameters that have been added."""
+        return SqlBindParameters(param_items=tuple(self._key_to_bind_parameter.values()))
@@ -1,21 +1,19 @@
 from __future__ import annotations
 
 import logging
-import textwrap
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass
-from string import Template
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Mapping, Optional, Sequence, Set
 
-from metricflow_semantics.mf_logging.formatting import indent
+from metricflow_semantics.dag.mf_dag import NodeId
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
 
 from metricflow.sql.render.expr_renderer import (
     DefaultSqlExpressionRenderer,
     SqlExpressionRenderer,
-    SqlExpressionRenderResult,
 )
-from metricflow.sql.render.rendering_constants import SqlRenderingConstants
+from metricflow.sql.render.indented_sql_writer import IndentedSqlWriter
 from metricflow.sql.sql_plan import (
     SqlCreateTableAsNode,
     SqlJoinDescription,
@@ -65,66 +63,166 @@ class StringJoinDescription:
     on_condition_str: str
 
 
+# For the render in progress, maps the ID of a sub-query that is rendered in a WITH clause to the name of the common
+# table expression. This is a context variable as the renderer can be used by multiple threads.
+_common_table_expression_names: ContextVar[Mapping[NodeId, str]] = ContextVar(
+    "_common_table_expression_names", default={}
+)
+
+
+def _find_common_sub_queries(node: SqlQueryPlanNode) -> Sequence[SqlSelectStatementNode]:
+    """Return the SELECT statements that are used as a source more than once, with sources ordered before dependents.
+
+    A sub-query is only counted once for each time that it's used by a statement that is rendered, so a sub-query
+    that is only used within a common sub-query is not returned.
+    """
+    reference_counts: Dict[NodeId, int] = {}
+    visited_node_ids: Set[NodeId] = set()
+    nodes_in_dependency_order: List[SqlQueryPlanNode] = []
+
+    def _visit(current_node: SqlQueryPlanNode) -> None:
+        if current_node.node_id in visited_node_ids:
+            return
+        visited_node_ids.add(current_node.node_id)
+        for parent_node in current_node.parent_nodes:
+            reference_counts[parent_node.node_id] = reference_counts.get(parent_node.node_id, 0) + 1
+            _visit(parent_node)
+        nodes_in_dependency_order.append(current_node)
+
+    _visit(node)
+
+    common_sub_queries: List[SqlSelectStatementNode] = []
+    for node_in_order in nodes_in_dependency_order:
+        select_node = node_in_order.as_select_node
+        if select_node is not None and reference_counts.get(select_node.node_id, 0) > 1:
+            common_sub_queries.append(select_node)
+    return common_sub_queries
+
+
 class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
-    """Renders an SQL plan following ANSI SQL."""
+    """Renders an SQL plan following ANSI SQL.
+
+    If enabled for the plan, a SELECT statement that is used as a source more than once (e.g. after
+    `SqlCommonSubQueryDeduplicator`) is rendered once as a common table expression in a WITH clause and referenced by
+    name.
+    """
 
     # The renderer that is used to render the SQL expressions.
     EXPR_RENDERER = DefaultSqlExpressionRenderer()
+    # Whether the engine supports common table expressions. If not, shared sub-queries are rendered at each use.
+    SUPPORTS_COMMON_TABLE_EXPRESSIONS = True
+    # The prefix for the names of the common table expressions.
+    COMMON_TABLE_EXPRESSION_NAME_PREFIX = "cte_"
+
+    def _render_node(self, node: SqlQueryPlanNode) -> SqlPlanRenderResult:
+        writer = IndentedSqlWriter()
+        self._write_node(node, writer)
+        return SqlPlanRenderResult(sql=writer.sql, bind_parameters=writer.bind_parameters)
 
-    def _render_select_columns_section(
+    def _write_node(self, node: SqlQueryPlanNode, writer: IndentedSqlWriter) -> None:
+        node.accept(_SqlPlanNodeWriter(renderer=self, writer=writer))
+
+    def render_sql_query_plan(self, sql_query_plan: SqlQueryPlan) -> SqlPlanRenderResult:  # noqa: D102
+        render_node = sql_query_plan.render_node
+        if not (sql_query_plan.render_common_table_expressions and self.SUPPORTS_COMMON_TABLE_EXPRESSIONS):
+            return self._render_node(render_node)
+
+        writer = IndentedSqlWriter()
+        # For CREATE TABLE AS, the WITH clause needs to go in the SELECT statement.
+        if isinstance(render_node, SqlCreateTableAsNode):
+            self._write_create_table_as(render_node, writer, render_common_table_expressions=True)
+        else:
+            self._write_with_common_table_expressions(render_node, writer)
+        return SqlPlanRenderResult(sql=writer.sql, bind_parameters=writer.bind_parameters)
+
+    def _write_with_common_table_expressions(self, node: SqlQueryPlanNode, writer: IndentedSqlWriter) -> None:
+        """Write the node, placing sub-queries that are used more than once in a WITH clause."""
+        common_sub_queries = _find_common_sub_queries(node)
+        if len(common_sub_queries) == 0:
+            self._write_node(node, writer)
+            return
+
+        common_table_expression_names = {
+            sub_query.node_id: f"{self.COMMON_TABLE_EXPRESSION_NAME_PREFIX}{i}"
+            for i, sub_query in enumerate(common_sub_queries)
+        }
+        token = _common_table_expression_names.set(common_table_expression_names)
+        try:
+            # Since a sub-query's entry in the mapping is only used when it's referenced as a source, writing the
+            # sub-query directly writes the definition.
+            for i, sub_query in enumerate(common_sub_queries):
+                writer.write_line(
+                    f"{'WITH' if i == 0 else ','} {common_table_expression_names[sub_query.node_id]} AS ("
+                )
+                with writer.indented():
+                    self._write_node(sub_query, writer)
+                writer.write_line(")")
+            # Separate the WITH clause from the query with an empty line.
+            writer.write_line("")
+            self._write_node(node, writer)
+        finally:
+            _common_table_expression_names.reset(token)
+
+    def _render_table_like_source(self, source_node: SqlQueryPlanNode) -> Optional[SqlPlanRenderResult]:
+        """Render a source in a FROM / JOIN clause if it can be rendered like a table (i.e. without parenthesis).
+
+        Returns None if the source needs to be written as a sub-query.
+        """
+        common_table_expression_name = _common_table_expression_names.get().get(source_node.node_id)
+        if common_table_expression_name is not None:
+            return SqlPlanRenderResult(sql=common_table_expression_name, bind_parameters=SqlBindParameters())
+        if source_node.is_table:
+            return self._render_node(source_node)
+        return None
+
+    def _write_select_columns_section(
         self,
         select_columns: Sequence[SqlSelectColumn],
         num_parents: int,
         distinct: bool,
-    ) -> Tuple[str, SqlBindParameters]:
-        """Convert the select columns into a "SELECT" section.
+        writer: IndentedSqlWriter,
+    ) -> None:
+        """Write the select columns as a "SELECT" section.
 
         e.g.
         SELECT
           1 AS bookings
           , listing_id AS listing
           ...
-
-        Returns a tuple of the "SELECT" section as a string and the associated execution parameters.
         """
-        params = SqlBindParameters()
-        select_section_lines = ["SELECT DISTINCT" if distinct else "SELECT"]
-        first_column = True
-        for select_column in select_columns:
-            expr_rendered = self.EXPR_RENDERER.render_sql_expr(select_column.expr)
-            # Merge all execution parameters together. Similar pattern follows below.
-            params = params.combine(expr_rendered.bind_parameters)
-
-            column_select_str = f"{expr_rendered.sql} AS {select_column.column_alias}"
-
-            # For cases where the alias is the same as column like "src.foo AS foo", just render it as "src.foo"
-            # SQLite throws an ambiguous column error with something like
-            #
-            # SELECT a.ds
-            # FROM fct_bookings a
-            # JOIN dim_users b
-            # on a.ds = b.ds
-            #
-            # so don't do this if it has joins.
-            if num_parents <= 1 and select_column.expr.as_column_reference_expression:
-                column_reference = select_column.expr.as_column_reference_expression.col_ref
-                if column_reference.column_name == select_column.column_alias:
-                    column_select_str = expr_rendered.sql
-
-            if first_column:
-                first_column = False
-                select_section_lines.append(indent(column_select_str, indent_prefix=SqlRenderingConstants.INDENT))
-            else:
-                select_section_lines.append(
-                    indent(", " + column_select_str, indent_prefix=SqlRenderingConstants.INDENT)
-                )
-
-        return "\n".join(select_section_lines), params
-
-    def _render_from_section(
-        self, from_source: SqlQueryPlanNode, from_source_alias: str
-    ) -> Tuple[str, SqlBindParameters]:
-        """Convert the node into a "FROM" section.
+        writer.write_line("SELECT DISTINCT" if distinct else "SELECT")
+        with writer.indented():
+            first_column = True
+            for select_column in select_columns:
+                expr_rendered = self.EXPR_RENDERER.render_sql_expr(select_column.expr)
+                writer.add_bind_parameters(expr_rendered.bind_parameters)
+
+                column_select_str = f"{expr_rendered.sql} AS {select_column.column_alias}"
+
+                # For cases where the alias is the same as column like "src.foo AS foo", just render it as "src.foo"
+                # SQLite throws an ambiguous column error with something like
+                #
+                # SELECT a.ds
+                # FROM fct_bookings a
+                # JOIN dim_users b
+                # on a.ds = b.ds
+                #
+                # so don't do this if it has joins.
+                if num_parents <= 1 and select_column.expr.as_column_reference_expression:
+                    column_reference = select_column.expr.as_column_reference_expression.col_ref
+                    if column_reference.column_name == select_column.column_alias:
+                        column_select_str = expr_rendered.sql
+
+                if first_column:
+                    first_column = False
+                    writer.write_line(column_select_str)
+                else:
+                    writer.write_line(", " + column_select_str)
+
+    def _write_from_section(
+        self, from_source: SqlQueryPlanNode, from_source_alias: str, writer: IndentedSqlWriter
+    ) -> None:
+        """Write the node as a "FROM" section.
 
         e.g.
         FROM (
@@ -132,24 +230,20 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
             1 AS bookings
             ...
         )
-
-        Returns a tuple of the "FROM" section as a string and the associated execution parameters.
         """
-        from_render_result = self._render_node(from_source)
+        table_like_render_result = self._render_table_like_source(from_source)
+        if table_like_render_result is not None:
+            writer.add_bind_parameters(table_like_render_result.bind_parameters)
+            writer.write_line(f"FROM {table_like_render_result.sql} {from_source_alias}")
+            return
 
-        from_section_lines = []
-        if from_source.is_table:
-            from_section_lines.append(f"FROM {from_render_result.sql} {from_source_alias}")
-        else:
-            from_section_lines.append("FROM (")
-            from_section_lines.append(indent(from_render_result.sql, indent_prefix=SqlRenderingConstants.INDENT))
-            from_section_lines.append(f") {from_source_alias}")
-        from_section = "\n".join(from_section_lines)
-
-        return from_section, from_render_result.bind_parameters
+        writer.write_line("FROM (")
+        with writer.indented():
+            self._write_node(from_source, writer)
+        writer.write_line(f") {from_source_alias}")
 
-    def _render_joins_section(self, join_descriptions: Sequence[SqlJoinDescription]) -> Tuple[str, SqlBindParameters]:
-        """Convert the join descriptions into a "JOIN" section.
+    def _write_joins_section(self, join_descriptions: Sequence[SqlJoinDescription], writer: IndentedSqlWriter) -> None:
+        """Write the join descriptions as a "JOIN" section.
 
         e.g.
         JOIN (
@@ -157,149 +251,99 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
         ) right
         ON
           left.ds = right.ds
-
-        Returns a tuple of the "JOIN" section as a string and the associated execution parameters.
         """
-        params = SqlBindParameters()
-        join_section_lines = []
         for join_description in join_descriptions:
-            # Render the source for the join
-            right_source_rendered = self._render_node(join_description.right_source)
-            params = params.combine(right_source_rendered.bind_parameters)
+            # Write the source for the join
+            table_like_render_result = self._render_table_like_source(join_description.right_source)
+            if table_like_render_result is not None:
+                writer.add_bind_parameters(table_like_render_result.bind_parameters)
+                writer.write_line(join_description.join_type.value)
+                with writer.indented():
+                    writer.write_line(f"{table_like_render_result.sql} {join_description.right_source_alias}")
+            else:
+                writer.write_line(f"{join_description.join_type.value} (")
+                with writer.indented():
+                    self._write_node(join_description.right_source, writer)
+                writer.write_line(f") {join_description.right_source_alias}")
 
-            # Render the on condition for the join
-            on_condition_rendered: Optional[SqlExpressionRenderResult] = None
+            # Write the on condition for the join
             if join_description.on_condition:
                 on_condition_rendered = self.EXPR_RENDERER.render_sql_expr(join_description.on_condition)
-                params = params.combine(on_condition_rendered.bind_parameters)
-
-            if join_description.right_source.is_table:
-                join_section_lines.append(join_description.join_type.value)
-                join_section_lines.append(
-                    textwrap.indent(
-                        f"{right_source_rendered.sql} {join_description.right_source_alias}",
-                        prefix=SqlRenderingConstants.INDENT,
-                    )
-                )
-            else:
-                join_section_lines.append(f"{join_description.join_type.value} (")
-                join_section_lines.append(
-                    textwrap.indent(right_source_rendered.sql, prefix=SqlRenderingConstants.INDENT)
-                )
-                join_section_lines.append(f") {join_description.right_source_alias}")
-
-            if on_condition_rendered:
-                join_section_lines.append("ON")
-                join_section_lines.append(
-                    textwrap.indent(on_condition_rendered.sql, prefix=SqlRenderingConstants.INDENT)
-                )
-
-        return "\n".join(join_section_lines), params
-
-    def _render_group_by_section(self, group_by_columns: Sequence[SqlSelectColumn]) -> Tuple[str, SqlBindParameters]:
-        """Convert the group by columns into a "GROUP BY" section.
-
-        e.g.
-        GROUP BY
-          a.ds
-
-        Returns a tuple of the "GROUP BY" section as a string and the associated execution parameters.
-        """
-        group_by_section_lines: List[str] = []
-        params = SqlBindParameters()
-        first = True
+                writer.add_bind_parameters(on_condition_rendered.bind_parameters)
+                writer.write_line("ON")
+                with writer.indented():
+                    writer.write_line(on_condition_rendered.sql)
+
+    def _render_group_by_expressions(
+        self, group_by_columns: Sequence[SqlSelectColumn], writer: IndentedSqlWriter
+    ) -> Sequence[str]:
+        """Render the expressions for the "GROUP BY" section and add the associated bind parameters to the writer."""
+        group_by_expressions: List[str] = []
         for group_by_column in group_by_columns:
             group_by_expr_rendered = self.EXPR_RENDERER.render_group_by_expr(group_by_column)
-            params = params.combine(group_by_expr_rendered.bind_parameters)
-            if first:
-                first = False
-                group_by_section_lines.append("GROUP BY")
-                group_by_section_lines.append(
-                    textwrap.indent(group_by_expr_rendered.sql, prefix=SqlRenderingConstants.INDENT)
-                )
-            else:
-                group_by_section_lines.append(
-                    textwrap.indent(f", {group_by_expr_rendered.sql}", prefix=SqlRenderingConstants.INDENT)
-                )
+            writer.add_bind_parameters(group_by_expr_rendered.bind_parameters)
+            group_by_expressions.append(group_by_expr_rendered.sql)
+        return group_by_expressions
 
-        return "\n".join(group_by_section_lines), params
-
-    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlPlanRenderResult:  # noqa: D102
-        # Keep track of all execution parameters for all expressions
-        combined_params = SqlBindParameters()
-
-        # Render description section
+    def _write_select_statement(self, node: SqlSelectStatementNode, writer: IndentedSqlWriter) -> None:
+        # Write description section
         description_section = "\n".join([f"-- {x}" for x in node.description.split("\n") if x])
+        if description_section:
+            writer.write_line(description_section)
 
-        # Render "SELECT" column section
-        select_section, select_params = self._render_select_columns_section(
-            node.select_columns, len(node.parent_nodes), node.distinct
-        )
-        combined_params = combined_params.combine(select_params)
+        # Write "SELECT" column section
+        self._write_select_columns_section(node.select_columns, len(node.parent_nodes), node.distinct, writer)
 
-        # Render "FROM" section
-        from_section, from_params = self._render_from_section(node.from_source, node.from_source_alias)
-        combined_params = combined_params.combine(from_params)
+        # Write "FROM" section
+        self._write_from_section(node.from_source, node.from_source_alias, writer)
 
-        # Render "JOIN" section
-        join_section, join_params = self._render_joins_section(node.join_descs)
-        combined_params = combined_params.combine(join_params)
+        # Write "JOIN" section
+        self._write_joins_section(node.join_descs, writer)
 
-        # Render "GROUP BY" section
-        group_by_section, group_by_params = self._render_group_by_section(node.group_bys)
-        combined_params = combined_params.combine(group_by_params)
+        # The "GROUP BY" section is written after the "WHERE" section, but the expressions are rendered first to keep
+        # the same order of bind parameters as before.
+        group_by_expressions = self._render_group_by_expressions(node.group_bys, writer)
 
-        # Render "WHERE" section
-        where_section = None
+        # Write "WHERE" section
         if node.where:
             where_render_result = self.EXPR_RENDERER.render_sql_expr(node.where)
-            combined_params = combined_params.combine(where_render_result.bind_parameters)
-            where_section = f"WHERE {where_render_result.sql}"
+            writer.add_bind_parameters(where_render_result.bind_parameters)
+            writer.write_line(f"WHERE {where_render_result.sql}")
+
+        # Write "GROUP BY" section
+        if len(group_by_expressions) > 0:
+            writer.write_line("GROUP BY")
+            with writer.indented():
+                for i, group_by_expression in enumerate(group_by_expressions):
+                    writer.write_line(group_by_expression if i == 0 else f", {group_by_expression}")
 
-        # Render "ORDER BY" section
-        order_by_section = None
+        # Write "ORDER BY" section
         if node.order_bys:
             order_by_items: List[str] = []
             for order_by in node.order_bys:
                 order_by_render_result = self.EXPR_RENDERER.render_sql_expr(order_by.expr)
                 order_by_items.append(order_by_render_result.sql + (" DESC" if order_by.desc else ""))
-                combined_params = combined_params.combine(order_by_render_result.bind_parameters)
+                writer.add_bind_parameters(order_by_render_result.bind_parameters)
 
-            order_by_section = "ORDER BY " + ", ".join(order_by_items)
+            writer.write_line("ORDER BY " + ", ".join(order_by_items))
 
-        # Render "LIMIT" section
-        limit_section = None
+        # Write "LIMIT" section
         if node.limit:
-            limit_section = f"LIMIT {node.limit}"
-
-        # Combine the sections into a single string.
-        sections_to_render = []
-
-        if description_section:
-            sections_to_render.append(description_section)
-
-        sections_to_render.append(select_section)
-        sections_to_render.append(from_section)
-
-        if join_section:
-            sections_to_render.append(join_section)
-
-        if where_section:
-            sections_to_render.append(where_section)
-
-        if group_by_section:
-            sections_to_render.append(group_by_section)
-
-        if order_by_section:
-            sections_to_render.append(order_by_section)
-
-        if limit_section:
-            sections_to_render.append(limit_section)
+            writer.write_line(f"LIMIT {node.limit}")
+
+    def _write_create_table_as(
+        self, node: SqlCreateTableAsNode, writer: IndentedSqlWriter, render_common_table_expressions: bool
+    ) -> None:
+        writer.write_line(f"CREATE {node.sql_table.table_type.value.upper()} {node.sql_table.sql} AS (")
+        with writer.indented():
+            if render_common_table_expressions:
+                self._write_with_common_table_expressions(node.parent_node, writer)
+            else:
+                self._write_node(node.parent_node, writer)
+        writer.write_line(")")
 
-        return SqlPlanRenderResult(
-            sql="\n".join(sections_to_render),
-            bind_parameters=combined_params,
-        )
+    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlPlanRenderResult:  # noqa: D102
+        return self._render_node(node)
 
     def visit_table_from_clause_node(self, node: SqlTableFromClauseNode) -> SqlPlanRenderResult:  # noqa: D102
         return SqlPlanRenderResult(
@@ -314,25 +358,32 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
         )
 
     def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> SqlPlanRenderResult:  # noqa: D102
-        inner_sql_render_result = node.parent_node.accept(self)
-        inner_sql = inner_sql_render_result.sql
-        # Using a substitution since inner_sql can have multiple lines, and then dedent() wouldn't dent due to the
-        # short line.
-        sql = Template(
-            textwrap.dedent(
-                f"""\
-                CREATE {node.sql_table.table_type.value.upper()} {node.sql_table.sql} AS (
-                $inner_sql
-                )
-                """
-            ).rstrip()
-        ).substitute({"inner_sql": indent(inner_sql, indent_prefix=SqlRenderingConstants.INDENT)})
-
-        return SqlPlanRenderResult(
-            sql=sql,
-            bind_parameters=inner_sql_render_result.bind_parameters,
-        )
+        return self._render_node(node)
 
     @property
     def expr_renderer(self) -> SqlExpressionRenderer:  # noqa :D
         return self.EXPR_RENDERER
+
+
+class _SqlPlanNodeWriter(SqlQueryPlanNodeVisitor[None]):
+    """Writes the SQL for the visited node to the writer using the given renderer."""
+
+    def __init__(self, renderer: DefaultSqlQueryPlanRenderer, writer: IndentedSqlWriter) -> None:  # noqa: D107
+        self._renderer = renderer
+        self._writer = writer
+
+    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> None:  # noqa: D102
+        self._renderer._write_select_statement(node, self._writer)
+
+    def visit_table_from_clause_node(self, node: SqlTableFromClauseNode) -> None:  # noqa: D102
+        self._write_render_result(self._renderer.visit_table_from_clause_node(node))
+
+    def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> None:  # noqa: D102
+        self._write_render_result(self._renderer.visit_query_from_clause_node(node))
+
+    def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> None:  # noqa: D102
+        self._renderer._write_create_table_as(node, self._writer, render_common_table_expressions=False)
+
+    def _write_render_result(self, render_result: SqlPlanRenderResult) -> None:
+        self._writer.add_bind_parameters(render_result.bind_parameters)
+        self._writer.write_line(render_result.sql)
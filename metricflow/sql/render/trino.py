@@ -21,6 +21,7 @@ from metricflow.sql.sql_exprs import (
     SqlGenerateUuidExpression,
     SqlPercentileExpression,
     SqlPercentileFunctionType,
+    SqlStringLiteralExpression,
     SqlSubtractTimeIntervalExpression,
 )
 
@@ -95,8 +96,12 @@ class TrinoSqlExpressionRenderer(DefaultSqlExpressionRenderer):
         bind_parameters = bind_parameters.combine(rendered_start_expr.bind_parameters)
         bind_parameters = bind_parameters.combine(rendered_end_expr.bind_parameters)
 
-        # Handle timestamp literals differently.
-        if parse(rendered_start_expr.sql):
+        # Handle timestamp literals differently. The value of a bound literal isn't in the SQL, but bound literals in
+        # a BETWEEN are only used for time range constraints.
+        start_expr_is_bound_literal = (
+            isinstance(node.start_expr, SqlStringLiteralExpression) and node.start_expr.bind_parameter_key is not None
+        )
+        if start_expr_is_bound_literal or parse(rendered_start_expr.sql):
             sql = f"{rendered_column_arg.sql} BETWEEN timestamp {rendered_start_expr.sql} AND timestamp {rendered_end_expr.sql}"
         else:
             sql = f"{rendered_column_arg.sql} BETWEEN {rendered_start_expr.sql} AND {rendered_end_expr.sql}"
@@ -316,13 +316,24 @@ class SqlStringExpression(SqlExpressionNode):
 
 @dataclass(frozen=True)
 class SqlStringLiteralExpression(SqlExpressionNode):
-    """A string literal like 'foo'. It shouldn't include delimiters as it should be added during rendering."""
+    """A string literal like 'foo'. It shouldn't include delimiters as it should be added during rendering.
+
+    Attributes:
+        literal_value: The value of the string.
+        bind_parameter_key: If set, the value is rendered as a bind parameter with this key instead of being inlined.
+        This allows the rendered SQL to be reused with different values.
+    """
 
     literal_value: str
+    bind_parameter_key: Optional[str] = None
 
     @staticmethod
-    def create(literal_value: str) -> SqlStringLiteralExpression:  # noqa: D102
-        return SqlStringLiteralExpression(parent_nodes=(), literal_value=literal_value)
+    def create(  # noqa: D102
+        literal_value: str, bind_parameter_key: Optional[str] = None
+    ) -> SqlStringLiteralExpression:
+        return SqlStringLiteralExpression(
+            parent_nodes=(), literal_value=literal_value, bind_parameter_key=bind_parameter_key
+        )
 
     @classmethod
     def id_prefix(cls) -> IdPrefix:  # noqa: D102
@@ -345,7 +356,9 @@ class SqlStringLiteralExpression(SqlExpressionNode):
 
     @property
     def bind_parameters(self) -> SqlBindParameters:  # noqa: D102
-        return SqlBindParameters()
+        if self.bind_parameter_key is None:
+            return SqlBindParameters()
+        return SqlBindParameters.create_from_dict({self.bind_parameter_key: self.literal_value})
 
     def __repr__(self) -> str:  # noqa: D105
         return f"{self.__class__.__name__}(node_id={self.node_id}, literal_value={self.literal_value})"
@@ -364,7 +377,7 @@ class SqlStringLiteralExpression(SqlExpressionNode):
     def matches(self, other: SqlExpressionNode) -> bool:  # noqa: D102
         if not isinstance(other, SqlStringLiteralExpression):
             return False
-        return self.literal_value == other.literal_value
+        return self.literal_value == other.literal_value and self.bind_parameter_key == other.bind_parameter_key
 
 
 @dataclass(frozen=True)
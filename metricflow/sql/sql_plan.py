@@ -318,14 +318,22 @@ class SqlCreateTableAsNode(SqlQueryPlanNode):
 class SqlQueryPlan(MetricFlowDag[SqlQueryPlanNode]):
     """Model for an SQL Query as a DAG."""
 
-    def __init__(self, render_node: SqlQueryPlanNode, plan_id: Optional[DagId] = None) -> None:
+    def __init__(
+        self,
+        render_node: SqlQueryPlanNode,
+        plan_id: Optional[DagId] = None,
+        render_common_table_expressions: bool = False,
+    ) -> None:
         """Constructor.
 
         Args:
             render_node: The node from which to start rendering the SQL query.
             plan_id: If specified, use this sql_query_plan_id instead of a generated one.
+            render_common_table_expressions: If the engine supports it, render SELECT statements that are used as a
+            source more than once in a WITH clause.
         """
         self._render_node = render_node
+        self._render_common_table_expressions = render_common_table_expressions
         super().__init__(
             dag_id=plan_id or DagId.from_id_prefix(StaticIdPrefix.SQL_QUERY_PLAN_PREFIX),
             sink_nodes=[self._render_node],
@@ -334,3 +342,7 @@ class SqlQueryPlan(MetricFlowDag[SqlQueryPlanNode]):
     @property
     def render_node(self) -> SqlQueryPlanNode:  # noqa: D102
         return self._render_node
+
+    @property
+    def render_common_table_expressions(self) -> bool:  # noqa: D102
+        return self._render_common_table_expressions
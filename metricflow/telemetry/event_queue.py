@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import atexit
+import collections
+import logging
+import threading
+import weakref
+from typing import Callable, Deque, Generic, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT")
+
+
+class BackgroundBatchQueue(Generic[ItemT]):
+    """A bounded queue where the items are processed in batches by a background thread.
+
+    This is used to move work (e.g. reporting telemetry) off the thread that handles a request. Adding an item only
+    appends it to a deque, so the cost to the caller is small. If the queue is full, the item is dropped instead of
+    blocking the caller.
+
+    The thread is started when the first item is added, and the queue is flushed when the interpreter exits.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[ItemT]], None],
+        max_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        thread_name: str = "mf_background_batch_queue",
+    ) -> None:
+        """Constructor.
+
+        Args:
+            process_batch: The function called in the background thread with a batch of items.
+            max_size: The maximum number of items in the queue. Items added when the queue is full are dropped.
+            batch_size: The maximum number of items passed to a call of process_batch. The background thread is also
+                woken up when the queue has this many items.
+            flush_interval_seconds: The longest time that an item waits in the queue before it's processed.
+            thread_name: The name of the background thread.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size should be >= 1. Got: {max_size}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be >= 1. Got: {batch_size}")
+        self._process_batch = process_batch
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._thread_name = thread_name
+
+        self._items: Deque[ItemT] = collections.deque()
+        self._dropped_item_count = 0
+        self._reported_dropped_item_count = 0
+        # Set to wake up the background thread before the flush interval has elapsed.
+        self._wake_up_event = threading.Event()
+        # Held while processing items so that a flush returns only after the items taken by the background thread are
+        # processed.
+        self._process_lock = threading.Lock()
+        self._thread_start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def put(self, item: ItemT) -> bool:
+        """Add the item to the queue. Returns false if the item was dropped because the queue is full or closed."""
+        items = self._items
+        # The length check and the append are not atomic, so the queue can exceed the maximum size by the number of
+        # threads adding items at the same time. That's preferable to taking a lock in the caller's thread.
+        if len(items) >= self._max_size or self._closed:
+            self._dropped_item_count += 1
+            return False
+        items.append(item)
+
+        if self._thread is None:
+            self._start_thread()
+        # Setting the event is comparatively slow, so it's only set once for each batch. If the thread misses it, the
+        # items are processed after the flush interval.
+        elif len(items) == self._batch_size:
+            self._wake_up_event.set()
+        return True
+
+    @property
+    def dropped_item_count(self) -> int:
+        """The number of items that were dropped because the queue was full or closed."""
+        return self._dropped_item_count
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._items)
+
+    def _start_thread(self) -> None:
+        with self._thread_start_lock:
+            if self._thread is not None:
+                return
+            # The thread and the exit hook only hold weak references so that the queue can be garbage collected.
+            queue_ref = weakref.ref(self)
+            wake_up_event = self._wake_up_event
+            flush_interval_seconds = self._flush_interval_seconds
+
+            def _run() -> None:
+                while True:
+                    wake_up_event.wait(timeout=flush_interval_seconds)
+                    wake_up_event.clear()
+                    queue = queue_ref()
+                    if queue is None or queue._closed:
+                        return
+                    queue._process_items()
+                    del queue
+
+            atexit.register(_flush_on_exit, queue_ref)
+            self._thread = threading.Thread(target=_run, name=self._thread_name, daemon=True)
+            self._thread.start()
+
+    def _process_items(self) -> None:
+        with self._process_lock:
+            items = self._items
+            while len(items) > 0:
+                batch: List[ItemT] = []
+                while len(items) > 0 and len(batch) < self._batch_size:
+                    batch.append(items.popleft())
+                try:
+                    self._process_batch(batch)
+                except Exception:
+                    logger.exception(f"Unable to process a batch of {len(batch)} item(s)")
+
+            dropped_item_count = self._dropped_item_count
+            unreported_dropped_item_count = dropped_item_count - self._reported_dropped_item_count
+            if unreported_dropped_item_count > 0:
+                logger.warning(f"Dropped {unreported_dropped_item_count} item(s) as the queue was full or closed")
+                self._reported_dropped_item_count = dropped_item_count
+
+    def flush(self) -> None:
+        """Process all items that were added before this call in the caller's thread."""
+        self._process_items()
+
+    def close(self) -> None:
+        """Flush the queue and stop the background thread. Items added after this call are dropped."""
+        self._closed = True
+        self._wake_up_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+
+def _flush_on_exit(queue_ref: weakref.ReferenceType[BackgroundBatchQueue[ItemT]]) -> None:
+    queue = queue_ref()
+    if queue is not None:
+        queue.flush()
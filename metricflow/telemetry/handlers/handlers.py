@@ -25,11 +25,24 @@ class TelemetryHandler(ABC):
         function_end_event: Optional[FunctionEndEvent] = None,
     ) -> bool:
         """Log an event to telemetry."""
-        payload = TelemetryPayload(
+        return self.log_batch(
             client_id=client_id,
             function_start_events=(function_start_event,) if function_start_event else (),
             function_end_events=(function_end_event,) if function_end_event else (),
         )
+
+    def log_batch(
+        self,
+        client_id: str,
+        function_start_events: Sequence[FunctionStartEvent] = (),
+        function_end_events: Sequence[FunctionEndEvent] = (),
+    ) -> bool:
+        """Log a batch of events to telemetry in a single payload."""
+        payload = TelemetryPayload(
+            client_id=client_id,
+            function_start_events=tuple(function_start_events),
+            function_end_events=tuple(function_end_events),
+        )
         self._write_log(client_id, payload.dict())
         return True
 
@@ -47,17 +60,27 @@ class ToMemoryTelemetryHandler(TelemetryHandler):
     def payloads(self) -> Sequence[TelemetryPayload]:  # noqa: D102
         return self._payloads
 
-    def log(
+    @property
+    def function_start_events(self) -> Sequence[FunctionStartEvent]:
+        """The start events in all payloads."""
+        return tuple(event for payload in self._payloads for event in payload.function_start_events)
+
+    @property
+    def function_end_events(self) -> Sequence[FunctionEndEvent]:
+        """The end events in all payloads."""
+        return tuple(event for payload in self._payloads for event in payload.function_end_events)
+
+    def log_batch(
         self,
         client_id: str,
-        function_start_event: Optional[FunctionStartEvent] = None,
-        function_end_event: Optional[FunctionEndEvent] = None,
+        function_start_events: Sequence[FunctionStartEvent] = (),
+        function_end_events: Sequence[FunctionEndEvent] = (),
     ) -> bool:
-        """Log an event to telemetry."""
+        """Log a batch of events to telemetry in a single payload."""
         payload = TelemetryPayload(
             client_id=client_id,
-            function_start_events=(function_start_event,) if function_start_event else (),
-            function_end_events=(function_end_event,) if function_end_event else (),
+            function_start_events=tuple(function_start_events),
+            function_end_events=tuple(function_end_events),
         )
         if len(self._payloads) > 10:
             self._payloads.pop()
@@ -17,6 +17,9 @@ class PythonLoggerTelemetryHandler(TelemetryHandler):
         self._logger_level = logger_level
 
     def _write_log(self, client_id: str, payload: PayloadType) -> None:
+        # Formatting the payload is comparatively slow.
+        if not logger.isEnabledFor(self._logger_level):
+            return
         logger.log(
             level=self._logger_level,
             msg=f"Logging telemetry payload:\n{textwrap.indent(mf_pformat(payload), prefix='    ')}",
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from metricflow.telemetry.tracing import TraceSpan
+
+if TYPE_CHECKING:
+    from opentelemetry.context import Context
+    from opentelemetry.trace import Tracer
+
+logger = logging.getLogger(__name__)
+
+
+class OpenTelemetryTraceSpanExporter:
+    """A `TraceSpanExporter` that sends the spans of each request to an OpenTelemetry tracer.
+
+    The spans are created with the recorded start and end times after the request has finished. The root span of a
+    request is a child of the span that's current in the calling thread, if there is one.
+    """
+
+    def __init__(self, tracer: Optional[Tracer] = None) -> None:
+        """Constructor.
+
+        Args:
+            tracer: The tracer used to create the spans. Defaults to the tracer from the global tracer provider.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("Exporting spans to OpenTelemetry requires the `opentelemetry-api` package.") from e
+
+        self._tracer = tracer or trace.get_tracer("metricflow")
+
+    def export(self, span: TraceSpan) -> None:  # noqa: D102
+        self._export(span, context=None)
+
+    def _export(self, span: TraceSpan, context: Optional[Context]) -> None:
+        from opentelemetry import trace
+        from opentelemetry.trace.status import Status, StatusCode
+
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            attributes=span.attribute_dict,
+            start_time=span.start_time_ns,
+        )
+        exception_name = span.attribute_dict.get("exception")
+        if exception_name is not None:
+            otel_span.set_status(Status(StatusCode.ERROR, description=exception_name))
+
+        child_context = trace.set_span_in_context(otel_span)
+        for child_span in span.child_spans:
+            self._export(child_span, context=child_context)
+        otel_span.end(end_time=span.end_time_ns)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import functools
+import itertools
 import logging
 import os
 import platform
@@ -10,11 +11,13 @@ import time
 import traceback
 import uuid
 from hashlib import sha256
-from typing import Callable, List, Optional, TypeVar
+from types import TracebackType
+from typing import Callable, Coroutine, List, NamedTuple, Optional, Tuple, Type, TypeVar, Union
 
 from metricflow_semantics.random_id import random_id
 from typing_extensions import ParamSpec
 
+from metricflow.telemetry.event_queue import BackgroundBatchQueue
 from metricflow.telemetry.handlers.handlers import (
     TelemetryHandler,
     ToMemoryTelemetryHandler,
@@ -24,17 +27,65 @@ from metricflow.telemetry.models import FunctionEndEvent, FunctionStartEvent, Te
 
 logger = logging.getLogger(__name__)
 
+ExceptionInfo = Tuple[Type[BaseException], BaseException, TracebackType]
+
+
+class _FunctionStartRecord(NamedTuple):
+    """The data for a `FunctionStartEvent` that's queued to be reported by the background thread."""
+
+    event_timestamp: float
+    invocation_id: str
+    module_name: str
+    function_name: str
+
+
+class _FunctionEndRecord(NamedTuple):
+    """The data for a `FunctionEndEvent` that's queued to be reported by the background thread.
+
+    To avoid formatting the trace in the caller's thread, the exception info can be queued instead of the trace.
+    """
+
+    event_timestamp: float
+    invocation_id: str
+    module_name: str
+    function_name: str
+    runtime: float
+    exception_trace: Optional[str]
+    exception_info: Optional[ExceptionInfo]
+
 
 class TelemetryReporter:
-    """Reports telemetry for improving product experience."""
+    """Reports telemetry for improving product experience.
+
+    To keep the cost of reporting out of the calling thread, events are added to a bounded queue, and the handlers are
+    called with batches of events in a background thread. If the queue is full, events are dropped. Queued events are
+    reported when the interpreter exits, or when `flush()` is called.
+    """
 
     # Session ID to use when requesting a non-uniquely identifiable ID.
     FULLY_ANONYMOUS_CLIENT_ID = "anonymous"
     ENV_EMAIL_OVERRIDE = "METRICFLOW_CLIENT_EMAIL"
 
-    def __init__(self, report_levels_higher_or_equal_to: TelemetryLevel, fully_anonymous: bool = False) -> None:
-        """If fully_anonymous is set, use a client_id that is not unique."""
+    def __init__(
+        self,
+        report_levels_higher_or_equal_to: TelemetryLevel,
+        fully_anonymous: bool = False,
+        max_queued_event_count: int = 10000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            report_levels_higher_or_equal_to: Only events with a level higher or equal to this are reported.
+            fully_anonymous: If set, use a client_id that is not unique.
+            max_queued_event_count: The maximum number of events waiting to be reported. Additional events are dropped.
+            batch_size: The maximum number of events passed to a handler in a single call.
+            flush_interval_seconds: The longest time that an event waits before it's reported.
+        """
         self._report_levels_higher_or_equal_to = report_levels_higher_or_equal_to
+        self._report_usage = TelemetryLevel.USAGE >= report_levels_higher_or_equal_to
+        self._report_exceptions = TelemetryLevel.EXCEPTION >= report_levels_higher_or_equal_to
         self._fully_anonymous = fully_anonymous
         self._email = os.getenv(TelemetryReporter.ENV_EMAIL_OVERRIDE)
 
@@ -49,6 +100,17 @@ class TelemetryReporter:
         self._test_handler = ToMemoryTelemetryHandler()
         self._handlers: List[TelemetryHandler] = []
 
+        # Invocation IDs are created from a counter as generating a random ID for each call is comparatively slow.
+        self._invocation_id_prefix = f"call_{random_id()}_"
+        self._invocation_counter = itertools.count()
+        self._event_queue: BackgroundBatchQueue[Union[_FunctionStartRecord, _FunctionEndRecord]] = BackgroundBatchQueue(
+            process_batch=self._report_records,
+            max_size=max_queued_event_count,
+            batch_size=batch_size,
+            flush_interval_seconds=flush_interval_seconds,
+            thread_name="mf_telemetry_reporter",
+        )
+
     @staticmethod
     def _create_client_id() -> str:
         """Creates an identifier for the current user based on their current environment.
@@ -70,9 +132,29 @@ class TelemetryReporter:
 
     @property
     def test_handler(self) -> ToMemoryTelemetryHandler:
-        """Used for testing only to verify that the handlers are getting the right events."""
+        """Used for testing only to verify that the handlers are getting the right events.
+
+        Call `flush()` before checking the events.
+        """
         return self._test_handler
 
+    @property
+    def dropped_event_count(self) -> int:
+        """The number of events that were dropped because too many events were waiting to be reported."""
+        return self._event_queue.dropped_item_count
+
+    def flush(self) -> None:
+        """Report all events that were logged before this call."""
+        self._event_queue.flush()
+
+    def close(self) -> None:
+        """Report the queued events and stop the background thread. Events logged after this call are dropped."""
+        self._event_queue.close()
+
+    def create_invocation_id(self) -> str:
+        """Create an ID to match the start and the end events of a function call."""
+        return f"{self._invocation_id_prefix}{next(self._invocation_counter)}"
+
     def log_function_start(
         self,
         invocation_id: str,
@@ -83,39 +165,73 @@ class TelemetryReporter:
 
         invocation_id is to uniquely identify different function calls.
         """
-        if TelemetryLevel.USAGE >= self._report_levels_higher_or_equal_to:
-            for handler in self._handlers:
-                handler.log(
-                    client_id=self._client_id,
-                    function_start_event=FunctionStartEvent.create(
-                        event_time=datetime.datetime.now(),
-                        level_name=TelemetryLevel.USAGE.name,
-                        invocation_id=invocation_id,
-                        module_name=module_name,
-                        function_name=function_name,
-                    ),
-                )
+        if self._report_usage:
+            # Positional arguments are used as this is called for every logged call and they're faster.
+            self._event_queue.put(_FunctionStartRecord(time.time(), invocation_id, module_name, function_name))
 
     def log_function_end(
-        self, invocation_id: str, module_name: str, function_name: str, runtime: float, exception_trace: Optional[str]
+        self,
+        invocation_id: str,
+        module_name: str,
+        function_name: str,
+        runtime: float,
+        exception_trace: Optional[str],
+        exception_info: Optional[ExceptionInfo] = None,
     ) -> None:
-        """Similar to log_function_end, except adding the duration of the call and exception trace on error."""
-        if TelemetryLevel.USAGE >= self._report_levels_higher_or_equal_to or (
-            exception_trace and TelemetryLevel.EXCEPTION >= self._report_levels_higher_or_equal_to
-        ):
-            for handler in self._handlers:
-                handler.log(
+        """Similar to log_function_end, except adding the duration of the call and exception trace on error.
+
+        Instead of exception_trace, exception_info (i.e. the result of `sys.exc_info()`) can be passed so that the trace
+        is formatted in the background thread.
+        """
+        has_exception = exception_trace is not None or exception_info is not None
+        if self._report_usage or (has_exception and self._report_exceptions):
+            self._event_queue.put(
+                _FunctionEndRecord(
+                    time.time(), invocation_id, module_name, function_name, runtime, exception_trace, exception_info
+                )
+            )
+
+    def _report_records(self, records: List[Union[_FunctionStartRecord, _FunctionEndRecord]]) -> None:
+        """Convert the queued records to events and pass them to the handlers. Called in the background thread."""
+        function_start_events: List[FunctionStartEvent] = []
+        function_end_events: List[FunctionEndEvent] = []
+        for record in records:
+            if isinstance(record, _FunctionStartRecord):
+                function_start_events.append(
+                    FunctionStartEvent.create(
+                        event_time=datetime.datetime.fromtimestamp(record.event_timestamp),
+                        level_name=TelemetryLevel.USAGE.name,
+                        invocation_id=record.invocation_id,
+                        module_name=record.module_name,
+                        function_name=record.function_name,
+                    )
+                )
+                continue
+
+            exception_trace = record.exception_trace
+            if exception_trace is None and record.exception_info is not None:
+                exception_trace = "".join(traceback.format_exception(*record.exception_info))
+            function_end_events.append(
+                FunctionEndEvent.create(
+                    event_time=datetime.datetime.fromtimestamp(record.event_timestamp),
+                    level_name=TelemetryLevel.USAGE.name if not exception_trace else TelemetryLevel.EXCEPTION.name,
+                    invocation_id=record.invocation_id,
+                    module_name=record.module_name,
+                    function_name=record.function_name,
+                    runtime=record.runtime,
+                    exception_trace=exception_trace,
+                )
+            )
+
+        for handler in self._handlers:
+            try:
+                handler.log_batch(
                     client_id=self._client_id,
-                    function_end_event=FunctionEndEvent.create(
-                        event_time=datetime.datetime.now(),
-                        level_name=TelemetryLevel.USAGE.name if not exception_trace else TelemetryLevel.EXCEPTION.name,
-                        invocation_id=invocation_id,
-                        module_name=module_name,
-                        function_name=function_name,
-                        runtime=runtime,
-                        exception_trace=exception_trace,
-                    ),
+                    function_start_events=function_start_events,
+                    function_end_events=function_end_events,
                 )
+            except Exception:
+                logger.exception(f"Unable to report telemetry with {handler.__class__.__name__}")
 
 
 P = ParamSpec("P")
@@ -136,28 +252,67 @@ def log_call(telemetry_reporter: TelemetryReporter, module_name: str) -> Callabl
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        # Not every Callable has a __name__
+        function_name = getattr(func, "__name__", repr(func))
+
         @functools.wraps(func)
         def wrapped(*args: P.args, **kwargs: P.kwargs) -> R:
-            # Not every Callable has a __name__
-            function_name = getattr(func, "__name__", repr(func))
-            invocation_id = f"call_{random_id()}"
-            start_time = time.time()
+            invocation_id = telemetry_reporter.create_invocation_id()
+            start_time = time.perf_counter()
             telemetry_reporter.log_function_start(
                 invocation_id=invocation_id, module_name=module_name, function_name=function_name
             )
-            exception_trace: Optional[str] = None
+            exception_info: Optional[ExceptionInfo] = None
             try:
                 return func(*args, **kwargs)
             except Exception:
-                exception_trace = traceback.format_exc()
+                # The trace is formatted in the background thread.
+                exception_info = sys.exc_info()  # type: ignore[assignment]
                 raise
             finally:
                 telemetry_reporter.log_function_end(
                     invocation_id=invocation_id,
                     module_name=module_name,
                     function_name=function_name,
-                    runtime=time.time() - start_time,
-                    exception_trace=exception_trace,
+                    runtime=time.perf_counter() - start_time,
+                    exception_trace=None,
+                    exception_info=exception_info,
+                )
+
+        return wrapped
+
+    return decorator
+
+
+def log_async_call(
+    telemetry_reporter: TelemetryReporter, module_name: str
+) -> Callable[[Callable[P, Coroutine[object, None, R]]], Callable[P, Coroutine[object, None, R]]]:
+    """Similar to `log_call`, but for coroutine functions. The runtime includes the time spent awaiting."""
+
+    def decorator(func: Callable[P, Coroutine[object, None, R]]) -> Callable[P, Coroutine[object, None, R]]:
+        function_name = getattr(func, "__name__", repr(func))
+
+        @functools.wraps(func)
+        async def wrapped(*args: P.args, **kwargs: P.kwargs) -> R:
+            invocation_id = telemetry_reporter.create_invocation_id()
+            start_time = time.perf_counter()
+            telemetry_reporter.log_function_start(
+                invocation_id=invocation_id, module_name=module_name, function_name=function_name
+            )
+            exception_info: Optional[ExceptionInfo] = None
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                exception_info = sys.exc_info()  # type: ignore[assignment]
+                raise
+            finally:
+                telemetry_reporter.log_function_end(
+                    invocation_id=invocation_id,
+                    module_name=module_name,
+                    function_name=function_name,
+                    runtime=time.perf_counter() - start_time,
+                    exception_trace=None,
+                    exception_info=exception_info,
                 )
 
         return wrapped
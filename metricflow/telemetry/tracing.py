@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Dict, Iterator, List, Optional, Protocol, Sequence, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TraceSpan:
+    """The timing of a phase in a request (e.g. building the dataflow plan).
+
+    Spans for the phases within this one are in child_spans. Times are in nanoseconds since the epoch, as used by
+    OpenTelemetry.
+    """
+
+    name: str
+    start_time_ns: int
+    end_time_ns: int
+    attributes: Tuple[Tuple[str, str], ...] = ()
+    child_spans: Tuple[TraceSpan, ...] = ()
+
+    @property
+    def duration(self) -> float:
+        """The duration of the span in seconds."""
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    @property
+    def attribute_dict(self) -> Dict[str, str]:  # noqa: D102
+        return dict(self.attributes)
+
+    def walk(self) -> Iterator[TraceSpan]:
+        """Iterate through this span and all spans within it, depth first."""
+        yield self
+        for child_span in self.child_spans:
+            yield from child_span.walk()
+
+    def find_spans(self, name: str) -> Sequence[TraceSpan]:
+        """Return all spans with the given name within this span (including this one) in the order that they started."""
+        return tuple(span for span in self.walk() if span.name == name)
+
+    def structure_text(self) -> str:
+        """Return a text representation of the spans with their durations for logging."""
+        lines: List[str] = []
+        self._append_structure_text_lines(lines, indent_level=0)
+        return "\n".join(lines)
+
+    def _append_structure_text_lines(self, lines: List[str], indent_level: int) -> None:
+        attributes_str = ", ".join(f"{key}={value}" for key, value in self.attributes)
+        lines.append(
+            "    " * indent_level
+            + f"{self.name}: {self.duration * 1000:.1f}ms"
+            + (f" ({attributes_str})" if attributes_str else "")
+        )
+        for child_span in self.child_spans:
+            child_span._append_structure_text_lines(lines, indent_level + 1)
+
+
+class TraceSpanExporter(Protocol):
+    """Receives the spans for each traced request e.g. to send them to a tracing system.
+
+    This is called in the thread that handled the request, so implementations should not block.
+    """
+
+    def export(self, span: TraceSpan) -> None:
+        """Export the root span of a request."""
+        ...
+
+
+class _TraceSpanBuilder:
+    """Collects the data for a span while it's open."""
+
+    def __init__(self, name: str, attributes: Dict[str, str]) -> None:  # noqa: D107
+        self.name = name
+        self.attributes = attributes
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        # Spans in tasks that run in other threads may be added concurrently, but appending to a list is thread-safe.
+        self.child_span_builders: List[_TraceSpanBuilder] = []
+
+    def build(self) -> TraceSpan:
+        end_time_ns = self.end_time_ns if self.end_time_ns is not None else time.time_ns()
+        return TraceSpan(
+            name=self.name,
+            start_time_ns=self.start_time_ns,
+            end_time_ns=end_time_ns,
+            attributes=tuple(self.attributes.items()),
+            child_spans=tuple(
+                child_span_builder.build()
+                for child_span_builder in sorted(
+                    tuple(self.child_span_builders), key=lambda span_builder: span_builder.start_time_ns
+                )
+            ),
+        )
+
+
+# The innermost open span. A context variable is used so that spans are collected separately for concurrent requests
+# in different threads or asyncio tasks.
+_current_span_builder: contextvars.ContextVar[Optional[_TraceSpanBuilder]] = contextvars.ContextVar(
+    "mf_current_trace_span_builder", default=None
+)
+
+
+@contextmanager
+def trace_span(name: str, **attributes: str) -> Iterator[None]:
+    """Record the enclosed code block as a span within the current trace.
+
+    If there is no trace being recorded (see `TraceRecorder`), this does nothing. Spans are not propagated to other
+    threads automatically, so code submitted to a thread pool should be run with `contextvars.copy_context().run`.
+    """
+    parent_span_builder = _current_span_builder.get()
+    if parent_span_builder is None:
+        yield
+        return
+
+    span_builder = _TraceSpanBuilder(name, attributes)
+    token = _current_span_builder.set(span_builder)
+    try:
+        yield
+    except BaseException as e:
+        span_builder.attributes["exception"] = type(e).__name__
+        raise
+    finally:
+        span_builder.end_time_ns = time.time_ns()
+        _current_span_builder.reset(token)
+        parent_span_builder.child_span_builders.append(span_builder)
+
+
+def add_trace_span_attributes(**attributes: str) -> None:
+    """Add the attributes to the current span, if a trace is being recorded."""
+    span_builder = _current_span_builder.get()
+    if span_builder is not None:
+        span_builder.attributes.update(attributes)
+
+
+class TraceRecorder:
+    """Records a trace of the spans opened with `trace_span` in the enclosed code block.
+
+    Use as a context manager. The recorded spans are available through `span` after exiting. If a trace is already
+    being recorded, the recorded span is also added to the current span.
+    """
+
+    def __init__(self, name: str, **attributes: str) -> None:
+        """Constructor.
+
+        Args:
+            name: The name of the root span.
+            attributes: Attributes for the root span.
+        """
+        self._span_builder = _TraceSpanBuilder(name, attributes)
+        self._parent_span_builder: Optional[_TraceSpanBuilder] = None
+        self._token: Optional[contextvars.Token[Optional[_TraceSpanBuilder]]] = None
+        self._span: Optional[TraceSpan] = None
+
+    def __enter__(self) -> TraceRecorder:  # noqa: D105
+        if self._token is not None:
+            raise RuntimeError("A trace recorder can't be entered more than once")
+        self._parent_span_builder = _current_span_builder.get()
+        self._span_builder.start_time_ns = time.time_ns()
+        self._token = _current_span_builder.set(self._span_builder)
+        return self
+
+    def __exit__(  # noqa: D105
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        assert self._token is not None, "The trace recorder should have been entered"
+        if exc_type is not None:
+            self._span_builder.attributes["exception"] = exc_type.__name__
+        self._span_builder.end_time_ns = time.time_ns()
+        _current_span_builder.reset(self._token)
+        if self._parent_span_builder is not None:
+            self._parent_span_builder.child_span_builders.append(self._span_builder)
+        self._span = self._span_builder.build()
+
+    @property
+    def span(self) -> TraceSpan:
+        """The root span of the recorded trace. Only available after the recorder has exited."""
+        if self._span is None:
+            raise RuntimeError("The trace is still being recorded")
+        return self._span
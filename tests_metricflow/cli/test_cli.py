@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import logging
 import shutil
+import socket
+import stat
 import textwrap
+import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, List
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -30,6 +34,9 @@ from dbt_metricflow.cli.main import (
     tutorial,
     validate_configs,
 )
+from dbt_metricflow.cli.main import list as list_command
+from dbt_metricflow.cli.server import MetricFlowServer
+from dbt_metricflow.cli.server_client import create_server_socket_dir, send_server_request, server_socket_path
 from metricflow.protocols.sql_client import SqlClient, SqlEngine
 from tests_metricflow.fixtures.cli_fixtures import MetricFlowCliRunner
 from tests_metricflow.snapshot_utils import assert_str_snapshot_equal
@@ -48,6 +55,16 @@ def test_query(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D103
     assert resp.exit_code == 0
 
 
+def test_query_to_csv(cli_runner: MetricFlowCliRunner, tmp_path: Path) -> None:  # noqa: D103
+    csv_path = tmp_path / "query_output.csv"
+    resp = cli_runner.run(query, args=["--metrics", "bookings", "--group-by", "metric_time", "--csv", str(csv_path)])
+    assert resp.exit_code == 0
+
+    csv_lines = csv_path.read_text().splitlines()
+    assert csv_lines[0].lower() == "metric_time__day,bookings"
+    assert len(csv_lines) > 1
+
+
 def test_list_dimensions(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D103
     resp = cli_runner.run(dimensions, args=["--metrics", "bookings"])
 
@@ -296,3 +313,83 @@ def test_saved_query_with_cumulative_metric(  # noqa: D103
     )
     print(resp.output)
     assert resp.exit_code == 0
+
+
+def test_server(cli_context: CLIContext, tmp_path: Path) -> None:
+    """Check that commands sent to the server are run with the context of the server."""
+    socket_path = tmp_path / "mf.sock"
+    metricflow_server = MetricFlowServer(
+        cli_context=cli_context, socket_path=socket_path, commands={"query": query, "list": list_command}
+    )
+    server_exceptions: List[Exception] = []
+
+    def _serve() -> None:
+        try:
+            metricflow_server.serve()
+        except Exception as e:
+            server_exceptions.append(e)
+            raise
+
+    server_thread = threading.Thread(target=_serve, daemon=True)
+    server_thread.start()
+    try:
+        # Wait for the server to start listening.
+        deadline = time.monotonic() + 30
+        while send_server_request(socket_path, {"type": "status"}) is None:
+            if not server_thread.is_alive():
+                pytest.fail(f"The server stopped before it started listening: {server_exceptions}")
+            if time.monotonic() > deadline:
+                pytest.fail(f"The server did not start listening on {socket_path} within 30s")
+            server_thread.join(timeout=0.1)
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+
+        response = send_server_request(
+            socket_path, {"type": "run", "args": ["query", "--metrics", "bookings", "--group-by", "metric_time"]}
+        )
+        assert response is not None
+        assert response["exit_code"] == 0
+        assert "bookings" in str(response["output"]).lower()
+
+        response = send_server_request(socket_path, {"type": "run", "args": ["list", "metrics"]})
+        assert response is not None
+        assert response["exit_code"] == 0
+        assert "bookings" in str(response["output"])
+
+        response = send_server_request(socket_path, {"type": "run", "args": ["tutorial"]})
+        assert response is not None
+        assert response["exit_code"] == 1
+
+        response = send_server_request(socket_path, {"type": "run", "args": ["query", "--unknown-option"]})
+        assert response is not None
+        assert response["exit_code"] == 2
+        assert "No such option" in str(response["output"])
+    finally:
+        send_server_request(socket_path, {"type": "stop"})
+        server_thread.join(timeout=30)
+    assert not server_thread.is_alive(), "The server did not stop"
+
+    assert not socket_path.exists()
+    assert send_server_request(socket_path, {"type": "status"}) is None
+
+
+def test_server_request_timeout(tmp_path: Path) -> None:
+    """Check that a request to a server that does not accept it in time is not sent, so the CLI runs it instead."""
+    socket_path = tmp_path / "mf.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server_socket:
+        server_socket.bind(str(socket_path))
+        # Connections are queued, but never accepted.
+        server_socket.listen()
+        assert send_server_request(socket_path, {"type": "status"}) is None
+
+
+def test_server_socket_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: D103
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    socket_dir = create_server_socket_dir()
+    assert socket_dir == tmp_path / "metricflow"
+    assert stat.S_IMODE(socket_dir.stat().st_mode) == 0o700
+    assert server_socket_path(tmp_path).parent == socket_dir
+
+    # A directory that other users can access is not used.
+    socket_dir.chmod(0o755)
+    with pytest.raises(PermissionError):
+        create_server_socket_dir()
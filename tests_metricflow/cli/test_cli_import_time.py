@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+# The CPU-time budget for importing the CLI. Importing it took ~0.2s when this was added, and ~2.7s before the modules
+# that take a while to import were imported in the commands that use them. CPU time is used instead of wall-clock time
+# as it's less affected by other tests running at the same time.
+_IMPORT_TIME_BUDGET_SECONDS = 1.0
+
+# Modules that should only be imported by the commands that use them.
+_LAZILY_IMPORTED_MODULE_NAMES = (
+    "dbt.adapters",
+    "dbt.cli",
+    "jinja2",
+    "metricflow.engine.metricflow_engine",
+    "metricflow_semantics.model.semantic_manifest_lookup",
+    "update_checker",
+)
+
+_IMPORT_CLI_SCRIPT = """
+import json
+import sys
+import time
+
+start_time = time.process_time()
+import dbt_metricflow.cli.main
+
+print(json.dumps({"import_time": time.process_time() - start_time, "module_names": sorted(sys.modules)}))
+"""
+
+
+def test_cli_import_time() -> None:
+    """Check that the CLI imports quickly so that commands like `mf --help` are responsive.
+
+    The import is run in a separate process as the modules are already imported in the test process. To see what
+    takes time to import, run `python -X importtime -c "import dbt_metricflow.cli.main"`.
+    """
+    completed_process = subprocess.run(
+        (sys.executable, "-c", _IMPORT_CLI_SCRIPT), capture_output=True, text=True, check=True
+    )
+    result = json.loads(completed_process.stdout)
+
+    imported_module_names = set(result["module_names"])
+    for module_name in _LAZILY_IMPORTED_MODULE_NAMES:
+        assert module_name not in imported_module_names, f"{module_name} should not be imported at startup"
+
+    import_time = result["import_time"]
+    assert (
+        import_time < _IMPORT_TIME_BUDGET_SECONDS
+    ), f"Importing the CLI took {import_time:.2f}s, which exceeds the budget of {_IMPORT_TIME_BUDGET_SECONDS:.2f}s"
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import io
+import logging
+from typing import Iterator
+
+import pytest
+from metricflow_semantics.query.query_parser import MetricFlowQueryParser
+from metricflow_semantics.specs.query_spec import MetricFlowQuerySpec
+from metricflow_semantics.test_helpers.benchmark_helpers import BenchmarkTimer
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+
+logger = logging.getLogger(__name__)
+
+_PLANNING_LOGGER_NAMES = ("metricflow", "metricflow_semantics")
+
+
+@pytest.fixture
+def planning_log_stream() -> Iterator[io.StringIO]:
+    """Adds a handler that writes the logs from the planning modules to a string so that the records are formatted."""
+    log_stream = io.StringIO()
+    handler = logging.StreamHandler(log_stream)
+    planning_loggers = [logging.getLogger(logger_name) for logger_name in _PLANNING_LOGGER_NAMES]
+    previous_levels = [planning_logger.level for planning_logger in planning_loggers]
+    for planning_logger in planning_loggers:
+        planning_logger.setLevel(logging.WARNING)
+        planning_logger.addHandler(handler)
+    yield log_stream
+    for planning_logger, previous_level in zip(planning_loggers, previous_levels):
+        planning_logger.removeHandler(handler)
+        planning_logger.setLevel(previous_level)
+
+
+def _build_plans(
+    dataflow_plan_builder: DataflowPlanBuilder, query_spec: MetricFlowQuerySpec, log_level: int, iteration_count: int
+) -> None:
+    for logger_name in _PLANNING_LOGGER_NAMES:
+        logging.getLogger(logger_name).setLevel(log_level)
+
+    for _ in range(iteration_count):
+        dataflow_plan_builder.build_plan(query_spec)
+
+
+@pytest.mark.slow
+def test_planning_with_logging_benchmark(
+    dataflow_plan_builder: DataflowPlanBuilder,
+    query_parser: MetricFlowQueryParser,
+    planning_log_stream: io.StringIO,
+) -> None:
+    """Compares the time to build a dataflow plan with INFO logging disabled vs. enabled."""
+    benchmark_timer = BenchmarkTimer("test_planning_with_logging_benchmark")
+    query_spec = query_parser.parse_and_validate_query(
+        metric_names=("bookings", "booking_value", "bookings_per_booker"),
+        group_by_names=("metric_time__day", "listing__country_latest", "user__home_state_latest"),
+    ).query_spec
+    iteration_count = 10
+    # Build once beforehand so that the first timing doesn't include populating caches.
+    dataflow_plan_builder.build_plan(query_spec)
+
+    with benchmark_timer.time("build_plans_with_info_logging_disabled"):
+        _build_plans(dataflow_plan_builder, query_spec, log_level=logging.WARNING, iteration_count=iteration_count)
+    assert planning_log_stream.getvalue() == ""
+
+    with benchmark_timer.time("build_plans_with_info_logging_enabled"):
+        _build_plans(dataflow_plan_builder, query_spec, log_level=logging.INFO, iteration_count=iteration_count)
+    assert planning_log_stream.getvalue() != ""
+
+    benchmark_timer.log_results(f"Built {iteration_count} plans with INFO logging disabled and enabled.")
@@ -126,3 +126,41 @@ def test_joined_node_data_set(
         set_id="result0",
         spec_set=join_node_output_data_set.instance_set.spec_set,
     )
+
+
+def test_node_data_set_cache(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+) -> None:
+    """Tests that outputs for pinned nodes are retained while outputs for other nodes are evicted."""
+    resolver: DataflowPlanNodeOutputDataSetResolver = DataflowPlanNodeOutputDataSetResolver(
+        column_association_resolver=DunderColumnAssociationResolver(simple_semantic_manifest_lookup),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        query_node_cache_max_size=1,
+    )
+    read_node_mapping = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].read_node_mapping
+    revenue_node = read_node_mapping["revenue"]
+    users_node = read_node_mapping["users_latest"]
+    bookings_node = read_node_mapping["bookings_source"]
+
+    resolver.cache_output_data_sets((revenue_node,))
+    pinned_data_set = resolver.get_output_data_set(revenue_node)
+    assert resolver.pinned_node_count == 1
+
+    users_data_set = resolver.get_output_data_set(users_node)
+    assert resolver.get_output_data_set(users_node) is users_data_set
+    resolver.get_output_data_set(bookings_node)
+    assert resolver.get_output_data_set(revenue_node) is pinned_data_set
+
+    cache_stats = resolver.query_node_cache_stats
+    assert cache_stats.size == 1
+    assert cache_stats.hit_count == 1
+    assert cache_stats.eviction_count == 1
+
+    # Pinned outputs are shared with the copy, but pinning nodes in the copy does not affect the original.
+    resolver_copy = resolver.copy()
+    assert resolver_copy.get_output_data_set(revenue_node) is pinned_data_set
+    assert resolver_copy.query_node_cache_stats.size == 0
+    resolver_copy.cache_output_data_sets((users_node,))
+    assert resolver_copy.pinned_node_count == 2
+    assert resolver.pinned_node_count == 1
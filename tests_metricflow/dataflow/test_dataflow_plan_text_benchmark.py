@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+from typing import List, Mapping
+
+import pytest
+from metricflow_semantics.specs.measure_spec import MeasureSpec
+from metricflow_semantics.specs.spec_set import InstanceSpecSet
+from metricflow_semantics.test_helpers.benchmark_helpers import BenchmarkTimer
+
+from metricflow.dataflow.dataflow_plan import DataflowPlan, DataflowPlanNode
+from metricflow.dataflow.nodes.combine_aggregated_outputs import CombineAggregatedOutputsNode
+from metricflow.dataflow.nodes.filter_elements import FilterElementsNode
+from tests_metricflow.fixtures.manifest_fixtures import MetricFlowEngineTestFixture, SemanticManifestSetup
+
+logger = logging.getLogger(__name__)
+
+
+def _build_large_plan(source_node: DataflowPlanNode, branch_count: int, branch_length: int) -> DataflowPlan:
+    """Build a plan with `branch_count` chains of `branch_length` filter nodes that are combined at the end."""
+    branch_sink_nodes: List[DataflowPlanNode] = []
+    for _ in range(branch_count):
+        node = source_node
+        for _ in range(branch_length):
+            node = FilterElementsNode.create(
+                parent_node=node,
+                include_specs=InstanceSpecSet(measure_specs=(MeasureSpec(element_name="bookings"),)),
+            )
+        branch_sink_nodes.append(node)
+    return DataflowPlan(sink_nodes=(CombineAggregatedOutputsNode.create(parent_nodes=branch_sink_nodes),))
+
+
+@pytest.mark.slow
+def test_plan_text_benchmark(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
+) -> None:
+    """Measures the throughput of `structure_text()` and the graphviz labels for a plan with 500 nodes."""
+    benchmark_timer = BenchmarkTimer("test_plan_text_benchmark")
+    source_node = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].read_node_mapping[
+        "bookings_source"
+    ]
+    plan = _build_large_plan(source_node, branch_count=100, branch_length=5)
+    plan_nodes: List[DataflowPlanNode] = [plan.sink_node]
+    for branch_sink_node in plan.sink_node.parent_nodes:
+        node = branch_sink_node
+        while node is not source_node:
+            plan_nodes.append(node)
+            node = node.parent_nodes[0]
+    node_count = len(plan_nodes)
+    assert node_count == 501
+
+    with benchmark_timer.time("structure_text"):
+        plan_text = plan.structure_text()
+
+    with benchmark_timer.time("graphviz_labels"):
+        labels = [node.graphviz_label for node in plan_nodes]
+
+    benchmark_timer.log_results(
+        f"For a plan with {node_count} nodes, structure_text() handled "
+        f"{node_count / benchmark_timer.duration('structure_text'):.0f} nodes/s and creating the graphviz labels "
+        f"handled {node_count / benchmark_timer.duration('graphviz_labels'):.0f} nodes/s."
+    )
+    assert plan_text.count("<FilterElementsNode>") == node_count - 1
+    assert len(labels) == node_count
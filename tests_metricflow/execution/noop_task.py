@@ -22,21 +22,25 @@ class NoOpExecutionPlanTask(ExecutionPlanTask):
 
     Attributes:
         should_error: If true, test the error flow by intentionally returning an error in the results.
+        sleep_seconds: How long the task should take to run.
     """
 
     EXAMPLE_ERROR: ClassVar[TaskExecutionError] = TaskExecutionError("Expected Error")
 
     should_error: bool = False
+    sleep_seconds: float = 0.01
 
     @staticmethod
     def create(  # noqa: D102
         parent_tasks: Sequence[ExecutionPlanTask] = (),
         should_error: bool = False,
+        sleep_seconds: float = 0.01,
     ) -> NoOpExecutionPlanTask:
         return NoOpExecutionPlanTask(
             parent_nodes=tuple(parent_tasks),
             sql_query=None,
             should_error=should_error,
+            sleep_seconds=sleep_seconds,
         )
 
     @property
@@ -49,7 +53,7 @@ class NoOpExecutionPlanTask(ExecutionPlanTask):
 
     def execute(self) -> TaskExecutionResult:  # noqa: D102
         start_time = time.time()
-        time.sleep(0.01)
+        time.sleep(self.sleep_seconds)
         end_time = time.time()
         return TaskExecutionResult(
             start_time=start_time, end_time=end_time, errors=(self.EXAMPLE_ERROR,) if self.should_error else ()
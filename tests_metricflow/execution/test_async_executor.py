@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+
+from metricflow_semantics.dag.mf_dag import DagId
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
+
+from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.execution.execution_plan import ExecutionPlan, SelectSqlQueryToDataTableTask, SqlQuery
+from metricflow.execution.executor import AsyncPlanExecutor
+from metricflow.execution.thread_pool_sql_client import ThreadPoolAsyncSqlClient
+from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from tests_metricflow.execution.noop_task import NoOpExecutionPlanTask
+from tests_metricflow.sql.compare_data_table import assert_data_tables_equal
+
+
+def test_read_sql_task(sql_client: SqlClient) -> None:
+    """Tests running a query through the async client."""
+    task = SelectSqlQueryToDataTableTask.create(sql_client, SqlQuery("SELECT 1 AS foo", SqlBindParameters()))
+    execution_plan = ExecutionPlan(leaf_tasks=[task], dag_id=DagId.from_str("plan0"))
+    # The wrapped client is not closed as it's shared between tests.
+    executor = AsyncPlanExecutor(ThreadPoolAsyncSqlClient(sql_client))
+
+    results = asyncio.run(executor.execute_plan(execution_plan))
+    task_result = results.get_result(task.task_id)
+
+    assert not results.contains_task_errors
+    assert task_result.df is not None
+    assert_data_tables_equal(
+        actual=task_result.df,
+        expected=MetricFlowDataTable.create_from_rows(
+            column_names=["foo"],
+            rows=[(1,)],
+        ),
+        compare_names_using_lowercase=sql_client.sql_engine_type is SqlEngine.SNOWFLAKE,
+    )
+
+
+def test_task_with_parents(sql_client: SqlClient) -> None:
+    """Tests that the parents of a task run concurrently and finish before the task."""
+    parent_task1 = NoOpExecutionPlanTask.create(sleep_seconds=0.5)
+    parent_task2 = NoOpExecutionPlanTask.create(sleep_seconds=0.5)
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+    executor = AsyncPlanExecutor(ThreadPoolAsyncSqlClient(sql_client))
+
+    results = asyncio.run(executor.execute_plan(execution_plan))
+
+    parent_result1 = results.get_result(parent_task1.task_id)
+    parent_result2 = results.get_result(parent_task2.task_id)
+    leaf_result = results.get_result(leaf_task.task_id)
+
+    # Check that the parents overlapped.
+    assert parent_result1.start_time < parent_result2.end_time
+    assert parent_result2.start_time < parent_result1.end_time
+
+    assert parent_result1.end_time <= leaf_result.start_time
+    assert parent_result2.end_time <= leaf_result.start_time
+
+    assert not results.contains_task_errors
+
+
+def test_parent_task_error(sql_client: SqlClient) -> None:
+    """Check that the other tasks are not run if a parent task fails."""
+    parent_task1 = NoOpExecutionPlanTask.create(should_error=True)
+    parent_task2 = NoOpExecutionPlanTask.create(sleep_seconds=0.5)
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+    executor = AsyncPlanExecutor(ThreadPoolAsyncSqlClient(sql_client))
+
+    results = asyncio.run(executor.execute_plan(execution_plan))
+    assert len(results.all_results()) == 1
+    assert results.get_result(parent_task1.task_id).errors[0] == NoOpExecutionPlanTask.EXAMPLE_ERROR
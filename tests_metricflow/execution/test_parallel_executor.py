@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from metricflow_semantics.dag.mf_dag import DagId
+
+from metricflow.execution.execution_plan import ExecutionPlan
+from metricflow.execution.executor import ParallelPlanExecutor
+from tests_metricflow.execution.noop_task import NoOpExecutionPlanTask
+
+
+def test_single_task() -> None:
+    """Tests running an execution plan with a single task."""
+    task = NoOpExecutionPlanTask.create()
+    execution_plan = ExecutionPlan(leaf_tasks=[task], dag_id=DagId.from_str("plan0"))
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert results.get_result(task.task_id)
+    assert not results.contains_task_errors
+
+
+def test_task_with_parents() -> None:
+    """Tests that the parents of a task run concurrently and finish before the task."""
+    parent_task1 = NoOpExecutionPlanTask.create(sleep_seconds=0.5)
+    parent_task2 = NoOpExecutionPlanTask.create(sleep_seconds=0.5)
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+    results = ParallelPlanExecutor(max_workers=2).execute_plan(execution_plan)
+
+    parent_result1 = results.get_result(parent_task1.task_id)
+    parent_result2 = results.get_result(parent_task2.task_id)
+    leaf_result = results.get_result(leaf_task.task_id)
+
+    # Check that the parents overlapped.
+    assert parent_result1.start_time < parent_result2.end_time
+    assert parent_result2.start_time < parent_result1.end_time
+
+    assert parent_result1.end_time <= leaf_result.start_time
+    assert parent_result2.end_time <= leaf_result.start_time
+
+    assert not results.contains_task_errors
+
+
+def test_shared_parent_task() -> None:
+    """Tests that a task that's a parent of multiple tasks is run once."""
+    shared_parent_task = NoOpExecutionPlanTask.create()
+    child_task1 = NoOpExecutionPlanTask.create(parent_tasks=[shared_parent_task])
+    child_task2 = NoOpExecutionPlanTask.create(parent_tasks=[shared_parent_task])
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[child_task1, child_task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+
+    assert len(results.all_results()) == 4
+    assert not results.contains_task_errors
+
+
+def test_parent_task_error() -> None:
+    """Check that the other tasks are not run if a parent task fails."""
+    parent_task1 = NoOpExecutionPlanTask.create(should_error=True)
+    parent_task2 = NoOpExecutionPlanTask.create(sleep_seconds=0.5)
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+
+    results = ParallelPlanExecutor(max_workers=2).execute_plan(execution_plan)
+    assert len(results.all_results()) == 1
+    assert results.get_result(parent_task1.task_id).errors[0] == NoOpExecutionPlanTask.EXAMPLE_ERROR
+
+
+def test_task_timeout() -> None:
+    """Check that a task that runs too long is recorded as an error."""
+    task = NoOpExecutionPlanTask.create(sleep_seconds=2.0)
+    execution_plan = ExecutionPlan(leaf_tasks=[task], dag_id=DagId.from_str("plan0"))
+
+    results = ParallelPlanExecutor(task_timeout_seconds=0.1).execute_plan(execution_plan)
+    assert results.contains_task_errors
+    assert "timed out" in results.get_result(task.task_id).errors[0].error_str
+
+
+def test_task_timeout_excludes_queued_time() -> None:
+    """Check that the time a task waits for a free worker doesn't count towards the timeout.
+
+    With one worker, the last task waits for longer than the timeout, but each task runs for much less than it.
+    """
+    tasks = [NoOpExecutionPlanTask.create(sleep_seconds=0.2) for _ in range(8)]
+    execution_plan = ExecutionPlan(leaf_tasks=tasks, dag_id=DagId.from_str("plan0"))
+
+    results = ParallelPlanExecutor(max_workers=1, task_timeout_seconds=1.0).execute_plan(execution_plan)
+    assert len(results.all_results()) == len(tasks)
+    assert not results.contains_task_errors
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from typing import List
+
 from _pytest.fixtures import FixtureRequest
+from dbt_semantic_interfaces.test_utils import as_datetime
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
+from metricflow_semantics.test_helpers.time_helpers import ConfigurableTimeSource
 
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.telemetry.tracing import TraceSpan
 from tests_metricflow.integration.conftest import IntegrationTestHelpers
 from tests_metricflow.snapshot_utils import assert_object_snapshot_equal
+from tests_metricflow.sql.compare_data_table import assert_data_tables_equal
 
 
 def test_list_dimensions(  # noqa: D103
@@ -16,3 +25,184 @@ def test_list_dimensions(  # noqa: D103
         obj_id="result0",
         obj=sorted([dim.qualified_name for dim in it_helpers.mf_engine.list_dimensions()]),
     )
+
+
+def test_plan_cache(it_helpers: IntegrationTestHelpers) -> None:  # noqa: D103
+    mf_engine = it_helpers.mf_engine
+    explain_result = mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=["metric_time"])
+    )
+    assert mf_engine.plan_cache_stats.miss_count == 1
+
+    # A request with the same parameters, but a different request ID should use the cached plan.
+    cached_explain_result = mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=["metric_time"])
+    )
+    assert cached_explain_result.dataflow_plan is explain_result.dataflow_plan
+    assert mf_engine.plan_cache_stats.hit_count == 1
+    assert explain_result.trace is not None and explain_result.trace.attribute_dict["plan_cache_hit"] == "false"
+    assert (
+        cached_explain_result.trace is not None
+        and cached_explain_result.trace.attribute_dict["plan_cache_hit"] == "true"
+    )
+
+    mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["metric_time"], limit=10
+        )
+    )
+    assert mf_engine.plan_cache_stats.miss_count == 2
+    assert mf_engine.plan_cache_stats.size == 2
+
+    mf_engine.clear_plan_cache()
+    assert mf_engine.plan_cache_stats.size == 0
+    assert (
+        mf_engine.explain(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings"], group_by_names=["metric_time"]
+            )
+        ).rendered_sql
+        == explain_result.rendered_sql
+    )
+
+
+def test_async_query(it_helpers: IntegrationTestHelpers) -> None:
+    """Check that a query run from an event loop gives the same results as a blocking query."""
+    mf_engine = it_helpers.mf_engine
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=["metric_time"]
+    )
+
+    async def _run_queries() -> None:
+        explain_result = await mf_engine.aexplain(mf_request)
+        query_results = await asyncio.gather(mf_engine.aquery(mf_request), mf_engine.aquery(mf_request))
+        expected_query_result = mf_engine.query(mf_request)
+        assert expected_query_result.result_df is not None
+        for query_result in query_results:
+            assert query_result.sql == explain_result.rendered_sql.sql_query
+            assert query_result.result_df is not None
+            assert_data_tables_equal(actual=query_result.result_df, expected=expected_query_result.result_df)
+
+    asyncio.run(_run_queries())
+
+
+def test_close_async_sql_client(
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    """Check that closing the engine stops the threads for `aquery()` without closing the SQL client."""
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=["metric_time"]
+    )
+    with MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=it_helpers.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+    ) as mf_engine:
+        query_result = asyncio.run(mf_engine.aquery(mf_request))
+    assert query_result.result_df is not None
+
+    # The threads are created again for a query after the engine is closed.
+    query_result_after_close = asyncio.run(mf_engine.aquery(mf_request))
+    mf_engine.close()
+    assert query_result_after_close.result_df is not None
+    assert_data_tables_equal(actual=query_result_after_close.result_df, expected=query_result.result_df)
+    assert it_helpers.sql_client.query("SELECT 1 AS y").row_count == 1
+
+
+class _ToListTraceSpanExporter:
+    def __init__(self) -> None:
+        self.spans: List[TraceSpan] = []
+
+    def export(self, span: TraceSpan) -> None:
+        self.spans.append(span)
+
+
+def test_query_trace(
+    it_helpers: IntegrationTestHelpers, simple_semantic_manifest_lookup: SemanticManifestLookup
+) -> None:
+    """Check that the trace of a query has spans for each phase and is passed to the exporter."""
+    trace_span_exporter = _ToListTraceSpanExporter()
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=it_helpers.sql_client,
+        time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+        trace_span_exporter=trace_span_exporter,
+    )
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=["metric_time"]
+    )
+    query_result = mf_engine.query(mf_request)
+
+    trace = query_result.trace
+    assert trace is not None
+    assert trace_span_exporter.spans == [trace]
+    assert trace.name == "query"
+    assert trace.attribute_dict["request_id"] == mf_request.request_id.mf_rid
+    assert [span.name for span in trace.child_spans] == [
+        "parse_query",
+        "build_dataflow_plan",
+        "convert_to_sql_query_plan",
+        "render_sql",
+        "execute_plan",
+    ]
+    for span_name in (
+        "optimize_dataflow_plan",
+        "optimize_sql_query_plan",
+        "execute_task",
+        "execute_sql",
+        "materialize_data_table",
+    ):
+        assert len(trace.find_spans(span_name)) > 0, f"Missing span {span_name} in:\n{trace.structure_text()}"
+    for span in trace.walk():
+        assert trace.start_time_ns <= span.start_time_ns <= span.end_time_ns <= trace.end_time_ns
+
+    # Spans for the SQL that's run in the thread pool of the async client should be included.
+    async_query_result = asyncio.run(mf_engine.aquery(mf_request))
+    assert async_query_result.trace is not None
+    assert async_query_result.trace.attribute_dict["plan_cache_hit"] == "true"
+    assert len(async_query_result.trace.find_spans("execute_sql")) == 1
+    assert len(trace_span_exporter.spans) == 2
+
+
+def test_parameterized_sql(it_helpers: IntegrationTestHelpers) -> None:
+    """Check that the SQL template for a query is reused for different time constraints and gives the same results."""
+    mf_engine = it_helpers.mf_engine
+    parameterized_sql_queries = []
+    for time_constraint_start, time_constraint_end in (
+        (as_datetime("2019-12-01"), as_datetime("2020-01-01")),
+        (as_datetime("2020-01-01"), as_datetime("2020-01-03")),
+    ):
+        mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings", "bookings_per_booker"],
+            group_by_names=["metric_time", "listing__country_latest"],
+            time_constraint_start=time_constraint_start,
+            time_constraint_end=time_constraint_end,
+        )
+        parameterized_sql_query = mf_engine.explain_parameterized_sql(mf_request)
+        parameterized_sql_queries.append(parameterized_sql_query)
+
+        query_result = mf_engine.query(mf_request)
+        assert query_result.result_df is not None
+        assert_data_tables_equal(
+            actual=it_helpers.sql_client.query(
+                parameterized_sql_query.sql_query, sql_bind_parameters=parameterized_sql_query.bind_parameters
+            ),
+            expected=query_result.result_df,
+        )
+
+    assert parameterized_sql_queries[0].sql_query == parameterized_sql_queries[1].sql_query
+    assert parameterized_sql_queries[0].bind_parameters != parameterized_sql_queries[1].bind_parameters
+
+
+def test_parameterized_sql_for_cumulative_metric(it_helpers: IntegrationTestHelpers) -> None:
+    """Check that the regular SQL is returned when the time constraint is adjusted within the query."""
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["trailing_2_months_revenue"],
+        group_by_names=["metric_time"],
+        time_constraint_start=as_datetime("2020-01-01"),
+        time_constraint_end=as_datetime("2020-01-03"),
+    )
+    assert (
+        it_helpers.mf_engine.explain_parameterized_sql(mf_request)
+        == it_helpers.mf_engine.explain(mf_request).rendered_sql
+    )
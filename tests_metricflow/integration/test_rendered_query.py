@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 import pytest
 from _pytest.fixtures import FixtureRequest
 from dbt_semantic_interfaces.test_utils import as_datetime
@@ -10,10 +13,12 @@ from metricflow_semantics.test_helpers.time_helpers import ConfigurableTimeSourc
 
 from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
 from metricflow.protocols.sql_client import SqlClient
+from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
 from tests_metricflow.integration.conftest import IntegrationTestHelpers
 from tests_metricflow.snapshot_utils import (
     assert_sql_snapshot_equal,
 )
+from tests_metricflow.sql.compare_data_table import check_data_tables_are_equal
 
 
 @pytest.mark.sql_engine_snapshot
@@ -83,3 +88,54 @@ def test_id_enumeration(  # noqa: D103
         sql=result.rendered_sql.sql_query,
         sql_engine=sql_client.sql_engine_type,
     )
+
+
+def test_concurrent_id_enumeration(it_helpers: IntegrationTestHelpers) -> None:
+    """Check that queries planned concurrently by the same engine generate the same SQL as when planned sequentially."""
+    mf_requests: List[MetricFlowQueryRequest] = [
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings", "listings"],
+            group_by_names=["metric_time"],
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings_per_booker"],
+            group_by_names=["metric_time", "listing__country_latest"],
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["booking_value"],
+            group_by_names=["booking__is_instant"],
+            where_constraint="{{ Dimension('booking__is_instant') }}",
+        ),
+    ]
+    mf_engine = it_helpers.mf_engine
+    expected_sql = [mf_engine.explain(mf_request).rendered_sql.sql_query for mf_request in mf_requests]
+
+    iteration_count = 8
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(mf_engine.explain, mf_requests[i % len(mf_requests)])
+            for i in range(iteration_count * len(mf_requests))
+        ]
+        for i, future in enumerate(futures):
+            assert future.result().rendered_sql.sql_query == expected_sql[i % len(mf_requests)]
+
+
+def test_common_table_expressions(it_helpers: IntegrationTestHelpers) -> None:
+    """Check that a query with a repeated sub-query renders it in a WITH clause, and returns the same result."""
+
+    def _create_request(sql_optimization_level: SqlQueryOptimizationLevel) -> MetricFlowQueryRequest:
+        return MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings_month_start_compared_to_1_month_prior"],
+            group_by_names=["metric_time"],
+            sql_optimization_level=sql_optimization_level,
+        )
+
+    sql = it_helpers.mf_engine.explain(_create_request(SqlQueryOptimizationLevel.O5)).rendered_sql.sql_query
+    assert sql.startswith("WITH cte_0 AS (")
+    # The CTE for reading `bookings_source` is referenced by both input metrics.
+    assert sql.count("cte_0") == 3
+
+    expected_result = it_helpers.mf_engine.query(_create_request(SqlQueryOptimizationLevel.O4))
+    actual_result = it_helpers.mf_engine.query(_create_request(SqlQueryOptimizationLevel.O5))
+    assert expected_result.result_df is not None and actual_result.result_df is not None
+    check_data_tables_are_equal(expected_table=expected_result.result_df, actual_table=actual_result.result_df)
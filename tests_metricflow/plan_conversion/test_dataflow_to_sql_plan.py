@@ -402,6 +402,49 @@ def test_multi_join_node(
     )
 
 
+def test_shared_node_converted_once(
+    dataflow_to_sql_converter: DataflowToSqlQueryPlanConverter,
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
+    sql_client: SqlClient,
+) -> None:
+    """Tests that a node used by multiple consumers in the dataflow plan is only converted once."""
+    entity_spec = LinklessEntitySpec.from_element_name(element_name="listing")
+    read_node_mapping = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].read_node_mapping
+    filtered_measure_node = FilterElementsNode.create(
+        parent_node=read_node_mapping["bookings_source"],
+        include_specs=InstanceSpecSet(
+            measure_specs=(MeasureSpec(element_name="bookings"),), entity_specs=(entity_spec,)
+        ),
+    )
+    filtered_dimension_node = FilterElementsNode.create(
+        parent_node=read_node_mapping["listings_latest"],
+        include_specs=InstanceSpecSet(
+            entity_specs=(entity_spec,),
+            dimension_specs=(DimensionSpec(element_name="country_latest", entity_links=()),),
+        ),
+    )
+    join_description = JoinDescription(
+        join_node=filtered_dimension_node,
+        join_on_entity=entity_spec,
+        join_on_partition_dimensions=(),
+        join_on_partition_time_dimensions=(),
+        join_type=SqlJoinType.LEFT_OUTER,
+    )
+    join_node = JoinOnEntitiesNode.create(
+        left_node=filtered_measure_node, join_targets=[join_description, join_description]
+    )
+
+    sql_plan = dataflow_to_sql_converter.convert_to_sql_query_plan(
+        sql_engine_type=sql_client.sql_engine_type,
+        dataflow_plan_node=join_node,
+        optimization_level=SqlQueryOptimizationLevel.O0,
+    ).sql_plan
+    select_node = sql_plan.render_node.as_select_node
+    assert select_node is not None
+    assert len(select_node.join_descs) == 2
+    assert select_node.join_descs[0].right_source is select_node.join_descs[1].right_source
+
+
 @pytest.mark.sql_engine_snapshot
 def test_compute_metrics_node(
     request: FixtureRequest,
@@ -0,0 +1,17 @@
+WITH cte_0 AS (
+  -- source
+  SELECT
+    source_table_0.col0
+    , source_table_0.join_col
+  FROM demo.source_table source_table_0
+)
+
+-- self_join
+SELECT
+  a.col0 AS a_col0
+  , b.col0 AS b_col0
+FROM cte_0 a
+INNER JOIN
+  cte_0 b
+ON
+  a.join_col = b.join_col
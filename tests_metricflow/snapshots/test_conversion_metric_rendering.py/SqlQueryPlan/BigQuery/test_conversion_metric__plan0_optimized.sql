@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_20.metric_time__day, subq_30.metric_time__day) AS metric_time__day
-    , MAX(subq_20.visits) AS visits
-    , MAX(subq_30.buys) AS buys
+    COALESCE(subq_19.metric_time__day, subq_29.metric_time__day) AS metric_time__day
+    , MAX(subq_19.visits) AS visits
+    , MAX(subq_29.buys) AS buys
   FROM (
     -- Constrain Output with WHERE
     -- Aggregate Measures
@@ -22,11 +22,11 @@ FROM (
         DATETIME_TRUNC(ds, day) AS metric_time__day
         , 1 AS visits
       FROM ***************************.fct_visits visits_source_src_28000
-    ) subq_18
+    ) subq_17
     WHERE metric_time__day = '2020-01-01'
     GROUP BY
       metric_time__day
-  ) subq_20
+  ) subq_19
   FULL OUTER JOIN (
     -- Find conversions for user within the range of INF
     -- Pass Only Elements: ['buys', 'metric_time__day']
@@ -37,40 +37,40 @@ FROM (
     FROM (
       -- Dedupe the fanout with mf_internal_uuid in the conversion data set
       SELECT DISTINCT
-        FIRST_VALUE(subq_23.visits) OVER (
+        FIRST_VALUE(subq_22.visits) OVER (
           PARTITION BY
-            subq_26.user
-            , subq_26.ds__day
-            , subq_26.mf_internal_uuid
-          ORDER BY subq_23.ds__day DESC
+            subq_25.user
+            , subq_25.ds__day
+            , subq_25.mf_internal_uuid
+          ORDER BY subq_22.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS visits
-        , FIRST_VALUE(subq_23.ds__day) OVER (
+        , FIRST_VALUE(subq_22.ds__day) OVER (
           PARTITION BY
-            subq_26.user
-            , subq_26.ds__day
-            , subq_26.mf_internal_uuid
-          ORDER BY subq_23.ds__day DESC
+            subq_25.user
+            , subq_25.ds__day
+            , subq_25.mf_internal_uuid
+          ORDER BY subq_22.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS ds__day
-        , FIRST_VALUE(subq_23.metric_time__day) OVER (
+        , FIRST_VALUE(subq_22.metric_time__day) OVER (
           PARTITION BY
-            subq_26.user
-            , subq_26.ds__day
-            , subq_26.mf_internal_uuid
-          ORDER BY subq_23.ds__day DESC
+            subq_25.user
+            , subq_25.ds__day
+            , subq_25.mf_internal_uuid
+          ORDER BY subq_22.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS metric_time__day
-        , FIRST_VALUE(subq_23.user) OVER (
+        , FIRST_VALUE(subq_22.user) OVER (
           PARTITION BY
-            subq_26.user
-            , subq_26.ds__day
-            , subq_26.mf_internal_uuid
-          ORDER BY subq_23.ds__day DESC
+            subq_25.user
+            , subq_25.ds__day
+            , subq_25.mf_internal_uuid
+          ORDER BY subq_22.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS user
-        , subq_26.mf_internal_uuid AS mf_internal_uuid
-        , subq_26.buys AS buys
+        , subq_25.mf_internal_uuid AS mf_internal_uuid
+        , subq_25.buys AS buys
       FROM (
         -- Read Elements From Semantic Model 'visits_source'
         -- Metric Time Dimension 'ds'
@@ -81,7 +81,7 @@ FROM (
           , user_id AS user
           , 1 AS visits
         FROM ***************************.fct_visits visits_source_src_28000
-      ) subq_23
+      ) subq_22
       INNER JOIN (
         -- Read Elements From Semantic Model 'buys_source'
         -- Metric Time Dimension 'ds'
@@ -92,19 +92,19 @@ FROM (
           , 1 AS buys
           , GENERATE_UUID() AS mf_internal_uuid
         FROM ***************************.fct_buys buys_source_src_28000
-      ) subq_26
+      ) subq_25
       ON
         (
-          subq_23.user = subq_26.user
+          subq_22.user = subq_25.user
         ) AND (
-          (subq_23.ds__day <= subq_26.ds__day)
+          (subq_22.ds__day <= subq_25.ds__day)
         )
-    ) subq_27
+    ) subq_26
     GROUP BY
       metric_time__day
-  ) subq_30
+  ) subq_29
   ON
-    subq_20.metric_time__day = subq_30.metric_time__day
+    subq_19.metric_time__day = subq_29.metric_time__day
   GROUP BY
     metric_time__day
-) subq_31
+) subq_30
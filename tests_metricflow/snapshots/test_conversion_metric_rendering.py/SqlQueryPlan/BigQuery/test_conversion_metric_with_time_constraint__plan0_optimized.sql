@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_23.visit__referrer_id, subq_34.visit__referrer_id) AS visit__referrer_id
-    , MAX(subq_23.visits) AS visits
-    , MAX(subq_34.buys) AS buys
+    COALESCE(subq_22.visit__referrer_id, subq_33.visit__referrer_id) AS visit__referrer_id
+    , MAX(subq_22.visits) AS visits
+    , MAX(subq_33.buys) AS buys
   FROM (
     -- Constrain Output with WHERE
     -- Constrain Time Range to [2020-01-01T00:00:00, 2020-01-02T00:00:00]
@@ -24,7 +24,7 @@ FROM (
         , referrer_id AS visit__referrer_id
         , 1 AS visits
       FROM ***************************.fct_visits visits_source_src_28000
-    ) subq_19
+    ) subq_18
     WHERE (
       metric_time__day BETWEEN '2020-01-01' AND '2020-01-02'
     ) AND (
@@ -32,7 +32,7 @@ FROM (
     )
     GROUP BY
       visit__referrer_id
-  ) subq_23
+  ) subq_22
   FULL OUTER JOIN (
     -- Find conversions for user within the range of INF
     -- Pass Only Elements: ['buys', 'visit__referrer_id']
@@ -43,40 +43,40 @@ FROM (
     FROM (
       -- Dedupe the fanout with mf_internal_uuid in the conversion data set
       SELECT DISTINCT
-        FIRST_VALUE(subq_27.visits) OVER (
+        FIRST_VALUE(subq_26.visits) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS visits
-        , FIRST_VALUE(subq_27.visit__referrer_id) OVER (
+        , FIRST_VALUE(subq_26.visit__referrer_id) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS visit__referrer_id
-        , FIRST_VALUE(subq_27.ds__day) OVER (
+        , FIRST_VALUE(subq_26.ds__day) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS ds__day
-        , FIRST_VALUE(subq_27.user) OVER (
+        , FIRST_VALUE(subq_26.user) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS user
-        , subq_30.mf_internal_uuid AS mf_internal_uuid
-        , subq_30.buys AS buys
+        , subq_29.mf_internal_uuid AS mf_internal_uuid
+        , subq_29.buys AS buys
       FROM (
         -- Read Elements From Semantic Model 'visits_source'
         -- Metric Time Dimension 'ds'
@@ -89,7 +89,7 @@ FROM (
           , 1 AS visits
         FROM ***************************.fct_visits visits_source_src_28000
         WHERE DATETIME_TRUNC(ds, day) BETWEEN '2020-01-01' AND '2020-01-02'
-      ) subq_27
+      ) subq_26
       INNER JOIN (
         -- Read Elements From Semantic Model 'buys_source'
         -- Metric Time Dimension 'ds'
@@ -100,19 +100,19 @@ FROM (
           , 1 AS buys
           , GENERATE_UUID() AS mf_internal_uuid
         FROM ***************************.fct_buys buys_source_src_28000
-      ) subq_30
+      ) subq_29
       ON
         (
-          subq_27.user = subq_30.user
+          subq_26.user = subq_29.user
         ) AND (
-          (subq_27.ds__day <= subq_30.ds__day)
+          (subq_26.ds__day <= subq_29.ds__day)
         )
-    ) subq_31
+    ) subq_30
     GROUP BY
       visit__referrer_id
-  ) subq_34
+  ) subq_33
   ON
-    subq_23.visit__referrer_id = subq_34.visit__referrer_id
+    subq_22.visit__referrer_id = subq_33.visit__referrer_id
   GROUP BY
     visit__referrer_id
-) subq_35
+) subq_34
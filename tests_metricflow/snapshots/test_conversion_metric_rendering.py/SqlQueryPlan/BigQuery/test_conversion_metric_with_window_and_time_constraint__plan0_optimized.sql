@@ -6,10 +6,10 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_23.metric_time__day, subq_34.metric_time__day) AS metric_time__day
-    , COALESCE(subq_23.visit__referrer_id, subq_34.visit__referrer_id) AS visit__referrer_id
-    , MAX(subq_23.visits) AS visits
-    , MAX(subq_34.buys) AS buys
+    COALESCE(subq_22.metric_time__day, subq_33.metric_time__day) AS metric_time__day
+    , COALESCE(subq_22.visit__referrer_id, subq_33.visit__referrer_id) AS visit__referrer_id
+    , MAX(subq_22.visits) AS visits
+    , MAX(subq_33.buys) AS buys
   FROM (
     -- Constrain Output with WHERE
     -- Constrain Time Range to [2020-01-01T00:00:00, 2020-01-02T00:00:00]
@@ -27,7 +27,7 @@ FROM (
         , referrer_id AS visit__referrer_id
         , 1 AS visits
       FROM ***************************.fct_visits visits_source_src_28000
-    ) subq_19
+    ) subq_18
     WHERE (
       metric_time__day BETWEEN '2020-01-01' AND '2020-01-02'
     ) AND (
@@ -36,7 +36,7 @@ FROM (
     GROUP BY
       metric_time__day
       , visit__referrer_id
-  ) subq_23
+  ) subq_22
   FULL OUTER JOIN (
     -- Find conversions for user within the range of 7 day
     -- Pass Only Elements: ['buys', 'visit__referrer_id', 'metric_time__day']
@@ -48,48 +48,48 @@ FROM (
     FROM (
       -- Dedupe the fanout with mf_internal_uuid in the conversion data set
       SELECT DISTINCT
-        FIRST_VALUE(subq_27.visits) OVER (
+        FIRST_VALUE(subq_26.visits) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS visits
-        , FIRST_VALUE(subq_27.visit__referrer_id) OVER (
+        , FIRST_VALUE(subq_26.visit__referrer_id) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS visit__referrer_id
-        , FIRST_VALUE(subq_27.ds__day) OVER (
+        , FIRST_VALUE(subq_26.ds__day) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS ds__day
-        , FIRST_VALUE(subq_27.metric_time__day) OVER (
+        , FIRST_VALUE(subq_26.metric_time__day) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS metric_time__day
-        , FIRST_VALUE(subq_27.user) OVER (
+        , FIRST_VALUE(subq_26.user) OVER (
           PARTITION BY
-            subq_30.user
-            , subq_30.ds__day
-            , subq_30.mf_internal_uuid
-          ORDER BY subq_27.ds__day DESC
+            subq_29.user
+            , subq_29.ds__day
+            , subq_29.mf_internal_uuid
+          ORDER BY subq_26.ds__day DESC
           ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
         ) AS user
-        , subq_30.mf_internal_uuid AS mf_internal_uuid
-        , subq_30.buys AS buys
+        , subq_29.mf_internal_uuid AS mf_internal_uuid
+        , subq_29.buys AS buys
       FROM (
         -- Read Elements From Semantic Model 'visits_source'
         -- Metric Time Dimension 'ds'
@@ -103,7 +103,7 @@ FROM (
           , 1 AS visits
         FROM ***************************.fct_visits visits_source_src_28000
         WHERE DATETIME_TRUNC(ds, day) BETWEEN '2020-01-01' AND '2020-01-02'
-      ) subq_27
+      ) subq_26
       INNER JOIN (
         -- Read Elements From Semantic Model 'buys_source'
         -- Metric Time Dimension 'ds'
@@ -114,29 +114,29 @@ FROM (
           , 1 AS buys
           , GENERATE_UUID() AS mf_internal_uuid
         FROM ***************************.fct_buys buys_source_src_28000
-      ) subq_30
+      ) subq_29
       ON
         (
-          subq_27.user = subq_30.user
+          subq_26.user = subq_29.user
         ) AND (
           (
-            subq_27.ds__day <= subq_30.ds__day
+            subq_26.ds__day <= subq_29.ds__day
           ) AND (
-            subq_27.ds__day > DATE_SUB(CAST(subq_30.ds__day AS DATETIME), INTERVAL 7 day)
+            subq_26.ds__day > DATE_SUB(CAST(subq_29.ds__day AS DATETIME), INTERVAL 7 day)
           )
         )
-    ) subq_31
+    ) subq_30
     GROUP BY
       metric_time__day
       , visit__referrer_id
-  ) subq_34
+  ) subq_33
   ON
     (
-      subq_23.visit__referrer_id = subq_34.visit__referrer_id
+      subq_22.visit__referrer_id = subq_33.visit__referrer_id
     ) AND (
-      subq_23.metric_time__day = subq_34.metric_time__day
+      subq_22.metric_time__day = subq_33.metric_time__day
     )
   GROUP BY
     metric_time__day
     , visit__referrer_id
-) subq_35
+) subq_34
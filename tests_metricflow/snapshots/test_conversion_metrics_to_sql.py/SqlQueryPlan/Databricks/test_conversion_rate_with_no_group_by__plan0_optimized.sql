@@ -1,7 +1,7 @@
 -- Combine Aggregated Outputs
 -- Compute Metrics via Expressions
 SELECT
-  CAST(MAX(subq_28.buys) AS DOUBLE) / CAST(NULLIF(MAX(subq_18.visits), 0) AS DOUBLE) AS visit_buy_conversion_rate_7days
+  CAST(MAX(subq_26.buys) AS DOUBLE) / CAST(NULLIF(MAX(subq_17.visits), 0) AS DOUBLE) AS visit_buy_conversion_rate_7days
 FROM (
   -- Read Elements From Semantic Model 'visits_source'
   -- Metric Time Dimension 'ds'
@@ -10,7 +10,7 @@ FROM (
   SELECT
     SUM(1) AS visits
   FROM ***************************.fct_visits visits_source_src_28000
-) subq_18
+) subq_17
 CROSS JOIN (
   -- Find conversions for user within the range of 7 day
   -- Pass Only Elements: ['buys',]
@@ -20,32 +20,32 @@ CROSS JOIN (
   FROM (
     -- Dedupe the fanout with mf_internal_uuid in the conversion data set
     SELECT DISTINCT
-      FIRST_VALUE(subq_21.visits) OVER (
+      FIRST_VALUE(subq_19.visits) OVER (
         PARTITION BY
-          subq_24.user
-          , subq_24.ds__day
-          , subq_24.mf_internal_uuid
-        ORDER BY subq_21.ds__day DESC
+          subq_22.user
+          , subq_22.ds__day
+          , subq_22.mf_internal_uuid
+        ORDER BY subq_19.ds__day DESC
         ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
       ) AS visits
-      , FIRST_VALUE(subq_21.ds__day) OVER (
+      , FIRST_VALUE(subq_19.ds__day) OVER (
         PARTITION BY
-          subq_24.user
-          , subq_24.ds__day
-          , subq_24.mf_internal_uuid
-        ORDER BY subq_21.ds__day DESC
+          subq_22.user
+          , subq_22.ds__day
+          , subq_22.mf_internal_uuid
+        ORDER BY subq_19.ds__day DESC
         ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
       ) AS ds__day
-      , FIRST_VALUE(subq_21.user) OVER (
+      , FIRST_VALUE(subq_19.user) OVER (
         PARTITION BY
-          subq_24.user
-          , subq_24.ds__day
-          , subq_24.mf_internal_uuid
-        ORDER BY subq_21.ds__day DESC
+          subq_22.user
+          , subq_22.ds__day
+          , subq_22.mf_internal_uuid
+        ORDER BY subq_19.ds__day DESC
         ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
       ) AS user
-      , subq_24.mf_internal_uuid AS mf_internal_uuid
-      , subq_24.buys AS buys
+      , subq_22.mf_internal_uuid AS mf_internal_uuid
+      , subq_22.buys AS buys
     FROM (
       -- Read Elements From Semantic Model 'visits_source'
       -- Metric Time Dimension 'ds'
@@ -55,7 +55,7 @@ CROSS JOIN (
         , user_id AS user
         , 1 AS visits
       FROM ***************************.fct_visits visits_source_src_28000
-    ) subq_21
+    ) subq_19
     INNER JOIN (
       -- Read Elements From Semantic Model 'buys_source'
       -- Metric Time Dimension 'ds'
@@ -66,16 +66,16 @@ CROSS JOIN (
         , 1 AS buys
         , UUID() AS mf_internal_uuid
       FROM ***************************.fct_buys buys_source_src_28000
-    ) subq_24
+    ) subq_22
     ON
       (
-        subq_21.user = subq_24.user
+        subq_19.user = subq_22.user
       ) AND (
         (
-          subq_21.ds__day <= subq_24.ds__day
+          subq_19.ds__day <= subq_22.ds__day
         ) AND (
-          subq_21.ds__day > DATEADD(day, -7, subq_24.ds__day)
+          subq_19.ds__day > DATEADD(day, -7, subq_22.ds__day)
         )
       )
-  ) subq_25
-) subq_28
+  ) subq_23
+) subq_26
@@ -5,15 +5,15 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_27.metric_time__day, subq_40.metric_time__day) AS metric_time__day
-    , COALESCE(MAX(subq_27.visits), 0) AS visits
-    , COALESCE(MAX(subq_40.buys), 0) AS buys
+    COALESCE(subq_26.metric_time__day, subq_38.metric_time__day) AS metric_time__day
+    , COALESCE(MAX(subq_26.visits), 0) AS visits
+    , COALESCE(MAX(subq_38.buys), 0) AS buys
   FROM (
     -- Join to Time Spine Dataset
     SELECT
-      subq_26.ds AS metric_time__day
-      , subq_24.visits AS visits
-    FROM ***************************.mf_time_spine subq_26
+      subq_25.ds AS metric_time__day
+      , subq_23.visits AS visits
+    FROM ***************************.mf_time_spine subq_25
     LEFT OUTER JOIN (
       -- Aggregate Measures
       SELECT
@@ -27,19 +27,19 @@ FROM (
           DATE_TRUNC('day', ds) AS metric_time__day
           , 1 AS visits
         FROM ***************************.fct_visits visits_source_src_28000
-      ) subq_23
+      ) subq_22
       GROUP BY
         metric_time__day
-    ) subq_24
+    ) subq_23
     ON
-      subq_26.ds = subq_24.metric_time__day
-  ) subq_27
+      subq_25.ds = subq_23.metric_time__day
+  ) subq_26
   FULL OUTER JOIN (
     -- Join to Time Spine Dataset
     SELECT
-      subq_39.ds AS metric_time__day
-      , subq_37.buys AS buys
-    FROM ***************************.mf_time_spine subq_39
+      subq_37.ds AS metric_time__day
+      , subq_35.buys AS buys
+    FROM ***************************.mf_time_spine subq_37
     LEFT OUTER JOIN (
       -- Find conversions for user within the range of 7 day
       -- Pass Only Elements: ['buys', 'metric_time__day']
@@ -50,40 +50,40 @@ FROM (
       FROM (
         -- Dedupe the fanout with mf_internal_uuid in the conversion data set
         SELECT DISTINCT
-          FIRST_VALUE(subq_30.visits) OVER (
+          FIRST_VALUE(subq_28.visits) OVER (
             PARTITION BY
-              subq_33.user
-              , subq_33.ds__day
-              , subq_33.mf_internal_uuid
-            ORDER BY subq_30.ds__day DESC
+              subq_31.user
+              , subq_31.ds__day
+              , subq_31.mf_internal_uuid
+            ORDER BY subq_28.ds__day DESC
             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
           ) AS visits
-          , FIRST_VALUE(subq_30.ds__day) OVER (
+          , FIRST_VALUE(subq_28.ds__day) OVER (
             PARTITION BY
-              subq_33.user
-              , subq_33.ds__day
-              , subq_33.mf_internal_uuid
-            ORDER BY subq_30.ds__day DESC
+              subq_31.user
+              , subq_31.ds__day
+              , subq_31.mf_internal_uuid
+            ORDER BY subq_28.ds__day DESC
             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
           ) AS ds__day
-          , FIRST_VALUE(subq_30.metric_time__day) OVER (
+          , FIRST_VALUE(subq_28.metric_time__day) OVER (
             PARTITION BY
-              subq_33.user
-              , subq_33.ds__day
-              , subq_33.mf_internal_uuid
-            ORDER BY subq_30.ds__day DESC
+              subq_31.user
+              , subq_31.ds__day
+              , subq_31.mf_internal_uuid
+            ORDER BY subq_28.ds__day DESC
             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
           ) AS metric_time__day
-          , FIRST_VALUE(subq_30.user) OVER (
+          , FIRST_VALUE(subq_28.user) OVER (
             PARTITION BY
-              subq_33.user
-              , subq_33.ds__day
-              , subq_33.mf_internal_uuid
-            ORDER BY subq_30.ds__day DESC
+              subq_31.user
+              , subq_31.ds__day
+              , subq_31.mf_internal_uuid
+            ORDER BY subq_28.ds__day DESC
             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
           ) AS user
-          , subq_33.mf_internal_uuid AS mf_internal_uuid
-          , subq_33.buys AS buys
+          , subq_31.mf_internal_uuid AS mf_internal_uuid
+          , subq_31.buys AS buys
         FROM (
           -- Read Elements From Semantic Model 'visits_source'
           -- Metric Time Dimension 'ds'
@@ -94,7 +94,7 @@ FROM (
             , user_id AS user
             , 1 AS visits
           FROM ***************************.fct_visits visits_source_src_28000
-        ) subq_30
+        ) subq_28
         INNER JOIN (
           -- Read Elements From Semantic Model 'buys_source'
           -- Metric Time Dimension 'ds'
@@ -105,26 +105,26 @@ FROM (
             , 1 AS buys
             , GEN_RANDOM_UUID() AS mf_internal_uuid
           FROM ***************************.fct_buys buys_source_src_28000
-        ) subq_33
+        ) subq_31
         ON
           (
-            subq_30.user = subq_33.user
+            subq_28.user = subq_31.user
           ) AND (
             (
-              subq_30.ds__day <= subq_33.ds__day
+              subq_28.ds__day <= subq_31.ds__day
             ) AND (
-              subq_30.ds__day > subq_33.ds__day - MAKE_INTERVAL(days => 7)
+              subq_28.ds__day > subq_31.ds__day - MAKE_INTERVAL(days => 7)
             )
           )
-      ) subq_34
+      ) subq_32
       GROUP BY
         metric_time__day
-    ) subq_37
+    ) subq_35
     ON
-      subq_39.ds = subq_37.metric_time__day
-  ) subq_40
+      subq_37.ds = subq_35.metric_time__day
+  ) subq_38
   ON
-    subq_27.metric_time__day = subq_40.metric_time__day
+    subq_26.metric_time__day = subq_38.metric_time__day
   GROUP BY
-    COALESCE(subq_27.metric_time__day, subq_40.metric_time__day)
-) subq_41
+    COALESCE(subq_26.metric_time__day, subq_38.metric_time__day)
+) subq_39
@@ -1,15 +1,15 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_20.ds__day
-  , subq_20.listing__country_latest
-  , CAST(subq_20.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_20.views, 0) AS DOUBLE PRECISION) AS bookings_per_view
+  subq_19.ds__day
+  , subq_19.listing__country_latest
+  , CAST(subq_19.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_19.views, 0) AS DOUBLE PRECISION) AS bookings_per_view
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_9.ds__day, subq_19.ds__day) AS ds__day
-    , COALESCE(subq_9.listing__country_latest, subq_19.listing__country_latest) AS listing__country_latest
+    COALESCE(subq_9.ds__day, subq_18.ds__day) AS ds__day
+    , COALESCE(subq_9.listing__country_latest, subq_18.listing__country_latest) AS listing__country_latest
     , MAX(subq_9.bookings) AS bookings
-    , MAX(subq_19.views) AS views
+    , MAX(subq_18.views) AS views
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -387,27 +387,27 @@ FROM (
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_18.ds__day
-      , subq_18.listing__country_latest
-      , subq_18.views
+      subq_17.ds__day
+      , subq_17.listing__country_latest
+      , subq_17.views
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_17.ds__day
-        , subq_17.listing__country_latest
-        , SUM(subq_17.views) AS views
+        subq_16.ds__day
+        , subq_16.listing__country_latest
+        , SUM(subq_16.views) AS views
       FROM (
         -- Pass Only Elements: ['views', 'listing__country_latest', 'ds__day']
         SELECT
-          subq_16.ds__day
-          , subq_16.listing__country_latest
-          , subq_16.views
+          subq_15.ds__day
+          , subq_15.listing__country_latest
+          , subq_15.views
         FROM (
           -- Join Standard Outputs
           SELECT
             subq_12.ds__day AS ds__day
             , subq_12.listing AS listing
-            , subq_15.country_latest AS listing__country_latest
+            , subq_14.country_latest AS listing__country_latest
             , subq_12.views AS views
           FROM (
             -- Pass Only Elements: ['views', 'ds__day', 'listing']
@@ -537,78 +537,78 @@ FROM (
           LEFT OUTER JOIN (
             -- Pass Only Elements: ['country_latest', 'listing']
             SELECT
-              subq_14.listing
-              , subq_14.country_latest
+              subq_13.listing
+              , subq_13.country_latest
             FROM (
               -- Metric Time Dimension 'ds'
               SELECT
-                subq_13.ds__day
-                , subq_13.ds__week
-                , subq_13.ds__month
-                , subq_13.ds__quarter
-                , subq_13.ds__year
-                , subq_13.ds__extract_year
-                , subq_13.ds__extract_quarter
-                , subq_13.ds__extract_month
-                , subq_13.ds__extract_day
-                , subq_13.ds__extract_dow
-                , subq_13.ds__extract_doy
-                , subq_13.created_at__day
-                , subq_13.created_at__week
-                , subq_13.created_at__month
-                , subq_13.created_at__quarter
-                , subq_13.created_at__year
-                , subq_13.created_at__extract_year
-                , subq_13.created_at__extract_quarter
-                , subq_13.created_at__extract_month
-                , subq_13.created_at__extract_day
-                , subq_13.created_at__extract_dow
-                , subq_13.created_at__extract_doy
-                , subq_13.listing__ds__day
-                , subq_13.listing__ds__week
-                , subq_13.listing__ds__month
-                , subq_13.listing__ds__quarter
-                , subq_13.listing__ds__year
-                , subq_13.listing__ds__extract_year
-                , subq_13.listing__ds__extract_quarter
-                , subq_13.listing__ds__extract_month
-                , subq_13.listing__ds__extract_day
-                , subq_13.listing__ds__extract_dow
-                , subq_13.listing__ds__extract_doy
-                , subq_13.listing__created_at__day
-                , subq_13.listing__created_at__week
-                , subq_13.listing__created_at__month
-                , subq_13.listing__created_at__quarter
-                , subq_13.listing__created_at__year
-                , subq_13.listing__created_at__extract_year
-                , subq_13.listing__created_at__extract_quarter
-                , subq_13.listing__created_at__extract_month
-                , subq_13.listing__created_at__extract_day
-                , subq_13.listing__created_at__extract_dow
-                , subq_13.listing__created_at__extract_doy
-                , subq_13.ds__day AS metric_time__day
-                , subq_13.ds__week AS metric_time__week
-                , subq_13.ds__month AS metric_time__month
-                , subq_13.ds__quarter AS metric_time__quarter
-                , subq_13.ds__year AS metric_time__year
-                , subq_13.ds__extract_year AS metric_time__extract_year
-                , subq_13.ds__extract_quarter AS metric_time__extract_quarter
-                , subq_13.ds__extract_month AS metric_time__extract_month
-                , subq_13.ds__extract_day AS metric_time__extract_day
-                , subq_13.ds__extract_dow AS metric_time__extract_dow
-                , subq_13.ds__extract_doy AS metric_time__extract_doy
-                , subq_13.listing
-                , subq_13.user
-                , subq_13.listing__user
-                , subq_13.country_latest
-                , subq_13.is_lux_latest
-                , subq_13.capacity_latest
-                , subq_13.listing__country_latest
-                , subq_13.listing__is_lux_latest
-                , subq_13.listing__capacity_latest
-                , subq_13.listings
-                , subq_13.largest_listing
-                , subq_13.smallest_listing
+                subq_3.ds__day
+                , subq_3.ds__week
+                , subq_3.ds__month
+                , subq_3.ds__quarter
+                , subq_3.ds__year
+                , subq_3.ds__extract_year
+                , subq_3.ds__extract_quarter
+                , subq_3.ds__extract_month
+                , subq_3.ds__extract_day
+                , subq_3.ds__extract_dow
+                , subq_3.ds__extract_doy
+                , subq_3.created_at__day
+                , subq_3.created_at__week
+                , subq_3.created_at__month
+                , subq_3.created_at__quarter
+                , subq_3.created_at__year
+                , subq_3.created_at__extract_year
+                , subq_3.created_at__extract_quarter
+                , subq_3.created_at__extract_month
+                , subq_3.created_at__extract_day
+                , subq_3.created_at__extract_dow
+                , subq_3.created_at__extract_doy
+                , subq_3.listing__ds__day
+                , subq_3.listing__ds__week
+                , subq_3.listing__ds__month
+                , subq_3.listing__ds__quarter
+                , subq_3.listing__ds__year
+                , subq_3.listing__ds__extract_year
+                , subq_3.listing__ds__extract_quarter
+                , subq_3.listing__ds__extract_month
+                , subq_3.listing__ds__extract_day
+                , subq_3.listing__ds__extract_dow
+                , subq_3.listing__ds__extract_doy
+                , subq_3.listing__created_at__day
+                , subq_3.listing__created_at__week
+                , subq_3.listing__created_at__month
+                , subq_3.listing__created_at__quarter
+                , subq_3.listing__created_at__year
+                , subq_3.listing__created_at__extract_year
+                , subq_3.listing__created_at__extract_quarter
+                , subq_3.listing__created_at__extract_month
+                , subq_3.listing__created_at__extract_day
+                , subq_3.listing__created_at__extract_dow
+                , subq_3.listing__created_at__extract_doy
+                , subq_3.ds__day AS metric_time__day
+                , subq_3.ds__week AS metric_time__week
+                , subq_3.ds__month AS metric_time__month
+                , subq_3.ds__quarter AS metric_time__quarter
+                , subq_3.ds__year AS metric_time__year
+                , subq_3.ds__extract_year AS metric_time__extract_year
+                , subq_3.ds__extract_quarter AS metric_time__extract_quarter
+                , subq_3.ds__extract_month AS metric_time__extract_month
+                , subq_3.ds__extract_day AS metric_time__extract_day
+                , subq_3.ds__extract_dow AS metric_time__extract_dow
+                , subq_3.ds__extract_doy AS metric_time__extract_doy
+                , subq_3.listing
+                , subq_3.user
+                , subq_3.listing__user
+                , subq_3.country_latest
+                , subq_3.is_lux_latest
+                , subq_3.capacity_latest
+                , subq_3.listing__country_latest
+                , subq_3.listing__is_lux_latest
+                , subq_3.listing__capacity_latest
+                , subq_3.listings
+                , subq_3.largest_listing
+                , subq_3.smallest_listing
               FROM (
                 -- Read Elements From Semantic Model 'listings_latest'
                 SELECT
@@ -669,25 +669,25 @@ FROM (
                   , listings_latest_src_28000.user_id AS user
                   , listings_latest_src_28000.user_id AS listing__user
                 FROM ***************************.dim_listings_latest listings_latest_src_28000
-              ) subq_13
-            ) subq_14
-          ) subq_15
+              ) subq_3
+            ) subq_13
+          ) subq_14
           ON
-            subq_12.listing = subq_15.listing
-        ) subq_16
-      ) subq_17
+            subq_12.listing = subq_14.listing
+        ) subq_15
+      ) subq_16
       GROUP BY
-        subq_17.ds__day
-        , subq_17.listing__country_latest
-    ) subq_18
-  ) subq_19
+        subq_16.ds__day
+        , subq_16.listing__country_latest
+    ) subq_17
+  ) subq_18
   ON
     (
-      subq_9.listing__country_latest = subq_19.listing__country_latest
+      subq_9.listing__country_latest = subq_18.listing__country_latest
     ) AND (
-      subq_9.ds__day = subq_19.ds__day
+      subq_9.ds__day = subq_18.ds__day
     )
   GROUP BY
-    COALESCE(subq_9.ds__day, subq_19.ds__day)
-    , COALESCE(subq_9.listing__country_latest, subq_19.listing__country_latest)
-) subq_20
+    COALESCE(subq_9.ds__day, subq_18.ds__day)
+    , COALESCE(subq_9.listing__country_latest, subq_18.listing__country_latest)
+) subq_19
@@ -1,9 +1,9 @@
 -- Join Standard Outputs
 SELECT
-  subq_7.listing AS listing
+  subq_6.listing AS listing
+  , subq_8.country_latest AS listing__country_latest
   , subq_9.country_latest AS listing__country_latest
-  , subq_11.country_latest AS listing__country_latest
-  , subq_7.bookings AS bookings
+  , subq_6.bookings AS bookings
 FROM (
   -- Read Elements From Semantic Model 'bookings_source'
   -- Pass Only Elements: ['bookings', 'listing']
@@ -11,7 +11,7 @@ FROM (
     listing_id AS listing
     , 1 AS bookings
   FROM ***************************.fct_bookings bookings_source_src_28000
-) subq_7
+) subq_6
 LEFT OUTER JOIN (
   -- Read Elements From Semantic Model 'listings_latest'
   -- Pass Only Elements: ['country_latest', 'listing']
@@ -19,9 +19,9 @@ LEFT OUTER JOIN (
     listing_id AS listing
     , country AS country_latest
   FROM ***************************.dim_listings_latest listings_latest_src_28000
-) subq_9
+) subq_8
 ON
-  subq_7.listing = subq_9.listing
+  subq_6.listing = subq_8.listing
 LEFT OUTER JOIN (
   -- Read Elements From Semantic Model 'listings_latest'
   -- Pass Only Elements: ['country_latest', 'listing']
@@ -29,6 +29,6 @@ LEFT OUTER JOIN (
     listing_id AS listing
     , country AS country_latest
   FROM ***************************.dim_listings_latest listings_latest_src_28000
-) subq_11
+) subq_9
 ON
-  subq_7.listing = subq_11.listing
+  subq_6.listing = subq_9.listing
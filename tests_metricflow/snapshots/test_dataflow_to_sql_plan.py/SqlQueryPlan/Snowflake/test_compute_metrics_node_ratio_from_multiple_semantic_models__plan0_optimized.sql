@@ -6,19 +6,19 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_30.ds__day, subq_40.ds__day) AS ds__day
-    , COALESCE(subq_30.listing__country_latest, subq_40.listing__country_latest) AS listing__country_latest
-    , MAX(subq_30.bookings) AS bookings
-    , MAX(subq_40.views) AS views
+    COALESCE(subq_29.ds__day, subq_38.ds__day) AS ds__day
+    , COALESCE(subq_29.listing__country_latest, subq_38.listing__country_latest) AS listing__country_latest
+    , MAX(subq_29.bookings) AS bookings
+    , MAX(subq_38.views) AS views
   FROM (
     -- Join Standard Outputs
     -- Pass Only Elements: ['bookings', 'listing__country_latest', 'ds__day']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      subq_23.ds__day AS ds__day
+      subq_22.ds__day AS ds__day
       , listings_latest_src_28000.country AS listing__country_latest
-      , SUM(subq_23.bookings) AS bookings
+      , SUM(subq_22.bookings) AS bookings
     FROM (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -28,24 +28,24 @@ FROM (
         , listing_id AS listing
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_23
+    ) subq_22
     LEFT OUTER JOIN
       ***************************.dim_listings_latest listings_latest_src_28000
     ON
-      subq_23.listing = listings_latest_src_28000.listing_id
+      subq_22.listing = listings_latest_src_28000.listing_id
     GROUP BY
-      subq_23.ds__day
+      subq_22.ds__day
       , listings_latest_src_28000.country
-  ) subq_30
+  ) subq_29
   FULL OUTER JOIN (
     -- Join Standard Outputs
     -- Pass Only Elements: ['views', 'listing__country_latest', 'ds__day']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      subq_33.ds__day AS ds__day
+      subq_32.ds__day AS ds__day
       , listings_latest_src_28000.country AS listing__country_latest
-      , SUM(subq_33.views) AS views
+      , SUM(subq_32.views) AS views
     FROM (
       -- Read Elements From Semantic Model 'views_source'
       -- Metric Time Dimension 'ds'
@@ -55,22 +55,22 @@ FROM (
         , listing_id AS listing
         , 1 AS views
       FROM ***************************.fct_views views_source_src_28000
-    ) subq_33
+    ) subq_32
     LEFT OUTER JOIN
       ***************************.dim_listings_latest listings_latest_src_28000
     ON
-      subq_33.listing = listings_latest_src_28000.listing_id
+      subq_32.listing = listings_latest_src_28000.listing_id
     GROUP BY
-      subq_33.ds__day
+      subq_32.ds__day
       , listings_latest_src_28000.country
-  ) subq_40
+  ) subq_38
   ON
     (
-      subq_30.listing__country_latest = subq_40.listing__country_latest
+      subq_29.listing__country_latest = subq_38.listing__country_latest
     ) AND (
-      subq_30.ds__day = subq_40.ds__day
+      subq_29.ds__day = subq_38.ds__day
     )
   GROUP BY
-    COALESCE(subq_30.ds__day, subq_40.ds__day)
-    , COALESCE(subq_30.listing__country_latest, subq_40.listing__country_latest)
-) subq_41
+    COALESCE(subq_29.ds__day, subq_38.ds__day)
+    , COALESCE(subq_29.listing__country_latest, subq_38.listing__country_latest)
+) subq_39
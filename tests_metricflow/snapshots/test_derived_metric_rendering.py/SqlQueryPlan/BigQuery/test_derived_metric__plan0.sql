@@ -1,13 +1,13 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_10.metric_time__day
+  subq_9.metric_time__day
   , (bookings - ref_bookings) * 1.0 / bookings AS non_referred_bookings_pct
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_4.metric_time__day, subq_9.metric_time__day) AS metric_time__day
+    COALESCE(subq_4.metric_time__day, subq_8.metric_time__day) AS metric_time__day
     , MAX(subq_4.ref_bookings) AS ref_bookings
-    , MAX(subq_9.bookings) AS bookings
+    , MAX(subq_8.bookings) AS bookings
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -226,119 +226,119 @@ FROM (
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_8.metric_time__day
-      , subq_8.bookings
+      subq_7.metric_time__day
+      , subq_7.bookings
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_7.metric_time__day
-        , SUM(subq_7.bookings) AS bookings
+        subq_6.metric_time__day
+        , SUM(subq_6.bookings) AS bookings
       FROM (
         -- Pass Only Elements: ['bookings', 'metric_time__day']
         SELECT
-          subq_6.metric_time__day
-          , subq_6.bookings
+          subq_5.metric_time__day
+          , subq_5.bookings
         FROM (
           -- Metric Time Dimension 'ds'
           SELECT
-            subq_5.ds__day
-            , subq_5.ds__week
-            , subq_5.ds__month
-            , subq_5.ds__quarter
-            , subq_5.ds__year
-            , subq_5.ds__extract_year
-            , subq_5.ds__extract_quarter
-            , subq_5.ds__extract_month
-            , subq_5.ds__extract_day
-            , subq_5.ds__extract_dow
-            , subq_5.ds__extract_doy
-            , subq_5.ds_partitioned__day
-            , subq_5.ds_partitioned__week
-            , subq_5.ds_partitioned__month
-            , subq_5.ds_partitioned__quarter
-            , subq_5.ds_partitioned__year
-            , subq_5.ds_partitioned__extract_year
-            , subq_5.ds_partitioned__extract_quarter
-            , subq_5.ds_partitioned__extract_month
-            , subq_5.ds_partitioned__extract_day
-            , subq_5.ds_partitioned__extract_dow
-            , subq_5.ds_partitioned__extract_doy
-            , subq_5.paid_at__day
-            , subq_5.paid_at__week
-            , subq_5.paid_at__month
-            , subq_5.paid_at__quarter
-            , subq_5.paid_at__year
-            , subq_5.paid_at__extract_year
-            , subq_5.paid_at__extract_quarter
-            , subq_5.paid_at__extract_month
-            , subq_5.paid_at__extract_day
-            , subq_5.paid_at__extract_dow
-            , subq_5.paid_at__extract_doy
-            , subq_5.booking__ds__day
-            , subq_5.booking__ds__week
-            , subq_5.booking__ds__month
-            , subq_5.booking__ds__quarter
-            , subq_5.booking__ds__year
-            , subq_5.booking__ds__extract_year
-            , subq_5.booking__ds__extract_quarter
-            , subq_5.booking__ds__extract_month
-            , subq_5.booking__ds__extract_day
-            , subq_5.booking__ds__extract_dow
-            , subq_5.booking__ds__extract_doy
-            , subq_5.booking__ds_partitioned__day
-            , subq_5.booking__ds_partitioned__week
-            , subq_5.booking__ds_partitioned__month
-            , subq_5.booking__ds_partitioned__quarter
-            , subq_5.booking__ds_partitioned__year
-            , subq_5.booking__ds_partitioned__extract_year
-            , subq_5.booking__ds_partitioned__extract_quarter
-            , subq_5.booking__ds_partitioned__extract_month
-            , subq_5.booking__ds_partitioned__extract_day
-            , subq_5.booking__ds_partitioned__extract_dow
-            , subq_5.booking__ds_partitioned__extract_doy
-            , subq_5.booking__paid_at__day
-            , subq_5.booking__paid_at__week
-            , subq_5.booking__paid_at__month
-            , subq_5.booking__paid_at__quarter
-            , subq_5.booking__paid_at__year
-            , subq_5.booking__paid_at__extract_year
-            , subq_5.booking__paid_at__extract_quarter
-            , subq_5.booking__paid_at__extract_month
-            , subq_5.booking__paid_at__extract_day
-            , subq_5.booking__paid_at__extract_dow
-            , subq_5.booking__paid_at__extract_doy
-            , subq_5.ds__day AS metric_time__day
-            , subq_5.ds__week AS metric_time__week
-            , subq_5.ds__month AS metric_time__month
-            , subq_5.ds__quarter AS metric_time__quarter
-            , subq_5.ds__year AS metric_time__year
-            , subq_5.ds__extract_year AS metric_time__extract_year
-            , subq_5.ds__extract_quarter AS metric_time__extract_quarter
-            , subq_5.ds__extract_month AS metric_time__extract_month
-            , subq_5.ds__extract_day AS metric_time__extract_day
-            , subq_5.ds__extract_dow AS metric_time__extract_dow
-            , subq_5.ds__extract_doy AS metric_time__extract_doy
-            , subq_5.listing
-            , subq_5.guest
-            , subq_5.host
-            , subq_5.booking__listing
-            , subq_5.booking__guest
-            , subq_5.booking__host
-            , subq_5.is_instant
-            , subq_5.booking__is_instant
-            , subq_5.bookings
-            , subq_5.instant_bookings
-            , subq_5.booking_value
-            , subq_5.max_booking_value
-            , subq_5.min_booking_value
-            , subq_5.bookers
-            , subq_5.average_booking_value
-            , subq_5.referred_bookings
-            , subq_5.median_booking_value
-            , subq_5.booking_value_p99
-            , subq_5.discrete_booking_value_p99
-            , subq_5.approximate_continuous_booking_value_p99
-            , subq_5.approximate_discrete_booking_value_p99
+            subq_0.ds__day
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.ds__extract_day
+            , subq_0.ds__extract_dow
+            , subq_0.ds__extract_doy
+            , subq_0.ds_partitioned__day
+            , subq_0.ds_partitioned__week
+            , subq_0.ds_partitioned__month
+            , subq_0.ds_partitioned__quarter
+            , subq_0.ds_partitioned__year
+            , subq_0.ds_partitioned__extract_year
+            , subq_0.ds_partitioned__extract_quarter
+            , subq_0.ds_partitioned__extract_month
+            , subq_0.ds_partitioned__extract_day
+            , subq_0.ds_partitioned__extract_dow
+            , subq_0.ds_partitioned__extract_doy
+            , subq_0.paid_at__day
+            , subq_0.paid_at__week
+            , subq_0.paid_at__month
+            , subq_0.paid_at__quarter
+            , subq_0.paid_at__year
+            , subq_0.paid_at__extract_year
+            , subq_0.paid_at__extract_quarter
+            , subq_0.paid_at__extract_month
+            , subq_0.paid_at__extract_day
+            , subq_0.paid_at__extract_dow
+            , subq_0.paid_at__extract_doy
+            , subq_0.booking__ds__day
+            , subq_0.booking__ds__week
+            , subq_0.booking__ds__month
+            , subq_0.booking__ds__quarter
+            , subq_0.booking__ds__year
+            , subq_0.booking__ds__extract_year
+            , subq_0.booking__ds__extract_quarter
+            , subq_0.booking__ds__extract_month
+            , subq_0.booking__ds__extract_day
+            , subq_0.booking__ds__extract_dow
+            , subq_0.booking__ds__extract_doy
+            , subq_0.booking__ds_partitioned__day
+            , subq_0.booking__ds_partitioned__week
+            , subq_0.booking__ds_partitioned__month
+            , subq_0.booking__ds_partitioned__quarter
+            , subq_0.booking__ds_partitioned__year
+            , subq_0.booking__ds_partitioned__extract_year
+            , subq_0.booking__ds_partitioned__extract_quarter
+            , subq_0.booking__ds_partitioned__extract_month
+            , subq_0.booking__ds_partitioned__extract_day
+            , subq_0.booking__ds_partitioned__extract_dow
+            , subq_0.booking__ds_partitioned__extract_doy
+            , subq_0.booking__paid_at__day
+            , subq_0.booking__paid_at__week
+            , subq_0.booking__paid_at__month
+            , subq_0.booking__paid_at__quarter
+            , subq_0.booking__paid_at__year
+            , subq_0.booking__paid_at__extract_year
+            , subq_0.booking__paid_at__extract_quarter
+            , subq_0.booking__paid_at__extract_month
+            , subq_0.booking__paid_at__extract_day
+            , subq_0.booking__paid_at__extract_dow
+            , subq_0.booking__paid_at__extract_doy
+            , subq_0.ds__day AS metric_time__day
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.ds__extract_day AS metric_time__extract_day
+            , subq_0.ds__extract_dow AS metric_time__extract_dow
+            , subq_0.ds__extract_doy AS metric_time__extract_doy
+            , subq_0.listing
+            , subq_0.guest
+            , subq_0.host
+            , subq_0.booking__listing
+            , subq_0.booking__guest
+            , subq_0.booking__host
+            , subq_0.is_instant
+            , subq_0.booking__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+            , subq_0.min_booking_value
+            , subq_0.bookers
+            , subq_0.average_booking_value
+            , subq_0.referred_bookings
+            , subq_0.median_booking_value
+            , subq_0.booking_value_p99
+            , subq_0.discrete_booking_value_p99
+            , subq_0.approximate_continuous_booking_value_p99
+            , subq_0.approximate_discrete_booking_value_p99
           FROM (
             -- Read Elements From Semantic Model 'bookings_source'
             SELECT
@@ -431,15 +431,15 @@ FROM (
               , bookings_source_src_28000.guest_id AS booking__guest
               , bookings_source_src_28000.host_id AS booking__host
             FROM ***************************.fct_bookings bookings_source_src_28000
-          ) subq_5
-        ) subq_6
-      ) subq_7
+          ) subq_0
+        ) subq_5
+      ) subq_6
       GROUP BY
         metric_time__day
-    ) subq_8
-  ) subq_9
+    ) subq_7
+  ) subq_8
   ON
-    subq_4.metric_time__day = subq_9.metric_time__day
+    subq_4.metric_time__day = subq_8.metric_time__day
   GROUP BY
     metric_time__day
-) subq_10
+) subq_9
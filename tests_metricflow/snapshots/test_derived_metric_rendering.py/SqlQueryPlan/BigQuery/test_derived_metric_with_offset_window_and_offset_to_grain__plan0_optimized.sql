@@ -5,18 +5,18 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_24.metric_time__day, subq_32.metric_time__day) AS metric_time__day
-    , MAX(subq_24.month_start_bookings) AS month_start_bookings
-    , MAX(subq_32.bookings_1_month_ago) AS bookings_1_month_ago
+    COALESCE(subq_23.metric_time__day, subq_31.metric_time__day) AS metric_time__day
+    , MAX(subq_23.month_start_bookings) AS month_start_bookings
+    , MAX(subq_31.bookings_1_month_ago) AS bookings_1_month_ago
   FROM (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['bookings', 'metric_time__day']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      subq_20.ds AS metric_time__day
-      , SUM(subq_18.bookings) AS month_start_bookings
-    FROM ***************************.mf_time_spine subq_20
+      subq_19.ds AS metric_time__day
+      , SUM(subq_17.bookings) AS month_start_bookings
+    FROM ***************************.mf_time_spine subq_19
     INNER JOIN (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -24,21 +24,21 @@ FROM (
         DATETIME_TRUNC(ds, day) AS metric_time__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_18
+    ) subq_17
     ON
-      DATETIME_TRUNC(subq_20.ds, month) = subq_18.metric_time__day
+      DATETIME_TRUNC(subq_19.ds, month) = subq_17.metric_time__day
     GROUP BY
       metric_time__day
-  ) subq_24
+  ) subq_23
   FULL OUTER JOIN (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['bookings', 'metric_time__day']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      subq_28.ds AS metric_time__day
-      , SUM(subq_26.bookings) AS bookings_1_month_ago
-    FROM ***************************.mf_time_spine subq_28
+      subq_27.ds AS metric_time__day
+      , SUM(subq_25.bookings) AS bookings_1_month_ago
+    FROM ***************************.mf_time_spine subq_27
     INNER JOIN (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -46,14 +46,14 @@ FROM (
         DATETIME_TRUNC(ds, day) AS metric_time__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_26
+    ) subq_25
     ON
-      DATE_SUB(CAST(subq_28.ds AS DATETIME), INTERVAL 1 month) = subq_26.metric_time__day
+      DATE_SUB(CAST(subq_27.ds AS DATETIME), INTERVAL 1 month) = subq_25.metric_time__day
     GROUP BY
       metric_time__day
-  ) subq_32
+  ) subq_31
   ON
-    subq_24.metric_time__day = subq_32.metric_time__day
+    subq_23.metric_time__day = subq_31.metric_time__day
   GROUP BY
     metric_time__day
-) subq_33
+) subq_32
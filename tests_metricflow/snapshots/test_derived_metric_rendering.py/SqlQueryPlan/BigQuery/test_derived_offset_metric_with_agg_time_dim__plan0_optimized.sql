@@ -5,25 +5,25 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_21.booking__ds__day, subq_26.booking__ds__day) AS booking__ds__day
-    , MAX(subq_21.booking_value) AS booking_value
-    , MAX(subq_26.bookers) AS bookers
+    COALESCE(subq_20.booking__ds__day, subq_25.booking__ds__day) AS booking__ds__day
+    , MAX(subq_20.booking_value) AS booking_value
+    , MAX(subq_25.bookers) AS bookers
   FROM (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['booking_value', 'booking__ds__day']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      subq_17.ds AS booking__ds__day
+      subq_16.ds AS booking__ds__day
       , SUM(bookings_source_src_28000.booking_value) AS booking_value
-    FROM ***************************.mf_time_spine subq_17
+    FROM ***************************.mf_time_spine subq_16
     INNER JOIN
       ***************************.fct_bookings bookings_source_src_28000
     ON
-      DATE_SUB(CAST(subq_17.ds AS DATETIME), INTERVAL 1 week) = DATETIME_TRUNC(bookings_source_src_28000.ds, day)
+      DATE_SUB(CAST(subq_16.ds AS DATETIME), INTERVAL 1 week) = DATETIME_TRUNC(bookings_source_src_28000.ds, day)
     GROUP BY
       booking__ds__day
-  ) subq_21
+  ) subq_20
   FULL OUTER JOIN (
     -- Read Elements From Semantic Model 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -36,9 +36,9 @@ FROM (
     FROM ***************************.fct_bookings bookings_source_src_28000
     GROUP BY
       booking__ds__day
-  ) subq_26
+  ) subq_25
   ON
-    subq_21.booking__ds__day = subq_26.booking__ds__day
+    subq_20.booking__ds__day = subq_25.booking__ds__day
   GROUP BY
     booking__ds__day
-) subq_27
+) subq_26
@@ -5,10 +5,10 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_28.metric_time__day, subq_33.metric_time__day) AS metric_time__day
-    , MAX(subq_28.non_referred) AS non_referred
-    , MAX(subq_33.instant) AS instant
-    , MAX(subq_33.bookings) AS bookings
+    COALESCE(subq_25.metric_time__day, subq_30.metric_time__day) AS metric_time__day
+    , MAX(subq_25.non_referred) AS non_referred
+    , MAX(subq_30.instant) AS instant
+    , MAX(subq_30.bookings) AS bookings
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -30,11 +30,11 @@ FROM (
           , 1 AS bookings
           , CASE WHEN referrer_id IS NOT NULL THEN 1 ELSE 0 END AS referred_bookings
         FROM ***************************.fct_bookings bookings_source_src_28000
-      ) subq_25
+      ) subq_22
       GROUP BY
         metric_time__day
-    ) subq_27
-  ) subq_28
+    ) subq_24
+  ) subq_25
   FULL OUTER JOIN (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -51,12 +51,12 @@ FROM (
         , 1 AS bookings
         , CASE WHEN is_instant THEN 1 ELSE 0 END AS instant_bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_31
+    ) subq_28
     GROUP BY
       metric_time__day
-  ) subq_33
+  ) subq_30
   ON
-    subq_28.metric_time__day = subq_33.metric_time__day
+    subq_25.metric_time__day = subq_30.metric_time__day
   GROUP BY
     metric_time__day
-) subq_34
+) subq_31
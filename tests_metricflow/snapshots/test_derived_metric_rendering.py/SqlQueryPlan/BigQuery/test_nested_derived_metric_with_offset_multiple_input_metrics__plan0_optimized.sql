@@ -5,15 +5,15 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_24.metric_time__day, subq_30.metric_time__day) AS metric_time__day
-    , MAX(subq_24.booking_fees_start_of_month) AS booking_fees_start_of_month
-    , MAX(subq_30.booking_fees) AS booking_fees
+    COALESCE(subq_23.metric_time__day, subq_29.metric_time__day) AS metric_time__day
+    , MAX(subq_23.booking_fees_start_of_month) AS booking_fees_start_of_month
+    , MAX(subq_29.booking_fees) AS booking_fees
   FROM (
     -- Join to Time Spine Dataset
     SELECT
-      subq_23.ds AS metric_time__day
-      , subq_21.booking_fees_start_of_month AS booking_fees_start_of_month
-    FROM ***************************.mf_time_spine subq_23
+      subq_22.ds AS metric_time__day
+      , subq_20.booking_fees_start_of_month AS booking_fees_start_of_month
+    FROM ***************************.mf_time_spine subq_22
     INNER JOIN (
       -- Compute Metrics via Expressions
       SELECT
@@ -31,11 +31,11 @@ FROM (
         FROM ***************************.fct_bookings bookings_source_src_28000
         GROUP BY
           metric_time__day
-      ) subq_20
-    ) subq_21
+      ) subq_19
+    ) subq_20
     ON
-      DATETIME_TRUNC(subq_23.ds, month) = subq_21.metric_time__day
-  ) subq_24
+      DATETIME_TRUNC(subq_22.ds, month) = subq_20.metric_time__day
+  ) subq_23
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
@@ -53,10 +53,10 @@ FROM (
       FROM ***************************.fct_bookings bookings_source_src_28000
       GROUP BY
         metric_time__day
-    ) subq_29
-  ) subq_30
+    ) subq_28
+  ) subq_29
   ON
-    subq_24.metric_time__day = subq_30.metric_time__day
+    subq_23.metric_time__day = subq_29.metric_time__day
   GROUP BY
     metric_time__day
-) subq_31
+) subq_30
@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_18.booking__ds__day, subq_26.booking__ds__day) AS booking__ds__day
-    , MAX(subq_18.bookings) AS bookings
-    , MAX(subq_26.bookings_at_start_of_month) AS bookings_at_start_of_month
+    COALESCE(subq_17.booking__ds__day, subq_25.booking__ds__day) AS booking__ds__day
+    , MAX(subq_17.bookings) AS bookings
+    , MAX(subq_25.bookings_at_start_of_month) AS bookings_at_start_of_month
   FROM (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -22,19 +22,19 @@ FROM (
         DATETIME_TRUNC(ds, day) AS booking__ds__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_16
+    ) subq_15
     GROUP BY
       booking__ds__day
-  ) subq_18
+  ) subq_17
   FULL OUTER JOIN (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['bookings', 'booking__ds__day']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      subq_22.ds AS booking__ds__day
-      , SUM(subq_20.bookings) AS bookings_at_start_of_month
-    FROM ***************************.mf_time_spine subq_22
+      subq_21.ds AS booking__ds__day
+      , SUM(subq_19.bookings) AS bookings_at_start_of_month
+    FROM ***************************.mf_time_spine subq_21
     INNER JOIN (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -42,14 +42,14 @@ FROM (
         DATETIME_TRUNC(ds, day) AS booking__ds__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_20
+    ) subq_19
     ON
-      DATETIME_TRUNC(subq_22.ds, month) = subq_20.booking__ds__day
+      DATETIME_TRUNC(subq_21.ds, month) = subq_19.booking__ds__day
     GROUP BY
       booking__ds__day
-  ) subq_26
+  ) subq_25
   ON
-    subq_18.booking__ds__day = subq_26.booking__ds__day
+    subq_17.booking__ds__day = subq_25.booking__ds__day
   GROUP BY
     booking__ds__day
-) subq_27
+) subq_26
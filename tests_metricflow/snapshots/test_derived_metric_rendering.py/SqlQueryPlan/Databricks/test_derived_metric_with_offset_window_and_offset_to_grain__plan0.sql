@@ -1,13 +1,13 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_16.metric_time__day
+  subq_15.metric_time__day
   , month_start_bookings - bookings_1_month_ago AS bookings_month_start_compared_to_1_month_prior
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_7.metric_time__day, subq_15.metric_time__day) AS metric_time__day
+    COALESCE(subq_7.metric_time__day, subq_14.metric_time__day) AS metric_time__day
     , MAX(subq_7.month_start_bookings) AS month_start_bookings
-    , MAX(subq_15.bookings_1_month_ago) AS bookings_1_month_ago
+    , MAX(subq_14.bookings_1_month_ago) AS bookings_1_month_ago
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -336,226 +336,226 @@ FROM (
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_14.metric_time__day
-      , subq_14.bookings AS bookings_1_month_ago
+      subq_13.metric_time__day
+      , subq_13.bookings AS bookings_1_month_ago
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_13.metric_time__day
-        , SUM(subq_13.bookings) AS bookings
+        subq_12.metric_time__day
+        , SUM(subq_12.bookings) AS bookings
       FROM (
         -- Pass Only Elements: ['bookings', 'metric_time__day']
         SELECT
-          subq_12.metric_time__day
-          , subq_12.bookings
+          subq_11.metric_time__day
+          , subq_11.bookings
         FROM (
           -- Join to Time Spine Dataset
           SELECT
-            subq_10.metric_time__day AS metric_time__day
-            , DATE_TRUNC('week', subq_10.metric_time__day) AS metric_time__week
-            , DATE_TRUNC('month', subq_10.metric_time__day) AS metric_time__month
-            , DATE_TRUNC('quarter', subq_10.metric_time__day) AS metric_time__quarter
-            , DATE_TRUNC('year', subq_10.metric_time__day) AS metric_time__year
-            , EXTRACT(year FROM subq_10.metric_time__day) AS metric_time__extract_year
-            , EXTRACT(quarter FROM subq_10.metric_time__day) AS metric_time__extract_quarter
-            , EXTRACT(month FROM subq_10.metric_time__day) AS metric_time__extract_month
-            , EXTRACT(day FROM subq_10.metric_time__day) AS metric_time__extract_day
-            , EXTRACT(DAYOFWEEK_ISO FROM subq_10.metric_time__day) AS metric_time__extract_dow
-            , EXTRACT(doy FROM subq_10.metric_time__day) AS metric_time__extract_doy
-            , subq_9.ds__day AS ds__day
-            , subq_9.ds__week AS ds__week
-            , subq_9.ds__month AS ds__month
-            , subq_9.ds__quarter AS ds__quarter
-            , subq_9.ds__year AS ds__year
-            , subq_9.ds__extract_year AS ds__extract_year
-            , subq_9.ds__extract_quarter AS ds__extract_quarter
-            , subq_9.ds__extract_month AS ds__extract_month
-            , subq_9.ds__extract_day AS ds__extract_day
-            , subq_9.ds__extract_dow AS ds__extract_dow
-            , subq_9.ds__extract_doy AS ds__extract_doy
-            , subq_9.ds_partitioned__day AS ds_partitioned__day
-            , subq_9.ds_partitioned__week AS ds_partitioned__week
-            , subq_9.ds_partitioned__month AS ds_partitioned__month
-            , subq_9.ds_partitioned__quarter AS ds_partitioned__quarter
-            , subq_9.ds_partitioned__year AS ds_partitioned__year
-            , subq_9.ds_partitioned__extract_year AS ds_partitioned__extract_year
-            , subq_9.ds_partitioned__extract_quarter AS ds_partitioned__extract_quarter
-            , subq_9.ds_partitioned__extract_month AS ds_partitioned__extract_month
-            , subq_9.ds_partitioned__extract_day AS ds_partitioned__extract_day
-            , subq_9.ds_partitioned__extract_dow AS ds_partitioned__extract_dow
-            , subq_9.ds_partitioned__extract_doy AS ds_partitioned__extract_doy
-            , subq_9.paid_at__day AS paid_at__day
-            , subq_9.paid_at__week AS paid_at__week
-            , subq_9.paid_at__month AS paid_at__month
-            , subq_9.paid_at__quarter AS paid_at__quarter
-            , subq_9.paid_at__year AS paid_at__year
-            , subq_9.paid_at__extract_year AS paid_at__extract_year
-            , subq_9.paid_at__extract_quarter AS paid_at__extract_quarter
-            , subq_9.paid_at__extract_month AS paid_at__extract_month
-            , subq_9.paid_at__extract_day AS paid_at__extract_day
-            , subq_9.paid_at__extract_dow AS paid_at__extract_dow
-            , subq_9.paid_at__extract_doy AS paid_at__extract_doy
-            , subq_9.booking__ds__day AS booking__ds__day
-            , subq_9.booking__ds__week AS booking__ds__week
-            , subq_9.booking__ds__month AS booking__ds__month
-            , subq_9.booking__ds__quarter AS booking__ds__quarter
-            , subq_9.booking__ds__year AS booking__ds__year
-            , subq_9.booking__ds__extract_year AS booking__ds__extract_year
-            , subq_9.booking__ds__extract_quarter AS booking__ds__extract_quarter
-            , subq_9.booking__ds__extract_month AS booking__ds__extract_month
-            , subq_9.booking__ds__extract_day AS booking__ds__extract_day
-            , subq_9.booking__ds__extract_dow AS booking__ds__extract_dow
-            , subq_9.booking__ds__extract_doy AS booking__ds__extract_doy
-            , subq_9.booking__ds_partitioned__day AS booking__ds_partitioned__day
-            , subq_9.booking__ds_partitioned__week AS booking__ds_partitioned__week
-            , subq_9.booking__ds_partitioned__month AS booking__ds_partitioned__month
-            , subq_9.booking__ds_partitioned__quarter AS booking__ds_partitioned__quarter
-            , subq_9.booking__ds_partitioned__year AS booking__ds_partitioned__year
-            , subq_9.booking__ds_partitioned__extract_year AS booking__ds_partitioned__extract_year
-            , subq_9.booking__ds_partitioned__extract_quarter AS booking__ds_partitioned__extract_quarter
-            , subq_9.booking__ds_partitioned__extract_month AS booking__ds_partitioned__extract_month
-            , subq_9.booking__ds_partitioned__extract_day AS booking__ds_partitioned__extract_day
-            , subq_9.booking__ds_partitioned__extract_dow AS booking__ds_partitioned__extract_dow
-            , subq_9.booking__ds_partitioned__extract_doy AS booking__ds_partitioned__extract_doy
-            , subq_9.booking__paid_at__day AS booking__paid_at__day
-            , subq_9.booking__paid_at__week AS booking__paid_at__week
-            , subq_9.booking__paid_at__month AS booking__paid_at__month
-            , subq_9.booking__paid_at__quarter AS booking__paid_at__quarter
-            , subq_9.booking__paid_at__year AS booking__paid_at__year
-            , subq_9.booking__paid_at__extract_year AS booking__paid_at__extract_year
-            , subq_9.booking__paid_at__extract_quarter AS booking__paid_at__extract_quarter
-            , subq_9.booking__paid_at__extract_month AS booking__paid_at__extract_month
-            , subq_9.booking__paid_at__extract_day AS booking__paid_at__extract_day
-            , subq_9.booking__paid_at__extract_dow AS booking__paid_at__extract_dow
-            , subq_9.booking__paid_at__extract_doy AS booking__paid_at__extract_doy
-            , subq_9.listing AS listing
-            , subq_9.guest AS guest
-            , subq_9.host AS host
-            , subq_9.booking__listing AS booking__listing
-            , subq_9.booking__guest AS booking__guest
-            , subq_9.booking__host AS booking__host
-            , subq_9.is_instant AS is_instant
-            , subq_9.booking__is_instant AS booking__is_instant
-            , subq_9.bookings AS bookings
-            , subq_9.instant_bookings AS instant_bookings
-            , subq_9.booking_value AS booking_value
-            , subq_9.max_booking_value AS max_booking_value
-            , subq_9.min_booking_value AS min_booking_value
-            , subq_9.bookers AS bookers
-            , subq_9.average_booking_value AS average_booking_value
-            , subq_9.referred_bookings AS referred_bookings
-            , subq_9.median_booking_value AS median_booking_value
-            , subq_9.booking_value_p99 AS booking_value_p99
-            , subq_9.discrete_booking_value_p99 AS discrete_booking_value_p99
-            , subq_9.approximate_continuous_booking_value_p99 AS approximate_continuous_booking_value_p99
-            , subq_9.approximate_discrete_booking_value_p99 AS approximate_discrete_booking_value_p99
+            subq_9.metric_time__day AS metric_time__day
+            , DATE_TRUNC('week', subq_9.metric_time__day) AS metric_time__week
+            , DATE_TRUNC('month', subq_9.metric_time__day) AS metric_time__month
+            , DATE_TRUNC('quarter', subq_9.metric_time__day) AS metric_time__quarter
+            , DATE_TRUNC('year', subq_9.metric_time__day) AS metric_time__year
+            , EXTRACT(year FROM subq_9.metric_time__day) AS metric_time__extract_year
+            , EXTRACT(quarter FROM subq_9.metric_time__day) AS metric_time__extract_quarter
+            , EXTRACT(month FROM subq_9.metric_time__day) AS metric_time__extract_month
+            , EXTRACT(day FROM subq_9.metric_time__day) AS metric_time__extract_day
+            , EXTRACT(DAYOFWEEK_ISO FROM subq_9.metric_time__day) AS metric_time__extract_dow
+            , EXTRACT(doy FROM subq_9.metric_time__day) AS metric_time__extract_doy
+            , subq_8.ds__day AS ds__day
+            , subq_8.ds__week AS ds__week
+            , subq_8.ds__month AS ds__month
+            , subq_8.ds__quarter AS ds__quarter
+            , subq_8.ds__year AS ds__year
+            , subq_8.ds__extract_year AS ds__extract_year
+            , subq_8.ds__extract_quarter AS ds__extract_quarter
+            , subq_8.ds__extract_month AS ds__extract_month
+            , subq_8.ds__extract_day AS ds__extract_day
+            , subq_8.ds__extract_dow AS ds__extract_dow
+            , subq_8.ds__extract_doy AS ds__extract_doy
+            , subq_8.ds_partitioned__day AS ds_partitioned__day
+            , subq_8.ds_partitioned__week AS ds_partitioned__week
+            , subq_8.ds_partitioned__month AS ds_partitioned__month
+            , subq_8.ds_partitioned__quarter AS ds_partitioned__quarter
+            , subq_8.ds_partitioned__year AS ds_partitioned__year
+            , subq_8.ds_partitioned__extract_year AS ds_partitioned__extract_year
+            , subq_8.ds_partitioned__extract_quarter AS ds_partitioned__extract_quarter
+            , subq_8.ds_partitioned__extract_month AS ds_partitioned__extract_month
+            , subq_8.ds_partitioned__extract_day AS ds_partitioned__extract_day
+            , subq_8.ds_partitioned__extract_dow AS ds_partitioned__extract_dow
+            , subq_8.ds_partitioned__extract_doy AS ds_partitioned__extract_doy
+            , subq_8.paid_at__day AS paid_at__day
+            , subq_8.paid_at__week AS paid_at__week
+            , subq_8.paid_at__month AS paid_at__month
+            , subq_8.paid_at__quarter AS paid_at__quarter
+            , subq_8.paid_at__year AS paid_at__year
+            , subq_8.paid_at__extract_year AS paid_at__extract_year
+            , subq_8.paid_at__extract_quarter AS paid_at__extract_quarter
+            , subq_8.paid_at__extract_month AS paid_at__extract_month
+            , subq_8.paid_at__extract_day AS paid_at__extract_day
+            , subq_8.paid_at__extract_dow AS paid_at__extract_dow
+            , subq_8.paid_at__extract_doy AS paid_at__extract_doy
+            , subq_8.booking__ds__day AS booking__ds__day
+            , subq_8.booking__ds__week AS booking__ds__week
+            , subq_8.booking__ds__month AS booking__ds__month
+            , subq_8.booking__ds__quarter AS booking__ds__quarter
+            , subq_8.booking__ds__year AS booking__ds__year
+            , subq_8.booking__ds__extract_year AS booking__ds__extract_year
+            , subq_8.booking__ds__extract_quarter AS booking__ds__extract_quarter
+            , subq_8.booking__ds__extract_month AS booking__ds__extract_month
+            , subq_8.booking__ds__extract_day AS booking__ds__extract_day
+            , subq_8.booking__ds__extract_dow AS booking__ds__extract_dow
+            , subq_8.booking__ds__extract_doy AS booking__ds__extract_doy
+            , subq_8.booking__ds_partitioned__day AS booking__ds_partitioned__day
+            , subq_8.booking__ds_partitioned__week AS booking__ds_partitioned__week
+            , subq_8.booking__ds_partitioned__month AS booking__ds_partitioned__month
+            , subq_8.booking__ds_partitioned__quarter AS booking__ds_partitioned__quarter
+            , subq_8.booking__ds_partitioned__year AS booking__ds_partitioned__year
+            , subq_8.booking__ds_partitioned__extract_year AS booking__ds_partitioned__extract_year
+            , subq_8.booking__ds_partitioned__extract_quarter AS booking__ds_partitioned__extract_quarter
+            , subq_8.booking__ds_partitioned__extract_month AS booking__ds_partitioned__extract_month
+            , subq_8.booking__ds_partitioned__extract_day AS booking__ds_partitioned__extract_day
+            , subq_8.booking__ds_partitioned__extract_dow AS booking__ds_partitioned__extract_dow
+            , subq_8.booking__ds_partitioned__extract_doy AS booking__ds_partitioned__extract_doy
+            , subq_8.booking__paid_at__day AS booking__paid_at__day
+            , subq_8.booking__paid_at__week AS booking__paid_at__week
+            , subq_8.booking__paid_at__month AS booking__paid_at__month
+            , subq_8.booking__paid_at__quarter AS booking__paid_at__quarter
+            , subq_8.booking__paid_at__year AS booking__paid_at__year
+            , subq_8.booking__paid_at__extract_year AS booking__paid_at__extract_year
+            , subq_8.booking__paid_at__extract_quarter AS booking__paid_at__extract_quarter
+            , subq_8.booking__paid_at__extract_month AS booking__paid_at__extract_month
+            , subq_8.booking__paid_at__extract_day AS booking__paid_at__extract_day
+            , subq_8.booking__paid_at__extract_dow AS booking__paid_at__extract_dow
+            , subq_8.booking__paid_at__extract_doy AS booking__paid_at__extract_doy
+            , subq_8.listing AS listing
+            , subq_8.guest AS guest
+            , subq_8.host AS host
+            , subq_8.booking__listing AS booking__listing
+            , subq_8.booking__guest AS booking__guest
+            , subq_8.booking__host AS booking__host
+            , subq_8.is_instant AS is_instant
+            , subq_8.booking__is_instant AS booking__is_instant
+            , subq_8.bookings AS bookings
+            , subq_8.instant_bookings AS instant_bookings
+            , subq_8.booking_value AS booking_value
+            , subq_8.max_booking_value AS max_booking_value
+            , subq_8.min_booking_value AS min_booking_value
+            , subq_8.bookers AS bookers
+            , subq_8.average_booking_value AS average_booking_value
+            , subq_8.referred_bookings AS referred_bookings
+            , subq_8.median_booking_value AS median_booking_value
+            , subq_8.booking_value_p99 AS booking_value_p99
+            , subq_8.discrete_booking_value_p99 AS discrete_booking_value_p99
+            , subq_8.approximate_continuous_booking_value_p99 AS approximate_continuous_booking_value_p99
+            , subq_8.approximate_discrete_booking_value_p99 AS approximate_discrete_booking_value_p99
           FROM (
             -- Time Spine
             SELECT
-              subq_11.ds AS metric_time__day
-            FROM ***************************.mf_time_spine subq_11
-          ) subq_10
+              subq_10.ds AS metric_time__day
+            FROM ***************************.mf_time_spine subq_10
+          ) subq_9
           INNER JOIN (
             -- Metric Time Dimension 'ds'
             SELECT
-              subq_8.ds__day
-              , subq_8.ds__week
-              , subq_8.ds__month
-              , subq_8.ds__quarter
-              , subq_8.ds__year
-              , subq_8.ds__extract_year
-              , subq_8.ds__extract_quarter
-              , subq_8.ds__extract_month
-              , subq_8.ds__extract_day
-              , subq_8.ds__extract_dow
-              , subq_8.ds__extract_doy
-              , subq_8.ds_partitioned__day
-              , subq_8.ds_partitioned__week
-              , subq_8.ds_partitioned__month
-              , subq_8.ds_partitioned__quarter
-              , subq_8.ds_partitioned__year
-              , subq_8.ds_partitioned__extract_year
-              , subq_8.ds_partitioned__extract_quarter
-              , subq_8.ds_partitioned__extract_month
-              , subq_8.ds_partitioned__extract_day
-              , subq_8.ds_partitioned__extract_dow
-              , subq_8.ds_partitioned__extract_doy
-              , subq_8.paid_at__day
-              , subq_8.paid_at__week
-              , subq_8.paid_at__month
-              , subq_8.paid_at__quarter
-              , subq_8.paid_at__year
-              , subq_8.paid_at__extract_year
-              , subq_8.paid_at__extract_quarter
-              , subq_8.paid_at__extract_month
-              , subq_8.paid_at__extract_day
-              , subq_8.paid_at__extract_dow
-              , subq_8.paid_at__extract_doy
-              , subq_8.booking__ds__day
-              , subq_8.booking__ds__week
-              , subq_8.booking__ds__month
-              , subq_8.booking__ds__quarter
-              , subq_8.booking__ds__year
-              , subq_8.booking__ds__extract_year
-              , subq_8.booking__ds__extract_quarter
-              , subq_8.booking__ds__extract_month
-              , subq_8.booking__ds__extract_day
-              , subq_8.booking__ds__extract_dow
-              , subq_8.booking__ds__extract_doy
-              , subq_8.booking__ds_partitioned__day
-              , subq_8.booking__ds_partitioned__week
-              , subq_8.booking__ds_partitioned__month
-              , subq_8.booking__ds_partitioned__quarter
-              , subq_8.booking__ds_partitioned__year
-              , subq_8.booking__ds_partitioned__extract_year
-              , subq_8.booking__ds_partitioned__extract_quarter
-              , subq_8.booking__ds_partitioned__extract_month
-              , subq_8.booking__ds_partitioned__extract_day
-              , subq_8.booking__ds_partitioned__extract_dow
-              , subq_8.booking__ds_partitioned__extract_doy
-              , subq_8.booking__paid_at__day
-              , subq_8.booking__paid_at__week
-              , subq_8.booking__paid_at__month
-              , subq_8.booking__paid_at__quarter
-              , subq_8.booking__paid_at__year
-              , subq_8.booking__paid_at__extract_year
-              , subq_8.booking__paid_at__extract_quarter
-              , subq_8.booking__paid_at__extract_month
-              , subq_8.booking__paid_at__extract_day
-              , subq_8.booking__paid_at__extract_dow
-              , subq_8.booking__paid_at__extract_doy
-              , subq_8.ds__day AS metric_time__day
-              , subq_8.ds__week AS metric_time__week
-              , subq_8.ds__month AS metric_time__month
-              , subq_8.ds__quarter AS metric_time__quarter
-              , subq_8.ds__year AS metric_time__year
-              , subq_8.ds__extract_year AS metric_time__extract_year
-              , subq_8.ds__extract_quarter AS metric_time__extract_quarter
-              , subq_8.ds__extract_month AS metric_time__extract_month
-              , subq_8.ds__extract_day AS metric_time__extract_day
-              , subq_8.ds__extract_dow AS metric_time__extract_dow
-              , subq_8.ds__extract_doy AS metric_time__extract_doy
-              , subq_8.listing
-              , subq_8.guest
-              , subq_8.host
-              , subq_8.booking__listing
-              , subq_8.booking__guest
-              , subq_8.booking__host
-              , subq_8.is_instant
-              , subq_8.booking__is_instant
-              , subq_8.bookings
-              , subq_8.instant_bookings
-              , subq_8.booking_value
-              , subq_8.max_booking_value
-              , subq_8.min_booking_value
-              , subq_8.bookers
-              , subq_8.average_booking_value
-              , subq_8.referred_bookings
-              , subq_8.median_booking_value
-              , subq_8.booking_value_p99
-              , subq_8.discrete_booking_value_p99
-              , subq_8.approximate_continuous_booking_value_p99
-              , subq_8.approximate_discrete_booking_value_p99
+              subq_0.ds__day
+              , subq_0.ds__week
+              , subq_0.ds__month
+              , subq_0.ds__quarter
+              , subq_0.ds__year
+              , subq_0.ds__extract_year
+              , subq_0.ds__extract_quarter
+              , subq_0.ds__extract_month
+              , subq_0.ds__extract_day
+              , subq_0.ds__extract_dow
+              , subq_0.ds__extract_doy
+              , subq_0.ds_partitioned__day
+              , subq_0.ds_partitioned__week
+              , subq_0.ds_partitioned__month
+              , subq_0.ds_partitioned__quarter
+              , subq_0.ds_partitioned__year
+              , subq_0.ds_partitioned__extract_year
+              , subq_0.ds_partitioned__extract_quarter
+              , subq_0.ds_partitioned__extract_month
+              , subq_0.ds_partitioned__extract_day
+              , subq_0.ds_partitioned__extract_dow
+              , subq_0.ds_partitioned__extract_doy
+              , subq_0.paid_at__day
+              , subq_0.paid_at__week
+              , subq_0.paid_at__month
+              , subq_0.paid_at__quarter
+              , subq_0.paid_at__year
+              , subq_0.paid_at__extract_year
+              , subq_0.paid_at__extract_quarter
+              , subq_0.paid_at__extract_month
+              , subq_0.paid_at__extract_day
+              , subq_0.paid_at__extract_dow
+              , subq_0.paid_at__extract_doy
+              , subq_0.booking__ds__day
+              , subq_0.booking__ds__week
+              , subq_0.booking__ds__month
+              , subq_0.booking__ds__quarter
+              , subq_0.booking__ds__year
+              , subq_0.booking__ds__extract_year
+              , subq_0.booking__ds__extract_quarter
+              , subq_0.booking__ds__extract_month
+              , subq_0.booking__ds__extract_day
+              , subq_0.booking__ds__extract_dow
+              , subq_0.booking__ds__extract_doy
+              , subq_0.booking__ds_partitioned__day
+              , subq_0.booking__ds_partitioned__week
+              , subq_0.booking__ds_partitioned__month
+              , subq_0.booking__ds_partitioned__quarter
+              , subq_0.booking__ds_partitioned__year
+              , subq_0.booking__ds_partitioned__extract_year
+              , subq_0.booking__ds_partitioned__extract_quarter
+              , subq_0.booking__ds_partitioned__extract_month
+              , subq_0.booking__ds_partitioned__extract_day
+              , subq_0.booking__ds_partitioned__extract_dow
+              , subq_0.booking__ds_partitioned__extract_doy
+              , subq_0.booking__paid_at__day
+              , subq_0.booking__paid_at__week
+              , subq_0.booking__paid_at__month
+              , subq_0.booking__paid_at__quarter
+              , subq_0.booking__paid_at__year
+              , subq_0.booking__paid_at__extract_year
+              , subq_0.booking__paid_at__extract_quarter
+              , subq_0.booking__paid_at__extract_month
+              , subq_0.booking__paid_at__extract_day
+              , subq_0.booking__paid_at__extract_dow
+              , subq_0.booking__paid_at__extract_doy
+              , subq_0.ds__day AS metric_time__day
+              , subq_0.ds__week AS metric_time__week
+              , subq_0.ds__month AS metric_time__month
+              , subq_0.ds__quarter AS metric_time__quarter
+              , subq_0.ds__year AS metric_time__year
+              , subq_0.ds__extract_year AS metric_time__extract_year
+              , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+              , subq_0.ds__extract_month AS metric_time__extract_month
+              , subq_0.ds__extract_day AS metric_time__extract_day
+              , subq_0.ds__extract_dow AS metric_time__extract_dow
+              , subq_0.ds__extract_doy AS metric_time__extract_doy
+              , subq_0.listing
+              , subq_0.guest
+              , subq_0.host
+              , subq_0.booking__listing
+              , subq_0.booking__guest
+              , subq_0.booking__host
+              , subq_0.is_instant
+              , subq_0.booking__is_instant
+              , subq_0.bookings
+              , subq_0.instant_bookings
+              , subq_0.booking_value
+              , subq_0.max_booking_value
+              , subq_0.min_booking_value
+              , subq_0.bookers
+              , subq_0.average_booking_value
+              , subq_0.referred_bookings
+              , subq_0.median_booking_value
+              , subq_0.booking_value_p99
+              , subq_0.discrete_booking_value_p99
+              , subq_0.approximate_continuous_booking_value_p99
+              , subq_0.approximate_discrete_booking_value_p99
             FROM (
               -- Read Elements From Semantic Model 'bookings_source'
               SELECT
@@ -648,18 +648,18 @@ FROM (
                 , bookings_source_src_28000.guest_id AS booking__guest
                 , bookings_source_src_28000.host_id AS booking__host
               FROM ***************************.fct_bookings bookings_source_src_28000
-            ) subq_8
-          ) subq_9
+            ) subq_0
+          ) subq_8
           ON
-            DATEADD(month, -1, subq_10.metric_time__day) = subq_9.metric_time__day
-        ) subq_12
-      ) subq_13
+            DATEADD(month, -1, subq_9.metric_time__day) = subq_8.metric_time__day
+        ) subq_11
+      ) subq_12
       GROUP BY
-        subq_13.metric_time__day
-    ) subq_14
-  ) subq_15
+        subq_12.metric_time__day
+    ) subq_13
+  ) subq_14
   ON
-    subq_7.metric_time__day = subq_15.metric_time__day
+    subq_7.metric_time__day = subq_14.metric_time__day
   GROUP BY
-    COALESCE(subq_7.metric_time__day, subq_15.metric_time__day)
-) subq_16
+    COALESCE(subq_7.metric_time__day, subq_14.metric_time__day)
+) subq_15
@@ -5,18 +5,18 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_24.metric_time__year, subq_32.metric_time__year) AS metric_time__year
-    , MAX(subq_24.month_start_bookings) AS month_start_bookings
-    , MAX(subq_32.bookings_1_month_ago) AS bookings_1_month_ago
+    COALESCE(subq_23.metric_time__year, subq_31.metric_time__year) AS metric_time__year
+    , MAX(subq_23.month_start_bookings) AS month_start_bookings
+    , MAX(subq_31.bookings_1_month_ago) AS bookings_1_month_ago
   FROM (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['bookings', 'metric_time__year']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      DATE_TRUNC('year', subq_20.ds) AS metric_time__year
-      , SUM(subq_18.bookings) AS month_start_bookings
-    FROM ***************************.mf_time_spine subq_20
+      DATE_TRUNC('year', subq_19.ds) AS metric_time__year
+      , SUM(subq_17.bookings) AS month_start_bookings
+    FROM ***************************.mf_time_spine subq_19
     INNER JOIN (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -24,22 +24,22 @@ FROM (
         DATE_TRUNC('day', ds) AS metric_time__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_18
+    ) subq_17
     ON
-      DATE_TRUNC('month', subq_20.ds) = subq_18.metric_time__day
-    WHERE DATE_TRUNC('year', subq_20.ds) = subq_20.ds
+      DATE_TRUNC('month', subq_19.ds) = subq_17.metric_time__day
+    WHERE DATE_TRUNC('year', subq_19.ds) = subq_19.ds
     GROUP BY
-      DATE_TRUNC('year', subq_20.ds)
-  ) subq_24
+      DATE_TRUNC('year', subq_19.ds)
+  ) subq_23
   FULL OUTER JOIN (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['bookings', 'metric_time__year']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      DATE_TRUNC('year', subq_28.ds) AS metric_time__year
-      , SUM(subq_26.bookings) AS bookings_1_month_ago
-    FROM ***************************.mf_time_spine subq_28
+      DATE_TRUNC('year', subq_27.ds) AS metric_time__year
+      , SUM(subq_25.bookings) AS bookings_1_month_ago
+    FROM ***************************.mf_time_spine subq_27
     INNER JOIN (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -47,14 +47,14 @@ FROM (
         DATE_TRUNC('day', ds) AS metric_time__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_26
+    ) subq_25
     ON
-      DATEADD(month, -1, subq_28.ds) = subq_26.metric_time__day
+      DATEADD(month, -1, subq_27.ds) = subq_25.metric_time__day
     GROUP BY
-      DATE_TRUNC('year', subq_28.ds)
-  ) subq_32
+      DATE_TRUNC('year', subq_27.ds)
+  ) subq_31
   ON
-    subq_24.metric_time__year = subq_32.metric_time__year
+    subq_23.metric_time__year = subq_31.metric_time__year
   GROUP BY
-    COALESCE(subq_24.metric_time__year, subq_32.metric_time__year)
-) subq_33
+    COALESCE(subq_23.metric_time__year, subq_31.metric_time__year)
+) subq_32
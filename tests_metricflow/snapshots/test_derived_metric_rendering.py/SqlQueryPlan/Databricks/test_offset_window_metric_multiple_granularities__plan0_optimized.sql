@@ -7,31 +7,31 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_21.metric_time__day, subq_26.metric_time__day) AS metric_time__day
-    , COALESCE(subq_21.metric_time__month, subq_26.metric_time__month) AS metric_time__month
-    , COALESCE(subq_21.metric_time__year, subq_26.metric_time__year) AS metric_time__year
-    , MAX(subq_21.booking_value) AS booking_value
-    , MAX(subq_26.bookers) AS bookers
+    COALESCE(subq_20.metric_time__day, subq_25.metric_time__day) AS metric_time__day
+    , COALESCE(subq_20.metric_time__month, subq_25.metric_time__month) AS metric_time__month
+    , COALESCE(subq_20.metric_time__year, subq_25.metric_time__year) AS metric_time__year
+    , MAX(subq_20.booking_value) AS booking_value
+    , MAX(subq_25.bookers) AS bookers
   FROM (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['booking_value', 'metric_time__day', 'metric_time__month', 'metric_time__year']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      subq_17.ds AS metric_time__day
-      , DATE_TRUNC('month', subq_17.ds) AS metric_time__month
-      , DATE_TRUNC('year', subq_17.ds) AS metric_time__year
+      subq_16.ds AS metric_time__day
+      , DATE_TRUNC('month', subq_16.ds) AS metric_time__month
+      , DATE_TRUNC('year', subq_16.ds) AS metric_time__year
       , SUM(bookings_source_src_28000.booking_value) AS booking_value
-    FROM ***************************.mf_time_spine subq_17
+    FROM ***************************.mf_time_spine subq_16
     INNER JOIN
       ***************************.fct_bookings bookings_source_src_28000
     ON
-      DATEADD(week, -1, subq_17.ds) = DATE_TRUNC('day', bookings_source_src_28000.ds)
+      DATEADD(week, -1, subq_16.ds) = DATE_TRUNC('day', bookings_source_src_28000.ds)
     GROUP BY
-      subq_17.ds
-      , DATE_TRUNC('month', subq_17.ds)
-      , DATE_TRUNC('year', subq_17.ds)
-  ) subq_21
+      subq_16.ds
+      , DATE_TRUNC('month', subq_16.ds)
+      , DATE_TRUNC('year', subq_16.ds)
+  ) subq_20
   FULL OUTER JOIN (
     -- Read Elements From Semantic Model 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -48,17 +48,17 @@ FROM (
       DATE_TRUNC('day', ds)
       , DATE_TRUNC('month', ds)
       , DATE_TRUNC('year', ds)
-  ) subq_26
+  ) subq_25
   ON
     (
-      subq_21.metric_time__day = subq_26.metric_time__day
+      subq_20.metric_time__day = subq_25.metric_time__day
     ) AND (
-      subq_21.metric_time__month = subq_26.metric_time__month
+      subq_20.metric_time__month = subq_25.metric_time__month
     ) AND (
-      subq_21.metric_time__year = subq_26.metric_time__year
+      subq_20.metric_time__year = subq_25.metric_time__year
     )
   GROUP BY
-    COALESCE(subq_21.metric_time__day, subq_26.metric_time__day)
-    , COALESCE(subq_21.metric_time__month, subq_26.metric_time__month)
-    , COALESCE(subq_21.metric_time__year, subq_26.metric_time__year)
-) subq_27
+    COALESCE(subq_20.metric_time__day, subq_25.metric_time__day)
+    , COALESCE(subq_20.metric_time__month, subq_25.metric_time__month)
+    , COALESCE(subq_20.metric_time__year, subq_25.metric_time__year)
+) subq_26
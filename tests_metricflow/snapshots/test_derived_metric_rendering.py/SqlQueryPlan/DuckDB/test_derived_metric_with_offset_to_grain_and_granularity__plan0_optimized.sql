@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_18.metric_time__week, subq_26.metric_time__week) AS metric_time__week
-    , MAX(subq_18.bookings) AS bookings
-    , MAX(subq_26.bookings_at_start_of_month) AS bookings_at_start_of_month
+    COALESCE(subq_17.metric_time__week, subq_25.metric_time__week) AS metric_time__week
+    , MAX(subq_17.bookings) AS bookings
+    , MAX(subq_25.bookings_at_start_of_month) AS bookings_at_start_of_month
   FROM (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -22,19 +22,19 @@ FROM (
         DATE_TRUNC('week', ds) AS metric_time__week
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_16
+    ) subq_15
     GROUP BY
       metric_time__week
-  ) subq_18
+  ) subq_17
   FULL OUTER JOIN (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['bookings', 'metric_time__week']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      DATE_TRUNC('week', subq_22.ds) AS metric_time__week
-      , SUM(subq_20.bookings) AS bookings_at_start_of_month
-    FROM ***************************.mf_time_spine subq_22
+      DATE_TRUNC('week', subq_21.ds) AS metric_time__week
+      , SUM(subq_19.bookings) AS bookings_at_start_of_month
+    FROM ***************************.mf_time_spine subq_21
     INNER JOIN (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -42,15 +42,15 @@ FROM (
         DATE_TRUNC('day', ds) AS metric_time__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_20
+    ) subq_19
     ON
-      DATE_TRUNC('month', subq_22.ds) = subq_20.metric_time__day
-    WHERE DATE_TRUNC('week', subq_22.ds) = subq_22.ds
+      DATE_TRUNC('month', subq_21.ds) = subq_19.metric_time__day
+    WHERE DATE_TRUNC('week', subq_21.ds) = subq_21.ds
     GROUP BY
-      DATE_TRUNC('week', subq_22.ds)
-  ) subq_26
+      DATE_TRUNC('week', subq_21.ds)
+  ) subq_25
   ON
-    subq_18.metric_time__week = subq_26.metric_time__week
+    subq_17.metric_time__week = subq_25.metric_time__week
   GROUP BY
-    COALESCE(subq_18.metric_time__week, subq_26.metric_time__week)
-) subq_27
+    COALESCE(subq_17.metric_time__week, subq_25.metric_time__week)
+) subq_26
@@ -1,13 +1,13 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_13.booking__ds__day
+  subq_12.booking__ds__day
   , booking_value * 0.05 / bookers AS booking_fees_last_week_per_booker_this_week
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_7.booking__ds__day, subq_12.booking__ds__day) AS booking__ds__day
+    COALESCE(subq_7.booking__ds__day, subq_11.booking__ds__day) AS booking__ds__day
     , MAX(subq_7.booking_value) AS booking_value
-    , MAX(subq_12.bookers) AS bookers
+    , MAX(subq_11.bookers) AS bookers
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -336,119 +336,119 @@ FROM (
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_11.booking__ds__day
-      , subq_11.bookers
+      subq_10.booking__ds__day
+      , subq_10.bookers
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_10.booking__ds__day
-        , COUNT(DISTINCT subq_10.bookers) AS bookers
+        subq_9.booking__ds__day
+        , COUNT(DISTINCT subq_9.bookers) AS bookers
       FROM (
         -- Pass Only Elements: ['bookers', 'booking__ds__day']
         SELECT
-          subq_9.booking__ds__day
-          , subq_9.bookers
+          subq_8.booking__ds__day
+          , subq_8.bookers
         FROM (
           -- Metric Time Dimension 'ds'
           SELECT
-            subq_8.ds__day
-            , subq_8.ds__week
-            , subq_8.ds__month
-            , subq_8.ds__quarter
-            , subq_8.ds__year
-            , subq_8.ds__extract_year
-            , subq_8.ds__extract_quarter
-            , subq_8.ds__extract_month
-            , subq_8.ds__extract_day
-            , subq_8.ds__extract_dow
-            , subq_8.ds__extract_doy
-            , subq_8.ds_partitioned__day
-            , subq_8.ds_partitioned__week
-            , subq_8.ds_partitioned__month
-            , subq_8.ds_partitioned__quarter
-            , subq_8.ds_partitioned__year
-            , subq_8.ds_partitioned__extract_year
-            , subq_8.ds_partitioned__extract_quarter
-            , subq_8.ds_partitioned__extract_month
-            , subq_8.ds_partitioned__extract_day
-            , subq_8.ds_partitioned__extract_dow
-            , subq_8.ds_partitioned__extract_doy
-            , subq_8.paid_at__day
-            , subq_8.paid_at__week
-            , subq_8.paid_at__month
-            , subq_8.paid_at__quarter
-            , subq_8.paid_at__year
-            , subq_8.paid_at__extract_year
-            , subq_8.paid_at__extract_quarter
-            , subq_8.paid_at__extract_month
-            , subq_8.paid_at__extract_day
-            , subq_8.paid_at__extract_dow
-            , subq_8.paid_at__extract_doy
-            , subq_8.booking__ds__day
-            , subq_8.booking__ds__week
-            , subq_8.booking__ds__month
-            , subq_8.booking__ds__quarter
-            , subq_8.booking__ds__year
-            , subq_8.booking__ds__extract_year
-            , subq_8.booking__ds__extract_quarter
-            , subq_8.booking__ds__extract_month
-            , subq_8.booking__ds__extract_day
-            , subq_8.booking__ds__extract_dow
-            , subq_8.booking__ds__extract_doy
-            , subq_8.booking__ds_partitioned__day
-            , subq_8.booking__ds_partitioned__week
-            , subq_8.booking__ds_partitioned__month
-            , subq_8.booking__ds_partitioned__quarter
-            , subq_8.booking__ds_partitioned__year
-            , subq_8.booking__ds_partitioned__extract_year
-            , subq_8.booking__ds_partitioned__extract_quarter
-            , subq_8.booking__ds_partitioned__extract_month
-            , subq_8.booking__ds_partitioned__extract_day
-            , subq_8.booking__ds_partitioned__extract_dow
-            , subq_8.booking__ds_partitioned__extract_doy
-            , subq_8.booking__paid_at__day
-            , subq_8.booking__paid_at__week
-            , subq_8.booking__paid_at__month
-            , subq_8.booking__paid_at__quarter
-            , subq_8.booking__paid_at__year
-            , subq_8.booking__paid_at__extract_year
-            , subq_8.booking__paid_at__extract_quarter
-            , subq_8.booking__paid_at__extract_month
-            , subq_8.booking__paid_at__extract_day
-            , subq_8.booking__paid_at__extract_dow
-            , subq_8.booking__paid_at__extract_doy
-            , subq_8.ds__day AS metric_time__day
-            , subq_8.ds__week AS metric_time__week
-            , subq_8.ds__month AS metric_time__month
-            , subq_8.ds__quarter AS metric_time__quarter
-            , subq_8.ds__year AS metric_time__year
-            , subq_8.ds__extract_year AS metric_time__extract_year
-            , subq_8.ds__extract_quarter AS metric_time__extract_quarter
-            , subq_8.ds__extract_month AS metric_time__extract_month
-            , subq_8.ds__extract_day AS metric_time__extract_day
-            , subq_8.ds__extract_dow AS metric_time__extract_dow
-            , subq_8.ds__extract_doy AS metric_time__extract_doy
-            , subq_8.listing
-            , subq_8.guest
-            , subq_8.host
-            , subq_8.booking__listing
-            , subq_8.booking__guest
-            , subq_8.booking__host
-            , subq_8.is_instant
-            , subq_8.booking__is_instant
-            , subq_8.bookings
-            , subq_8.instant_bookings
-            , subq_8.booking_value
-            , subq_8.max_booking_value
-            , subq_8.min_booking_value
-            , subq_8.bookers
-            , subq_8.average_booking_value
-            , subq_8.referred_bookings
-            , subq_8.median_booking_value
-            , subq_8.booking_value_p99
-            , subq_8.discrete_booking_value_p99
-            , subq_8.approximate_continuous_booking_value_p99
-            , subq_8.approximate_discrete_booking_value_p99
+            subq_0.ds__day
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.ds__extract_day
+            , subq_0.ds__extract_dow
+            , subq_0.ds__extract_doy
+            , subq_0.ds_partitioned__day
+            , subq_0.ds_partitioned__week
+            , subq_0.ds_partitioned__month
+            , subq_0.ds_partitioned__quarter
+            , subq_0.ds_partitioned__year
+            , subq_0.ds_partitioned__extract_year
+            , subq_0.ds_partitioned__extract_quarter
+            , subq_0.ds_partitioned__extract_month
+            , subq_0.ds_partitioned__extract_day
+            , subq_0.ds_partitioned__extract_dow
+            , subq_0.ds_partitioned__extract_doy
+            , subq_0.paid_at__day
+            , subq_0.paid_at__week
+            , subq_0.paid_at__month
+            , subq_0.paid_at__quarter
+            , subq_0.paid_at__year
+            , subq_0.paid_at__extract_year
+            , subq_0.paid_at__extract_quarter
+            , subq_0.paid_at__extract_month
+            , subq_0.paid_at__extract_day
+            , subq_0.paid_at__extract_dow
+            , subq_0.paid_at__extract_doy
+            , subq_0.booking__ds__day
+            , subq_0.booking__ds__week
+            , subq_0.booking__ds__month
+            , subq_0.booking__ds__quarter
+            , subq_0.booking__ds__year
+            , subq_0.booking__ds__extract_year
+            , subq_0.booking__ds__extract_quarter
+            , subq_0.booking__ds__extract_month
+            , subq_0.booking__ds__extract_day
+            , subq_0.booking__ds__extract_dow
+            , subq_0.booking__ds__extract_doy
+            , subq_0.booking__ds_partitioned__day
+            , subq_0.booking__ds_partitioned__week
+            , subq_0.booking__ds_partitioned__month
+            , subq_0.booking__ds_partitioned__quarter
+            , subq_0.booking__ds_partitioned__year
+            , subq_0.booking__ds_partitioned__extract_year
+            , subq_0.booking__ds_partitioned__extract_quarter
+            , subq_0.booking__ds_partitioned__extract_month
+            , subq_0.booking__ds_partitioned__extract_day
+            , subq_0.booking__ds_partitioned__extract_dow
+            , subq_0.booking__ds_partitioned__extract_doy
+            , subq_0.booking__paid_at__day
+            , subq_0.booking__paid_at__week
+            , subq_0.booking__paid_at__month
+            , subq_0.booking__paid_at__quarter
+            , subq_0.booking__paid_at__year
+            , subq_0.booking__paid_at__extract_year
+            , subq_0.booking__paid_at__extract_quarter
+            , subq_0.booking__paid_at__extract_month
+            , subq_0.booking__paid_at__extract_day
+            , subq_0.booking__paid_at__extract_dow
+            , subq_0.booking__paid_at__extract_doy
+            , subq_0.ds__day AS metric_time__day
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.ds__extract_day AS metric_time__extract_day
+            , subq_0.ds__extract_dow AS metric_time__extract_dow
+            , subq_0.ds__extract_doy AS metric_time__extract_doy
+            , subq_0.listing
+            , subq_0.guest
+            , subq_0.host
+            , subq_0.booking__listing
+            , subq_0.booking__guest
+            , subq_0.booking__host
+            , subq_0.is_instant
+            , subq_0.booking__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+            , subq_0.min_booking_value
+            , subq_0.bookers
+            , subq_0.average_booking_value
+            , subq_0.referred_bookings
+            , subq_0.median_booking_value
+            , subq_0.booking_value_p99
+            , subq_0.discrete_booking_value_p99
+            , subq_0.approximate_continuous_booking_value_p99
+            , subq_0.approximate_discrete_booking_value_p99
           FROM (
             -- Read Elements From Semantic Model 'bookings_source'
             SELECT
@@ -541,15 +541,15 @@ FROM (
               , bookings_source_src_28000.guest_id AS booking__guest
               , bookings_source_src_28000.host_id AS booking__host
             FROM ***************************.fct_bookings bookings_source_src_28000
-          ) subq_8
-        ) subq_9
-      ) subq_10
+          ) subq_0
+        ) subq_8
+      ) subq_9
       GROUP BY
-        subq_10.booking__ds__day
-    ) subq_11
-  ) subq_12
+        subq_9.booking__ds__day
+    ) subq_10
+  ) subq_11
   ON
-    subq_7.booking__ds__day = subq_12.booking__ds__day
+    subq_7.booking__ds__day = subq_11.booking__ds__day
   GROUP BY
-    COALESCE(subq_7.booking__ds__day, subq_12.booking__ds__day)
-) subq_13
+    COALESCE(subq_7.booking__ds__day, subq_11.booking__ds__day)
+) subq_12
@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_27.metric_time__month, subq_34.metric_time__month) AS metric_time__month
-    , MAX(subq_27.booking_value) AS booking_value
-    , MAX(subq_34.bookers) AS bookers
+    COALESCE(subq_26.metric_time__month, subq_33.metric_time__month) AS metric_time__month
+    , MAX(subq_26.booking_value) AS booking_value
+    , MAX(subq_33.bookers) AS bookers
   FROM (
     -- Constrain Output with WHERE
     -- Pass Only Elements: ['booking_value', 'metric_time__month']
@@ -20,19 +20,19 @@ FROM (
       -- Join to Time Spine Dataset
       -- Pass Only Elements: ['booking_value', 'metric_time__month', 'metric_time__day']
       SELECT
-        subq_21.ds AS metric_time__day
-        , DATE_TRUNC('month', subq_21.ds) AS metric_time__month
+        subq_20.ds AS metric_time__day
+        , DATE_TRUNC('month', subq_20.ds) AS metric_time__month
         , bookings_source_src_28000.booking_value AS booking_value
-      FROM ***************************.mf_time_spine subq_21
+      FROM ***************************.mf_time_spine subq_20
       INNER JOIN
         ***************************.fct_bookings bookings_source_src_28000
       ON
-        subq_21.ds - MAKE_INTERVAL(weeks => 1) = DATE_TRUNC('day', bookings_source_src_28000.ds)
-    ) subq_23
+        subq_20.ds - MAKE_INTERVAL(weeks => 1) = DATE_TRUNC('day', bookings_source_src_28000.ds)
+    ) subq_22
     WHERE metric_time__day = '2020-01-01'
     GROUP BY
       metric_time__month
-  ) subq_27
+  ) subq_26
   FULL OUTER JOIN (
     -- Constrain Output with WHERE
     -- Pass Only Elements: ['bookers', 'metric_time__month']
@@ -50,13 +50,13 @@ FROM (
         , DATE_TRUNC('month', ds) AS metric_time__month
         , guest_id AS bookers
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_30
+    ) subq_29
     WHERE metric_time__day = '2020-01-01'
     GROUP BY
       metric_time__month
-  ) subq_34
+  ) subq_33
   ON
-    subq_27.metric_time__month = subq_34.metric_time__month
+    subq_26.metric_time__month = subq_33.metric_time__month
   GROUP BY
-    COALESCE(subq_27.metric_time__month, subq_34.metric_time__month)
-) subq_35
+    COALESCE(subq_26.metric_time__month, subq_33.metric_time__month)
+) subq_34
@@ -8,9 +8,9 @@ FROM (
   FROM (
     -- Combine Aggregated Outputs
     SELECT
-      MAX(subq_45.average_booking_value) AS average_booking_value
-      , MAX(subq_45.bookings) AS bookings
-      , MAX(subq_52.booking_value) AS booking_value
+      MAX(subq_42.average_booking_value) AS average_booking_value
+      , MAX(subq_42.bookings) AS bookings
+      , MAX(subq_49.booking_value) AS booking_value
     FROM (
       -- Constrain Output with WHERE
       -- Pass Only Elements: ['average_booking_value', 'bookings']
@@ -24,8 +24,8 @@ FROM (
         -- Pass Only Elements: ['average_booking_value', 'bookings', 'listing__is_lux_latest', 'booking__is_instant']
         SELECT
           listings_latest_src_28000.is_lux AS listing__is_lux_latest
-          , subq_36.bookings AS bookings
-          , subq_36.average_booking_value AS average_booking_value
+          , subq_33.bookings AS bookings
+          , subq_33.average_booking_value AS average_booking_value
         FROM (
           -- Constrain Output with WHERE
           -- Pass Only Elements: ['average_booking_value', 'bookings', 'booking__is_instant', 'listing']
@@ -42,16 +42,16 @@ FROM (
               , 1 AS bookings
               , booking_value AS average_booking_value
             FROM ***************************.fct_bookings bookings_source_src_28000
-          ) subq_34
+          ) subq_31
           WHERE booking__is_instant
-        ) subq_36
+        ) subq_33
         LEFT OUTER JOIN
           ***************************.dim_listings_latest listings_latest_src_28000
         ON
-          subq_36.listing = listings_latest_src_28000.listing_id
-      ) subq_41
+          subq_33.listing = listings_latest_src_28000.listing_id
+      ) subq_38
       WHERE listing__is_lux_latest
-    ) subq_45
+    ) subq_42
     CROSS JOIN (
       -- Constrain Output with WHERE
       -- Pass Only Elements: ['booking_value', 'booking__is_instant']
@@ -67,8 +67,8 @@ FROM (
           is_instant AS booking__is_instant
           , booking_value
         FROM ***************************.fct_bookings bookings_source_src_28000
-      ) subq_47
+      ) subq_44
       WHERE booking__is_instant
-    ) subq_52
-  ) subq_53
-) subq_54
+    ) subq_49
+  ) subq_50
+) subq_51
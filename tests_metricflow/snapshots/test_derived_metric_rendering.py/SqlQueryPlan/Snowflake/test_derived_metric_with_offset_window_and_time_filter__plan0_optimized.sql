@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_21.metric_time__day, subq_30.metric_time__day) AS metric_time__day
-    , MAX(subq_21.bookings) AS bookings
-    , MAX(subq_30.bookings_2_weeks_ago) AS bookings_2_weeks_ago
+    COALESCE(subq_20.metric_time__day, subq_29.metric_time__day) AS metric_time__day
+    , MAX(subq_20.bookings) AS bookings
+    , MAX(subq_29.bookings_2_weeks_ago) AS bookings_2_weeks_ago
   FROM (
     -- Constrain Output with WHERE
     -- Aggregate Measures
@@ -23,11 +23,11 @@ FROM (
         DATE_TRUNC('day', ds) AS metric_time__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_18
+    ) subq_17
     WHERE metric_time__day = '2020-01-01' or metric_time__day = '2020-01-14'
     GROUP BY
       metric_time__day
-  ) subq_21
+  ) subq_20
   FULL OUTER JOIN (
     -- Constrain Output with WHERE
     -- Aggregate Measures
@@ -39,9 +39,9 @@ FROM (
       -- Join to Time Spine Dataset
       -- Pass Only Elements: ['bookings', 'metric_time__day']
       SELECT
-        subq_25.ds AS metric_time__day
-        , subq_23.bookings AS bookings
-      FROM ***************************.mf_time_spine subq_25
+        subq_24.ds AS metric_time__day
+        , subq_22.bookings AS bookings
+      FROM ***************************.mf_time_spine subq_24
       INNER JOIN (
         -- Read Elements From Semantic Model 'bookings_source'
         -- Metric Time Dimension 'ds'
@@ -49,16 +49,16 @@ FROM (
           DATE_TRUNC('day', ds) AS metric_time__day
           , 1 AS bookings
         FROM ***************************.fct_bookings bookings_source_src_28000
-      ) subq_23
+      ) subq_22
       ON
-        DATEADD(day, -14, subq_25.ds) = subq_23.metric_time__day
-    ) subq_27
+        DATEADD(day, -14, subq_24.ds) = subq_22.metric_time__day
+    ) subq_26
     WHERE metric_time__day = '2020-01-01' or metric_time__day = '2020-01-14'
     GROUP BY
       metric_time__day
-  ) subq_30
+  ) subq_29
   ON
-    subq_21.metric_time__day = subq_30.metric_time__day
+    subq_20.metric_time__day = subq_29.metric_time__day
   GROUP BY
-    COALESCE(subq_21.metric_time__day, subq_30.metric_time__day)
-) subq_31
+    COALESCE(subq_20.metric_time__day, subq_29.metric_time__day)
+) subq_30
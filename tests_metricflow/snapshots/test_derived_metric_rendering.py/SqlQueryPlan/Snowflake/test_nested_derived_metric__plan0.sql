@@ -1,25 +1,25 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_22.metric_time__day
+  subq_19.metric_time__day
   , non_referred + (instant * 1.0 / bookings) AS instant_plus_non_referred_bookings_pct
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_11.metric_time__day, subq_16.metric_time__day, subq_21.metric_time__day) AS metric_time__day
-    , MAX(subq_11.non_referred) AS non_referred
-    , MAX(subq_16.instant) AS instant
-    , MAX(subq_21.bookings) AS bookings
+    COALESCE(subq_10.metric_time__day, subq_14.metric_time__day, subq_18.metric_time__day) AS metric_time__day
+    , MAX(subq_10.non_referred) AS non_referred
+    , MAX(subq_14.instant) AS instant
+    , MAX(subq_18.bookings) AS bookings
   FROM (
     -- Compute Metrics via Expressions
     SELECT
-      subq_10.metric_time__day
+      subq_9.metric_time__day
       , (bookings - ref_bookings) * 1.0 / bookings AS non_referred
     FROM (
       -- Combine Aggregated Outputs
       SELECT
-        COALESCE(subq_4.metric_time__day, subq_9.metric_time__day) AS metric_time__day
+        COALESCE(subq_4.metric_time__day, subq_8.metric_time__day) AS metric_time__day
         , MAX(subq_4.ref_bookings) AS ref_bookings
-        , MAX(subq_9.bookings) AS bookings
+        , MAX(subq_8.bookings) AS bookings
       FROM (
         -- Compute Metrics via Expressions
         SELECT
@@ -238,119 +238,119 @@ FROM (
       FULL OUTER JOIN (
         -- Compute Metrics via Expressions
         SELECT
-          subq_8.metric_time__day
-          , subq_8.bookings
+          subq_7.metric_time__day
+          , subq_7.bookings
         FROM (
           -- Aggregate Measures
           SELECT
-            subq_7.metric_time__day
-            , SUM(subq_7.bookings) AS bookings
+            subq_6.metric_time__day
+            , SUM(subq_6.bookings) AS bookings
           FROM (
             -- Pass Only Elements: ['bookings', 'metric_time__day']
             SELECT
-              subq_6.metric_time__day
-              , subq_6.bookings
+              subq_5.metric_time__day
+              , subq_5.bookings
             FROM (
               -- Metric Time Dimension 'ds'
               SELECT
-                subq_5.ds__day
-                , subq_5.ds__week
-                , subq_5.ds__month
-                , subq_5.ds__quarter
-                , subq_5.ds__year
-                , subq_5.ds__extract_year
-                , subq_5.ds__extract_quarter
-                , subq_5.ds__extract_month
-                , subq_5.ds__extract_day
-                , subq_5.ds__extract_dow
-                , subq_5.ds__extract_doy
-                , subq_5.ds_partitioned__day
-                , subq_5.ds_partitioned__week
-                , subq_5.ds_partitioned__month
-                , subq_5.ds_partitioned__quarter
-                , subq_5.ds_partitioned__year
-                , subq_5.ds_partitioned__extract_year
-                , subq_5.ds_partitioned__extract_quarter
-                , subq_5.ds_partitioned__extract_month
-                , subq_5.ds_partitioned__extract_day
-                , subq_5.ds_partitioned__extract_dow
-                , subq_5.ds_partitioned__extract_doy
-                , subq_5.paid_at__day
-                , subq_5.paid_at__week
-                , subq_5.paid_at__month
-                , subq_5.paid_at__quarter
-                , subq_5.paid_at__year
-                , subq_5.paid_at__extract_year
-                , subq_5.paid_at__extract_quarter
-                , subq_5.paid_at__extract_month
-                , subq_5.paid_at__extract_day
-                , subq_5.paid_at__extract_dow
-                , subq_5.paid_at__extract_doy
-                , subq_5.booking__ds__day
-                , subq_5.booking__ds__week
-                , subq_5.booking__ds__month
-                , subq_5.booking__ds__quarter
-                , subq_5.booking__ds__year
-                , subq_5.booking__ds__extract_year
-                , subq_5.booking__ds__extract_quarter
-                , subq_5.booking__ds__extract_month
-                , subq_5.booking__ds__extract_day
-                , subq_5.booking__ds__extract_dow
-                , subq_5.booking__ds__extract_doy
-                , subq_5.booking__ds_partitioned__day
-                , subq_5.booking__ds_partitioned__week
-                , subq_5.booking__ds_partitioned__month
-                , subq_5.booking__ds_partitioned__quarter
-                , subq_5.booking__ds_partitioned__year
-                , subq_5.booking__ds_partitioned__extract_year
-                , subq_5.booking__ds_partitioned__extract_quarter
-                , subq_5.booking__ds_partitioned__extract_month
-                , subq_5.booking__ds_partitioned__extract_day
-                , subq_5.booking__ds_partitioned__extract_dow
-                , subq_5.booking__ds_partitioned__extract_doy
-                , subq_5.booking__paid_at__day
-                , subq_5.booking__paid_at__week
-                , subq_5.booking__paid_at__month
-                , subq_5.booking__paid_at__quarter
-                , subq_5.booking__paid_at__year
-                , subq_5.booking__paid_at__extract_year
-                , subq_5.booking__paid_at__extract_quarter
-                , subq_5.booking__paid_at__extract_month
-                , subq_5.booking__paid_at__extract_day
-                , subq_5.booking__paid_at__extract_dow
-                , subq_5.booking__paid_at__extract_doy
-                , subq_5.ds__day AS metric_time__day
-                , subq_5.ds__week AS metric_time__week
-                , subq_5.ds__month AS metric_time__month
-                , subq_5.ds__quarter AS metric_time__quarter
-                , subq_5.ds__year AS metric_time__year
-                , subq_5.ds__extract_year AS metric_time__extract_year
-                , subq_5.ds__extract_quarter AS metric_time__extract_quarter
-                , subq_5.ds__extract_month AS metric_time__extract_month
-                , subq_5.ds__extract_day AS metric_time__extract_day
-                , subq_5.ds__extract_dow AS metric_time__extract_dow
-                , subq_5.ds__extract_doy AS metric_time__extract_doy
-                , subq_5.listing
-                , subq_5.guest
-                , subq_5.host
-                , subq_5.booking__listing
-                , subq_5.booking__guest
-                , subq_5.booking__host
-                , subq_5.is_instant
-                , subq_5.booking__is_instant
-                , subq_5.bookings
-                , subq_5.instant_bookings
-                , subq_5.booking_value
-                , subq_5.max_booking_value
-                , subq_5.min_booking_value
-                , subq_5.bookers
-                , subq_5.average_booking_value
-                , subq_5.referred_bookings
-                , subq_5.median_booking_value
-                , subq_5.booking_value_p99
-                , subq_5.discrete_booking_value_p99
-                , subq_5.approximate_continuous_booking_value_p99
-                , subq_5.approximate_discrete_booking_value_p99
+                subq_0.ds__day
+                , subq_0.ds__week
+                , subq_0.ds__month
+                , subq_0.ds__quarter
+                , subq_0.ds__year
+                , subq_0.ds__extract_year
+                , subq_0.ds__extract_quarter
+                , subq_0.ds__extract_month
+                , subq_0.ds__extract_day
+                , subq_0.ds__extract_dow
+                , subq_0.ds__extract_doy
+                , subq_0.ds_partitioned__day
+                , subq_0.ds_partitioned__week
+                , subq_0.ds_partitioned__month
+                , subq_0.ds_partitioned__quarter
+                , subq_0.ds_partitioned__year
+                , subq_0.ds_partitioned__extract_year
+                , subq_0.ds_partitioned__extract_quarter
+                , subq_0.ds_partitioned__extract_month
+                , subq_0.ds_partitioned__extract_day
+                , subq_0.ds_partitioned__extract_dow
+                , subq_0.ds_partitioned__extract_doy
+                , subq_0.paid_at__day
+                , subq_0.paid_at__week
+                , subq_0.paid_at__month
+                , subq_0.paid_at__quarter
+                , subq_0.paid_at__year
+                , subq_0.paid_at__extract_year
+                , subq_0.paid_at__extract_quarter
+                , subq_0.paid_at__extract_month
+                , subq_0.paid_at__extract_day
+                , subq_0.paid_at__extract_dow
+                , subq_0.paid_at__extract_doy
+                , subq_0.booking__ds__day
+                , subq_0.booking__ds__week
+                , subq_0.booking__ds__month
+                , subq_0.booking__ds__quarter
+                , subq_0.booking__ds__year
+                , subq_0.booking__ds__extract_year
+                , subq_0.booking__ds__extract_quarter
+                , subq_0.booking__ds__extract_month
+                , subq_0.booking__ds__extract_day
+                , subq_0.booking__ds__extract_dow
+                , subq_0.booking__ds__extract_doy
+                , subq_0.booking__ds_partitioned__day
+                , subq_0.booking__ds_partitioned__week
+                , subq_0.booking__ds_partitioned__month
+                , subq_0.booking__ds_partitioned__quarter
+                , subq_0.booking__ds_partitioned__year
+                , subq_0.booking__ds_partitioned__extract_year
+                , subq_0.booking__ds_partitioned__extract_quarter
+                , subq_0.booking__ds_partitioned__extract_month
+                , subq_0.booking__ds_partitioned__extract_day
+                , subq_0.booking__ds_partitioned__extract_dow
+                , subq_0.booking__ds_partitioned__extract_doy
+                , subq_0.booking__paid_at__day
+                , subq_0.booking__paid_at__week
+                , subq_0.booking__paid_at__month
+                , subq_0.booking__paid_at__quarter
+                , subq_0.booking__paid_at__year
+                , subq_0.booking__paid_at__extract_year
+                , subq_0.booking__paid_at__extract_quarter
+                , subq_0.booking__paid_at__extract_month
+                , subq_0.booking__paid_at__extract_day
+                , subq_0.booking__paid_at__extract_dow
+                , subq_0.booking__paid_at__extract_doy
+                , subq_0.ds__day AS metric_time__day
+                , subq_0.ds__week AS metric_time__week
+                , subq_0.ds__month AS metric_time__month
+                , subq_0.ds__quarter AS metric_time__quarter
+                , subq_0.ds__year AS metric_time__year
+                , subq_0.ds__extract_year AS metric_time__extract_year
+                , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+                , subq_0.ds__extract_month AS metric_time__extract_month
+                , subq_0.ds__extract_day AS metric_time__extract_day
+                , subq_0.ds__extract_dow AS metric_time__extract_dow
+                , subq_0.ds__extract_doy AS metric_time__extract_doy
+                , subq_0.listing
+                , subq_0.guest
+                , subq_0.host
+                , subq_0.booking__listing
+                , subq_0.booking__guest
+                , subq_0.booking__host
+                , subq_0.is_instant
+                , subq_0.booking__is_instant
+                , subq_0.bookings
+                , subq_0.instant_bookings
+                , subq_0.booking_value
+                , subq_0.max_booking_value
+                , subq_0.min_booking_value
+                , subq_0.bookers
+                , subq_0.average_booking_value
+                , subq_0.referred_bookings
+                , subq_0.median_booking_value
+                , subq_0.booking_value_p99
+                , subq_0.discrete_booking_value_p99
+                , subq_0.approximate_continuous_booking_value_p99
+                , subq_0.approximate_discrete_booking_value_p99
               FROM (
                 -- Read Elements From Semantic Model 'bookings_source'
                 SELECT
@@ -443,135 +443,135 @@ FROM (
                   , bookings_source_src_28000.guest_id AS booking__guest
                   , bookings_source_src_28000.host_id AS booking__host
                 FROM ***************************.fct_bookings bookings_source_src_28000
-              ) subq_5
-            ) subq_6
-          ) subq_7
+              ) subq_0
+            ) subq_5
+          ) subq_6
           GROUP BY
-            subq_7.metric_time__day
-        ) subq_8
-      ) subq_9
+            subq_6.metric_time__day
+        ) subq_7
+      ) subq_8
       ON
-        subq_4.metric_time__day = subq_9.metric_time__day
+        subq_4.metric_time__day = subq_8.metric_time__day
       GROUP BY
-        COALESCE(subq_4.metric_time__day, subq_9.metric_time__day)
-    ) subq_10
-  ) subq_11
+        COALESCE(subq_4.metric_time__day, subq_8.metric_time__day)
+    ) subq_9
+  ) subq_10
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_15.metric_time__day
-      , subq_15.instant_bookings AS instant
+      subq_13.metric_time__day
+      , subq_13.instant_bookings AS instant
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_14.metric_time__day
-        , SUM(subq_14.instant_bookings) AS instant_bookings
+        subq_12.metric_time__day
+        , SUM(subq_12.instant_bookings) AS instant_bookings
       FROM (
         -- Pass Only Elements: ['instant_bookings', 'metric_time__day']
         SELECT
-          subq_13.metric_time__day
-          , subq_13.instant_bookings
+          subq_11.metric_time__day
+          , subq_11.instant_bookings
         FROM (
           -- Metric Time Dimension 'ds'
           SELECT
-            subq_12.ds__day
-            , subq_12.ds__week
-            , subq_12.ds__month
-            , subq_12.ds__quarter
-            , subq_12.ds__year
-            , subq_12.ds__extract_year
-            , subq_12.ds__extract_quarter
-            , subq_12.ds__extract_month
-            , subq_12.ds__extract_day
-            , subq_12.ds__extract_dow
-            , subq_12.ds__extract_doy
-            , subq_12.ds_partitioned__day
-            , subq_12.ds_partitioned__week
-            , subq_12.ds_partitioned__month
-            , subq_12.ds_partitioned__quarter
-            , subq_12.ds_partitioned__year
-            , subq_12.ds_partitioned__extract_year
-            , subq_12.ds_partitioned__extract_quarter
-            , subq_12.ds_partitioned__extract_month
-            , subq_12.ds_partitioned__extract_day
-            , subq_12.ds_partitioned__extract_dow
-            , subq_12.ds_partitioned__extract_doy
-            , subq_12.paid_at__day
-            , subq_12.paid_at__week
-            , subq_12.paid_at__month
-            , subq_12.paid_at__quarter
-            , subq_12.paid_at__year
-            , subq_12.paid_at__extract_year
-            , subq_12.paid_at__extract_quarter
-            , subq_12.paid_at__extract_month
-            , subq_12.paid_at__extract_day
-            , subq_12.paid_at__extract_dow
-            , subq_12.paid_at__extract_doy
-            , subq_12.booking__ds__day
-            , subq_12.booking__ds__week
-            , subq_12.booking__ds__month
-            , subq_12.booking__ds__quarter
-            , subq_12.booking__ds__year
-            , subq_12.booking__ds__extract_year
-            , subq_12.booking__ds__extract_quarter
-            , subq_12.booking__ds__extract_month
-            , subq_12.booking__ds__extract_day
-            , subq_12.booking__ds__extract_dow
-            , subq_12.booking__ds__extract_doy
-            , subq_12.booking__ds_partitioned__day
-            , subq_12.booking__ds_partitioned__week
-            , subq_12.booking__ds_partitioned__month
-            , subq_12.booking__ds_partitioned__quarter
-            , subq_12.booking__ds_partitioned__year
-            , subq_12.booking__ds_partitioned__extract_year
-            , subq_12.booking__ds_partitioned__extract_quarter
-            , subq_12.booking__ds_partitioned__extract_month
-            , subq_12.booking__ds_partitioned__extract_day
-            , subq_12.booking__ds_partitioned__extract_dow
-            , subq_12.booking__ds_partitioned__extract_doy
-            , subq_12.booking__paid_at__day
-            , subq_12.booking__paid_at__week
-            , subq_12.booking__paid_at__month
-            , subq_12.booking__paid_at__quarter
-            , subq_12.booking__paid_at__year
-            , subq_12.booking__paid_at__extract_year
-            , subq_12.booking__paid_at__extract_quarter
-            , subq_12.booking__paid_at__extract_month
-            , subq_12.booking__paid_at__extract_day
-            , subq_12.booking__paid_at__extract_dow
-            , subq_12.booking__paid_at__extract_doy
-            , subq_12.ds__day AS metric_time__day
-            , subq_12.ds__week AS metric_time__week
-            , subq_12.ds__month AS metric_time__month
-            , subq_12.ds__quarter AS metric_time__quarter
-            , subq_12.ds__year AS metric_time__year
-            , subq_12.ds__extract_year AS metric_time__extract_year
-            , subq_12.ds__extract_quarter AS metric_time__extract_quarter
-            , subq_12.ds__extract_month AS metric_time__extract_month
-            , subq_12.ds__extract_day AS metric_time__extract_day
-            , subq_12.ds__extract_dow AS metric_time__extract_dow
-            , subq_12.ds__extract_doy AS metric_time__extract_doy
-            , subq_12.listing
-            , subq_12.guest
-            , subq_12.host
-            , subq_12.booking__listing
-            , subq_12.booking__guest
-            , subq_12.booking__host
-            , subq_12.is_instant
-            , subq_12.booking__is_instant
-            , subq_12.bookings
-            , subq_12.instant_bookings
-            , subq_12.booking_value
-            , subq_12.max_booking_value
-            , subq_12.min_booking_value
-            , subq_12.bookers
-            , subq_12.average_booking_value
-            , subq_12.referred_bookings
-            , subq_12.median_booking_value
-            , subq_12.booking_value_p99
-            , subq_12.discrete_booking_value_p99
-            , subq_12.approximate_continuous_booking_value_p99
-            , subq_12.approximate_discrete_booking_value_p99
+            subq_0.ds__day
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.ds__extract_day
+            , subq_0.ds__extract_dow
+            , subq_0.ds__extract_doy
+            , subq_0.ds_partitioned__day
+            , subq_0.ds_partitioned__week
+            , subq_0.ds_partitioned__month
+            , subq_0.ds_partitioned__quarter
+            , subq_0.ds_partitioned__year
+            , subq_0.ds_partitioned__extract_year
+            , subq_0.ds_partitioned__extract_quarter
+            , subq_0.ds_partitioned__extract_month
+            , subq_0.ds_partitioned__extract_day
+            , subq_0.ds_partitioned__extract_dow
+            , subq_0.ds_partitioned__extract_doy
+            , subq_0.paid_at__day
+            , subq_0.paid_at__week
+            , subq_0.paid_at__month
+            , subq_0.paid_at__quarter
+            , subq_0.paid_at__year
+            , subq_0.paid_at__extract_year
+            , subq_0.paid_at__extract_quarter
+            , subq_0.paid_at__extract_month
+            , subq_0.paid_at__extract_day
+            , subq_0.paid_at__extract_dow
+            , subq_0.paid_at__extract_doy
+            , subq_0.booking__ds__day
+            , subq_0.booking__ds__week
+            , subq_0.booking__ds__month
+            , subq_0.booking__ds__quarter
+            , subq_0.booking__ds__year
+            , subq_0.booking__ds__extract_year
+            , subq_0.booking__ds__extract_quarter
+            , subq_0.booking__ds__extract_month
+            , subq_0.booking__ds__extract_day
+            , subq_0.booking__ds__extract_dow
+            , subq_0.booking__ds__extract_doy
+            , subq_0.booking__ds_partitioned__day
+            , subq_0.booking__ds_partitioned__week
+            , subq_0.booking__ds_partitioned__month
+            , subq_0.booking__ds_partitioned__quarter
+            , subq_0.booking__ds_partitioned__year
+            , subq_0.booking__ds_partitioned__extract_year
+            , subq_0.booking__ds_partitioned__extract_quarter
+            , subq_0.booking__ds_partitioned__extract_month
+            , subq_0.booking__ds_partitioned__extract_day
+            , subq_0.booking__ds_partitioned__extract_dow
+            , subq_0.booking__ds_partitioned__extract_doy
+            , subq_0.booking__paid_at__day
+            , subq_0.booking__paid_at__week
+            , subq_0.booking__paid_at__month
+            , subq_0.booking__paid_at__quarter
+            , subq_0.booking__paid_at__year
+            , subq_0.booking__paid_at__extract_year
+            , subq_0.booking__paid_at__extract_quarter
+            , subq_0.booking__paid_at__extract_month
+            , subq_0.booking__paid_at__extract_day
+            , subq_0.booking__paid_at__extract_dow
+            , subq_0.booking__paid_at__extract_doy
+            , subq_0.ds__day AS metric_time__day
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.ds__extract_day AS metric_time__extract_day
+            , subq_0.ds__extract_dow AS metric_time__extract_dow
+            , subq_0.ds__extract_doy AS metric_time__extract_doy
+            , subq_0.listing
+            , subq_0.guest
+            , subq_0.host
+            , subq_0.booking__listing
+            , subq_0.booking__guest
+            , subq_0.booking__host
+            , subq_0.is_instant
+            , subq_0.booking__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+            , subq_0.min_booking_value
+            , subq_0.bookers
+            , subq_0.average_booking_value
+            , subq_0.referred_bookings
+            , subq_0.median_booking_value
+            , subq_0.booking_value_p99
+            , subq_0.discrete_booking_value_p99
+            , subq_0.approximate_continuous_booking_value_p99
+            , subq_0.approximate_discrete_booking_value_p99
           FROM (
             -- Read Elements From Semantic Model 'bookings_source'
             SELECT
@@ -664,131 +664,131 @@ FROM (
               , bookings_source_src_28000.guest_id AS booking__guest
               , bookings_source_src_28000.host_id AS booking__host
             FROM ***************************.fct_bookings bookings_source_src_28000
-          ) subq_12
-        ) subq_13
-      ) subq_14
+          ) subq_0
+        ) subq_11
+      ) subq_12
       GROUP BY
-        subq_14.metric_time__day
-    ) subq_15
-  ) subq_16
+        subq_12.metric_time__day
+    ) subq_13
+  ) subq_14
   ON
-    subq_11.metric_time__day = subq_16.metric_time__day
+    subq_10.metric_time__day = subq_14.metric_time__day
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_20.metric_time__day
-      , subq_20.bookings
+      subq_17.metric_time__day
+      , subq_17.bookings
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_19.metric_time__day
-        , SUM(subq_19.bookings) AS bookings
+        subq_16.metric_time__day
+        , SUM(subq_16.bookings) AS bookings
       FROM (
         -- Pass Only Elements: ['bookings', 'metric_time__day']
         SELECT
-          subq_18.metric_time__day
-          , subq_18.bookings
+          subq_15.metric_time__day
+          , subq_15.bookings
         FROM (
           -- Metric Time Dimension 'ds'
           SELECT
-            subq_17.ds__day
-            , subq_17.ds__week
-            , subq_17.ds__month
-            , subq_17.ds__quarter
-            , subq_17.ds__year
-            , subq_17.ds__extract_year
-            , subq_17.ds__extract_quarter
-            , subq_17.ds__extract_month
-            , subq_17.ds__extract_day
-            , subq_17.ds__extract_dow
-            , subq_17.ds__extract_doy
-            , subq_17.ds_partitioned__day
-            , subq_17.ds_partitioned__week
-            , subq_17.ds_partitioned__month
-            , subq_17.ds_partitioned__quarter
-            , subq_17.ds_partitioned__year
-            , subq_17.ds_partitioned__extract_year
-            , subq_17.ds_partitioned__extract_quarter
-            , subq_17.ds_partitioned__extract_month
-            , subq_17.ds_partitioned__extract_day
-            , subq_17.ds_partitioned__extract_dow
-            , subq_17.ds_partitioned__extract_doy
-            , subq_17.paid_at__day
-            , subq_17.paid_at__week
-            , subq_17.paid_at__month
-            , subq_17.paid_at__quarter
-            , subq_17.paid_at__year
-            , subq_17.paid_at__extract_year
-            , subq_17.paid_at__extract_quarter
-            , subq_17.paid_at__extract_month
-            , subq_17.paid_at__extract_day
-            , subq_17.paid_at__extract_dow
-            , subq_17.paid_at__extract_doy
-            , subq_17.booking__ds__day
-            , subq_17.booking__ds__week
-            , subq_17.booking__ds__month
-            , subq_17.booking__ds__quarter
-            , subq_17.booking__ds__year
-            , subq_17.booking__ds__extract_year
-            , subq_17.booking__ds__extract_quarter
-            , subq_17.booking__ds__extract_month
-            , subq_17.booking__ds__extract_day
-            , subq_17.booking__ds__extract_dow
-            , subq_17.booking__ds__extract_doy
-            , subq_17.booking__ds_partitioned__day
-            , subq_17.booking__ds_partitioned__week
-            , subq_17.booking__ds_partitioned__month
-            , subq_17.booking__ds_partitioned__quarter
-            , subq_17.booking__ds_partitioned__year
-            , subq_17.booking__ds_partitioned__extract_year
-            , subq_17.booking__ds_partitioned__extract_quarter
-            , subq_17.booking__ds_partitioned__extract_month
-            , subq_17.booking__ds_partitioned__extract_day
-            , subq_17.booking__ds_partitioned__extract_dow
-            , subq_17.booking__ds_partitioned__extract_doy
-            , subq_17.booking__paid_at__day
-            , subq_17.booking__paid_at__week
-            , subq_17.booking__paid_at__month
-            , subq_17.booking__paid_at__quarter
-            , subq_17.booking__paid_at__year
-            , subq_17.booking__paid_at__extract_year
-            , subq_17.booking__paid_at__extract_quarter
-            , subq_17.booking__paid_at__extract_month
-            , subq_17.booking__paid_at__extract_day
-            , subq_17.booking__paid_at__extract_dow
-            , subq_17.booking__paid_at__extract_doy
-            , subq_17.ds__day AS metric_time__day
-            , subq_17.ds__week AS metric_time__week
-            , subq_17.ds__month AS metric_time__month
-            , subq_17.ds__quarter AS metric_time__quarter
-            , subq_17.ds__year AS metric_time__year
-            , subq_17.ds__extract_year AS metric_time__extract_year
-            , subq_17.ds__extract_quarter AS metric_time__extract_quarter
-            , subq_17.ds__extract_month AS metric_time__extract_month
-            , subq_17.ds__extract_day AS metric_time__extract_day
-            , subq_17.ds__extract_dow AS metric_time__extract_dow
-            , subq_17.ds__extract_doy AS metric_time__extract_doy
-            , subq_17.listing
-            , subq_17.guest
-            , subq_17.host
-            , subq_17.booking__listing
-            , subq_17.booking__guest
-            , subq_17.booking__host
-            , subq_17.is_instant
-            , subq_17.booking__is_instant
-            , subq_17.bookings
-            , subq_17.instant_bookings
-            , subq_17.booking_value
-            , subq_17.max_booking_value
-            , subq_17.min_booking_value
-            , subq_17.bookers
-            , subq_17.average_booking_value
-            , subq_17.referred_bookings
-            , subq_17.median_booking_value
-            , subq_17.booking_value_p99
-            , subq_17.discrete_booking_value_p99
-            , subq_17.approximate_continuous_booking_value_p99
-            , subq_17.approximate_discrete_booking_value_p99
+            subq_0.ds__day
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.ds__extract_day
+            , subq_0.ds__extract_dow
+            , subq_0.ds__extract_doy
+            , subq_0.ds_partitioned__day
+            , subq_0.ds_partitioned__week
+            , subq_0.ds_partitioned__month
+            , subq_0.ds_partitioned__quarter
+            , subq_0.ds_partitioned__year
+            , subq_0.ds_partitioned__extract_year
+            , subq_0.ds_partitioned__extract_quarter
+            , subq_0.ds_partitioned__extract_month
+            , subq_0.ds_partitioned__extract_day
+            , subq_0.ds_partitioned__extract_dow
+            , subq_0.ds_partitioned__extract_doy
+            , subq_0.paid_at__day
+            , subq_0.paid_at__week
+            , subq_0.paid_at__month
+            , subq_0.paid_at__quarter
+            , subq_0.paid_at__year
+            , subq_0.paid_at__extract_year
+            , subq_0.paid_at__extract_quarter
+            , subq_0.paid_at__extract_month
+            , subq_0.paid_at__extract_day
+            , subq_0.paid_at__extract_dow
+            , subq_0.paid_at__extract_doy
+            , subq_0.booking__ds__day
+            , subq_0.booking__ds__week
+            , subq_0.booking__ds__month
+            , subq_0.booking__ds__quarter
+            , subq_0.booking__ds__year
+            , subq_0.booking__ds__extract_year
+            , subq_0.booking__ds__extract_quarter
+            , subq_0.booking__ds__extract_month
+            , subq_0.booking__ds__extract_day
+            , subq_0.booking__ds__extract_dow
+            , subq_0.booking__ds__extract_doy
+            , subq_0.booking__ds_partitioned__day
+            , subq_0.booking__ds_partitioned__week
+            , subq_0.booking__ds_partitioned__month
+            , subq_0.booking__ds_partitioned__quarter
+            , subq_0.booking__ds_partitioned__year
+            , subq_0.booking__ds_partitioned__extract_year
+            , subq_0.booking__ds_partitioned__extract_quarter
+            , subq_0.booking__ds_partitioned__extract_month
+            , subq_0.booking__ds_partitioned__extract_day
+            , subq_0.booking__ds_partitioned__extract_dow
+            , subq_0.booking__ds_partitioned__extract_doy
+            , subq_0.booking__paid_at__day
+            , subq_0.booking__paid_at__week
+            , subq_0.booking__paid_at__month
+            , subq_0.booking__paid_at__quarter
+            , subq_0.booking__paid_at__year
+            , subq_0.booking__paid_at__extract_year
+            , subq_0.booking__paid_at__extract_quarter
+            , subq_0.booking__paid_at__extract_month
+            , subq_0.booking__paid_at__extract_day
+            , subq_0.booking__paid_at__extract_dow
+            , subq_0.booking__paid_at__extract_doy
+            , subq_0.ds__day AS metric_time__day
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.ds__extract_day AS metric_time__extract_day
+            , subq_0.ds__extract_dow AS metric_time__extract_dow
+            , subq_0.ds__extract_doy AS metric_time__extract_doy
+            , subq_0.listing
+            , subq_0.guest
+            , subq_0.host
+            , subq_0.booking__listing
+            , subq_0.booking__guest
+            , subq_0.booking__host
+            , subq_0.is_instant
+            , subq_0.booking__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+            , subq_0.min_booking_value
+            , subq_0.bookers
+            , subq_0.average_booking_value
+            , subq_0.referred_bookings
+            , subq_0.median_booking_value
+            , subq_0.booking_value_p99
+            , subq_0.discrete_booking_value_p99
+            , subq_0.approximate_continuous_booking_value_p99
+            , subq_0.approximate_discrete_booking_value_p99
           FROM (
             -- Read Elements From Semantic Model 'bookings_source'
             SELECT
@@ -881,15 +881,15 @@ FROM (
               , bookings_source_src_28000.guest_id AS booking__guest
               , bookings_source_src_28000.host_id AS booking__host
             FROM ***************************.fct_bookings bookings_source_src_28000
-          ) subq_17
-        ) subq_18
-      ) subq_19
+          ) subq_0
+        ) subq_15
+      ) subq_16
       GROUP BY
-        subq_19.metric_time__day
-    ) subq_20
-  ) subq_21
+        subq_16.metric_time__day
+    ) subq_17
+  ) subq_18
   ON
-    COALESCE(subq_11.metric_time__day, subq_16.metric_time__day) = subq_21.metric_time__day
+    COALESCE(subq_10.metric_time__day, subq_14.metric_time__day) = subq_18.metric_time__day
   GROUP BY
-    COALESCE(subq_11.metric_time__day, subq_16.metric_time__day, subq_21.metric_time__day)
-) subq_22
+    COALESCE(subq_10.metric_time__day, subq_14.metric_time__day, subq_18.metric_time__day)
+) subq_19
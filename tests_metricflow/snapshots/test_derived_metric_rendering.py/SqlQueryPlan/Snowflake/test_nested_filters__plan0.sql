@@ -9,8 +9,8 @@ FROM (
     -- Combine Aggregated Outputs
     SELECT
       MAX(subq_11.average_booking_value) AS average_booking_value
-      , MAX(subq_23.bookings) AS bookings
-      , MAX(subq_30.booking_value) AS booking_value
+      , MAX(subq_21.bookings) AS bookings
+      , MAX(subq_27.booking_value) AS booking_value
     FROM (
       -- Compute Metrics via Expressions
       SELECT
@@ -394,141 +394,141 @@ FROM (
     CROSS JOIN (
       -- Compute Metrics via Expressions
       SELECT
-        subq_22.bookings
+        subq_20.bookings
       FROM (
         -- Aggregate Measures
         SELECT
-          SUM(subq_21.bookings) AS bookings
+          SUM(subq_19.bookings) AS bookings
         FROM (
           -- Pass Only Elements: ['bookings',]
           SELECT
-            subq_20.bookings
+            subq_18.bookings
           FROM (
             -- Constrain Output with WHERE
             SELECT
-              subq_19.booking__is_instant
-              , subq_19.listing__is_lux_latest
-              , subq_19.bookings
+              subq_17.booking__is_instant
+              , subq_17.listing__is_lux_latest
+              , subq_17.bookings
             FROM (
               -- Pass Only Elements: ['bookings', 'listing__is_lux_latest', 'booking__is_instant']
               SELECT
-                subq_18.booking__is_instant
-                , subq_18.listing__is_lux_latest
-                , subq_18.bookings
+                subq_16.booking__is_instant
+                , subq_16.listing__is_lux_latest
+                , subq_16.bookings
               FROM (
                 -- Join Standard Outputs
                 SELECT
-                  subq_14.listing AS listing
-                  , subq_14.booking__is_instant AS booking__is_instant
-                  , subq_17.is_lux_latest AS listing__is_lux_latest
-                  , subq_14.bookings AS bookings
+                  subq_13.listing AS listing
+                  , subq_13.booking__is_instant AS booking__is_instant
+                  , subq_15.is_lux_latest AS listing__is_lux_latest
+                  , subq_13.bookings AS bookings
                 FROM (
                   -- Pass Only Elements: ['bookings', 'booking__is_instant', 'listing']
                   SELECT
-                    subq_13.listing
-                    , subq_13.booking__is_instant
-                    , subq_13.bookings
+                    subq_12.listing
+                    , subq_12.booking__is_instant
+                    , subq_12.bookings
                   FROM (
                     -- Metric Time Dimension 'ds'
                     SELECT
-                      subq_12.ds__day
-                      , subq_12.ds__week
-                      , subq_12.ds__month
-                      , subq_12.ds__quarter
-                      , subq_12.ds__year
-                      , subq_12.ds__extract_year
-                      , subq_12.ds__extract_quarter
-                      , subq_12.ds__extract_month
-                      , subq_12.ds__extract_day
-                      , subq_12.ds__extract_dow
-                      , subq_12.ds__extract_doy
-                      , subq_12.ds_partitioned__day
-                      , subq_12.ds_partitioned__week
-                      , subq_12.ds_partitioned__month
-                      , subq_12.ds_partitioned__quarter
-                      , subq_12.ds_partitioned__year
-                      , subq_12.ds_partitioned__extract_year
-                      , subq_12.ds_partitioned__extract_quarter
-                      , subq_12.ds_partitioned__extract_month
-                      , subq_12.ds_partitioned__extract_day
-                      , subq_12.ds_partitioned__extract_dow
-                      , subq_12.ds_partitioned__extract_doy
-                      , subq_12.paid_at__day
-                      , subq_12.paid_at__week
-                      , subq_12.paid_at__month
-                      , subq_12.paid_at__quarter
-                      , subq_12.paid_at__year
-                      , subq_12.paid_at__extract_year
-                      , subq_12.paid_at__extract_quarter
-                      , subq_12.paid_at__extract_month
-                      , subq_12.paid_at__extract_day
-                      , subq_12.paid_at__extract_dow
-                      , subq_12.paid_at__extract_doy
-                      , subq_12.booking__ds__day
-                      , subq_12.booking__ds__week
-                      , subq_12.booking__ds__month
-                      , subq_12.booking__ds__quarter
-                      , subq_12.booking__ds__year
-                      , subq_12.booking__ds__extract_year
-                      , subq_12.booking__ds__extract_quarter
-                      , subq_12.booking__ds__extract_month
-                      , subq_12.booking__ds__extract_day
-                      , subq_12.booking__ds__extract_dow
-                      , subq_12.booking__ds__extract_doy
-                      , subq_12.booking__ds_partitioned__day
-                      , subq_12.booking__ds_partitioned__week
-                      , subq_12.booking__ds_partitioned__month
-                      , subq_12.booking__ds_partitioned__quarter
-                      , subq_12.booking__ds_partitioned__year
-                      , subq_12.booking__ds_partitioned__extract_year
-                      , subq_12.booking__ds_partitioned__extract_quarter
-                      , subq_12.booking__ds_partitioned__extract_month
-                      , subq_12.booking__ds_partitioned__extract_day
-                      , subq_12.booking__ds_partitioned__extract_dow
-                      , subq_12.booking__ds_partitioned__extract_doy
-                      , subq_12.booking__paid_at__day
-                      , subq_12.booking__paid_at__week
-                      , subq_12.booking__paid_at__month
-                      , subq_12.booking__paid_at__quarter
-                      , subq_12.booking__paid_at__year
-                      , subq_12.booking__paid_at__extract_year
-                      , subq_12.booking__paid_at__extract_quarter
-                      , subq_12.booking__paid_at__extract_month
-                      , subq_12.booking__paid_at__extract_day
-                      , subq_12.booking__paid_at__extract_dow
-                      , subq_12.booking__paid_at__extract_doy
-                      , subq_12.ds__day AS metric_time__day
-                      , subq_12.ds__week AS metric_time__week
-                      , subq_12.ds__month AS metric_time__month
-                      , subq_12.ds__quarter AS metric_time__quarter
-                      , subq_12.ds__year AS metric_time__year
-                      , subq_12.ds__extract_year AS metric_time__extract_year
-                      , subq_12.ds__extract_quarter AS metric_time__extract_quarter
-                      , subq_12.ds__extract_month AS metric_time__extract_month
-                      , subq_12.ds__extract_day AS metric_time__extract_day
-                      , subq_12.ds__extract_dow AS metric_time__extract_dow
-                      , subq_12.ds__extract_doy AS metric_time__extract_doy
-                      , subq_12.listing
-                      , subq_12.guest
-                      , subq_12.host
-                      , subq_12.booking__listing
-                      , subq_12.booking__guest
-                      , subq_12.booking__host
-                      , subq_12.is_instant
-                      , subq_12.booking__is_instant
-                      , subq_12.bookings
-                      , subq_12.instant_bookings
-                      , subq_12.booking_value
-                      , subq_12.max_booking_value
-                      , subq_12.min_booking_value
-                      , subq_12.bookers
-                      , subq_12.average_booking_value
-                      , subq_12.referred_bookings
-                      , subq_12.median_booking_value
-                      , subq_12.booking_value_p99
-                      , subq_12.discrete_booking_value_p99
-                      , subq_12.approximate_continuous_booking_value_p99
-                      , subq_12.approximate_discrete_booking_value_p99
+                      subq_0.ds__day
+                      , subq_0.ds__week
+                      , subq_0.ds__month
+                      , subq_0.ds__quarter
+                      , subq_0.ds__year
+                      , subq_0.ds__extract_year
+                      , subq_0.ds__extract_quarter
+                      , subq_0.ds__extract_month
+                      , subq_0.ds__extract_day
+                      , subq_0.ds__extract_dow
+                      , subq_0.ds__extract_doy
+                      , subq_0.ds_partitioned__day
+                      , subq_0.ds_partitioned__week
+                      , subq_0.ds_partitioned__month
+                      , subq_0.ds_partitioned__quarter
+                      , subq_0.ds_partitioned__year
+                      , subq_0.ds_partitioned__extract_year
+                      , subq_0.ds_partitioned__extract_quarter
+                      , subq_0.ds_partitioned__extract_month
+                      , subq_0.ds_partitioned__extract_day
+                      , subq_0.ds_partitioned__extract_dow
+                      , subq_0.ds_partitioned__extract_doy
+                      , subq_0.paid_at__day
+                      , subq_0.paid_at__week
+                      , subq_0.paid_at__month
+                      , subq_0.paid_at__quarter
+                      , subq_0.paid_at__year
+                      , subq_0.paid_at__extract_year
+                      , subq_0.paid_at__extract_quarter
+                      , subq_0.paid_at__extract_month
+                      , subq_0.paid_at__extract_day
+                      , subq_0.paid_at__extract_dow
+                      , subq_0.paid_at__extract_doy
+                      , subq_0.booking__ds__day
+                      , subq_0.booking__ds__week
+                      , subq_0.booking__ds__month
+                      , subq_0.booking__ds__quarter
+                      , subq_0.booking__ds__year
+                      , subq_0.booking__ds__extract_year
+                      , subq_0.booking__ds__extract_quarter
+                      , subq_0.booking__ds__extract_month
+                      , subq_0.booking__ds__extract_day
+                      , subq_0.booking__ds__extract_dow
+                      , subq_0.booking__ds__extract_doy
+                      , subq_0.booking__ds_partitioned__day
+                      , subq_0.booking__ds_partitioned__week
+                      , subq_0.booking__ds_partitioned__month
+                      , subq_0.booking__ds_partitioned__quarter
+                      , subq_0.booking__ds_partitioned__year
+                      , subq_0.booking__ds_partitioned__extract_year
+                      , subq_0.booking__ds_partitioned__extract_quarter
+                      , subq_0.booking__ds_partitioned__extract_month
+                      , subq_0.booking__ds_partitioned__extract_day
+                      , subq_0.booking__ds_partitioned__extract_dow
+                      , subq_0.booking__ds_partitioned__extract_doy
+                      , subq_0.booking__paid_at__day
+                      , subq_0.booking__paid_at__week
+                      , subq_0.booking__paid_at__month
+                      , subq_0.booking__paid_at__quarter
+                      , subq_0.booking__paid_at__year
+                      , subq_0.booking__paid_at__extract_year
+                      , subq_0.booking__paid_at__extract_quarter
+                      , subq_0.booking__paid_at__extract_month
+                      , subq_0.booking__paid_at__extract_day
+                      , subq_0.booking__paid_at__extract_dow
+                      , subq_0.booking__paid_at__extract_doy
+                      , subq_0.ds__day AS metric_time__day
+                      , subq_0.ds__week AS metric_time__week
+                      , subq_0.ds__month AS metric_time__month
+                      , subq_0.ds__quarter AS metric_time__quarter
+                      , subq_0.ds__year AS metric_time__year
+                      , subq_0.ds__extract_year AS metric_time__extract_year
+                      , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+                      , subq_0.ds__extract_month AS metric_time__extract_month
+                      , subq_0.ds__extract_day AS metric_time__extract_day
+                      , subq_0.ds__extract_dow AS metric_time__extract_dow
+                      , subq_0.ds__extract_doy AS metric_time__extract_doy
+                      , subq_0.listing
+                      , subq_0.guest
+                      , subq_0.host
+                      , subq_0.booking__listing
+                      , subq_0.booking__guest
+                      , subq_0.booking__host
+                      , subq_0.is_instant
+                      , subq_0.booking__is_instant
+                      , subq_0.bookings
+                      , subq_0.instant_bookings
+                      , subq_0.booking_value
+                      , subq_0.max_booking_value
+                      , subq_0.min_booking_value
+                      , subq_0.bookers
+                      , subq_0.average_booking_value
+                      , subq_0.referred_bookings
+                      , subq_0.median_booking_value
+                      , subq_0.booking_value_p99
+                      , subq_0.discrete_booking_value_p99
+                      , subq_0.approximate_continuous_booking_value_p99
+                      , subq_0.approximate_discrete_booking_value_p99
                     FROM (
                       -- Read Elements From Semantic Model 'bookings_source'
                       SELECT
@@ -621,84 +621,84 @@ FROM (
                         , bookings_source_src_28000.guest_id AS booking__guest
                         , bookings_source_src_28000.host_id AS booking__host
                       FROM ***************************.fct_bookings bookings_source_src_28000
-                    ) subq_12
-                  ) subq_13
-                ) subq_14
+                    ) subq_0
+                  ) subq_12
+                ) subq_13
                 LEFT OUTER JOIN (
                   -- Pass Only Elements: ['is_lux_latest', 'listing']
                   SELECT
-                    subq_16.listing
-                    , subq_16.is_lux_latest
+                    subq_14.listing
+                    , subq_14.is_lux_latest
                   FROM (
                     -- Metric Time Dimension 'ds'
                     SELECT
-                      subq_15.ds__day
-                      , subq_15.ds__week
-                      , subq_15.ds__month
-                      , subq_15.ds__quarter
-                      , subq_15.ds__year
-                      , subq_15.ds__extract_year
-                      , subq_15.ds__extract_quarter
-                      , subq_15.ds__extract_month
-                      , subq_15.ds__extract_day
-                      , subq_15.ds__extract_dow
-                      , subq_15.ds__extract_doy
-                      , subq_15.created_at__day
-                      , subq_15.created_at__week
-                      , subq_15.created_at__month
-                      , subq_15.created_at__quarter
-                      , subq_15.created_at__year
-                      , subq_15.created_at__extract_year
-                      , subq_15.created_at__extract_quarter
-                      , subq_15.created_at__extract_month
-                      , subq_15.created_at__extract_day
-                      , subq_15.created_at__extract_dow
-                      , subq_15.created_at__extract_doy
-                      , subq_15.listing__ds__day
-                      , subq_15.listing__ds__week
-                      , subq_15.listing__ds__month
-                      , subq_15.listing__ds__quarter
-                      , subq_15.listing__ds__year
-                      , subq_15.listing__ds__extract_year
-                      , subq_15.listing__ds__extract_quarter
-                      , subq_15.listing__ds__extract_month
-                      , subq_15.listing__ds__extract_day
-                      , subq_15.listing__ds__extract_dow
-                      , subq_15.listing__ds__extract_doy
-                      , subq_15.listing__created_at__day
-                      , subq_15.listing__created_at__week
-                      , subq_15.listing__created_at__month
-                      , subq_15.listing__created_at__quarter
-                      , subq_15.listing__created_at__year
-                      , subq_15.listing__created_at__extract_year
-                      , subq_15.listing__created_at__extract_quarter
-                      , subq_15.listing__created_at__extract_month
-                      , subq_15.listing__created_at__extract_day
-                      , subq_15.listing__created_at__extract_dow
-                      , subq_15.listing__created_at__extract_doy
-                      , subq_15.ds__day AS metric_time__day
-                      , subq_15.ds__week AS metric_time__week
-                      , subq_15.ds__month AS metric_time__month
-                      , subq_15.ds__quarter AS metric_time__quarter
-                      , subq_15.ds__year AS metric_time__year
-                      , subq_15.ds__extract_year AS metric_time__extract_year
-                      , subq_15.ds__extract_quarter AS metric_time__extract_quarter
-                      , subq_15.ds__extract_month AS metric_time__extract_month
-                      , subq_15.ds__extract_day AS metric_time__extract_day
-                      , subq_15.ds__extract_dow AS metric_time__extract_dow
-                      , subq_15.ds__extract_doy AS metric_time__extract_doy
-                      , subq_15.listing
-                      , subq_15.user
-                      , subq_15.listing__user
-                      , subq_15.country_latest
-                      , subq_15.is_lux_latest
-                      , subq_15.capacity_latest
-                      , subq_15.listing__country_latest
-                      , subq_15.listing__is_lux_latest
-                      , subq_15.listing__capacity_latest
-                      , subq_15.listings
-                      , subq_15.largest_listing
-                      , subq_15.smallest_listing
+                      subq_3.ds__day
+                      , subq_3.ds__week
+                      , subq_3.ds__month
+                      , subq_3.ds__quarter
+                      , subq_3.ds__year
+                      , subq_3.ds__extract_year
+                      , subq_3.ds__extract_quarter
+                      , subq_3.ds__extract_month
+                      , subq_3.ds__extract_day
+                      , subq_3.ds__extract_dow
+                      , subq_3.ds__extract_doy
+                      , subq_3.created_at__day
+                      , subq_3.created_at__week
+                      , subq_3.created_at__month
+                      , subq_3.created_at__quarter
+                      , subq_3.created_at__year
+                      , subq_3.created_at__extract_year
+                      , subq_3.created_at__extract_quarter
+                      , subq_3.created_at__extract_month
+                      , subq_3.created_at__extract_day
+                      , subq_3.created_at__extract_dow
+                      , subq_3.created_at__extract_doy
+                      , subq_3.listing__ds__day
+                      , subq_3.listing__ds__week
+                      , subq_3.listing__ds__month
+                      , subq_3.listing__ds__quarter
+                      , subq_3.listing__ds__year
+                      , subq_3.listing__ds__extract_year
+                      , subq_3.listing__ds__extract_quarter
+                      , subq_3.listing__ds__extract_month
+                      , subq_3.listing__ds__extract_day
+                      , subq_3.listing__ds__extract_dow
+                      , subq_3.listing__ds__extract_doy
+                      , subq_3.listing__created_at__day
+                      , subq_3.listing__created_at__week
+                      , subq_3.listing__created_at__month
+                      , subq_3.listing__created_at__quarter
+                      , subq_3.listing__created_at__year
+                      , subq_3.listing__created_at__extract_year
+                      , subq_3.listing__created_at__extract_quarter
+                      , subq_3.listing__created_at__extract_month
+                      , subq_3.listing__created_at__extract_day
+                      , subq_3.listing__created_at__extract_dow
+                      , subq_3.listing__created_at__extract_doy
+                      , subq_3.ds__day AS metric_time__day
+                      , subq_3.ds__week AS metric_time__week
+                      , subq_3.ds__month AS metric_time__month
+                      , subq_3.ds__quarter AS metric_time__quarter
+                      , subq_3.ds__year AS metric_time__year
+                      , subq_3.ds__extract_year AS metric_time__extract_year
+                      , subq_3.ds__extract_quarter AS metric_time__extract_quarter
+                      , subq_3.ds__extract_month AS metric_time__extract_month
+                      , subq_3.ds__extract_day AS metric_time__extract_day
+                      , subq_3.ds__extract_dow AS metric_time__extract_dow
+                      , subq_3.ds__extract_doy AS metric_time__extract_doy
+                      , subq_3.listing
+                      , subq_3.user
+                      , subq_3.listing__user
+                      , subq_3.country_latest
+                      , subq_3.is_lux_latest
+                      , subq_3.capacity_latest
+                      , subq_3.listing__country_latest
+                      , subq_3.listing__is_lux_latest
+                      , subq_3.listing__capacity_latest
+                      , subq_3.listings
+                      , subq_3.largest_listing
+                      , subq_3.smallest_listing
                     FROM (
                       -- Read Elements From Semantic Model 'listings_latest'
                       SELECT
@@ -759,141 +759,141 @@ FROM (
                         , listings_latest_src_28000.user_id AS user
                         , listings_latest_src_28000.user_id AS listing__user
                       FROM ***************************.dim_listings_latest listings_latest_src_28000
-                    ) subq_15
-                  ) subq_16
-                ) subq_17
+                    ) subq_3
+                  ) subq_14
+                ) subq_15
                 ON
-                  subq_14.listing = subq_17.listing
-              ) subq_18
-            ) subq_19
+                  subq_13.listing = subq_15.listing
+              ) subq_16
+            ) subq_17
             WHERE (listing__is_lux_latest) AND (booking__is_instant)
-          ) subq_20
-        ) subq_21
-      ) subq_22
-    ) subq_23
+          ) subq_18
+        ) subq_19
+      ) subq_20
+    ) subq_21
     CROSS JOIN (
       -- Compute Metrics via Expressions
       SELECT
-        subq_29.booking_value
+        subq_26.booking_value
       FROM (
         -- Aggregate Measures
         SELECT
-          SUM(subq_28.booking_value) AS booking_value
+          SUM(subq_25.booking_value) AS booking_value
         FROM (
           -- Pass Only Elements: ['booking_value',]
           SELECT
-            subq_27.booking_value
+            subq_24.booking_value
           FROM (
             -- Constrain Output with WHERE
             SELECT
-              subq_26.booking__is_instant
-              , subq_26.booking_value
+              subq_23.booking__is_instant
+              , subq_23.booking_value
             FROM (
               -- Pass Only Elements: ['booking_value', 'booking__is_instant']
               SELECT
-                subq_25.booking__is_instant
-                , subq_25.booking_value
+                subq_22.booking__is_instant
+                , subq_22.booking_value
               FROM (
                 -- Metric Time Dimension 'ds'
                 SELECT
-                  subq_24.ds__day
-                  , subq_24.ds__week
-                  , subq_24.ds__month
-                  , subq_24.ds__quarter
-                  , subq_24.ds__year
-                  , subq_24.ds__extract_year
-                  , subq_24.ds__extract_quarter
-                  , subq_24.ds__extract_month
-                  , subq_24.ds__extract_day
-                  , subq_24.ds__extract_dow
-                  , subq_24.ds__extract_doy
-                  , subq_24.ds_partitioned__day
-                  , subq_24.ds_partitioned__week
-                  , subq_24.ds_partitioned__month
-                  , subq_24.ds_partitioned__quarter
-                  , subq_24.ds_partitioned__year
-                  , subq_24.ds_partitioned__extract_year
-                  , subq_24.ds_partitioned__extract_quarter
-                  , subq_24.ds_partitioned__extract_month
-                  , subq_24.ds_partitioned__extract_day
-                  , subq_24.ds_partitioned__extract_dow
-                  , subq_24.ds_partitioned__extract_doy
-                  , subq_24.paid_at__day
-                  , subq_24.paid_at__week
-                  , subq_24.paid_at__month
-                  , subq_24.paid_at__quarter
-                  , subq_24.paid_at__year
-                  , subq_24.paid_at__extract_year
-                  , subq_24.paid_at__extract_quarter
-                  , subq_24.paid_at__extract_month
-                  , subq_24.paid_at__extract_day
-                  , subq_24.paid_at__extract_dow
-                  , subq_24.paid_at__extract_doy
-                  , subq_24.booking__ds__day
-                  , subq_24.booking__ds__week
-                  , subq_24.booking__ds__month
-                  , subq_24.booking__ds__quarter
-                  , subq_24.booking__ds__year
-                  , subq_24.booking__ds__extract_year
-                  , subq_24.booking__ds__extract_quarter
-                  , subq_24.booking__ds__extract_month
-                  , subq_24.booking__ds__extract_day
-                  , subq_24.booking__ds__extract_dow
-                  , subq_24.booking__ds__extract_doy
-                  , subq_24.booking__ds_partitioned__day
-                  , subq_24.booking__ds_partitioned__week
-                  , subq_24.booking__ds_partitioned__month
-                  , subq_24.booking__ds_partitioned__quarter
-                  , subq_24.booking__ds_partitioned__year
-                  , subq_24.booking__ds_partitioned__extract_year
-                  , subq_24.booking__ds_partitioned__extract_quarter
-                  , subq_24.booking__ds_partitioned__extract_month
-                  , subq_24.booking__ds_partitioned__extract_day
-                  , subq_24.booking__ds_partitioned__extract_dow
-                  , subq_24.booking__ds_partitioned__extract_doy
-                  , subq_24.booking__paid_at__day
-                  , subq_24.booking__paid_at__week
-                  , subq_24.booking__paid_at__month
-                  , subq_24.booking__paid_at__quarter
-                  , subq_24.booking__paid_at__year
-                  , subq_24.booking__paid_at__extract_year
-                  , subq_24.booking__paid_at__extract_quarter
-                  , subq_24.booking__paid_at__extract_month
-                  , subq_24.booking__paid_at__extract_day
-                  , subq_24.booking__paid_at__extract_dow
-                  , subq_24.booking__paid_at__extract_doy
-                  , subq_24.ds__day AS metric_time__day
-                  , subq_24.ds__week AS metric_time__week
-                  , subq_24.ds__month AS metric_time__month
-                  , subq_24.ds__quarter AS metric_time__quarter
-                  , subq_24.ds__year AS metric_time__year
-                  , subq_24.ds__extract_year AS metric_time__extract_year
-                  , subq_24.ds__extract_quarter AS metric_time__extract_quarter
-                  , subq_24.ds__extract_month AS metric_time__extract_month
-                  , subq_24.ds__extract_day AS metric_time__extract_day
-                  , subq_24.ds__extract_dow AS metric_time__extract_dow
-                  , subq_24.ds__extract_doy AS metric_time__extract_doy
-                  , subq_24.listing
-                  , subq_24.guest
-                  , subq_24.host
-                  , subq_24.booking__listing
-                  , subq_24.booking__guest
-                  , subq_24.booking__host
-                  , subq_24.is_instant
-                  , subq_24.booking__is_instant
-                  , subq_24.bookings
-                  , subq_24.instant_bookings
-                  , subq_24.booking_value
-                  , subq_24.max_booking_value
-                  , subq_24.min_booking_value
-                  , subq_24.bookers
-                  , subq_24.average_booking_value
-                  , subq_24.referred_bookings
-                  , subq_24.median_booking_value
-                  , subq_24.booking_value_p99
-                  , subq_24.discrete_booking_value_p99
-                  , subq_24.approximate_continuous_booking_value_p99
-                  , subq_24.approximate_discrete_booking_value_p99
+                  subq_0.ds__day
+                  , subq_0.ds__week
+                  , subq_0.ds__month
+                  , subq_0.ds__quarter
+                  , subq_0.ds__year
+                  , subq_0.ds__extract_year
+                  , subq_0.ds__extract_quarter
+                  , subq_0.ds__extract_month
+                  , subq_0.ds__extract_day
+                  , subq_0.ds__extract_dow
+                  , subq_0.ds__extract_doy
+                  , subq_0.ds_partitioned__day
+                  , subq_0.ds_partitioned__week
+                  , subq_0.ds_partitioned__month
+                  , subq_0.ds_partitioned__quarter
+                  , subq_0.ds_partitioned__year
+                  , subq_0.ds_partitioned__extract_year
+                  , subq_0.ds_partitioned__extract_quarter
+                  , subq_0.ds_partitioned__extract_month
+                  , subq_0.ds_partitioned__extract_day
+                  , subq_0.ds_partitioned__extract_dow
+                  , subq_0.ds_partitioned__extract_doy
+                  , subq_0.paid_at__day
+                  , subq_0.paid_at__week
+                  , subq_0.paid_at__month
+                  , subq_0.paid_at__quarter
+                  , subq_0.paid_at__year
+                  , subq_0.paid_at__extract_year
+                  , subq_0.paid_at__extract_quarter
+                  , subq_0.paid_at__extract_month
+                  , subq_0.paid_at__extract_day
+                  , subq_0.paid_at__extract_dow
+                  , subq_0.paid_at__extract_doy
+                  , subq_0.booking__ds__day
+                  , subq_0.booking__ds__week
+                  , subq_0.booking__ds__month
+                  , subq_0.booking__ds__quarter
+                  , subq_0.booking__ds__year
+                  , subq_0.booking__ds__extract_year
+                  , subq_0.booking__ds__extract_quarter
+                  , subq_0.booking__ds__extract_month
+                  , subq_0.booking__ds__extract_day
+                  , subq_0.booking__ds__extract_dow
+                  , subq_0.booking__ds__extract_doy
+                  , subq_0.booking__ds_partitioned__day
+                  , subq_0.booking__ds_partitioned__week
+                  , subq_0.booking__ds_partitioned__month
+                  , subq_0.booking__ds_partitioned__quarter
+                  , subq_0.booking__ds_partitioned__year
+                  , subq_0.booking__ds_partitioned__extract_year
+                  , subq_0.booking__ds_partitioned__extract_quarter
+                  , subq_0.booking__ds_partitioned__extract_month
+                  , subq_0.booking__ds_partitioned__extract_day
+                  , subq_0.booking__ds_partitioned__extract_dow
+                  , subq_0.booking__ds_partitioned__extract_doy
+                  , subq_0.booking__paid_at__day
+                  , subq_0.booking__paid_at__week
+                  , subq_0.booking__paid_at__month
+                  , subq_0.booking__paid_at__quarter
+                  , subq_0.booking__paid_at__year
+                  , subq_0.booking__paid_at__extract_year
+                  , subq_0.booking__paid_at__extract_quarter
+                  , subq_0.booking__paid_at__extract_month
+                  , subq_0.booking__paid_at__extract_day
+                  , subq_0.booking__paid_at__extract_dow
+                  , subq_0.booking__paid_at__extract_doy
+                  , subq_0.ds__day AS metric_time__day
+                  , subq_0.ds__week AS metric_time__week
+                  , subq_0.ds__month AS metric_time__month
+                  , subq_0.ds__quarter AS metric_time__quarter
+                  , subq_0.ds__year AS metric_time__year
+                  , subq_0.ds__extract_year AS metric_time__extract_year
+                  , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+                  , subq_0.ds__extract_month AS metric_time__extract_month
+                  , subq_0.ds__extract_day AS metric_time__extract_day
+                  , subq_0.ds__extract_dow AS metric_time__extract_dow
+                  , subq_0.ds__extract_doy AS metric_time__extract_doy
+                  , subq_0.listing
+                  , subq_0.guest
+                  , subq_0.host
+                  , subq_0.booking__listing
+                  , subq_0.booking__guest
+                  , subq_0.booking__host
+                  , subq_0.is_instant
+                  , subq_0.booking__is_instant
+                  , subq_0.bookings
+                  , subq_0.instant_bookings
+                  , subq_0.booking_value
+                  , subq_0.max_booking_value
+                  , subq_0.min_booking_value
+                  , subq_0.bookers
+                  , subq_0.average_booking_value
+                  , subq_0.referred_bookings
+                  , subq_0.median_booking_value
+                  , subq_0.booking_value_p99
+                  , subq_0.discrete_booking_value_p99
+                  , subq_0.approximate_continuous_booking_value_p99
+                  , subq_0.approximate_discrete_booking_value_p99
                 FROM (
                   -- Read Elements From Semantic Model 'bookings_source'
                   SELECT
@@ -986,13 +986,13 @@ FROM (
                     , bookings_source_src_28000.guest_id AS booking__guest
                     , bookings_source_src_28000.host_id AS booking__host
                   FROM ***************************.fct_bookings bookings_source_src_28000
-                ) subq_24
-              ) subq_25
-            ) subq_26
+                ) subq_0
+              ) subq_22
+            ) subq_23
             WHERE booking__is_instant
-          ) subq_27
-        ) subq_28
-      ) subq_29
-    ) subq_30
-  ) subq_31
-) subq_32
+          ) subq_24
+        ) subq_25
+      ) subq_26
+    ) subq_27
+  ) subq_28
+) subq_29
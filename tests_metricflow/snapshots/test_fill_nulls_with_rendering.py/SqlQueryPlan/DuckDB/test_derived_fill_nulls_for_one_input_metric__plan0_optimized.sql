@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_24.metric_time__day, subq_32.metric_time__day) AS metric_time__day
-    , COALESCE(MAX(subq_24.bookings_fill_nulls_with_0), 0) AS bookings_fill_nulls_with_0
-    , MAX(subq_32.bookings_2_weeks_ago) AS bookings_2_weeks_ago
+    COALESCE(subq_23.metric_time__day, subq_31.metric_time__day) AS metric_time__day
+    , COALESCE(MAX(subq_23.bookings_fill_nulls_with_0), 0) AS bookings_fill_nulls_with_0
+    , MAX(subq_31.bookings_2_weeks_ago) AS bookings_2_weeks_ago
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -16,9 +16,9 @@ FROM (
     FROM (
       -- Join to Time Spine Dataset
       SELECT
-        subq_22.ds AS metric_time__day
-        , subq_20.bookings AS bookings
-      FROM ***************************.mf_time_spine subq_22
+        subq_21.ds AS metric_time__day
+        , subq_19.bookings AS bookings
+      FROM ***************************.mf_time_spine subq_21
       LEFT OUTER JOIN (
         -- Aggregate Measures
         SELECT
@@ -32,23 +32,23 @@ FROM (
             DATE_TRUNC('day', ds) AS metric_time__day
             , 1 AS bookings
           FROM ***************************.fct_bookings bookings_source_src_28000
-        ) subq_19
+        ) subq_18
         GROUP BY
           metric_time__day
-      ) subq_20
+      ) subq_19
       ON
-        subq_22.ds = subq_20.metric_time__day
-    ) subq_23
-  ) subq_24
+        subq_21.ds = subq_19.metric_time__day
+    ) subq_22
+  ) subq_23
   FULL OUTER JOIN (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['bookings', 'metric_time__day']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      subq_28.ds AS metric_time__day
-      , SUM(subq_26.bookings) AS bookings_2_weeks_ago
-    FROM ***************************.mf_time_spine subq_28
+      subq_27.ds AS metric_time__day
+      , SUM(subq_25.bookings) AS bookings_2_weeks_ago
+    FROM ***************************.mf_time_spine subq_27
     INNER JOIN (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -56,14 +56,14 @@ FROM (
         DATE_TRUNC('day', ds) AS metric_time__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_26
+    ) subq_25
     ON
-      subq_28.ds - INTERVAL 14 day = subq_26.metric_time__day
+      subq_27.ds - INTERVAL 14 day = subq_25.metric_time__day
     GROUP BY
-      subq_28.ds
-  ) subq_32
+      subq_27.ds
+  ) subq_31
   ON
-    subq_24.metric_time__day = subq_32.metric_time__day
+    subq_23.metric_time__day = subq_31.metric_time__day
   GROUP BY
-    COALESCE(subq_24.metric_time__day, subq_32.metric_time__day)
-) subq_33
+    COALESCE(subq_23.metric_time__day, subq_31.metric_time__day)
+) subq_32
@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_18.metric_time__extract_dow, subq_26.metric_time__extract_dow) AS metric_time__extract_dow
-    , MAX(subq_18.bookings) AS bookings
-    , MAX(subq_26.bookings_2_weeks_ago) AS bookings_2_weeks_ago
+    COALESCE(subq_17.metric_time__extract_dow, subq_25.metric_time__extract_dow) AS metric_time__extract_dow
+    , MAX(subq_17.bookings) AS bookings
+    , MAX(subq_25.bookings_2_weeks_ago) AS bookings_2_weeks_ago
   FROM (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -22,19 +22,19 @@ FROM (
         EXTRACT(DAYOFWEEK_ISO FROM ds) AS metric_time__extract_dow
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_16
+    ) subq_15
     GROUP BY
       metric_time__extract_dow
-  ) subq_18
+  ) subq_17
   FULL OUTER JOIN (
     -- Join to Time Spine Dataset
     -- Pass Only Elements: ['bookings', 'metric_time__extract_dow']
     -- Aggregate Measures
     -- Compute Metrics via Expressions
     SELECT
-      EXTRACT(DAYOFWEEK_ISO FROM subq_22.ds) AS metric_time__extract_dow
-      , SUM(subq_20.bookings) AS bookings_2_weeks_ago
-    FROM ***************************.mf_time_spine subq_22
+      EXTRACT(DAYOFWEEK_ISO FROM subq_21.ds) AS metric_time__extract_dow
+      , SUM(subq_19.bookings) AS bookings_2_weeks_ago
+    FROM ***************************.mf_time_spine subq_21
     INNER JOIN (
       -- Read Elements From Semantic Model 'bookings_source'
       -- Metric Time Dimension 'ds'
@@ -42,14 +42,14 @@ FROM (
         DATE_TRUNC('day', ds) AS metric_time__day
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_20
+    ) subq_19
     ON
-      DATEADD(day, -14, subq_22.ds) = subq_20.metric_time__day
+      DATEADD(day, -14, subq_21.ds) = subq_19.metric_time__day
     GROUP BY
-      EXTRACT(DAYOFWEEK_ISO FROM subq_22.ds)
-  ) subq_26
+      EXTRACT(DAYOFWEEK_ISO FROM subq_21.ds)
+  ) subq_25
   ON
-    subq_18.metric_time__extract_dow = subq_26.metric_time__extract_dow
+    subq_17.metric_time__extract_dow = subq_25.metric_time__extract_dow
   GROUP BY
-    COALESCE(subq_18.metric_time__extract_dow, subq_26.metric_time__extract_dow)
-) subq_27
+    COALESCE(subq_17.metric_time__extract_dow, subq_25.metric_time__extract_dow)
+) subq_26
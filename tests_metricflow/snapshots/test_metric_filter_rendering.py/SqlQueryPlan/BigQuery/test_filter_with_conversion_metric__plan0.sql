@@ -1,29 +1,29 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_24.listings
+  subq_23.listings
 FROM (
   -- Aggregate Measures
   SELECT
-    SUM(subq_23.listings) AS listings
+    SUM(subq_22.listings) AS listings
   FROM (
     -- Pass Only Elements: ['listings',]
     SELECT
-      subq_22.listings
+      subq_21.listings
     FROM (
       -- Constrain Output with WHERE
       SELECT
-        subq_21.user__visit_buy_conversion_rate
-        , subq_21.listings
+        subq_20.user__visit_buy_conversion_rate
+        , subq_20.listings
       FROM (
         -- Pass Only Elements: ['listings', 'user__visit_buy_conversion_rate']
         SELECT
-          subq_20.user__visit_buy_conversion_rate
-          , subq_20.listings
+          subq_19.user__visit_buy_conversion_rate
+          , subq_19.listings
         FROM (
           -- Join Standard Outputs
           SELECT
             subq_2.user AS user
-            , subq_19.user__visit_buy_conversion_rate AS user__visit_buy_conversion_rate
+            , subq_18.user__visit_buy_conversion_rate AS user__visit_buy_conversion_rate
             , subq_2.listings AS listings
           FROM (
             -- Pass Only Elements: ['listings', 'user']
@@ -166,19 +166,19 @@ FROM (
           LEFT OUTER JOIN (
             -- Pass Only Elements: ['user', 'user__visit_buy_conversion_rate']
             SELECT
-              subq_18.user
-              , subq_18.user__visit_buy_conversion_rate
+              subq_17.user
+              , subq_17.user__visit_buy_conversion_rate
             FROM (
               -- Compute Metrics via Expressions
               SELECT
-                subq_17.user
-                , CAST(subq_17.buys AS FLOAT64) / CAST(NULLIF(subq_17.visits, 0) AS FLOAT64) AS user__visit_buy_conversion_rate
+                subq_16.user
+                , CAST(subq_16.buys AS FLOAT64) / CAST(NULLIF(subq_16.visits, 0) AS FLOAT64) AS user__visit_buy_conversion_rate
               FROM (
                 -- Combine Aggregated Outputs
                 SELECT
-                  COALESCE(subq_6.user, subq_16.user) AS user
+                  COALESCE(subq_6.user, subq_15.user) AS user
                   , MAX(subq_6.visits) AS visits
-                  , MAX(subq_16.buys) AS buys
+                  , MAX(subq_15.buys) AS buys
                 FROM (
                   -- Aggregate Measures
                   SELECT
@@ -276,99 +276,99 @@ FROM (
                 FULL OUTER JOIN (
                   -- Aggregate Measures
                   SELECT
-                    subq_15.user
-                    , SUM(subq_15.buys) AS buys
+                    subq_14.user
+                    , SUM(subq_14.buys) AS buys
                   FROM (
                     -- Pass Only Elements: ['buys', 'user']
                     SELECT
-                      subq_14.user
-                      , subq_14.buys
+                      subq_13.user
+                      , subq_13.buys
                     FROM (
                       -- Find conversions for user within the range of INF
                       SELECT
-                        subq_13.ds__day
-                        , subq_13.user
-                        , subq_13.buys
-                        , subq_13.visits
+                        subq_12.ds__day
+                        , subq_12.user
+                        , subq_12.buys
+                        , subq_12.visits
                       FROM (
                         -- Dedupe the fanout with mf_internal_uuid in the conversion data set
                         SELECT DISTINCT
-                          FIRST_VALUE(subq_9.visits) OVER (
+                          FIRST_VALUE(subq_8.visits) OVER (
                             PARTITION BY
-                              subq_12.user
-                              , subq_12.ds__day
-                              , subq_12.mf_internal_uuid
-                            ORDER BY subq_9.ds__day DESC
+                              subq_11.user
+                              , subq_11.ds__day
+                              , subq_11.mf_internal_uuid
+                            ORDER BY subq_8.ds__day DESC
                             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                           ) AS visits
-                          , FIRST_VALUE(subq_9.ds__day) OVER (
+                          , FIRST_VALUE(subq_8.ds__day) OVER (
                             PARTITION BY
-                              subq_12.user
-                              , subq_12.ds__day
-                              , subq_12.mf_internal_uuid
-                            ORDER BY subq_9.ds__day DESC
+                              subq_11.user
+                              , subq_11.ds__day
+                              , subq_11.mf_internal_uuid
+                            ORDER BY subq_8.ds__day DESC
                             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                           ) AS ds__day
-                          , FIRST_VALUE(subq_9.user) OVER (
+                          , FIRST_VALUE(subq_8.user) OVER (
                             PARTITION BY
-                              subq_12.user
-                              , subq_12.ds__day
-                              , subq_12.mf_internal_uuid
-                            ORDER BY subq_9.ds__day DESC
+                              subq_11.user
+                              , subq_11.ds__day
+                              , subq_11.mf_internal_uuid
+                            ORDER BY subq_8.ds__day DESC
                             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                           ) AS user
-                          , subq_12.mf_internal_uuid AS mf_internal_uuid
-                          , subq_12.buys AS buys
+                          , subq_11.mf_internal_uuid AS mf_internal_uuid
+                          , subq_11.buys AS buys
                         FROM (
                           -- Pass Only Elements: ['visits', 'ds__day', 'user']
                           SELECT
-                            subq_8.ds__day
-                            , subq_8.user
-                            , subq_8.visits
+                            subq_7.ds__day
+                            , subq_7.user
+                            , subq_7.visits
                           FROM (
                             -- Metric Time Dimension 'ds'
                             SELECT
-                              subq_7.ds__day
-                              , subq_7.ds__week
-                              , subq_7.ds__month
-                              , subq_7.ds__quarter
-                              , subq_7.ds__year
-                              , subq_7.ds__extract_year
-                              , subq_7.ds__extract_quarter
-                              , subq_7.ds__extract_month
-                              , subq_7.ds__extract_day
-                              , subq_7.ds__extract_dow
-                              , subq_7.ds__extract_doy
-                              , subq_7.visit__ds__day
-                              , subq_7.visit__ds__week
-                              , subq_7.visit__ds__month
-                              , subq_7.visit__ds__quarter
-                              , subq_7.visit__ds__year
-                              , subq_7.visit__ds__extract_year
-                              , subq_7.visit__ds__extract_quarter
-                              , subq_7.visit__ds__extract_month
-                              , subq_7.visit__ds__extract_day
-                              , subq_7.visit__ds__extract_dow
-                              , subq_7.visit__ds__extract_doy
-                              , subq_7.ds__day AS metric_time__day
-                              , subq_7.ds__week AS metric_time__week
-                              , subq_7.ds__month AS metric_time__month
-                              , subq_7.ds__quarter AS metric_time__quarter
-                              , subq_7.ds__year AS metric_time__year
-                              , subq_7.ds__extract_year AS metric_time__extract_year
-                              , subq_7.ds__extract_quarter AS metric_time__extract_quarter
-                              , subq_7.ds__extract_month AS metric_time__extract_month
-                              , subq_7.ds__extract_day AS metric_time__extract_day
-                              , subq_7.ds__extract_dow AS metric_time__extract_dow
-                              , subq_7.ds__extract_doy AS metric_time__extract_doy
-                              , subq_7.user
-                              , subq_7.session
-                              , subq_7.visit__user
-                              , subq_7.visit__session
-                              , subq_7.referrer_id
-                              , subq_7.visit__referrer_id
-                              , subq_7.visits
-                              , subq_7.visitors
+                              subq_3.ds__day
+                              , subq_3.ds__week
+                              , subq_3.ds__month
+                              , subq_3.ds__quarter
+                              , subq_3.ds__year
+                              , subq_3.ds__extract_year
+                              , subq_3.ds__extract_quarter
+                              , subq_3.ds__extract_month
+                              , subq_3.ds__extract_day
+                              , subq_3.ds__extract_dow
+                              , subq_3.ds__extract_doy
+                              , subq_3.visit__ds__day
+                              , subq_3.visit__ds__week
+                              , subq_3.visit__ds__month
+                              , subq_3.visit__ds__quarter
+                              , subq_3.visit__ds__year
+                              , subq_3.visit__ds__extract_year
+                              , subq_3.visit__ds__extract_quarter
+                              , subq_3.visit__ds__extract_month
+                              , subq_3.visit__ds__extract_day
+                              , subq_3.visit__ds__extract_dow
+                              , subq_3.visit__ds__extract_doy
+                              , subq_3.ds__day AS metric_time__day
+                              , subq_3.ds__week AS metric_time__week
+                              , subq_3.ds__month AS metric_time__month
+                              , subq_3.ds__quarter AS metric_time__quarter
+                              , subq_3.ds__year AS metric_time__year
+                              , subq_3.ds__extract_year AS metric_time__extract_year
+                              , subq_3.ds__extract_quarter AS metric_time__extract_quarter
+                              , subq_3.ds__extract_month AS metric_time__extract_month
+                              , subq_3.ds__extract_day AS metric_time__extract_day
+                              , subq_3.ds__extract_dow AS metric_time__extract_dow
+                              , subq_3.ds__extract_doy AS metric_time__extract_doy
+                              , subq_3.user
+                              , subq_3.session
+                              , subq_3.visit__user
+                              , subq_3.visit__session
+                              , subq_3.referrer_id
+                              , subq_3.visit__referrer_id
+                              , subq_3.visits
+                              , subq_3.visitors
                             FROM (
                               -- Read Elements From Semantic Model 'visits_source'
                               SELECT
@@ -403,94 +403,94 @@ FROM (
                                 , visits_source_src_28000.user_id AS visit__user
                                 , visits_source_src_28000.session_id AS visit__session
                               FROM ***************************.fct_visits visits_source_src_28000
-                            ) subq_7
-                          ) subq_8
-                        ) subq_9
+                            ) subq_3
+                          ) subq_7
+                        ) subq_8
                         INNER JOIN (
                           -- Add column with generated UUID
                           SELECT
-                            subq_11.ds__day
-                            , subq_11.ds__week
-                            , subq_11.ds__month
-                            , subq_11.ds__quarter
-                            , subq_11.ds__year
-                            , subq_11.ds__extract_year
-                            , subq_11.ds__extract_quarter
-                            , subq_11.ds__extract_month
-                            , subq_11.ds__extract_day
-                            , subq_11.ds__extract_dow
-                            , subq_11.ds__extract_doy
-                            , subq_11.buy__ds__day
-                            , subq_11.buy__ds__week
-                            , subq_11.buy__ds__month
-                            , subq_11.buy__ds__quarter
-                            , subq_11.buy__ds__year
-                            , subq_11.buy__ds__extract_year
-                            , subq_11.buy__ds__extract_quarter
-                            , subq_11.buy__ds__extract_month
-                            , subq_11.buy__ds__extract_day
-                            , subq_11.buy__ds__extract_dow
-                            , subq_11.buy__ds__extract_doy
-                            , subq_11.metric_time__day
-                            , subq_11.metric_time__week
-                            , subq_11.metric_time__month
-                            , subq_11.metric_time__quarter
-                            , subq_11.metric_time__year
-                            , subq_11.metric_time__extract_year
-                            , subq_11.metric_time__extract_quarter
-                            , subq_11.metric_time__extract_month
-                            , subq_11.metric_time__extract_day
-                            , subq_11.metric_time__extract_dow
-                            , subq_11.metric_time__extract_doy
-                            , subq_11.user
-                            , subq_11.session_id
-                            , subq_11.buy__user
-                            , subq_11.buy__session_id
-                            , subq_11.buys
-                            , subq_11.buyers
+                            subq_10.ds__day
+                            , subq_10.ds__week
+                            , subq_10.ds__month
+                            , subq_10.ds__quarter
+                            , subq_10.ds__year
+                            , subq_10.ds__extract_year
+                            , subq_10.ds__extract_quarter
+                            , subq_10.ds__extract_month
+                            , subq_10.ds__extract_day
+                            , subq_10.ds__extract_dow
+                            , subq_10.ds__extract_doy
+                            , subq_10.buy__ds__day
+                            , subq_10.buy__ds__week
+                            , subq_10.buy__ds__month
+                            , subq_10.buy__ds__quarter
+                            , subq_10.buy__ds__year
+                            , subq_10.buy__ds__extract_year
+                            , subq_10.buy__ds__extract_quarter
+                            , subq_10.buy__ds__extract_month
+                            , subq_10.buy__ds__extract_day
+                            , subq_10.buy__ds__extract_dow
+                            , subq_10.buy__ds__extract_doy
+                            , subq_10.metric_time__day
+                            , subq_10.metric_time__week
+                            , subq_10.metric_time__month
+                            , subq_10.metric_time__quarter
+                            , subq_10.metric_time__year
+                            , subq_10.metric_time__extract_year
+                            , subq_10.metric_time__extract_quarter
+                            , subq_10.metric_time__extract_month
+                            , subq_10.metric_time__extract_day
+                            , subq_10.metric_time__extract_dow
+                            , subq_10.metric_time__extract_doy
+                            , subq_10.user
+                            , subq_10.session_id
+                            , subq_10.buy__user
+                            , subq_10.buy__session_id
+                            , subq_10.buys
+                            , subq_10.buyers
                             , GENERATE_UUID() AS mf_internal_uuid
                           FROM (
                             -- Metric Time Dimension 'ds'
                             SELECT
-                              subq_10.ds__day
-                              , subq_10.ds__week
-                              , subq_10.ds__month
-                              , subq_10.ds__quarter
-                              , subq_10.ds__year
-                              , subq_10.ds__extract_year
-                              , subq_10.ds__extract_quarter
-                              , subq_10.ds__extract_month
-                              , subq_10.ds__extract_day
-                              , subq_10.ds__extract_dow
-                              , subq_10.ds__extract_doy
-                              , subq_10.buy__ds__day
-                              , subq_10.buy__ds__week
-                              , subq_10.buy__ds__month
-                              , subq_10.buy__ds__quarter
-                              , subq_10.buy__ds__year
-                              , subq_10.buy__ds__extract_year
-                              , subq_10.buy__ds__extract_quarter
-                              , subq_10.buy__ds__extract_month
-                              , subq_10.buy__ds__extract_day
-                              , subq_10.buy__ds__extract_dow
-                              , subq_10.buy__ds__extract_doy
-                              , subq_10.ds__day AS metric_time__day
-                              , subq_10.ds__week AS metric_time__week
-                              , subq_10.ds__month AS metric_time__month
-                              , subq_10.ds__quarter AS metric_time__quarter
-                              , subq_10.ds__year AS metric_time__year
-                              , subq_10.ds__extract_year AS metric_time__extract_year
-                              , subq_10.ds__extract_quarter AS metric_time__extract_quarter
-                              , subq_10.ds__extract_month AS metric_time__extract_month
-                              , subq_10.ds__extract_day AS metric_time__extract_day
-                              , subq_10.ds__extract_dow AS metric_time__extract_dow
-                              , subq_10.ds__extract_doy AS metric_time__extract_doy
-                              , subq_10.user
-                              , subq_10.session_id
-                              , subq_10.buy__user
-                              , subq_10.buy__session_id
-                              , subq_10.buys
-                              , subq_10.buyers
+                              subq_9.ds__day
+                              , subq_9.ds__week
+                              , subq_9.ds__month
+                              , subq_9.ds__quarter
+                              , subq_9.ds__year
+                              , subq_9.ds__extract_year
+                              , subq_9.ds__extract_quarter
+                              , subq_9.ds__extract_month
+                              , subq_9.ds__extract_day
+                              , subq_9.ds__extract_dow
+                              , subq_9.ds__extract_doy
+                              , subq_9.buy__ds__day
+                              , subq_9.buy__ds__week
+                              , subq_9.buy__ds__month
+                              , subq_9.buy__ds__quarter
+                              , subq_9.buy__ds__year
+                              , subq_9.buy__ds__extract_year
+                              , subq_9.buy__ds__extract_quarter
+                              , subq_9.buy__ds__extract_month
+                              , subq_9.buy__ds__extract_day
+                              , subq_9.buy__ds__extract_dow
+                              , subq_9.buy__ds__extract_doy
+                              , subq_9.ds__day AS metric_time__day
+                              , subq_9.ds__week AS metric_time__week
+                              , subq_9.ds__month AS metric_time__month
+                              , subq_9.ds__quarter AS metric_time__quarter
+                              , subq_9.ds__year AS metric_time__year
+                              , subq_9.ds__extract_year AS metric_time__extract_year
+                              , subq_9.ds__extract_quarter AS metric_time__extract_quarter
+                              , subq_9.ds__extract_month AS metric_time__extract_month
+                              , subq_9.ds__extract_day AS metric_time__extract_day
+                              , subq_9.ds__extract_dow AS metric_time__extract_dow
+                              , subq_9.ds__extract_doy AS metric_time__extract_doy
+                              , subq_9.user
+                              , subq_9.session_id
+                              , subq_9.buy__user
+                              , subq_9.buy__session_id
+                              , subq_9.buys
+                              , subq_9.buyers
                             FROM (
                               -- Read Elements From Semantic Model 'buys_source'
                               SELECT
@@ -523,33 +523,33 @@ FROM (
                                 , buys_source_src_28000.user_id AS buy__user
                                 , buys_source_src_28000.session_id AS buy__session_id
                               FROM ***************************.fct_buys buys_source_src_28000
-                            ) subq_10
-                          ) subq_11
-                        ) subq_12
+                            ) subq_9
+                          ) subq_10
+                        ) subq_11
                         ON
                           (
-                            subq_9.user = subq_12.user
+                            subq_8.user = subq_11.user
                           ) AND (
-                            (subq_9.ds__day <= subq_12.ds__day)
+                            (subq_8.ds__day <= subq_11.ds__day)
                           )
-                      ) subq_13
-                    ) subq_14
-                  ) subq_15
+                      ) subq_12
+                    ) subq_13
+                  ) subq_14
                   GROUP BY
                     user
-                ) subq_16
+                ) subq_15
                 ON
-                  subq_6.user = subq_16.user
+                  subq_6.user = subq_15.user
                 GROUP BY
                   user
-              ) subq_17
-            ) subq_18
-          ) subq_19
+              ) subq_16
+            ) subq_17
+          ) subq_18
           ON
-            subq_2.user = subq_19.user
-        ) subq_20
-      ) subq_21
+            subq_2.user = subq_18.user
+        ) subq_19
+      ) subq_20
       WHERE user__visit_buy_conversion_rate > 2
-    ) subq_22
-  ) subq_23
-) subq_24
+    ) subq_21
+  ) subq_22
+) subq_23
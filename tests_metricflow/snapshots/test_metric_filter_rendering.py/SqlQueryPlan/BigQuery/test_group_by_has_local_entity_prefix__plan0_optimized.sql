@@ -8,8 +8,8 @@ FROM (
   -- Join Standard Outputs
   -- Pass Only Elements: ['listings', 'user__listing__user__average_booking_value']
   SELECT
-    subq_32.listing__user__average_booking_value AS user__listing__user__average_booking_value
-    , subq_21.listings AS listings
+    subq_31.listing__user__average_booking_value AS user__listing__user__average_booking_value
+    , subq_20.listings AS listings
   FROM (
     -- Read Elements From Semantic Model 'listings_latest'
     -- Metric Time Dimension 'ds'
@@ -18,7 +18,7 @@ FROM (
       user_id AS user
       , 1 AS listings
     FROM ***************************.dim_listings_latest listings_latest_src_28000
-  ) subq_21
+  ) subq_20
   LEFT OUTER JOIN (
     -- Join Standard Outputs
     -- Pass Only Elements: ['average_booking_value', 'listing__user']
@@ -35,8 +35,8 @@ FROM (
       bookings_source_src_28000.listing_id = listings_latest_src_28000.listing_id
     GROUP BY
       listing__user
-  ) subq_32
+  ) subq_31
   ON
-    subq_21.user = subq_32.listing__user
-) subq_34
+    subq_20.user = subq_31.listing__user
+) subq_33
 WHERE user__listing__user__average_booking_value > 1
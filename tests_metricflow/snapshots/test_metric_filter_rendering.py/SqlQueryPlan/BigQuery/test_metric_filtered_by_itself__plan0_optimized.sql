@@ -8,8 +8,8 @@ FROM (
   -- Join Standard Outputs
   -- Pass Only Elements: ['bookers', 'listing__bookers']
   SELECT
-    subq_22.listing__bookers AS listing__bookers
-    , subq_16.bookers AS bookers
+    subq_21.listing__bookers AS listing__bookers
+    , subq_15.bookers AS bookers
   FROM (
     -- Read Elements From Semantic Model 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -18,7 +18,7 @@ FROM (
       listing_id AS listing
       , guest_id AS bookers
     FROM ***************************.fct_bookings bookings_source_src_28000
-  ) subq_16
+  ) subq_15
   LEFT OUTER JOIN (
     -- Read Elements From Semantic Model 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -32,8 +32,8 @@ FROM (
     FROM ***************************.fct_bookings bookings_source_src_28000
     GROUP BY
       listing
-  ) subq_22
+  ) subq_21
   ON
-    subq_16.listing = subq_22.listing
-) subq_24
+    subq_15.listing = subq_21.listing
+) subq_23
 WHERE listing__bookers > 1.00
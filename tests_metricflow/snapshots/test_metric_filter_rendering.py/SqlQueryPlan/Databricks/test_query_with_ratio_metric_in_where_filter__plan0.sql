@@ -1,29 +1,29 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_20.listings
+  subq_19.listings
 FROM (
   -- Aggregate Measures
   SELECT
-    SUM(subq_19.listings) AS listings
+    SUM(subq_18.listings) AS listings
   FROM (
     -- Pass Only Elements: ['listings',]
     SELECT
-      subq_18.listings
+      subq_17.listings
     FROM (
       -- Constrain Output with WHERE
       SELECT
-        subq_17.listing__bookings_per_booker
-        , subq_17.listings
+        subq_16.listing__bookings_per_booker
+        , subq_16.listings
       FROM (
         -- Pass Only Elements: ['listings', 'listing__bookings_per_booker']
         SELECT
-          subq_16.listing__bookings_per_booker
-          , subq_16.listings
+          subq_15.listing__bookings_per_booker
+          , subq_15.listings
         FROM (
           -- Join Standard Outputs
           SELECT
             subq_2.listing AS listing
-            , subq_15.listing__bookings_per_booker AS listing__bookings_per_booker
+            , subq_14.listing__bookings_per_booker AS listing__bookings_per_booker
             , subq_2.listings AS listings
           FROM (
             -- Pass Only Elements: ['listings', 'listing']
@@ -166,19 +166,19 @@ FROM (
           LEFT OUTER JOIN (
             -- Pass Only Elements: ['listing', 'listing__bookings_per_booker']
             SELECT
-              subq_14.listing
-              , subq_14.listing__bookings_per_booker
+              subq_13.listing
+              , subq_13.listing__bookings_per_booker
             FROM (
               -- Compute Metrics via Expressions
               SELECT
-                subq_13.listing
-                , CAST(subq_13.bookings AS DOUBLE) / CAST(NULLIF(subq_13.bookers, 0) AS DOUBLE) AS listing__bookings_per_booker
+                subq_12.listing
+                , CAST(subq_12.bookings AS DOUBLE) / CAST(NULLIF(subq_12.bookers, 0) AS DOUBLE) AS listing__bookings_per_booker
               FROM (
                 -- Combine Aggregated Outputs
                 SELECT
-                  COALESCE(subq_7.listing, subq_12.listing) AS listing
+                  COALESCE(subq_7.listing, subq_11.listing) AS listing
                   , MAX(subq_7.bookings) AS bookings
-                  , MAX(subq_12.bookers) AS bookers
+                  , MAX(subq_11.bookers) AS bookers
                 FROM (
                   -- Compute Metrics via Expressions
                   SELECT
@@ -397,119 +397,119 @@ FROM (
                 FULL OUTER JOIN (
                   -- Compute Metrics via Expressions
                   SELECT
-                    subq_11.listing
-                    , subq_11.bookers
+                    subq_10.listing
+                    , subq_10.bookers
                   FROM (
                     -- Aggregate Measures
                     SELECT
-                      subq_10.listing
-                      , COUNT(DISTINCT subq_10.bookers) AS bookers
+                      subq_9.listing
+                      , COUNT(DISTINCT subq_9.bookers) AS bookers
                     FROM (
                       -- Pass Only Elements: ['bookers', 'listing']
                       SELECT
-                        subq_9.listing
-                        , subq_9.bookers
+                        subq_8.listing
+                        , subq_8.bookers
                       FROM (
                         -- Metric Time Dimension 'ds'
                         SELECT
-                          subq_8.ds__day
-                          , subq_8.ds__week
-                          , subq_8.ds__month
-                          , subq_8.ds__quarter
-                          , subq_8.ds__year
-                          , subq_8.ds__extract_year
-                          , subq_8.ds__extract_quarter
-                          , subq_8.ds__extract_month
-                          , subq_8.ds__extract_day
-                          , subq_8.ds__extract_dow
-                          , subq_8.ds__extract_doy
-                          , subq_8.ds_partitioned__day
-                          , subq_8.ds_partitioned__week
-                          , subq_8.ds_partitioned__month
-                          , subq_8.ds_partitioned__quarter
-                          , subq_8.ds_partitioned__year
-                          , subq_8.ds_partitioned__extract_year
-                          , subq_8.ds_partitioned__extract_quarter
-                          , subq_8.ds_partitioned__extract_month
-                          , subq_8.ds_partitioned__extract_day
-                          , subq_8.ds_partitioned__extract_dow
-                          , subq_8.ds_partitioned__extract_doy
-                          , subq_8.paid_at__day
-                          , subq_8.paid_at__week
-                          , subq_8.paid_at__month
-                          , subq_8.paid_at__quarter
-                          , subq_8.paid_at__year
-                          , subq_8.paid_at__extract_year
-                          , subq_8.paid_at__extract_quarter
-                          , subq_8.paid_at__extract_month
-                          , subq_8.paid_at__extract_day
-                          , subq_8.paid_at__extract_dow
-                          , subq_8.paid_at__extract_doy
-                          , subq_8.booking__ds__day
-                          , subq_8.booking__ds__week
-                          , subq_8.booking__ds__month
-                          , subq_8.booking__ds__quarter
-                          , subq_8.booking__ds__year
-                          , subq_8.booking__ds__extract_year
-                          , subq_8.booking__ds__extract_quarter
-                          , subq_8.booking__ds__extract_month
-                          , subq_8.booking__ds__extract_day
-                          , subq_8.booking__ds__extract_dow
-                          , subq_8.booking__ds__extract_doy
-                          , subq_8.booking__ds_partitioned__day
-                          , subq_8.booking__ds_partitioned__week
-                          , subq_8.booking__ds_partitioned__month
-                          , subq_8.booking__ds_partitioned__quarter
-                          , subq_8.booking__ds_partitioned__year
-                          , subq_8.booking__ds_partitioned__extract_year
-                          , subq_8.booking__ds_partitioned__extract_quarter
-                          , subq_8.booking__ds_partitioned__extract_month
-                          , subq_8.booking__ds_partitioned__extract_day
-                          , subq_8.booking__ds_partitioned__extract_dow
-                          , subq_8.booking__ds_partitioned__extract_doy
-                          , subq_8.booking__paid_at__day
-                          , subq_8.booking__paid_at__week
-                          , subq_8.booking__paid_at__month
-                          , subq_8.booking__paid_at__quarter
-                          , subq_8.booking__paid_at__year
-                          , subq_8.booking__paid_at__extract_year
-                          , subq_8.booking__paid_at__extract_quarter
-                          , subq_8.booking__paid_at__extract_month
-                          , subq_8.booking__paid_at__extract_day
-                          , subq_8.booking__paid_at__extract_dow
-                          , subq_8.booking__paid_at__extract_doy
-                          , subq_8.ds__day AS metric_time__day
-                          , subq_8.ds__week AS metric_time__week
-                          , subq_8.ds__month AS metric_time__month
-                          , subq_8.ds__quarter AS metric_time__quarter
-                          , subq_8.ds__year AS metric_time__year
-                          , subq_8.ds__extract_year AS metric_time__extract_year
-                          , subq_8.ds__extract_quarter AS metric_time__extract_quarter
-                          , subq_8.ds__extract_month AS metric_time__extract_month
-                          , subq_8.ds__extract_day AS metric_time__extract_day
-                          , subq_8.ds__extract_dow AS metric_time__extract_dow
-                          , subq_8.ds__extract_doy AS metric_time__extract_doy
-                          , subq_8.listing
-                          , subq_8.guest
-                          , subq_8.host
-                          , subq_8.booking__listing
-                          , subq_8.booking__guest
-                          , subq_8.booking__host
-                          , subq_8.is_instant
-                          , subq_8.booking__is_instant
-                          , subq_8.bookings
-                          , subq_8.instant_bookings
-                          , subq_8.booking_value
-                          , subq_8.max_booking_value
-                          , subq_8.min_booking_value
-                          , subq_8.bookers
-                          , subq_8.average_booking_value
-                          , subq_8.referred_bookings
-                          , subq_8.median_booking_value
-                          , subq_8.booking_value_p99
-                          , subq_8.discrete_booking_value_p99
-                          , subq_8.approximate_continuous_booking_value_p99
-                          , subq_8.approximate_discrete_booking_value_p99
+                          subq_3.ds__day
+                          , subq_3.ds__week
+                          , subq_3.ds__month
+                          , subq_3.ds__quarter
+                          , subq_3.ds__year
+                          , subq_3.ds__extract_year
+                          , subq_3.ds__extract_quarter
+                          , subq_3.ds__extract_month
+                          , subq_3.ds__extract_day
+                          , subq_3.ds__extract_dow
+                          , subq_3.ds__extract_doy
+                          , subq_3.ds_partitioned__day
+                          , subq_3.ds_partitioned__week
+                          , subq_3.ds_partitioned__month
+                          , subq_3.ds_partitioned__quarter
+                          , subq_3.ds_partitioned__year
+                          , subq_3.ds_partitioned__extract_year
+                          , subq_3.ds_partitioned__extract_quarter
+                          , subq_3.ds_partitioned__extract_month
+                          , subq_3.ds_partitioned__extract_day
+                          , subq_3.ds_partitioned__extract_dow
+                          , subq_3.ds_partitioned__extract_doy
+                          , subq_3.paid_at__day
+                          , subq_3.paid_at__week
+                          , subq_3.paid_at__month
+                          , subq_3.paid_at__quarter
+                          , subq_3.paid_at__year
+                          , subq_3.paid_at__extract_year
+                          , subq_3.paid_at__extract_quarter
+                          , subq_3.paid_at__extract_month
+                          , subq_3.paid_at__extract_day
+                          , subq_3.paid_at__extract_dow
+                          , subq_3.paid_at__extract_doy
+                          , subq_3.booking__ds__day
+                          , subq_3.booking__ds__week
+                          , subq_3.booking__ds__month
+                          , subq_3.booking__ds__quarter
+                          , subq_3.booking__ds__year
+                          , subq_3.booking__ds__extract_year
+                          , subq_3.booking__ds__extract_quarter
+                          , subq_3.booking__ds__extract_month
+                          , subq_3.booking__ds__extract_day
+                          , subq_3.booking__ds__extract_dow
+                          , subq_3.booking__ds__extract_doy
+                          , subq_3.booking__ds_partitioned__day
+                          , subq_3.booking__ds_partitioned__week
+                          , subq_3.booking__ds_partitioned__month
+                          , subq_3.booking__ds_partitioned__quarter
+                          , subq_3.booking__ds_partitioned__year
+                          , subq_3.booking__ds_partitioned__extract_year
+                          , subq_3.booking__ds_partitioned__extract_quarter
+                          , subq_3.booking__ds_partitioned__extract_month
+                          , subq_3.booking__ds_partitioned__extract_day
+                          , subq_3.booking__ds_partitioned__extract_dow
+                          , subq_3.booking__ds_partitioned__extract_doy
+                          , subq_3.booking__paid_at__day
+                          , subq_3.booking__paid_at__week
+                          , subq_3.booking__paid_at__month
+                          , subq_3.booking__paid_at__quarter
+                          , subq_3.booking__paid_at__year
+                          , subq_3.booking__paid_at__extract_year
+                          , subq_3.booking__paid_at__extract_quarter
+                          , subq_3.booking__paid_at__extract_month
+                          , subq_3.booking__paid_at__extract_day
+                          , subq_3.booking__paid_at__extract_dow
+                          , subq_3.booking__paid_at__extract_doy
+                          , subq_3.ds__day AS metric_time__day
+                          , subq_3.ds__week AS metric_time__week
+                          , subq_3.ds__month AS metric_time__month
+                          , subq_3.ds__quarter AS metric_time__quarter
+                          , subq_3.ds__year AS metric_time__year
+                          , subq_3.ds__extract_year AS metric_time__extract_year
+                          , subq_3.ds__extract_quarter AS metric_time__extract_quarter
+                          , subq_3.ds__extract_month AS metric_time__extract_month
+                          , subq_3.ds__extract_day AS metric_time__extract_day
+                          , subq_3.ds__extract_dow AS metric_time__extract_dow
+                          , subq_3.ds__extract_doy AS metric_time__extract_doy
+                          , subq_3.listing
+                          , subq_3.guest
+                          , subq_3.host
+                          , subq_3.booking__listing
+                          , subq_3.booking__guest
+                          , subq_3.booking__host
+                          , subq_3.is_instant
+                          , subq_3.booking__is_instant
+                          , subq_3.bookings
+                          , subq_3.instant_bookings
+                          , subq_3.booking_value
+                          , subq_3.max_booking_value
+                          , subq_3.min_booking_value
+                          , subq_3.bookers
+                          , subq_3.average_booking_value
+                          , subq_3.referred_bookings
+                          , subq_3.median_booking_value
+                          , subq_3.booking_value_p99
+                          , subq_3.discrete_booking_value_p99
+                          , subq_3.approximate_continuous_booking_value_p99
+                          , subq_3.approximate_discrete_booking_value_p99
                         FROM (
                           -- Read Elements From Semantic Model 'bookings_source'
                           SELECT
@@ -602,25 +602,25 @@ FROM (
                             , bookings_source_src_28000.guest_id AS booking__guest
                             , bookings_source_src_28000.host_id AS booking__host
                           FROM ***************************.fct_bookings bookings_source_src_28000
-                        ) subq_8
-                      ) subq_9
-                    ) subq_10
+                        ) subq_3
+                      ) subq_8
+                    ) subq_9
                     GROUP BY
-                      subq_10.listing
-                  ) subq_11
-                ) subq_12
+                      subq_9.listing
+                  ) subq_10
+                ) subq_11
                 ON
-                  subq_7.listing = subq_12.listing
+                  subq_7.listing = subq_11.listing
                 GROUP BY
-                  COALESCE(subq_7.listing, subq_12.listing)
-              ) subq_13
-            ) subq_14
-          ) subq_15
+                  COALESCE(subq_7.listing, subq_11.listing)
+              ) subq_12
+            ) subq_13
+          ) subq_14
           ON
-            subq_2.listing = subq_15.listing
-        ) subq_16
-      ) subq_17
+            subq_2.listing = subq_14.listing
+        ) subq_15
+      ) subq_16
       WHERE listing__bookings_per_booker > 1
-    ) subq_18
-  ) subq_19
-) subq_20
+    ) subq_17
+  ) subq_18
+) subq_19
@@ -1,32 +1,32 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_19.listings
+  subq_18.listings
 FROM (
   -- Aggregate Measures
   SELECT
-    SUM(subq_18.listings) AS listings
+    SUM(subq_17.listings) AS listings
   FROM (
     -- Pass Only Elements: ['listings',]
     SELECT
-      subq_17.listings
+      subq_16.listings
     FROM (
       -- Constrain Output with WHERE
       SELECT
-        subq_16.listing__bookings
-        , subq_16.listing__bookers
-        , subq_16.listings
+        subq_15.listing__bookings
+        , subq_15.listing__bookers
+        , subq_15.listings
       FROM (
         -- Pass Only Elements: ['listings', 'listing__bookings', 'listing__bookers']
         SELECT
-          subq_15.listing__bookings
-          , subq_15.listing__bookers
-          , subq_15.listings
+          subq_14.listing__bookings
+          , subq_14.listing__bookers
+          , subq_14.listings
         FROM (
           -- Join Standard Outputs
           SELECT
             subq_2.listing AS listing
             , subq_8.listing__bookings AS listing__bookings
-            , subq_14.listing__bookers AS listing__bookers
+            , subq_13.listing__bookers AS listing__bookers
             , subq_2.listings AS listings
           FROM (
             -- Pass Only Elements: ['listings', 'listing', 'listing']
@@ -392,124 +392,124 @@ FROM (
           LEFT OUTER JOIN (
             -- Pass Only Elements: ['listing', 'listing__bookers']
             SELECT
-              subq_13.listing
-              , subq_13.listing__bookers
+              subq_12.listing
+              , subq_12.listing__bookers
             FROM (
               -- Compute Metrics via Expressions
               SELECT
-                subq_12.listing
-                , subq_12.bookers AS listing__bookers
+                subq_11.listing
+                , subq_11.bookers AS listing__bookers
               FROM (
                 -- Aggregate Measures
                 SELECT
-                  subq_11.listing
-                  , COUNT(DISTINCT subq_11.bookers) AS bookers
+                  subq_10.listing
+                  , COUNT(DISTINCT subq_10.bookers) AS bookers
                 FROM (
                   -- Pass Only Elements: ['bookers', 'listing']
                   SELECT
-                    subq_10.listing
-                    , subq_10.bookers
+                    subq_9.listing
+                    , subq_9.bookers
                   FROM (
                     -- Metric Time Dimension 'ds'
                     SELECT
-                      subq_9.ds__day
-                      , subq_9.ds__week
-                      , subq_9.ds__month
-                      , subq_9.ds__quarter
-                      , subq_9.ds__year
-                      , subq_9.ds__extract_year
-                      , subq_9.ds__extract_quarter
-                      , subq_9.ds__extract_month
-                      , subq_9.ds__extract_day
-                      , subq_9.ds__extract_dow
-                      , subq_9.ds__extract_doy
-                      , subq_9.ds_partitioned__day
-                      , subq_9.ds_partitioned__week
-                      , subq_9.ds_partitioned__month
-                      , subq_9.ds_partitioned__quarter
-                      , subq_9.ds_partitioned__year
-                      , subq_9.ds_partitioned__extract_year
-                      , subq_9.ds_partitioned__extract_quarter
-                      , subq_9.ds_partitioned__extract_month
-                      , subq_9.ds_partitioned__extract_day
-                      , subq_9.ds_partitioned__extract_dow
-                      , subq_9.ds_partitioned__extract_doy
-                      , subq_9.paid_at__day
-                      , subq_9.paid_at__week
-                      , subq_9.paid_at__month
-                      , subq_9.paid_at__quarter
-                      , subq_9.paid_at__year
-                      , subq_9.paid_at__extract_year
-                      , subq_9.paid_at__extract_quarter
-                      , subq_9.paid_at__extract_month
-                      , subq_9.paid_at__extract_day
-                      , subq_9.paid_at__extract_dow
-                      , subq_9.paid_at__extract_doy
-                      , subq_9.booking__ds__day
-                      , subq_9.booking__ds__week
-                      , subq_9.booking__ds__month
-                      , subq_9.booking__ds__quarter
-                      , subq_9.booking__ds__year
-                      , subq_9.booking__ds__extract_year
-                      , subq_9.booking__ds__extract_quarter
-                      , subq_9.booking__ds__extract_month
-                      , subq_9.booking__ds__extract_day
-                      , subq_9.booking__ds__extract_dow
-                      , subq_9.booking__ds__extract_doy
-                      , subq_9.booking__ds_partitioned__day
-                      , subq_9.booking__ds_partitioned__week
-                      , subq_9.booking__ds_partitioned__month
-                      , subq_9.booking__ds_partitioned__quarter
-                      , subq_9.booking__ds_partitioned__year
-                      , subq_9.booking__ds_partitioned__extract_year
-                      , subq_9.booking__ds_partitioned__extract_quarter
-                      , subq_9.booking__ds_partitioned__extract_month
-                      , subq_9.booking__ds_partitioned__extract_day
-                      , subq_9.booking__ds_partitioned__extract_dow
-                      , subq_9.booking__ds_partitioned__extract_doy
-                      , subq_9.booking__paid_at__day
-                      , subq_9.booking__paid_at__week
-                      , subq_9.booking__paid_at__month
-                      , subq_9.booking__paid_at__quarter
-                      , subq_9.booking__paid_at__year
-                      , subq_9.booking__paid_at__extract_year
-                      , subq_9.booking__paid_at__extract_quarter
-                      , subq_9.booking__paid_at__extract_month
-                      , subq_9.booking__paid_at__extract_day
-                      , subq_9.booking__paid_at__extract_dow
-                      , subq_9.booking__paid_at__extract_doy
-                      , subq_9.ds__day AS metric_time__day
-                      , subq_9.ds__week AS metric_time__week
-                      , subq_9.ds__month AS metric_time__month
-                      , subq_9.ds__quarter AS metric_time__quarter
-                      , subq_9.ds__year AS metric_time__year
-                      , subq_9.ds__extract_year AS metric_time__extract_year
-                      , subq_9.ds__extract_quarter AS metric_time__extract_quarter
-                      , subq_9.ds__extract_month AS metric_time__extract_month
-                      , subq_9.ds__extract_day AS metric_time__extract_day
-                      , subq_9.ds__extract_dow AS metric_time__extract_dow
-                      , subq_9.ds__extract_doy AS metric_time__extract_doy
-                      , subq_9.listing
-                      , subq_9.guest
-                      , subq_9.host
-                      , subq_9.booking__listing
-                      , subq_9.booking__guest
-                      , subq_9.booking__host
-                      , subq_9.is_instant
-                      , subq_9.booking__is_instant
-                      , subq_9.bookings
-                      , subq_9.instant_bookings
-                      , subq_9.booking_value
-                      , subq_9.max_booking_value
-                      , subq_9.min_booking_value
-                      , subq_9.bookers
-                      , subq_9.average_booking_value
-                      , subq_9.referred_bookings
-                      , subq_9.median_booking_value
-                      , subq_9.booking_value_p99
-                      , subq_9.discrete_booking_value_p99
-                      , subq_9.approximate_continuous_booking_value_p99
-                      , subq_9.approximate_discrete_booking_value_p99
+                      subq_3.ds__day
+                      , subq_3.ds__week
+                      , subq_3.ds__month
+                      , subq_3.ds__quarter
+                      , subq_3.ds__year
+                      , subq_3.ds__extract_year
+                      , subq_3.ds__extract_quarter
+                      , subq_3.ds__extract_month
+                      , subq_3.ds__extract_day
+                      , subq_3.ds__extract_dow
+                      , subq_3.ds__extract_doy
+                      , subq_3.ds_partitioned__day
+                      , subq_3.ds_partitioned__week
+                      , subq_3.ds_partitioned__month
+                      , subq_3.ds_partitioned__quarter
+                      , subq_3.ds_partitioned__year
+                      , subq_3.ds_partitioned__extract_year
+                      , subq_3.ds_partitioned__extract_quarter
+                      , subq_3.ds_partitioned__extract_month
+                      , subq_3.ds_partitioned__extract_day
+                      , subq_3.ds_partitioned__extract_dow
+                      , subq_3.ds_partitioned__extract_doy
+                      , subq_3.paid_at__day
+                      , subq_3.paid_at__week
+                      , subq_3.paid_at__month
+                      , subq_3.paid_at__quarter
+                      , subq_3.paid_at__year
+                      , subq_3.paid_at__extract_year
+                      , subq_3.paid_at__extract_quarter
+                      , subq_3.paid_at__extract_month
+                      , subq_3.paid_at__extract_day
+                      , subq_3.paid_at__extract_dow
+                      , subq_3.paid_at__extract_doy
+                      , subq_3.booking__ds__day
+                      , subq_3.booking__ds__week
+                      , subq_3.booking__ds__month
+                      , subq_3.booking__ds__quarter
+                      , subq_3.booking__ds__year
+                      , subq_3.booking__ds__extract_year
+                      , subq_3.booking__ds__extract_quarter
+                      , subq_3.booking__ds__extract_month
+                      , subq_3.booking__ds__extract_day
+                      , subq_3.booking__ds__extract_dow
+                      , subq_3.booking__ds__extract_doy
+                      , subq_3.booking__ds_partitioned__day
+                      , subq_3.booking__ds_partitioned__week
+                      , subq_3.booking__ds_partitioned__month
+                      , subq_3.booking__ds_partitioned__quarter
+                      , subq_3.booking__ds_partitioned__year
+                      , subq_3.booking__ds_partitioned__extract_year
+                      , subq_3.booking__ds_partitioned__extract_quarter
+                      , subq_3.booking__ds_partitioned__extract_month
+                      , subq_3.booking__ds_partitioned__extract_day
+                      , subq_3.booking__ds_partitioned__extract_dow
+                      , subq_3.booking__ds_partitioned__extract_doy
+                      , subq_3.booking__paid_at__day
+                      , subq_3.booking__paid_at__week
+                      , subq_3.booking__paid_at__month
+                      , subq_3.booking__paid_at__quarter
+                      , subq_3.booking__paid_at__year
+                      , subq_3.booking__paid_at__extract_year
+                      , subq_3.booking__paid_at__extract_quarter
+                      , subq_3.booking__paid_at__extract_month
+                      , subq_3.booking__paid_at__extract_day
+                      , subq_3.booking__paid_at__extract_dow
+                      , subq_3.booking__paid_at__extract_doy
+                      , subq_3.ds__day AS metric_time__day
+                      , subq_3.ds__week AS metric_time__week
+                      , subq_3.ds__month AS metric_time__month
+                      , subq_3.ds__quarter AS metric_time__quarter
+                      , subq_3.ds__year AS metric_time__year
+                      , subq_3.ds__extract_year AS metric_time__extract_year
+                      , subq_3.ds__extract_quarter AS metric_time__extract_quarter
+                      , subq_3.ds__extract_month AS metric_time__extract_month
+                      , subq_3.ds__extract_day AS metric_time__extract_day
+                      , subq_3.ds__extract_dow AS metric_time__extract_dow
+                      , subq_3.ds__extract_doy AS metric_time__extract_doy
+                      , subq_3.listing
+                      , subq_3.guest
+                      , subq_3.host
+                      , subq_3.booking__listing
+                      , subq_3.booking__guest
+                      , subq_3.booking__host
+                      , subq_3.is_instant
+                      , subq_3.booking__is_instant
+                      , subq_3.bookings
+                      , subq_3.instant_bookings
+                      , subq_3.booking_value
+                      , subq_3.max_booking_value
+                      , subq_3.min_booking_value
+                      , subq_3.bookers
+                      , subq_3.average_booking_value
+                      , subq_3.referred_bookings
+                      , subq_3.median_booking_value
+                      , subq_3.booking_value_p99
+                      , subq_3.discrete_booking_value_p99
+                      , subq_3.approximate_continuous_booking_value_p99
+                      , subq_3.approximate_discrete_booking_value_p99
                     FROM (
                       -- Read Elements From Semantic Model 'bookings_source'
                       SELECT
@@ -602,19 +602,19 @@ FROM (
                         , bookings_source_src_28000.guest_id AS booking__guest
                         , bookings_source_src_28000.host_id AS booking__host
                       FROM ***************************.fct_bookings bookings_source_src_28000
-                    ) subq_9
-                  ) subq_10
-                ) subq_11
+                    ) subq_3
+                  ) subq_9
+                ) subq_10
                 GROUP BY
-                  subq_11.listing
-              ) subq_12
-            ) subq_13
-          ) subq_14
+                  subq_10.listing
+              ) subq_11
+            ) subq_12
+          ) subq_13
           ON
-            subq_2.listing = subq_14.listing
-        ) subq_15
-      ) subq_16
+            subq_2.listing = subq_13.listing
+        ) subq_14
+      ) subq_15
       WHERE listing__bookings > 2 AND listing__bookers > 1
-    ) subq_17
-  ) subq_18
-) subq_19
+    ) subq_16
+  ) subq_17
+) subq_18
@@ -8,9 +8,9 @@ FROM (
   -- Join Standard Outputs
   -- Pass Only Elements: ['listings', 'listing__bookings', 'listing__bookers']
   SELECT
-    subq_28.listing__bookings AS listing__bookings
-    , subq_34.listing__bookers AS listing__bookers
-    , subq_22.listings AS listings
+    subq_27.listing__bookings AS listing__bookings
+    , subq_33.listing__bookers AS listing__bookers
+    , subq_21.listings AS listings
   FROM (
     -- Read Elements From Semantic Model 'listings_latest'
     -- Metric Time Dimension 'ds'
@@ -19,7 +19,7 @@ FROM (
       listing_id AS listing
       , 1 AS listings
     FROM ***************************.dim_listings_latest listings_latest_src_28000
-  ) subq_22
+  ) subq_21
   LEFT OUTER JOIN (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -35,12 +35,12 @@ FROM (
         listing_id AS listing
         , 1 AS bookings
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_25
+    ) subq_24
     GROUP BY
       listing
-  ) subq_28
+  ) subq_27
   ON
-    subq_22.listing = subq_28.listing
+    subq_21.listing = subq_27.listing
   LEFT OUTER JOIN (
     -- Read Elements From Semantic Model 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -54,8 +54,8 @@ FROM (
     FROM ***************************.fct_bookings bookings_source_src_28000
     GROUP BY
       listing_id
-  ) subq_34
+  ) subq_33
   ON
-    subq_22.listing = subq_34.listing
-) subq_36
+    subq_21.listing = subq_33.listing
+) subq_35
 WHERE listing__bookings > 2 AND listing__bookers > 1
@@ -8,8 +8,8 @@ FROM (
   -- Join Standard Outputs
   -- Pass Only Elements: ['listings', 'user__visit_buy_conversion_rate']
   SELECT
-    CAST(subq_42.buys AS DOUBLE PRECISION) / CAST(NULLIF(subq_42.visits, 0) AS DOUBLE PRECISION) AS user__visit_buy_conversion_rate
-    , subq_27.listings AS listings
+    CAST(subq_41.buys AS DOUBLE PRECISION) / CAST(NULLIF(subq_41.visits, 0) AS DOUBLE PRECISION) AS user__visit_buy_conversion_rate
+    , subq_26.listings AS listings
   FROM (
     -- Read Elements From Semantic Model 'listings_latest'
     -- Metric Time Dimension 'ds'
@@ -18,17 +18,17 @@ FROM (
       user_id AS user
       , 1 AS listings
     FROM ***************************.dim_listings_latest listings_latest_src_28000
-  ) subq_27
+  ) subq_26
   LEFT OUTER JOIN (
     -- Combine Aggregated Outputs
     SELECT
-      COALESCE(subq_31.user, subq_41.user) AS user
-      , MAX(subq_31.visits) AS visits
-      , MAX(subq_41.buys) AS buys
+      COALESCE(subq_30.user, subq_40.user) AS user
+      , MAX(subq_30.visits) AS visits
+      , MAX(subq_40.buys) AS buys
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_30.user
+        subq_29.user
         , SUM(visits) AS visits
       FROM (
         -- Read Elements From Semantic Model 'visits_source'
@@ -38,46 +38,46 @@ FROM (
           user_id AS user
           , 1 AS visits
         FROM ***************************.fct_visits visits_source_src_28000
-      ) subq_30
+      ) subq_29
       GROUP BY
-        subq_30.user
-    ) subq_31
+        subq_29.user
+    ) subq_30
     FULL OUTER JOIN (
       -- Find conversions for user within the range of INF
       -- Pass Only Elements: ['buys', 'user']
       -- Aggregate Measures
       SELECT
-        subq_38.user
+        subq_37.user
         , SUM(buys) AS buys
       FROM (
         -- Dedupe the fanout with mf_internal_uuid in the conversion data set
         SELECT DISTINCT
-          FIRST_VALUE(subq_34.visits) OVER (
+          FIRST_VALUE(subq_33.visits) OVER (
             PARTITION BY
-              subq_37.user
-              , subq_37.ds__day
-              , subq_37.mf_internal_uuid
-            ORDER BY subq_34.ds__day DESC
+              subq_36.user
+              , subq_36.ds__day
+              , subq_36.mf_internal_uuid
+            ORDER BY subq_33.ds__day DESC
             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
           ) AS visits
-          , FIRST_VALUE(subq_34.ds__day) OVER (
+          , FIRST_VALUE(subq_33.ds__day) OVER (
             PARTITION BY
-              subq_37.user
-              , subq_37.ds__day
-              , subq_37.mf_internal_uuid
-            ORDER BY subq_34.ds__day DESC
+              subq_36.user
+              , subq_36.ds__day
+              , subq_36.mf_internal_uuid
+            ORDER BY subq_33.ds__day DESC
             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
           ) AS ds__day
-          , FIRST_VALUE(subq_34.user) OVER (
+          , FIRST_VALUE(subq_33.user) OVER (
             PARTITION BY
-              subq_37.user
-              , subq_37.ds__day
-              , subq_37.mf_internal_uuid
-            ORDER BY subq_34.ds__day DESC
+              subq_36.user
+              , subq_36.ds__day
+              , subq_36.mf_internal_uuid
+            ORDER BY subq_33.ds__day DESC
             ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
           ) AS user
-          , subq_37.mf_internal_uuid AS mf_internal_uuid
-          , subq_37.buys AS buys
+          , subq_36.mf_internal_uuid AS mf_internal_uuid
+          , subq_36.buys AS buys
         FROM (
           -- Read Elements From Semantic Model 'visits_source'
           -- Metric Time Dimension 'ds'
@@ -87,7 +87,7 @@ FROM (
             , user_id AS user
             , 1 AS visits
           FROM ***************************.fct_visits visits_source_src_28000
-        ) subq_34
+        ) subq_33
         INNER JOIN (
           -- Read Elements From Semantic Model 'buys_source'
           -- Metric Time Dimension 'ds'
@@ -98,23 +98,23 @@ FROM (
             , 1 AS buys
             , CONCAT(CAST(RANDOM()*100000000 AS INT)::VARCHAR,CAST(RANDOM()*100000000 AS INT)::VARCHAR) AS mf_internal_uuid
           FROM ***************************.fct_buys buys_source_src_28000
-        ) subq_37
+        ) subq_36
         ON
           (
-            subq_34.user = subq_37.user
+            subq_33.user = subq_36.user
           ) AND (
-            (subq_34.ds__day <= subq_37.ds__day)
+            (subq_33.ds__day <= subq_36.ds__day)
           )
-      ) subq_38
+      ) subq_37
       GROUP BY
-        subq_38.user
-    ) subq_41
+        subq_37.user
+    ) subq_40
     ON
-      subq_31.user = subq_41.user
+      subq_30.user = subq_40.user
     GROUP BY
-      COALESCE(subq_31.user, subq_41.user)
-  ) subq_42
+      COALESCE(subq_30.user, subq_40.user)
+  ) subq_41
   ON
-    subq_27.user = subq_42.user
-) subq_46
+    subq_26.user = subq_41.user
+) subq_45
 WHERE user__visit_buy_conversion_rate > 2
@@ -1,30 +1,30 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_18.listings
+  subq_17.listings
 FROM (
   -- Aggregate Measures
   SELECT
-    SUM(subq_17.listings) AS listings
+    SUM(subq_16.listings) AS listings
   FROM (
     -- Pass Only Elements: ['listings',]
     SELECT
-      subq_16.listings
+      subq_15.listings
     FROM (
       -- Constrain Output with WHERE
       SELECT
-        subq_15.user__listing__user__average_booking_value
-        , subq_15.listings
+        subq_14.user__listing__user__average_booking_value
+        , subq_14.listings
       FROM (
         -- Pass Only Elements: ['listings', 'user__listing__user__average_booking_value']
         SELECT
-          subq_14.user__listing__user__average_booking_value
-          , subq_14.listings
+          subq_13.user__listing__user__average_booking_value
+          , subq_13.listings
         FROM (
           -- Join Standard Outputs
           SELECT
             subq_2.user AS user
-            , subq_13.listing__user AS user__listing__user
-            , subq_13.listing__user__average_booking_value AS user__listing__user__average_booking_value
+            , subq_12.listing__user AS user__listing__user
+            , subq_12.listing__user__average_booking_value AS user__listing__user__average_booking_value
             , subq_2.listings AS listings
           FROM (
             -- Pass Only Elements: ['listings', 'user']
@@ -167,28 +167,28 @@ FROM (
           LEFT OUTER JOIN (
             -- Pass Only Elements: ['listing__user', 'listing__user__average_booking_value']
             SELECT
-              subq_12.listing__user
-              , subq_12.listing__user__average_booking_value
+              subq_11.listing__user
+              , subq_11.listing__user__average_booking_value
             FROM (
               -- Compute Metrics via Expressions
               SELECT
-                subq_11.listing__user
-                , subq_11.average_booking_value AS listing__user__average_booking_value
+                subq_10.listing__user
+                , subq_10.average_booking_value AS listing__user__average_booking_value
               FROM (
                 -- Aggregate Measures
                 SELECT
-                  subq_10.listing__user
-                  , AVG(subq_10.average_booking_value) AS average_booking_value
+                  subq_9.listing__user
+                  , AVG(subq_9.average_booking_value) AS average_booking_value
                 FROM (
                   -- Pass Only Elements: ['average_booking_value', 'listing__user']
                   SELECT
-                    subq_9.listing__user
-                    , subq_9.average_booking_value
+                    subq_8.listing__user
+                    , subq_8.average_booking_value
                   FROM (
                     -- Join Standard Outputs
                     SELECT
                       subq_5.listing AS listing
-                      , subq_8.user AS listing__user
+                      , subq_7.user AS listing__user
                       , subq_5.average_booking_value AS average_booking_value
                     FROM (
                       -- Pass Only Elements: ['average_booking_value', 'listing']
@@ -394,78 +394,78 @@ FROM (
                     LEFT OUTER JOIN (
                       -- Pass Only Elements: ['listing', 'user']
                       SELECT
-                        subq_7.listing
-                        , subq_7.user
+                        subq_6.listing
+                        , subq_6.user
                       FROM (
                         -- Metric Time Dimension 'ds'
                         SELECT
-                          subq_6.ds__day
-                          , subq_6.ds__week
-                          , subq_6.ds__month
-                          , subq_6.ds__quarter
-                          , subq_6.ds__year
-                          , subq_6.ds__extract_year
-                          , subq_6.ds__extract_quarter
-                          , subq_6.ds__extract_month
-                          , subq_6.ds__extract_day
-                          , subq_6.ds__extract_dow
-                          , subq_6.ds__extract_doy
-                          , subq_6.created_at__day
-                          , subq_6.created_at__week
-                          , subq_6.created_at__month
-                          , subq_6.created_at__quarter
-                          , subq_6.created_at__year
-                          , subq_6.created_at__extract_year
-                          , subq_6.created_at__extract_quarter
-                          , subq_6.created_at__extract_month
-                          , subq_6.created_at__extract_day
-                          , subq_6.created_at__extract_dow
-                          , subq_6.created_at__extract_doy
-                          , subq_6.listing__ds__day
-                          , subq_6.listing__ds__week
-                          , subq_6.listing__ds__month
-                          , subq_6.listing__ds__quarter
-                          , subq_6.listing__ds__year
-                          , subq_6.listing__ds__extract_year
-                          , subq_6.listing__ds__extract_quarter
-                          , subq_6.listing__ds__extract_month
-                          , subq_6.listing__ds__extract_day
-                          , subq_6.listing__ds__extract_dow
-                          , subq_6.listing__ds__extract_doy
-                          , subq_6.listing__created_at__day
-                          , subq_6.listing__created_at__week
-                          , subq_6.listing__created_at__month
-                          , subq_6.listing__created_at__quarter
-                          , subq_6.listing__created_at__year
-                          , subq_6.listing__created_at__extract_year
-                          , subq_6.listing__created_at__extract_quarter
-                          , subq_6.listing__created_at__extract_month
-                          , subq_6.listing__created_at__extract_day
-                          , subq_6.listing__created_at__extract_dow
-                          , subq_6.listing__created_at__extract_doy
-                          , subq_6.ds__day AS metric_time__day
-                          , subq_6.ds__week AS metric_time__week
-                          , subq_6.ds__month AS metric_time__month
-                          , subq_6.ds__quarter AS metric_time__quarter
-                          , subq_6.ds__year AS metric_time__year
-                          , subq_6.ds__extract_year AS metric_time__extract_year
-                          , subq_6.ds__extract_quarter AS metric_time__extract_quarter
-                          , subq_6.ds__extract_month AS metric_time__extract_month
-                          , subq_6.ds__extract_day AS metric_time__extract_day
-                          , subq_6.ds__extract_dow AS metric_time__extract_dow
-                          , subq_6.ds__extract_doy AS metric_time__extract_doy
-                          , subq_6.listing
-                          , subq_6.user
-                          , subq_6.listing__user
-                          , subq_6.country_latest
-                          , subq_6.is_lux_latest
-                          , subq_6.capacity_latest
-                          , subq_6.listing__country_latest
-                          , subq_6.listing__is_lux_latest
-                          , subq_6.listing__capacity_latest
-                          , subq_6.listings
-                          , subq_6.largest_listing
-                          , subq_6.smallest_listing
+                          subq_0.ds__day
+                          , subq_0.ds__week
+                          , subq_0.ds__month
+                          , subq_0.ds__quarter
+                          , subq_0.ds__year
+                          , subq_0.ds__extract_year
+                          , subq_0.ds__extract_quarter
+                          , subq_0.ds__extract_month
+                          , subq_0.ds__extract_day
+                          , subq_0.ds__extract_dow
+                          , subq_0.ds__extract_doy
+                          , subq_0.created_at__day
+                          , subq_0.created_at__week
+                          , subq_0.created_at__month
+                          , subq_0.created_at__quarter
+                          , subq_0.created_at__year
+                          , subq_0.created_at__extract_year
+                          , subq_0.created_at__extract_quarter
+                          , subq_0.created_at__extract_month
+                          , subq_0.created_at__extract_day
+                          , subq_0.created_at__extract_dow
+                          , subq_0.created_at__extract_doy
+                          , subq_0.listing__ds__day
+                          , subq_0.listing__ds__week
+                          , subq_0.listing__ds__month
+                          , subq_0.listing__ds__quarter
+                          , subq_0.listing__ds__year
+                          , subq_0.listing__ds__extract_year
+                          , subq_0.listing__ds__extract_quarter
+                          , subq_0.listing__ds__extract_month
+                          , subq_0.listing__ds__extract_day
+                          , subq_0.listing__ds__extract_dow
+                          , subq_0.listing__ds__extract_doy
+                          , subq_0.listing__created_at__day
+                          , subq_0.listing__created_at__week
+                          , subq_0.listing__created_at__month
+                          , subq_0.listing__created_at__quarter
+                          , subq_0.listing__created_at__year
+                          , subq_0.listing__created_at__extract_year
+                          , subq_0.listing__created_at__extract_quarter
+                          , subq_0.listing__created_at__extract_month
+                          , subq_0.listing__created_at__extract_day
+                          , subq_0.listing__created_at__extract_dow
+                          , subq_0.listing__created_at__extract_doy
+                          , subq_0.ds__day AS metric_time__day
+                          , subq_0.ds__week AS metric_time__week
+                          , subq_0.ds__month AS metric_time__month
+                          , subq_0.ds__quarter AS metric_time__quarter
+                          , subq_0.ds__year AS metric_time__year
+                          , subq_0.ds__extract_year AS metric_time__extract_year
+                          , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+                          , subq_0.ds__extract_month AS metric_time__extract_month
+                          , subq_0.ds__extract_day AS metric_time__extract_day
+                          , subq_0.ds__extract_dow AS metric_time__extract_dow
+                          , subq_0.ds__extract_doy AS metric_time__extract_doy
+                          , subq_0.listing
+                          , subq_0.user
+                          , subq_0.listing__user
+                          , subq_0.country_latest
+                          , subq_0.is_lux_latest
+                          , subq_0.capacity_latest
+                          , subq_0.listing__country_latest
+                          , subq_0.listing__is_lux_latest
+                          , subq_0.listing__capacity_latest
+                          , subq_0.listings
+                          , subq_0.largest_listing
+                          , subq_0.smallest_listing
                         FROM (
                           -- Read Elements From Semantic Model 'listings_latest'
                           SELECT
@@ -526,23 +526,23 @@ FROM (
                             , listings_latest_src_28000.user_id AS user
                             , listings_latest_src_28000.user_id AS listing__user
                           FROM ***************************.dim_listings_latest listings_latest_src_28000
-                        ) subq_6
-                      ) subq_7
-                    ) subq_8
+                        ) subq_0
+                      ) subq_6
+                    ) subq_7
                     ON
-                      subq_5.listing = subq_8.listing
-                  ) subq_9
-                ) subq_10
+                      subq_5.listing = subq_7.listing
+                  ) subq_8
+                ) subq_9
                 GROUP BY
-                  subq_10.listing__user
-              ) subq_11
-            ) subq_12
-          ) subq_13
+                  subq_9.listing__user
+              ) subq_10
+            ) subq_11
+          ) subq_12
           ON
-            subq_2.user = subq_13.listing__user
-        ) subq_14
-      ) subq_15
+            subq_2.user = subq_12.listing__user
+        ) subq_13
+      ) subq_14
       WHERE user__listing__user__average_booking_value > 1
-    ) subq_16
-  ) subq_17
-) subq_18
+    ) subq_15
+  ) subq_16
+) subq_17
@@ -8,8 +8,8 @@ FROM (
   -- Join Standard Outputs
   -- Pass Only Elements: ['listings', 'listing__bookings_per_booker']
   SELECT
-    CAST(subq_28.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_28.bookers, 0) AS DOUBLE PRECISION) AS listing__bookings_per_booker
-    , subq_23.listings AS listings
+    CAST(subq_27.bookings AS DOUBLE PRECISION) / CAST(NULLIF(subq_27.bookers, 0) AS DOUBLE PRECISION) AS listing__bookings_per_booker
+    , subq_22.listings AS listings
   FROM (
     -- Read Elements From Semantic Model 'listings_latest'
     -- Metric Time Dimension 'ds'
@@ -18,7 +18,7 @@ FROM (
       listing_id AS listing
       , 1 AS listings
     FROM ***************************.dim_listings_latest listings_latest_src_28000
-  ) subq_23
+  ) subq_22
   LEFT OUTER JOIN (
     -- Aggregate Measures
     -- Compute Metrics via Expressions
@@ -35,11 +35,11 @@ FROM (
         , 1 AS bookings
         , guest_id AS bookers
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_26
+    ) subq_25
     GROUP BY
       listing
-  ) subq_28
+  ) subq_27
   ON
-    subq_23.listing = subq_28.listing
-) subq_32
+    subq_22.listing = subq_27.listing
+) subq_31
 WHERE listing__bookings_per_booker > 1
@@ -5,9 +5,9 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_19.metric_time__day, subq_24.metric_time__day) AS metric_time__day
-    , MAX(subq_19.average_booking_value) AS average_booking_value
-    , MAX(subq_24.max_booking_value) AS max_booking_value
+    COALESCE(subq_18.metric_time__day, subq_23.metric_time__day) AS metric_time__day
+    , MAX(subq_18.average_booking_value) AS average_booking_value
+    , MAX(subq_23.max_booking_value) AS max_booking_value
   FROM (
     -- Constrain Output with WHERE
     -- Pass Only Elements: ['average_booking_value', 'booking__is_instant', 'metric_time__day']
@@ -25,11 +25,11 @@ FROM (
         , is_instant AS booking__is_instant
         , booking_value AS average_booking_value
       FROM ***************************.fct_bookings bookings_source_src_28000
-    ) subq_14
+    ) subq_13
     WHERE booking__is_instant
     GROUP BY
       metric_time__day
-  ) subq_19
+  ) subq_18
   FULL OUTER JOIN (
     -- Read Elements From Semantic Model 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -42,9 +42,9 @@ FROM (
     FROM ***************************.fct_bookings bookings_source_src_28000
     GROUP BY
       metric_time__day
-  ) subq_24
+  ) subq_23
   ON
-    subq_19.metric_time__day = subq_24.metric_time__day
+    subq_18.metric_time__day = subq_23.metric_time__day
   GROUP BY
     metric_time__day
-) subq_25
+) subq_24
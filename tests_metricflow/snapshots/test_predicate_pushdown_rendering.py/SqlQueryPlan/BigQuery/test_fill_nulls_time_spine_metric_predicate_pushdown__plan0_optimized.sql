@@ -6,10 +6,10 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_48.metric_time__day, subq_66.metric_time__day) AS metric_time__day
-    , COALESCE(subq_48.listing__country_latest, subq_66.listing__country_latest) AS listing__country_latest
-    , COALESCE(MAX(subq_48.bookings_fill_nulls_with_0), 0) AS bookings_fill_nulls_with_0
-    , COALESCE(MAX(subq_66.bookings_2_weeks_ago), 0) AS bookings_2_weeks_ago
+    COALESCE(subq_46.metric_time__day, subq_64.metric_time__day) AS metric_time__day
+    , COALESCE(subq_46.listing__country_latest, subq_64.listing__country_latest) AS listing__country_latest
+    , COALESCE(MAX(subq_46.bookings_fill_nulls_with_0), 0) AS bookings_fill_nulls_with_0
+    , COALESCE(MAX(subq_64.bookings_2_weeks_ago), 0) AS bookings_2_weeks_ago
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -19,19 +19,19 @@ FROM (
     FROM (
       -- Join to Time Spine Dataset
       SELECT
-        subq_46.ds AS metric_time__day
-        , subq_44.listing__country_latest AS listing__country_latest
-        , subq_44.bookings AS bookings
-      FROM ***************************.mf_time_spine subq_46
+        subq_44.ds AS metric_time__day
+        , subq_42.listing__country_latest AS listing__country_latest
+        , subq_42.bookings AS bookings
+      FROM ***************************.mf_time_spine subq_44
       LEFT OUTER JOIN (
         -- Join Standard Outputs
         -- Pass Only Elements: ['bookings', 'listing__country_latest', 'booking__is_instant', 'metric_time__day']
         -- Pass Only Elements: ['bookings', 'listing__country_latest', 'metric_time__day']
         -- Aggregate Measures
         SELECT
-          subq_37.metric_time__day AS metric_time__day
+          subq_35.metric_time__day AS metric_time__day
           , listings_latest_src_28000.country AS listing__country_latest
-          , SUM(subq_37.bookings) AS bookings
+          , SUM(subq_35.bookings) AS bookings
         FROM (
           -- Constrain Output with WHERE
           -- Pass Only Elements: ['bookings', 'booking__is_instant', 'metric_time__day', 'listing']
@@ -48,21 +48,21 @@ FROM (
               , is_instant AS booking__is_instant
               , 1 AS bookings
             FROM ***************************.fct_bookings bookings_source_src_28000
-          ) subq_35
+          ) subq_33
           WHERE booking__is_instant
-        ) subq_37
+        ) subq_35
         LEFT OUTER JOIN
           ***************************.dim_listings_latest listings_latest_src_28000
         ON
-          subq_37.listing = listings_latest_src_28000.listing_id
+          subq_35.listing = listings_latest_src_28000.listing_id
         GROUP BY
           metric_time__day
           , listing__country_latest
-      ) subq_44
+      ) subq_42
       ON
-        subq_46.ds = subq_44.metric_time__day
-    ) subq_47
-  ) subq_48
+        subq_44.ds = subq_42.metric_time__day
+    ) subq_45
+  ) subq_46
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
@@ -72,10 +72,10 @@ FROM (
     FROM (
       -- Join to Time Spine Dataset
       SELECT
-        subq_64.ds AS metric_time__day
-        , subq_62.listing__country_latest AS listing__country_latest
-        , subq_62.bookings AS bookings
-      FROM ***************************.mf_time_spine subq_64
+        subq_62.ds AS metric_time__day
+        , subq_60.listing__country_latest AS listing__country_latest
+        , subq_60.bookings AS bookings
+      FROM ***************************.mf_time_spine subq_62
       LEFT OUTER JOIN (
         -- Constrain Output with WHERE
         -- Pass Only Elements: ['bookings', 'listing__country_latest', 'metric_time__day']
@@ -88,19 +88,19 @@ FROM (
           -- Join Standard Outputs
           -- Pass Only Elements: ['bookings', 'listing__country_latest', 'booking__is_instant', 'metric_time__day']
           SELECT
-            subq_54.metric_time__day AS metric_time__day
-            , subq_54.booking__is_instant AS booking__is_instant
+            subq_52.metric_time__day AS metric_time__day
+            , subq_52.booking__is_instant AS booking__is_instant
             , listings_latest_src_28000.country AS listing__country_latest
-            , subq_54.bookings AS bookings
+            , subq_52.bookings AS bookings
           FROM (
             -- Join to Time Spine Dataset
             -- Pass Only Elements: ['bookings', 'booking__is_instant', 'metric_time__day', 'listing']
             SELECT
-              subq_52.ds AS metric_time__day
-              , subq_50.listing AS listing
-              , subq_50.booking__is_instant AS booking__is_instant
-              , subq_50.bookings AS bookings
-            FROM ***************************.mf_time_spine subq_52
+              subq_50.ds AS metric_time__day
+              , subq_48.listing AS listing
+              , subq_48.booking__is_instant AS booking__is_instant
+              , subq_48.bookings AS bookings
+            FROM ***************************.mf_time_spine subq_50
             INNER JOIN (
               -- Read Elements From Semantic Model 'bookings_source'
               -- Metric Time Dimension 'ds'
@@ -110,31 +110,31 @@ FROM (
                 , is_instant AS booking__is_instant
                 , 1 AS bookings
               FROM ***************************.fct_bookings bookings_source_src_28000
-            ) subq_50
+            ) subq_48
             ON
-              DATE_SUB(CAST(subq_52.ds AS DATETIME), INTERVAL 14 day) = subq_50.metric_time__day
-          ) subq_54
+              DATE_SUB(CAST(subq_50.ds AS DATETIME), INTERVAL 14 day) = subq_48.metric_time__day
+          ) subq_52
           LEFT OUTER JOIN
             ***************************.dim_listings_latest listings_latest_src_28000
           ON
-            subq_54.listing = listings_latest_src_28000.listing_id
-        ) subq_59
+            subq_52.listing = listings_latest_src_28000.listing_id
+        ) subq_57
         WHERE booking__is_instant
         GROUP BY
           metric_time__day
           , listing__country_latest
-      ) subq_62
+      ) subq_60
       ON
-        subq_64.ds = subq_62.metric_time__day
-    ) subq_65
-  ) subq_66
+        subq_62.ds = subq_60.metric_time__day
+    ) subq_63
+  ) subq_64
   ON
     (
-      subq_48.listing__country_latest = subq_66.listing__country_latest
+      subq_46.listing__country_latest = subq_64.listing__country_latest
     ) AND (
-      subq_48.metric_time__day = subq_66.metric_time__day
+      subq_46.metric_time__day = subq_64.metric_time__day
     )
   GROUP BY
     metric_time__day
     , listing__country_latest
-) subq_67
+) subq_65
@@ -1,15 +1,15 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_27.metric_time__day
-  , subq_27.user__home_state_latest
-  , CAST(subq_27.buys AS DOUBLE) / CAST(NULLIF(subq_27.visits, 0) AS DOUBLE) AS visit_buy_conversion_rate_7days
+  subq_26.metric_time__day
+  , subq_26.user__home_state_latest
+  , CAST(subq_26.buys AS DOUBLE) / CAST(NULLIF(subq_26.visits, 0) AS DOUBLE) AS visit_buy_conversion_rate_7days
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_9.metric_time__day, subq_26.metric_time__day) AS metric_time__day
-    , COALESCE(subq_9.user__home_state_latest, subq_26.user__home_state_latest) AS user__home_state_latest
+    COALESCE(subq_9.metric_time__day, subq_25.metric_time__day) AS metric_time__day
+    , COALESCE(subq_9.user__home_state_latest, subq_25.user__home_state_latest) AS user__home_state_latest
     , MAX(subq_9.visits) AS visits
-    , MAX(subq_26.buys) AS buys
+    , MAX(subq_25.buys) AS buys
   FROM (
     -- Aggregate Measures
     SELECT
@@ -182,191 +182,191 @@ FROM (
   FULL OUTER JOIN (
     -- Aggregate Measures
     SELECT
-      subq_25.metric_time__day
-      , subq_25.user__home_state_latest
-      , SUM(subq_25.buys) AS buys
+      subq_24.metric_time__day
+      , subq_24.user__home_state_latest
+      , SUM(subq_24.buys) AS buys
     FROM (
       -- Pass Only Elements: ['buys', 'user__home_state_latest', 'metric_time__day']
       SELECT
-        subq_24.metric_time__day
-        , subq_24.user__home_state_latest
-        , subq_24.buys
+        subq_23.metric_time__day
+        , subq_23.user__home_state_latest
+        , subq_23.buys
       FROM (
         -- Join Standard Outputs
         SELECT
-          subq_21.metric_time__day AS metric_time__day
-          , subq_21.user AS user
-          , subq_21.visit__referrer_id AS visit__referrer_id
-          , subq_23.home_state_latest AS user__home_state_latest
-          , subq_21.buys AS buys
+          subq_20.metric_time__day AS metric_time__day
+          , subq_20.user AS user
+          , subq_20.visit__referrer_id AS visit__referrer_id
+          , subq_22.home_state_latest AS user__home_state_latest
+          , subq_20.buys AS buys
         FROM (
           -- Pass Only Elements: ['buys', 'visit__referrer_id', 'metric_time__day', 'user']
           SELECT
-            subq_20.metric_time__day
-            , subq_20.user
-            , subq_20.visit__referrer_id
-            , subq_20.buys
+            subq_19.metric_time__day
+            , subq_19.user
+            , subq_19.visit__referrer_id
+            , subq_19.buys
           FROM (
             -- Find conversions for user within the range of 7 day
             SELECT
-              subq_19.ds__day
-              , subq_19.metric_time__day
-              , subq_19.user
-              , subq_19.visit__referrer_id
-              , subq_19.user__home_state_latest
-              , subq_19.buys
-              , subq_19.visits
+              subq_18.ds__day
+              , subq_18.metric_time__day
+              , subq_18.user
+              , subq_18.visit__referrer_id
+              , subq_18.user__home_state_latest
+              , subq_18.buys
+              , subq_18.visits
             FROM (
               -- Dedupe the fanout with mf_internal_uuid in the conversion data set
               SELECT DISTINCT
-                FIRST_VALUE(subq_15.visits) OVER (
+                FIRST_VALUE(subq_14.visits) OVER (
                   PARTITION BY
-                    subq_18.user
-                    , subq_18.ds__day
-                    , subq_18.mf_internal_uuid
-                  ORDER BY subq_15.ds__day DESC
+                    subq_17.user
+                    , subq_17.ds__day
+                    , subq_17.mf_internal_uuid
+                  ORDER BY subq_14.ds__day DESC
                   ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                 ) AS visits
-                , FIRST_VALUE(subq_15.visit__referrer_id) OVER (
+                , FIRST_VALUE(subq_14.visit__referrer_id) OVER (
                   PARTITION BY
-                    subq_18.user
-                    , subq_18.ds__day
-                    , subq_18.mf_internal_uuid
-                  ORDER BY subq_15.ds__day DESC
+                    subq_17.user
+                    , subq_17.ds__day
+                    , subq_17.mf_internal_uuid
+                  ORDER BY subq_14.ds__day DESC
                   ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                 ) AS visit__referrer_id
-                , FIRST_VALUE(subq_15.user__home_state_latest) OVER (
+                , FIRST_VALUE(subq_14.user__home_state_latest) OVER (
                   PARTITION BY
-                    subq_18.user
-                    , subq_18.ds__day
-                    , subq_18.mf_internal_uuid
-                  ORDER BY subq_15.ds__day DESC
+                    subq_17.user
+                    , subq_17.ds__day
+                    , subq_17.mf_internal_uuid
+                  ORDER BY subq_14.ds__day DESC
                   ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                 ) AS user__home_state_latest
-                , FIRST_VALUE(subq_15.ds__day) OVER (
+                , FIRST_VALUE(subq_14.ds__day) OVER (
                   PARTITION BY
-                    subq_18.user
-                    , subq_18.ds__day
-                    , subq_18.mf_internal_uuid
-                  ORDER BY subq_15.ds__day DESC
+                    subq_17.user
+                    , subq_17.ds__day
+                    , subq_17.mf_internal_uuid
+                  ORDER BY subq_14.ds__day DESC
                   ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                 ) AS ds__day
-                , FIRST_VALUE(subq_15.metric_time__day) OVER (
+                , FIRST_VALUE(subq_14.metric_time__day) OVER (
                   PARTITION BY
-                    subq_18.user
-                    , subq_18.ds__day
-                    , subq_18.mf_internal_uuid
-                  ORDER BY subq_15.ds__day DESC
+                    subq_17.user
+                    , subq_17.ds__day
+                    , subq_17.mf_internal_uuid
+                  ORDER BY subq_14.ds__day DESC
                   ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                 ) AS metric_time__day
-                , FIRST_VALUE(subq_15.user) OVER (
+                , FIRST_VALUE(subq_14.user) OVER (
                   PARTITION BY
-                    subq_18.user
-                    , subq_18.ds__day
-                    , subq_18.mf_internal_uuid
-                  ORDER BY subq_15.ds__day DESC
+                    subq_17.user
+                    , subq_17.ds__day
+                    , subq_17.mf_internal_uuid
+                  ORDER BY subq_14.ds__day DESC
                   ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
                 ) AS user
-                , subq_18.mf_internal_uuid AS mf_internal_uuid
-                , subq_18.buys AS buys
+                , subq_17.mf_internal_uuid AS mf_internal_uuid
+                , subq_17.buys AS buys
               FROM (
                 -- Pass Only Elements: ['visits', 'visit__referrer_id', 'user__home_state_latest', 'ds__day', 'metric_time__day', 'user']
                 SELECT
-                  subq_14.ds__day
-                  , subq_14.metric_time__day
-                  , subq_14.user
-                  , subq_14.visit__referrer_id
-                  , subq_14.user__home_state_latest
-                  , subq_14.visits
+                  subq_13.ds__day
+                  , subq_13.metric_time__day
+                  , subq_13.user
+                  , subq_13.visit__referrer_id
+                  , subq_13.user__home_state_latest
+                  , subq_13.visits
                 FROM (
                   -- Join Standard Outputs
                   SELECT
-                    subq_11.ds__day AS ds__day
-                    , subq_11.ds__week AS ds__week
-                    , subq_11.ds__month AS ds__month
-                    , subq_11.ds__quarter AS ds__quarter
-                    , subq_11.ds__year AS ds__year
-                    , subq_11.ds__extract_year AS ds__extract_year
-                    , subq_11.ds__extract_quarter AS ds__extract_quarter
-                    , subq_11.ds__extract_month AS ds__extract_month
-                    , subq_11.ds__extract_day AS ds__extract_day
-                    , subq_11.ds__extract_dow AS ds__extract_dow
-                    , subq_11.ds__extract_doy AS ds__extract_doy
-                    , subq_11.visit__ds__day AS visit__ds__day
-                    , subq_11.visit__ds__week AS visit__ds__week
-                    , subq_11.visit__ds__month AS visit__ds__month
-                    , subq_11.visit__ds__quarter AS visit__ds__quarter
-                    , subq_11.visit__ds__year AS visit__ds__year
-                    , subq_11.visit__ds__extract_year AS visit__ds__extract_year
-                    , subq_11.visit__ds__extract_quarter AS visit__ds__extract_quarter
-                    , subq_11.visit__ds__extract_month AS visit__ds__extract_month
-                    , subq_11.visit__ds__extract_day AS visit__ds__extract_day
-                    , subq_11.visit__ds__extract_dow AS visit__ds__extract_dow
-                    , subq_11.visit__ds__extract_doy AS visit__ds__extract_doy
-                    , subq_11.metric_time__day AS metric_time__day
-                    , subq_11.metric_time__week AS metric_time__week
-                    , subq_11.metric_time__month AS metric_time__month
-                    , subq_11.metric_time__quarter AS metric_time__quarter
-                    , subq_11.metric_time__year AS metric_time__year
-                    , subq_11.metric_time__extract_year AS metric_time__extract_year
-                    , subq_11.metric_time__extract_quarter AS metric_time__extract_quarter
-                    , subq_11.metric_time__extract_month AS metric_time__extract_month
-                    , subq_11.metric_time__extract_day AS metric_time__extract_day
-                    , subq_11.metric_time__extract_dow AS metric_time__extract_dow
-                    , subq_11.metric_time__extract_doy AS metric_time__extract_doy
-                    , subq_11.user AS user
-                    , subq_11.session AS session
-                    , subq_11.visit__user AS visit__user
-                    , subq_11.visit__session AS visit__session
-                    , subq_11.referrer_id AS referrer_id
-                    , subq_11.visit__referrer_id AS visit__referrer_id
-                    , subq_13.home_state_latest AS user__home_state_latest
-                    , subq_11.visits AS visits
-                    , subq_11.visitors AS visitors
+                    subq_10.ds__day AS ds__day
+                    , subq_10.ds__week AS ds__week
+                    , subq_10.ds__month AS ds__month
+                    , subq_10.ds__quarter AS ds__quarter
+                    , subq_10.ds__year AS ds__year
+                    , subq_10.ds__extract_year AS ds__extract_year
+                    , subq_10.ds__extract_quarter AS ds__extract_quarter
+                    , subq_10.ds__extract_month AS ds__extract_month
+                    , subq_10.ds__extract_day AS ds__extract_day
+                    , subq_10.ds__extract_dow AS ds__extract_dow
+                    , subq_10.ds__extract_doy AS ds__extract_doy
+                    , subq_10.visit__ds__day AS visit__ds__day
+                    , subq_10.visit__ds__week AS visit__ds__week
+                    , subq_10.visit__ds__month AS visit__ds__month
+                    , subq_10.visit__ds__quarter AS visit__ds__quarter
+                    , subq_10.visit__ds__year AS visit__ds__year
+                    , subq_10.visit__ds__extract_year AS visit__ds__extract_year
+                    , subq_10.visit__ds__extract_quarter AS visit__ds__extract_quarter
+                    , subq_10.visit__ds__extract_month AS visit__ds__extract_month
+                    , subq_10.visit__ds__extract_day AS visit__ds__extract_day
+                    , subq_10.visit__ds__extract_dow AS visit__ds__extract_dow
+                    , subq_10.visit__ds__extract_doy AS visit__ds__extract_doy
+                    , subq_10.metric_time__day AS metric_time__day
+                    , subq_10.metric_time__week AS metric_time__week
+                    , subq_10.metric_time__month AS metric_time__month
+                    , subq_10.metric_time__quarter AS metric_time__quarter
+                    , subq_10.metric_time__year AS metric_time__year
+                    , subq_10.metric_time__extract_year AS metric_time__extract_year
+                    , subq_10.metric_time__extract_quarter AS metric_time__extract_quarter
+                    , subq_10.metric_time__extract_month AS metric_time__extract_month
+                    , subq_10.metric_time__extract_day AS metric_time__extract_day
+                    , subq_10.metric_time__extract_dow AS metric_time__extract_dow
+                    , subq_10.metric_time__extract_doy AS metric_time__extract_doy
+                    , subq_10.user AS user
+                    , subq_10.session AS session
+                    , subq_10.visit__user AS visit__user
+                    , subq_10.visit__session AS visit__session
+                    , subq_10.referrer_id AS referrer_id
+                    , subq_10.visit__referrer_id AS visit__referrer_id
+                    , subq_12.home_state_latest AS user__home_state_latest
+                    , subq_10.visits AS visits
+                    , subq_10.visitors AS visitors
                   FROM (
                     -- Metric Time Dimension 'ds'
                     SELECT
-                      subq_10.ds__day
-                      , subq_10.ds__week
-                      , subq_10.ds__month
-                      , subq_10.ds__quarter
-                      , subq_10.ds__year
-                      , subq_10.ds__extract_year
-                      , subq_10.ds__extract_quarter
-                      , subq_10.ds__extract_month
-                      , subq_10.ds__extract_day
-                      , subq_10.ds__extract_dow
-                      , subq_10.ds__extract_doy
-                      , subq_10.visit__ds__day
-                      , subq_10.visit__ds__week
-                      , subq_10.visit__ds__month
-                      , subq_10.visit__ds__quarter
-                      , subq_10.visit__ds__year
-                      , subq_10.visit__ds__extract_year
-                      , subq_10.visit__ds__extract_quarter
-                      , subq_10.visit__ds__extract_month
-                      , subq_10.visit__ds__extract_day
-                      , subq_10.visit__ds__extract_dow
-                      , subq_10.visit__ds__extract_doy
-                      , subq_10.ds__day AS metric_time__day
-                      , subq_10.ds__week AS metric_time__week
-                      , subq_10.ds__month AS metric_time__month
-                      , subq_10.ds__quarter AS metric_time__quarter
-                      , subq_10.ds__year AS metric_time__year
-                      , subq_10.ds__extract_year AS metric_time__extract_year
-                      , subq_10.ds__extract_quarter AS metric_time__extract_quarter
-                      , subq_10.ds__extract_month AS metric_time__extract_month
-                      , subq_10.ds__extract_day AS metric_time__extract_day
-                      , subq_10.ds__extract_dow AS metric_time__extract_dow
-                      , subq_10.ds__extract_doy AS metric_time__extract_doy
-                      , subq_10.user
-                      , subq_10.session
-                      , subq_10.visit__user
-                      , subq_10.visit__session
-                      , subq_10.referrer_id
-                      , subq_10.visit__referrer_id
-                      , subq_10.visits
-                      , subq_10.visitors
+                      subq_0.ds__day
+                      , subq_0.ds__week
+                      , subq_0.ds__month
+                      , subq_0.ds__quarter
+                      , subq_0.ds__year
+                      , subq_0.ds__extract_year
+                      , subq_0.ds__extract_quarter
+                      , subq_0.ds__extract_month
+                      , subq_0.ds__extract_day
+                      , subq_0.ds__extract_dow
+                      , subq_0.ds__extract_doy
+                      , subq_0.visit__ds__day
+                      , subq_0.visit__ds__week
+                      , subq_0.visit__ds__month
+                      , subq_0.visit__ds__quarter
+                      , subq_0.visit__ds__year
+                      , subq_0.visit__ds__extract_year
+                      , subq_0.visit__ds__extract_quarter
+                      , subq_0.visit__ds__extract_month
+                      , subq_0.visit__ds__extract_day
+                      , subq_0.visit__ds__extract_dow
+                      , subq_0.visit__ds__extract_doy
+                      , subq_0.ds__day AS metric_time__day
+                      , subq_0.ds__week AS metric_time__week
+                      , subq_0.ds__month AS metric_time__month
+                      , subq_0.ds__quarter AS metric_time__quarter
+                      , subq_0.ds__year AS metric_time__year
+                      , subq_0.ds__extract_year AS metric_time__extract_year
+                      , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+                      , subq_0.ds__extract_month AS metric_time__extract_month
+                      , subq_0.ds__extract_day AS metric_time__extract_day
+                      , subq_0.ds__extract_dow AS metric_time__extract_dow
+                      , subq_0.ds__extract_doy AS metric_time__extract_doy
+                      , subq_0.user
+                      , subq_0.session
+                      , subq_0.visit__user
+                      , subq_0.visit__session
+                      , subq_0.referrer_id
+                      , subq_0.visit__referrer_id
+                      , subq_0.visits
+                      , subq_0.visitors
                     FROM (
                       -- Read Elements From Semantic Model 'visits_source'
                       SELECT
@@ -401,13 +401,13 @@ FROM (
                         , visits_source_src_28000.user_id AS visit__user
                         , visits_source_src_28000.session_id AS visit__session
                       FROM ***************************.fct_visits visits_source_src_28000
-                    ) subq_10
-                  ) subq_11
+                    ) subq_0
+                  ) subq_10
                   LEFT OUTER JOIN (
                     -- Pass Only Elements: ['home_state_latest', 'user']
                     SELECT
-                      subq_12.user
-                      , subq_12.home_state_latest
+                      subq_11.user
+                      , subq_11.home_state_latest
                     FROM (
                       -- Read Elements From Semantic Model 'users_latest'
                       SELECT
@@ -437,97 +437,97 @@ FROM (
                         , users_latest_src_28000.home_state_latest AS user__home_state_latest
                         , users_latest_src_28000.user_id AS user
                       FROM ***************************.dim_users_latest users_latest_src_28000
-                    ) subq_12
-                  ) subq_13
+                    ) subq_11
+                  ) subq_12
                   ON
-                    subq_11.user = subq_13.user
-                ) subq_14
-              ) subq_15
+                    subq_10.user = subq_12.user
+                ) subq_13
+              ) subq_14
               INNER JOIN (
                 -- Add column with generated UUID
                 SELECT
-                  subq_17.ds__day
-                  , subq_17.ds__week
-                  , subq_17.ds__month
-                  , subq_17.ds__quarter
-                  , subq_17.ds__year
-                  , subq_17.ds__extract_year
-                  , subq_17.ds__extract_quarter
-                  , subq_17.ds__extract_month
-                  , subq_17.ds__extract_day
-                  , subq_17.ds__extract_dow
-                  , subq_17.ds__extract_doy
-                  , subq_17.buy__ds__day
-                  , subq_17.buy__ds__week
-                  , subq_17.buy__ds__month
-                  , subq_17.buy__ds__quarter
-                  , subq_17.buy__ds__year
-                  , subq_17.buy__ds__extract_year
-                  , subq_17.buy__ds__extract_quarter
-                  , subq_17.buy__ds__extract_month
-                  , subq_17.buy__ds__extract_day
-                  , subq_17.buy__ds__extract_dow
-                  , subq_17.buy__ds__extract_doy
-                  , subq_17.metric_time__day
-                  , subq_17.metric_time__week
-                  , subq_17.metric_time__month
-                  , subq_17.metric_time__quarter
-                  , subq_17.metric_time__year
-                  , subq_17.metric_time__extract_year
-                  , subq_17.metric_time__extract_quarter
-                  , subq_17.metric_time__extract_month
-                  , subq_17.metric_time__extract_day
-                  , subq_17.metric_time__extract_dow
-                  , subq_17.metric_time__extract_doy
-                  , subq_17.user
-                  , subq_17.session_id
-                  , subq_17.buy__user
-                  , subq_17.buy__session_id
-                  , subq_17.buys
-                  , subq_17.buyers
+                  subq_16.ds__day
+                  , subq_16.ds__week
+                  , subq_16.ds__month
+                  , subq_16.ds__quarter
+                  , subq_16.ds__year
+                  , subq_16.ds__extract_year
+                  , subq_16.ds__extract_quarter
+                  , subq_16.ds__extract_month
+                  , subq_16.ds__extract_day
+                  , subq_16.ds__extract_dow
+                  , subq_16.ds__extract_doy
+                  , subq_16.buy__ds__day
+                  , subq_16.buy__ds__week
+                  , subq_16.buy__ds__month
+                  , subq_16.buy__ds__quarter
+                  , subq_16.buy__ds__year
+                  , subq_16.buy__ds__extract_year
+                  , subq_16.buy__ds__extract_quarter
+                  , subq_16.buy__ds__extract_month
+                  , subq_16.buy__ds__extract_day
+                  , subq_16.buy__ds__extract_dow
+                  , subq_16.buy__ds__extract_doy
+                  , subq_16.metric_time__day
+                  , subq_16.metric_time__week
+                  , subq_16.metric_time__month
+                  , subq_16.metric_time__quarter
+                  , subq_16.metric_time__year
+                  , subq_16.metric_time__extract_year
+                  , subq_16.metric_time__extract_quarter
+                  , subq_16.metric_time__extract_month
+                  , subq_16.metric_time__extract_day
+                  , subq_16.metric_time__extract_dow
+                  , subq_16.metric_time__extract_doy
+                  , subq_16.user
+                  , subq_16.session_id
+                  , subq_16.buy__user
+                  , subq_16.buy__session_id
+                  , subq_16.buys
+                  , subq_16.buyers
                   , GEN_RANDOM_UUID() AS mf_internal_uuid
                 FROM (
                   -- Metric Time Dimension 'ds'
                   SELECT
-                    subq_16.ds__day
-                    , subq_16.ds__week
-                    , subq_16.ds__month
-                    , subq_16.ds__quarter
-                    , subq_16.ds__year
-                    , subq_16.ds__extract_year
-                    , subq_16.ds__extract_quarter
-                    , subq_16.ds__extract_month
-                    , subq_16.ds__extract_day
-                    , subq_16.ds__extract_dow
-                    , subq_16.ds__extract_doy
-                    , subq_16.buy__ds__day
-                    , subq_16.buy__ds__week
-                    , subq_16.buy__ds__month
-                    , subq_16.buy__ds__quarter
-                    , subq_16.buy__ds__year
-                    , subq_16.buy__ds__extract_year
-                    , subq_16.buy__ds__extract_quarter
-                    , subq_16.buy__ds__extract_month
-                    , subq_16.buy__ds__extract_day
-                    , subq_16.buy__ds__extract_dow
-                    , subq_16.buy__ds__extract_doy
-                    , subq_16.ds__day AS metric_time__day
-                    , subq_16.ds__week AS metric_time__week
-                    , subq_16.ds__month AS metric_time__month
-                    , subq_16.ds__quarter AS metric_time__quarter
-                    , subq_16.ds__year AS metric_time__year
-                    , subq_16.ds__extract_year AS metric_time__extract_year
-                    , subq_16.ds__extract_quarter AS metric_time__extract_quarter
-                    , subq_16.ds__extract_month AS metric_time__extract_month
-                    , subq_16.ds__extract_day AS metric_time__extract_day
-                    , subq_16.ds__extract_dow AS metric_time__extract_dow
-                    , subq_16.ds__extract_doy AS metric_time__extract_doy
-                    , subq_16.user
-                    , subq_16.session_id
-                    , subq_16.buy__user
-                    , subq_16.buy__session_id
-                    , subq_16.buys
-                    , subq_16.buyers
+                    subq_15.ds__day
+                    , subq_15.ds__week
+                    , subq_15.ds__month
+                    , subq_15.ds__quarter
+                    , subq_15.ds__year
+                    , subq_15.ds__extract_year
+                    , subq_15.ds__extract_quarter
+                    , subq_15.ds__extract_month
+                    , subq_15.ds__extract_day
+                    , subq_15.ds__extract_dow
+                    , subq_15.ds__extract_doy
+                    , subq_15.buy__ds__day
+                    , subq_15.buy__ds__week
+                    , subq_15.buy__ds__month
+                    , subq_15.buy__ds__quarter
+                    , subq_15.buy__ds__year
+                    , subq_15.buy__ds__extract_year
+                    , subq_15.buy__ds__extract_quarter
+                    , subq_15.buy__ds__extract_month
+                    , subq_15.buy__ds__extract_day
+                    , subq_15.buy__ds__extract_dow
+                    , subq_15.buy__ds__extract_doy
+                    , subq_15.ds__day AS metric_time__day
+                    , subq_15.ds__week AS metric_time__week
+                    , subq_15.ds__month AS metric_time__month
+                    , subq_15.ds__quarter AS metric_time__quarter
+                    , subq_15.ds__year AS metric_time__year
+                    , subq_15.ds__extract_year AS metric_time__extract_year
+                    , subq_15.ds__extract_quarter AS metric_time__extract_quarter
+                    , subq_15.ds__extract_month AS metric_time__extract_month
+                    , subq_15.ds__extract_day AS metric_time__extract_day
+                    , subq_15.ds__extract_dow AS metric_time__extract_dow
+                    , subq_15.ds__extract_doy AS metric_time__extract_doy
+                    , subq_15.user
+                    , subq_15.session_id
+                    , subq_15.buy__user
+                    , subq_15.buy__session_id
+                    , subq_15.buys
+                    , subq_15.buyers
                   FROM (
                     -- Read Elements From Semantic Model 'buys_source'
                     SELECT
@@ -560,27 +560,27 @@ FROM (
                       , buys_source_src_28000.user_id AS buy__user
                       , buys_source_src_28000.session_id AS buy__session_id
                     FROM ***************************.fct_buys buys_source_src_28000
-                  ) subq_16
-                ) subq_17
-              ) subq_18
+                  ) subq_15
+                ) subq_16
+              ) subq_17
               ON
                 (
-                  subq_15.user = subq_18.user
+                  subq_14.user = subq_17.user
                 ) AND (
                   (
-                    subq_15.ds__day <= subq_18.ds__day
+                    subq_14.ds__day <= subq_17.ds__day
                   ) AND (
-                    subq_15.ds__day > subq_18.ds__day - INTERVAL 7 day
+                    subq_14.ds__day > subq_17.ds__day - INTERVAL 7 day
                   )
                 )
-            ) subq_19
-          ) subq_20
-        ) subq_21
+            ) subq_18
+          ) subq_19
+        ) subq_20
         LEFT OUTER JOIN (
           -- Pass Only Elements: ['home_state_latest', 'user']
           SELECT
-            subq_22.user
-            , subq_22.home_state_latest
+            subq_21.user
+            , subq_21.home_state_latest
           FROM (
             -- Read Elements From Semantic Model 'users_latest'
             SELECT
@@ -610,23 +610,23 @@ FROM (
               , users_latest_src_28000.home_state_latest AS user__home_state_latest
               , users_latest_src_28000.user_id AS user
             FROM ***************************.dim_users_latest users_latest_src_28000
-          ) subq_22
-        ) subq_23
+          ) subq_21
+        ) subq_22
         ON
-          subq_21.user = subq_23.user
-      ) subq_24
-    ) subq_25
+          subq_20.user = subq_22.user
+      ) subq_23
+    ) subq_24
     GROUP BY
-      subq_25.metric_time__day
-      , subq_25.user__home_state_latest
-  ) subq_26
+      subq_24.metric_time__day
+      , subq_24.user__home_state_latest
+  ) subq_25
   ON
     (
-      subq_9.user__home_state_latest = subq_26.user__home_state_latest
+      subq_9.user__home_state_latest = subq_25.user__home_state_latest
     ) AND (
-      subq_9.metric_time__day = subq_26.metric_time__day
+      subq_9.metric_time__day = subq_25.metric_time__day
     )
   GROUP BY
-    COALESCE(subq_9.metric_time__day, subq_26.metric_time__day)
-    , COALESCE(subq_9.user__home_state_latest, subq_26.user__home_state_latest)
-) subq_27
+    COALESCE(subq_9.metric_time__day, subq_25.metric_time__day)
+    , COALESCE(subq_9.user__home_state_latest, subq_25.user__home_state_latest)
+) subq_26
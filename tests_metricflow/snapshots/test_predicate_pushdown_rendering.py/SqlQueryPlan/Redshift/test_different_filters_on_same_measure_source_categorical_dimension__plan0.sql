@@ -1,13 +1,13 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_12.metric_time__day
-  , CAST(subq_12.average_booking_value AS DOUBLE PRECISION) / CAST(NULLIF(subq_12.max_booking_value, 0) AS DOUBLE PRECISION) AS instant_booking_fraction_of_max_value
+  subq_11.metric_time__day
+  , CAST(subq_11.average_booking_value AS DOUBLE PRECISION) / CAST(NULLIF(subq_11.max_booking_value, 0) AS DOUBLE PRECISION) AS instant_booking_fraction_of_max_value
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_6.metric_time__day, subq_11.metric_time__day) AS metric_time__day
+    COALESCE(subq_6.metric_time__day, subq_10.metric_time__day) AS metric_time__day
     , MAX(subq_6.average_booking_value) AS average_booking_value
-    , MAX(subq_11.max_booking_value) AS max_booking_value
+    , MAX(subq_10.max_booking_value) AS max_booking_value
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -241,119 +241,119 @@ FROM (
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_10.metric_time__day
-      , subq_10.max_booking_value
+      subq_9.metric_time__day
+      , subq_9.max_booking_value
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_9.metric_time__day
-        , MAX(subq_9.max_booking_value) AS max_booking_value
+        subq_8.metric_time__day
+        , MAX(subq_8.max_booking_value) AS max_booking_value
       FROM (
         -- Pass Only Elements: ['max_booking_value', 'metric_time__day']
         SELECT
-          subq_8.metric_time__day
-          , subq_8.max_booking_value
+          subq_7.metric_time__day
+          , subq_7.max_booking_value
         FROM (
           -- Metric Time Dimension 'ds'
           SELECT
-            subq_7.ds__day
-            , subq_7.ds__week
-            , subq_7.ds__month
-            , subq_7.ds__quarter
-            , subq_7.ds__year
-            , subq_7.ds__extract_year
-            , subq_7.ds__extract_quarter
-            , subq_7.ds__extract_month
-            , subq_7.ds__extract_day
-            , subq_7.ds__extract_dow
-            , subq_7.ds__extract_doy
-            , subq_7.ds_partitioned__day
-            , subq_7.ds_partitioned__week
-            , subq_7.ds_partitioned__month
-            , subq_7.ds_partitioned__quarter
-            , subq_7.ds_partitioned__year
-            , subq_7.ds_partitioned__extract_year
-            , subq_7.ds_partitioned__extract_quarter
-            , subq_7.ds_partitioned__extract_month
-            , subq_7.ds_partitioned__extract_day
-            , subq_7.ds_partitioned__extract_dow
-            , subq_7.ds_partitioned__extract_doy
-            , subq_7.paid_at__day
-            , subq_7.paid_at__week
-            , subq_7.paid_at__month
-            , subq_7.paid_at__quarter
-            , subq_7.paid_at__year
-            , subq_7.paid_at__extract_year
-            , subq_7.paid_at__extract_quarter
-            , subq_7.paid_at__extract_month
-            , subq_7.paid_at__extract_day
-            , subq_7.paid_at__extract_dow
-            , subq_7.paid_at__extract_doy
-            , subq_7.booking__ds__day
-            , subq_7.booking__ds__week
-            , subq_7.booking__ds__month
-            , subq_7.booking__ds__quarter
-            , subq_7.booking__ds__year
-            , subq_7.booking__ds__extract_year
-            , subq_7.booking__ds__extract_quarter
-            , subq_7.booking__ds__extract_month
-            , subq_7.booking__ds__extract_day
-            , subq_7.booking__ds__extract_dow
-            , subq_7.booking__ds__extract_doy
-            , subq_7.booking__ds_partitioned__day
-            , subq_7.booking__ds_partitioned__week
-            , subq_7.booking__ds_partitioned__month
-            , subq_7.booking__ds_partitioned__quarter
-            , subq_7.booking__ds_partitioned__year
-            , subq_7.booking__ds_partitioned__extract_year
-            , subq_7.booking__ds_partitioned__extract_quarter
-            , subq_7.booking__ds_partitioned__extract_month
-            , subq_7.booking__ds_partitioned__extract_day
-            , subq_7.booking__ds_partitioned__extract_dow
-            , subq_7.booking__ds_partitioned__extract_doy
-            , subq_7.booking__paid_at__day
-            , subq_7.booking__paid_at__week
-            , subq_7.booking__paid_at__month
-            , subq_7.booking__paid_at__quarter
-            , subq_7.booking__paid_at__year
-            , subq_7.booking__paid_at__extract_year
-            , subq_7.booking__paid_at__extract_quarter
-            , subq_7.booking__paid_at__extract_month
-            , subq_7.booking__paid_at__extract_day
-            , subq_7.booking__paid_at__extract_dow
-            , subq_7.booking__paid_at__extract_doy
-            , subq_7.ds__day AS metric_time__day
-            , subq_7.ds__week AS metric_time__week
-            , subq_7.ds__month AS metric_time__month
-            , subq_7.ds__quarter AS metric_time__quarter
-            , subq_7.ds__year AS metric_time__year
-            , subq_7.ds__extract_year AS metric_time__extract_year
-            , subq_7.ds__extract_quarter AS metric_time__extract_quarter
-            , subq_7.ds__extract_month AS metric_time__extract_month
-            , subq_7.ds__extract_day AS metric_time__extract_day
-            , subq_7.ds__extract_dow AS metric_time__extract_dow
-            , subq_7.ds__extract_doy AS metric_time__extract_doy
-            , subq_7.listing
-            , subq_7.guest
-            , subq_7.host
-            , subq_7.booking__listing
-            , subq_7.booking__guest
-            , subq_7.booking__host
-            , subq_7.is_instant
-            , subq_7.booking__is_instant
-            , subq_7.bookings
-            , subq_7.instant_bookings
-            , subq_7.booking_value
-            , subq_7.max_booking_value
-            , subq_7.min_booking_value
-            , subq_7.bookers
-            , subq_7.average_booking_value
-            , subq_7.referred_bookings
-            , subq_7.median_booking_value
-            , subq_7.booking_value_p99
-            , subq_7.discrete_booking_value_p99
-            , subq_7.approximate_continuous_booking_value_p99
-            , subq_7.approximate_discrete_booking_value_p99
+            subq_0.ds__day
+            , subq_0.ds__week
+            , subq_0.ds__month
+            , subq_0.ds__quarter
+            , subq_0.ds__year
+            , subq_0.ds__extract_year
+            , subq_0.ds__extract_quarter
+            , subq_0.ds__extract_month
+            , subq_0.ds__extract_day
+            , subq_0.ds__extract_dow
+            , subq_0.ds__extract_doy
+            , subq_0.ds_partitioned__day
+            , subq_0.ds_partitioned__week
+            , subq_0.ds_partitioned__month
+            , subq_0.ds_partitioned__quarter
+            , subq_0.ds_partitioned__year
+            , subq_0.ds_partitioned__extract_year
+            , subq_0.ds_partitioned__extract_quarter
+            , subq_0.ds_partitioned__extract_month
+            , subq_0.ds_partitioned__extract_day
+            , subq_0.ds_partitioned__extract_dow
+            , subq_0.ds_partitioned__extract_doy
+            , subq_0.paid_at__day
+            , subq_0.paid_at__week
+            , subq_0.paid_at__month
+            , subq_0.paid_at__quarter
+            , subq_0.paid_at__year
+            , subq_0.paid_at__extract_year
+            , subq_0.paid_at__extract_quarter
+            , subq_0.paid_at__extract_month
+            , subq_0.paid_at__extract_day
+            , subq_0.paid_at__extract_dow
+            , subq_0.paid_at__extract_doy
+            , subq_0.booking__ds__day
+            , subq_0.booking__ds__week
+            , subq_0.booking__ds__month
+            , subq_0.booking__ds__quarter
+            , subq_0.booking__ds__year
+            , subq_0.booking__ds__extract_year
+            , subq_0.booking__ds__extract_quarter
+            , subq_0.booking__ds__extract_month
+            , subq_0.booking__ds__extract_day
+            , subq_0.booking__ds__extract_dow
+            , subq_0.booking__ds__extract_doy
+            , subq_0.booking__ds_partitioned__day
+            , subq_0.booking__ds_partitioned__week
+            , subq_0.booking__ds_partitioned__month
+            , subq_0.booking__ds_partitioned__quarter
+            , subq_0.booking__ds_partitioned__year
+            , subq_0.booking__ds_partitioned__extract_year
+            , subq_0.booking__ds_partitioned__extract_quarter
+            , subq_0.booking__ds_partitioned__extract_month
+            , subq_0.booking__ds_partitioned__extract_day
+            , subq_0.booking__ds_partitioned__extract_dow
+            , subq_0.booking__ds_partitioned__extract_doy
+            , subq_0.booking__paid_at__day
+            , subq_0.booking__paid_at__week
+            , subq_0.booking__paid_at__month
+            , subq_0.booking__paid_at__quarter
+            , subq_0.booking__paid_at__year
+            , subq_0.booking__paid_at__extract_year
+            , subq_0.booking__paid_at__extract_quarter
+            , subq_0.booking__paid_at__extract_month
+            , subq_0.booking__paid_at__extract_day
+            , subq_0.booking__paid_at__extract_dow
+            , subq_0.booking__paid_at__extract_doy
+            , subq_0.ds__day AS metric_time__day
+            , subq_0.ds__week AS metric_time__week
+            , subq_0.ds__month AS metric_time__month
+            , subq_0.ds__quarter AS metric_time__quarter
+            , subq_0.ds__year AS metric_time__year
+            , subq_0.ds__extract_year AS metric_time__extract_year
+            , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+            , subq_0.ds__extract_month AS metric_time__extract_month
+            , subq_0.ds__extract_day AS metric_time__extract_day
+            , subq_0.ds__extract_dow AS metric_time__extract_dow
+            , subq_0.ds__extract_doy AS metric_time__extract_doy
+            , subq_0.listing
+            , subq_0.guest
+            , subq_0.host
+            , subq_0.booking__listing
+            , subq_0.booking__guest
+            , subq_0.booking__host
+            , subq_0.is_instant
+            , subq_0.booking__is_instant
+            , subq_0.bookings
+            , subq_0.instant_bookings
+            , subq_0.booking_value
+            , subq_0.max_booking_value
+            , subq_0.min_booking_value
+            , subq_0.bookers
+            , subq_0.average_booking_value
+            , subq_0.referred_bookings
+            , subq_0.median_booking_value
+            , subq_0.booking_value_p99
+            , subq_0.discrete_booking_value_p99
+            , subq_0.approximate_continuous_booking_value_p99
+            , subq_0.approximate_discrete_booking_value_p99
           FROM (
             -- Read Elements From Semantic Model 'bookings_source'
             SELECT
@@ -446,15 +446,15 @@ FROM (
               , bookings_source_src_28000.guest_id AS booking__guest
               , bookings_source_src_28000.host_id AS booking__host
             FROM ***************************.fct_bookings bookings_source_src_28000
-          ) subq_7
-        ) subq_8
-      ) subq_9
+          ) subq_0
+        ) subq_7
+      ) subq_8
       GROUP BY
-        subq_9.metric_time__day
-    ) subq_10
-  ) subq_11
+        subq_8.metric_time__day
+    ) subq_9
+  ) subq_10
   ON
-    subq_6.metric_time__day = subq_11.metric_time__day
+    subq_6.metric_time__day = subq_10.metric_time__day
   GROUP BY
-    COALESCE(subq_6.metric_time__day, subq_11.metric_time__day)
-) subq_12
+    COALESCE(subq_6.metric_time__day, subq_10.metric_time__day)
+) subq_11
@@ -1,15 +1,15 @@
 -- Compute Metrics via Expressions
 SELECT
-  subq_27.metric_time__day
-  , subq_27.listing__country_latest
+  subq_25.metric_time__day
+  , subq_25.listing__country_latest
   , bookings - bookings_2_weeks_ago AS bookings_growth_2_weeks
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_11.metric_time__day, subq_26.metric_time__day) AS metric_time__day
-    , COALESCE(subq_11.listing__country_latest, subq_26.listing__country_latest) AS listing__country_latest
+    COALESCE(subq_11.metric_time__day, subq_24.metric_time__day) AS metric_time__day
+    , COALESCE(subq_11.listing__country_latest, subq_24.listing__country_latest) AS listing__country_latest
     , MAX(subq_11.bookings) AS bookings
-    , MAX(subq_26.bookings_2_weeks_ago) AS bookings_2_weeks_ago
+    , MAX(subq_24.bookings_2_weeks_ago) AS bookings_2_weeks_ago
   FROM (
     -- Compute Metrics via Expressions
     SELECT
@@ -406,258 +406,258 @@ FROM (
   FULL OUTER JOIN (
     -- Compute Metrics via Expressions
     SELECT
-      subq_25.metric_time__day
-      , subq_25.listing__country_latest
-      , subq_25.bookings AS bookings_2_weeks_ago
+      subq_23.metric_time__day
+      , subq_23.listing__country_latest
+      , subq_23.bookings AS bookings_2_weeks_ago
     FROM (
       -- Aggregate Measures
       SELECT
-        subq_24.metric_time__day
-        , subq_24.listing__country_latest
-        , SUM(subq_24.bookings) AS bookings
+        subq_22.metric_time__day
+        , subq_22.listing__country_latest
+        , SUM(subq_22.bookings) AS bookings
       FROM (
         -- Pass Only Elements: ['bookings', 'listing__country_latest', 'metric_time__day']
         SELECT
-          subq_23.metric_time__day
-          , subq_23.listing__country_latest
-          , subq_23.bookings
+          subq_21.metric_time__day
+          , subq_21.listing__country_latest
+          , subq_21.bookings
         FROM (
           -- Constrain Output with WHERE
           SELECT
-            subq_22.metric_time__day
-            , subq_22.booking__is_instant
-            , subq_22.listing__country_latest
-            , subq_22.bookings
+            subq_20.metric_time__day
+            , subq_20.booking__is_instant
+            , subq_20.listing__country_latest
+            , subq_20.bookings
           FROM (
             -- Pass Only Elements: ['bookings', 'listing__country_latest', 'booking__is_instant', 'metric_time__day']
             SELECT
-              subq_21.metric_time__day
-              , subq_21.booking__is_instant
-              , subq_21.listing__country_latest
-              , subq_21.bookings
+              subq_19.metric_time__day
+              , subq_19.booking__is_instant
+              , subq_19.listing__country_latest
+              , subq_19.bookings
             FROM (
               -- Join Standard Outputs
               SELECT
-                subq_17.metric_time__day AS metric_time__day
-                , subq_17.listing AS listing
-                , subq_17.booking__is_instant AS booking__is_instant
-                , subq_20.country_latest AS listing__country_latest
-                , subq_17.bookings AS bookings
+                subq_16.metric_time__day AS metric_time__day
+                , subq_16.listing AS listing
+                , subq_16.booking__is_instant AS booking__is_instant
+                , subq_18.country_latest AS listing__country_latest
+                , subq_16.bookings AS bookings
               FROM (
                 -- Pass Only Elements: ['bookings', 'booking__is_instant', 'metric_time__day', 'listing']
                 SELECT
-                  subq_16.metric_time__day
-                  , subq_16.listing
-                  , subq_16.booking__is_instant
-                  , subq_16.bookings
+                  subq_15.metric_time__day
+                  , subq_15.listing
+                  , subq_15.booking__is_instant
+                  , subq_15.bookings
                 FROM (
                   -- Join to Time Spine Dataset
                   SELECT
-                    subq_14.metric_time__day AS metric_time__day
-                    , DATE_TRUNC('week', subq_14.metric_time__day) AS metric_time__week
-                    , DATE_TRUNC('month', subq_14.metric_time__day) AS metric_time__month
-                    , DATE_TRUNC('quarter', subq_14.metric_time__day) AS metric_time__quarter
-                    , DATE_TRUNC('year', subq_14.metric_time__day) AS metric_time__year
-                    , EXTRACT(year FROM subq_14.metric_time__day) AS metric_time__extract_year
-                    , EXTRACT(quarter FROM subq_14.metric_time__day) AS metric_time__extract_quarter
-                    , EXTRACT(month FROM subq_14.metric_time__day) AS metric_time__extract_month
-                    , EXTRACT(day FROM subq_14.metric_time__day) AS metric_time__extract_day
-                    , CASE WHEN EXTRACT(dow FROM subq_14.metric_time__day) = 0 THEN EXTRACT(dow FROM subq_14.metric_time__day) + 7 ELSE EXTRACT(dow FROM subq_14.metric_time__day) END AS metric_time__extract_dow
-                    , EXTRACT(doy FROM subq_14.metric_time__day) AS metric_time__extract_doy
-                    , subq_13.ds__day AS ds__day
-                    , subq_13.ds__week AS ds__week
-                    , subq_13.ds__month AS ds__month
-                    , subq_13.ds__quarter AS ds__quarter
-                    , subq_13.ds__year AS ds__year
-                    , subq_13.ds__extract_year AS ds__extract_year
-                    , subq_13.ds__extract_quarter AS ds__extract_quarter
-                    , subq_13.ds__extract_month AS ds__extract_month
-                    , subq_13.ds__extract_day AS ds__extract_day
-                    , subq_13.ds__extract_dow AS ds__extract_dow
-                    , subq_13.ds__extract_doy AS ds__extract_doy
-                    , subq_13.ds_partitioned__day AS ds_partitioned__day
-                    , subq_13.ds_partitioned__week AS ds_partitioned__week
-                    , subq_13.ds_partitioned__month AS ds_partitioned__month
-                    , subq_13.ds_partitioned__quarter AS ds_partitioned__quarter
-                    , subq_13.ds_partitioned__year AS ds_partitioned__year
-                    , subq_13.ds_partitioned__extract_year AS ds_partitioned__extract_year
-                    , subq_13.ds_partitioned__extract_quarter AS ds_partitioned__extract_quarter
-                    , subq_13.ds_partitioned__extract_month AS ds_partitioned__extract_month
-                    , subq_13.ds_partitioned__extract_day AS ds_partitioned__extract_day
-                    , subq_13.ds_partitioned__extract_dow AS ds_partitioned__extract_dow
-                    , subq_13.ds_partitioned__extract_doy AS ds_partitioned__extract_doy
-                    , subq_13.paid_at__day AS paid_at__day
-                    , subq_13.paid_at__week AS paid_at__week
-                    , subq_13.paid_at__month AS paid_at__month
-                    , subq_13.paid_at__quarter AS paid_at__quarter
-                    , subq_13.paid_at__year AS paid_at__year
-                    , subq_13.paid_at__extract_year AS paid_at__extract_year
-                    , subq_13.paid_at__extract_quarter AS paid_at__extract_quarter
-                    , subq_13.paid_at__extract_month AS paid_at__extract_month
-                    , subq_13.paid_at__extract_day AS paid_at__extract_day
-                    , subq_13.paid_at__extract_dow AS paid_at__extract_dow
-                    , subq_13.paid_at__extract_doy AS paid_at__extract_doy
-                    , subq_13.booking__ds__day AS booking__ds__day
-                    , subq_13.booking__ds__week AS booking__ds__week
-                    , subq_13.booking__ds__month AS booking__ds__month
-                    , subq_13.booking__ds__quarter AS booking__ds__quarter
-                    , subq_13.booking__ds__year AS booking__ds__year
-                    , subq_13.booking__ds__extract_year AS booking__ds__extract_year
-                    , subq_13.booking__ds__extract_quarter AS booking__ds__extract_quarter
-                    , subq_13.booking__ds__extract_month AS booking__ds__extract_month
-                    , subq_13.booking__ds__extract_day AS booking__ds__extract_day
-                    , subq_13.booking__ds__extract_dow AS booking__ds__extract_dow
-                    , subq_13.booking__ds__extract_doy AS booking__ds__extract_doy
-                    , subq_13.booking__ds_partitioned__day AS booking__ds_partitioned__day
-                    , subq_13.booking__ds_partitioned__week AS booking__ds_partitioned__week
-                    , subq_13.booking__ds_partitioned__month AS booking__ds_partitioned__month
-                    , subq_13.booking__ds_partitioned__quarter AS booking__ds_partitioned__quarter
-                    , subq_13.booking__ds_partitioned__year AS booking__ds_partitioned__year
-                    , subq_13.booking__ds_partitioned__extract_year AS booking__ds_partitioned__extract_year
-                    , subq_13.booking__ds_partitioned__extract_quarter AS booking__ds_partitioned__extract_quarter
-                    , subq_13.booking__ds_partitioned__extract_month AS booking__ds_partitioned__extract_month
-                    , subq_13.booking__ds_partitioned__extract_day AS booking__ds_partitioned__extract_day
-                    , subq_13.booking__ds_partitioned__extract_dow AS booking__ds_partitioned__extract_dow
-                    , subq_13.booking__ds_partitioned__extract_doy AS booking__ds_partitioned__extract_doy
-                    , subq_13.booking__paid_at__day AS booking__paid_at__day
-                    , subq_13.booking__paid_at__week AS booking__paid_at__week
-                    , subq_13.booking__paid_at__month AS booking__paid_at__month
-                    , subq_13.booking__paid_at__quarter AS booking__paid_at__quarter
-                    , subq_13.booking__paid_at__year AS booking__paid_at__year
-                    , subq_13.booking__paid_at__extract_year AS booking__paid_at__extract_year
-                    , subq_13.booking__paid_at__extract_quarter AS booking__paid_at__extract_quarter
-                    , subq_13.booking__paid_at__extract_month AS booking__paid_at__extract_month
-                    , subq_13.booking__paid_at__extract_day AS booking__paid_at__extract_day
-                    , subq_13.booking__paid_at__extract_dow AS booking__paid_at__extract_dow
-                    , subq_13.booking__paid_at__extract_doy AS booking__paid_at__extract_doy
-                    , subq_13.listing AS listing
-                    , subq_13.guest AS guest
-                    , subq_13.host AS host
-                    , subq_13.booking__listing AS booking__listing
-                    , subq_13.booking__guest AS booking__guest
-                    , subq_13.booking__host AS booking__host
-                    , subq_13.is_instant AS is_instant
-                    , subq_13.booking__is_instant AS booking__is_instant
-                    , subq_13.bookings AS bookings
-                    , subq_13.instant_bookings AS instant_bookings
-                    , subq_13.booking_value AS booking_value
-                    , subq_13.max_booking_value AS max_booking_value
-                    , subq_13.min_booking_value AS min_booking_value
-                    , subq_13.bookers AS bookers
-                    , subq_13.average_booking_value AS average_booking_value
-                    , subq_13.referred_bookings AS referred_bookings
-                    , subq_13.median_booking_value AS median_booking_value
-                    , subq_13.booking_value_p99 AS booking_value_p99
-                    , subq_13.discrete_booking_value_p99 AS discrete_booking_value_p99
-                    , subq_13.approximate_continuous_booking_value_p99 AS approximate_continuous_booking_value_p99
-                    , subq_13.approximate_discrete_booking_value_p99 AS approximate_discrete_booking_value_p99
+                    subq_13.metric_time__day AS metric_time__day
+                    , DATE_TRUNC('week', subq_13.metric_time__day) AS metric_time__week
+                    , DATE_TRUNC('month', subq_13.metric_time__day) AS metric_time__month
+                    , DATE_TRUNC('quarter', subq_13.metric_time__day) AS metric_time__quarter
+                    , DATE_TRUNC('year', subq_13.metric_time__day) AS metric_time__year
+                    , EXTRACT(year FROM subq_13.metric_time__day) AS metric_time__extract_year
+                    , EXTRACT(quarter FROM subq_13.metric_time__day) AS metric_time__extract_quarter
+                    , EXTRACT(month FROM subq_13.metric_time__day) AS metric_time__extract_month
+                    , EXTRACT(day FROM subq_13.metric_time__day) AS metric_time__extract_day
+                    , CASE WHEN EXTRACT(dow FROM subq_13.metric_time__day) = 0 THEN EXTRACT(dow FROM subq_13.metric_time__day) + 7 ELSE EXTRACT(dow FROM subq_13.metric_time__day) END AS metric_time__extract_dow
+                    , EXTRACT(doy FROM subq_13.metric_time__day) AS metric_time__extract_doy
+                    , subq_12.ds__day AS ds__day
+                    , subq_12.ds__week AS ds__week
+                    , subq_12.ds__month AS ds__month
+                    , subq_12.ds__quarter AS ds__quarter
+                    , subq_12.ds__year AS ds__year
+                    , subq_12.ds__extract_year AS ds__extract_year
+                    , subq_12.ds__extract_quarter AS ds__extract_quarter
+                    , subq_12.ds__extract_month AS ds__extract_month
+                    , subq_12.ds__extract_day AS ds__extract_day
+                    , subq_12.ds__extract_dow AS ds__extract_dow
+                    , subq_12.ds__extract_doy AS ds__extract_doy
+                    , subq_12.ds_partitioned__day AS ds_partitioned__day
+                    , subq_12.ds_partitioned__week AS ds_partitioned__week
+                    , subq_12.ds_partitioned__month AS ds_partitioned__month
+                    , subq_12.ds_partitioned__quarter AS ds_partitioned__quarter
+                    , subq_12.ds_partitioned__year AS ds_partitioned__year
+                    , subq_12.ds_partitioned__extract_year AS ds_partitioned__extract_year
+                    , subq_12.ds_partitioned__extract_quarter AS ds_partitioned__extract_quarter
+                    , subq_12.ds_partitioned__extract_month AS ds_partitioned__extract_month
+                    , subq_12.ds_partitioned__extract_day AS ds_partitioned__extract_day
+                    , subq_12.ds_partitioned__extract_dow AS ds_partitioned__extract_dow
+                    , subq_12.ds_partitioned__extract_doy AS ds_partitioned__extract_doy
+                    , subq_12.paid_at__day AS paid_at__day
+                    , subq_12.paid_at__week AS paid_at__week
+                    , subq_12.paid_at__month AS paid_at__month
+                    , subq_12.paid_at__quarter AS paid_at__quarter
+                    , subq_12.paid_at__year AS paid_at__year
+                    , subq_12.paid_at__extract_year AS paid_at__extract_year
+                    , subq_12.paid_at__extract_quarter AS paid_at__extract_quarter
+                    , subq_12.paid_at__extract_month AS paid_at__extract_month
+                    , subq_12.paid_at__extract_day AS paid_at__extract_day
+                    , subq_12.paid_at__extract_dow AS paid_at__extract_dow
+                    , subq_12.paid_at__extract_doy AS paid_at__extract_doy
+                    , subq_12.booking__ds__day AS booking__ds__day
+                    , subq_12.booking__ds__week AS booking__ds__week
+                    , subq_12.booking__ds__month AS booking__ds__month
+                    , subq_12.booking__ds__quarter AS booking__ds__quarter
+                    , subq_12.booking__ds__year AS booking__ds__year
+                    , subq_12.booking__ds__extract_year AS booking__ds__extract_year
+                    , subq_12.booking__ds__extract_quarter AS booking__ds__extract_quarter
+                    , subq_12.booking__ds__extract_month AS booking__ds__extract_month
+                    , subq_12.booking__ds__extract_day AS booking__ds__extract_day
+                    , subq_12.booking__ds__extract_dow AS booking__ds__extract_dow
+                    , subq_12.booking__ds__extract_doy AS booking__ds__extract_doy
+                    , subq_12.booking__ds_partitioned__day AS booking__ds_partitioned__day
+                    , subq_12.booking__ds_partitioned__week AS booking__ds_partitioned__week
+                    , subq_12.booking__ds_partitioned__month AS booking__ds_partitioned__month
+                    , subq_12.booking__ds_partitioned__quarter AS booking__ds_partitioned__quarter
+                    , subq_12.booking__ds_partitioned__year AS booking__ds_partitioned__year
+                    , subq_12.booking__ds_partitioned__extract_year AS booking__ds_partitioned__extract_year
+                    , subq_12.booking__ds_partitioned__extract_quarter AS booking__ds_partitioned__extract_quarter
+                    , subq_12.booking__ds_partitioned__extract_month AS booking__ds_partitioned__extract_month
+                    , subq_12.booking__ds_partitioned__extract_day AS booking__ds_partitioned__extract_day
+                    , subq_12.booking__ds_partitioned__extract_dow AS booking__ds_partitioned__extract_dow
+                    , subq_12.booking__ds_partitioned__extract_doy AS booking__ds_partitioned__extract_doy
+                    , subq_12.booking__paid_at__day AS booking__paid_at__day
+                    , subq_12.booking__paid_at__week AS booking__paid_at__week
+                    , subq_12.booking__paid_at__month AS booking__paid_at__month
+                    , subq_12.booking__paid_at__quarter AS booking__paid_at__quarter
+                    , subq_12.booking__paid_at__year AS booking__paid_at__year
+                    , subq_12.booking__paid_at__extract_year AS booking__paid_at__extract_year
+                    , subq_12.booking__paid_at__extract_quarter AS booking__paid_at__extract_quarter
+                    , subq_12.booking__paid_at__extract_month AS booking__paid_at__extract_month
+                    , subq_12.booking__paid_at__extract_day AS booking__paid_at__extract_day
+                    , subq_12.booking__paid_at__extract_dow AS booking__paid_at__extract_dow
+                    , subq_12.booking__paid_at__extract_doy AS booking__paid_at__extract_doy
+                    , subq_12.listing AS listing
+                    , subq_12.guest AS guest
+                    , subq_12.host AS host
+                    , subq_12.booking__listing AS booking__listing
+                    , subq_12.booking__guest AS booking__guest
+                    , subq_12.booking__host AS booking__host
+                    , subq_12.is_instant AS is_instant
+                    , subq_12.booking__is_instant AS booking__is_instant
+                    , subq_12.bookings AS bookings
+                    , subq_12.instant_bookings AS instant_bookings
+                    , subq_12.booking_value AS booking_value
+                    , subq_12.max_booking_value AS max_booking_value
+                    , subq_12.min_booking_value AS min_booking_value
+                    , subq_12.bookers AS bookers
+                    , subq_12.average_booking_value AS average_booking_value
+                    , subq_12.referred_bookings AS referred_bookings
+                    , subq_12.median_booking_value AS median_booking_value
+                    , subq_12.booking_value_p99 AS booking_value_p99
+                    , subq_12.discrete_booking_value_p99 AS discrete_booking_value_p99
+                    , subq_12.approximate_continuous_booking_value_p99 AS approximate_continuous_booking_value_p99
+                    , subq_12.approximate_discrete_booking_value_p99 AS approximate_discrete_booking_value_p99
                   FROM (
                     -- Time Spine
                     SELECT
-                      subq_15.ds AS metric_time__day
-                    FROM ***************************.mf_time_spine subq_15
-                  ) subq_14
+                      subq_14.ds AS metric_time__day
+                    FROM ***************************.mf_time_spine subq_14
+                  ) subq_13
                   INNER JOIN (
                     -- Metric Time Dimension 'ds'
                     SELECT
-                      subq_12.ds__day
-                      , subq_12.ds__week
-                      , subq_12.ds__month
-                      , subq_12.ds__quarter
-                      , subq_12.ds__year
-                      , subq_12.ds__extract_year
-                      , subq_12.ds__extract_quarter
-                      , subq_12.ds__extract_month
-                      , subq_12.ds__extract_day
-                      , subq_12.ds__extract_dow
-                      , subq_12.ds__extract_doy
-                      , subq_12.ds_partitioned__day
-                      , subq_12.ds_partitioned__week
-                      , subq_12.ds_partitioned__month
-                      , subq_12.ds_partitioned__quarter
-                      , subq_12.ds_partitioned__year
-                      , subq_12.ds_partitioned__extract_year
-                      , subq_12.ds_partitioned__extract_quarter
-                      , subq_12.ds_partitioned__extract_month
-                      , subq_12.ds_partitioned__extract_day
-                      , subq_12.ds_partitioned__extract_dow
-                      , subq_12.ds_partitioned__extract_doy
-                      , subq_12.paid_at__day
-                      , subq_12.paid_at__week
-                      , subq_12.paid_at__month
-                      , subq_12.paid_at__quarter
-                      , subq_12.paid_at__year
-                      , subq_12.paid_at__extract_year
-                      , subq_12.paid_at__extract_quarter
-                      , subq_12.paid_at__extract_month
-                      , subq_12.paid_at__extract_day
-                      , subq_12.paid_at__extract_dow
-                      , subq_12.paid_at__extract_doy
-                      , subq_12.booking__ds__day
-                      , subq_12.booking__ds__week
-                      , subq_12.booking__ds__month
-                      , subq_12.booking__ds__quarter
-                      , subq_12.booking__ds__year
-                      , subq_12.booking__ds__extract_year
-                      , subq_12.booking__ds__extract_quarter
-                      , subq_12.booking__ds__extract_month
-                      , subq_12.booking__ds__extract_day
-                      , subq_12.booking__ds__extract_dow
-                      , subq_12.booking__ds__extract_doy
-                      , subq_12.booking__ds_partitioned__day
-                      , subq_12.booking__ds_partitioned__week
-                      , subq_12.booking__ds_partitioned__month
-                      , subq_12.booking__ds_partitioned__quarter
-                      , subq_12.booking__ds_partitioned__year
-                      , subq_12.booking__ds_partitioned__extract_year
-                      , subq_12.booking__ds_partitioned__extract_quarter
-                      , subq_12.booking__ds_partitioned__extract_month
-                      , subq_12.booking__ds_partitioned__extract_day
-                      , subq_12.booking__ds_partitioned__extract_dow
-                      , subq_12.booking__ds_partitioned__extract_doy
-                      , subq_12.booking__paid_at__day
-                      , subq_12.booking__paid_at__week
-                      , subq_12.booking__paid_at__month
-                      , subq_12.booking__paid_at__quarter
-                      , subq_12.booking__paid_at__year
-                      , subq_12.booking__paid_at__extract_year
-                      , subq_12.booking__paid_at__extract_quarter
-                      , subq_12.booking__paid_at__extract_month
-                      , subq_12.booking__paid_at__extract_day
-                      , subq_12.booking__paid_at__extract_dow
-                      , subq_12.booking__paid_at__extract_doy
-                      , subq_12.ds__day AS metric_time__day
-                      , subq_12.ds__week AS metric_time__week
-                      , subq_12.ds__month AS metric_time__month
-                      , subq_12.ds__quarter AS metric_time__quarter
-                      , subq_12.ds__year AS metric_time__year
-                      , subq_12.ds__extract_year AS metric_time__extract_year
-                      , subq_12.ds__extract_quarter AS metric_time__extract_quarter
-                      , subq_12.ds__extract_month AS metric_time__extract_month
-                      , subq_12.ds__extract_day AS metric_time__extract_day
-                      , subq_12.ds__extract_dow AS metric_time__extract_dow
-                      , subq_12.ds__extract_doy AS metric_time__extract_doy
-                      , subq_12.listing
-                      , subq_12.guest
-                      , subq_12.host
-                      , subq_12.booking__listing
-                      , subq_12.booking__guest
-                      , subq_12.booking__host
-                      , subq_12.is_instant
-                      , subq_12.booking__is_instant
-                      , subq_12.bookings
-                      , subq_12.instant_bookings
-                      , subq_12.booking_value
-                      , subq_12.max_booking_value
-                      , subq_12.min_booking_value
-                      , subq_12.bookers
-                      , subq_12.average_booking_value
-                      , subq_12.referred_bookings
-                      , subq_12.median_booking_value
-                      , subq_12.booking_value_p99
-                      , subq_12.discrete_booking_value_p99
-                      , subq_12.approximate_continuous_booking_value_p99
-                      , subq_12.approximate_discrete_booking_value_p99
+                      subq_0.ds__day
+                      , subq_0.ds__week
+                      , subq_0.ds__month
+                      , subq_0.ds__quarter
+                      , subq_0.ds__year
+                      , subq_0.ds__extract_year
+                      , subq_0.ds__extract_quarter
+                      , subq_0.ds__extract_month
+                      , subq_0.ds__extract_day
+                      , subq_0.ds__extract_dow
+                      , subq_0.ds__extract_doy
+                      , subq_0.ds_partitioned__day
+                      , subq_0.ds_partitioned__week
+                      , subq_0.ds_partitioned__month
+                      , subq_0.ds_partitioned__quarter
+                      , subq_0.ds_partitioned__year
+                      , subq_0.ds_partitioned__extract_year
+                      , subq_0.ds_partitioned__extract_quarter
+                      , subq_0.ds_partitioned__extract_month
+                      , subq_0.ds_partitioned__extract_day
+                      , subq_0.ds_partitioned__extract_dow
+                      , subq_0.ds_partitioned__extract_doy
+                      , subq_0.paid_at__day
+                      , subq_0.paid_at__week
+                      , subq_0.paid_at__month
+                      , subq_0.paid_at__quarter
+                      , subq_0.paid_at__year
+                      , subq_0.paid_at__extract_year
+                      , subq_0.paid_at__extract_quarter
+                      , subq_0.paid_at__extract_month
+                      , subq_0.paid_at__extract_day
+                      , subq_0.paid_at__extract_dow
+                      , subq_0.paid_at__extract_doy
+                      , subq_0.booking__ds__day
+                      , subq_0.booking__ds__week
+                      , subq_0.booking__ds__month
+                      , subq_0.booking__ds__quarter
+                      , subq_0.booking__ds__year
+                      , subq_0.booking__ds__extract_year
+                      , subq_0.booking__ds__extract_quarter
+                      , subq_0.booking__ds__extract_month
+                      , subq_0.booking__ds__extract_day
+                      , subq_0.booking__ds__extract_dow
+                      , subq_0.booking__ds__extract_doy
+                      , subq_0.booking__ds_partitioned__day
+                      , subq_0.booking__ds_partitioned__week
+                      , subq_0.booking__ds_partitioned__month
+                      , subq_0.booking__ds_partitioned__quarter
+                      , subq_0.booking__ds_partitioned__year
+                      , subq_0.booking__ds_partitioned__extract_year
+                      , subq_0.booking__ds_partitioned__extract_quarter
+                      , subq_0.booking__ds_partitioned__extract_month
+                      , subq_0.booking__ds_partitioned__extract_day
+                      , subq_0.booking__ds_partitioned__extract_dow
+                      , subq_0.booking__ds_partitioned__extract_doy
+                      , subq_0.booking__paid_at__day
+                      , subq_0.booking__paid_at__week
+                      , subq_0.booking__paid_at__month
+                      , subq_0.booking__paid_at__quarter
+                      , subq_0.booking__paid_at__year
+                      , subq_0.booking__paid_at__extract_year
+                      , subq_0.booking__paid_at__extract_quarter
+                      , subq_0.booking__paid_at__extract_month
+                      , subq_0.booking__paid_at__extract_day
+                      , subq_0.booking__paid_at__extract_dow
+                      , subq_0.booking__paid_at__extract_doy
+                      , subq_0.ds__day AS metric_time__day
+                      , subq_0.ds__week AS metric_time__week
+                      , subq_0.ds__month AS metric_time__month
+                      , subq_0.ds__quarter AS metric_time__quarter
+                      , subq_0.ds__year AS metric_time__year
+                      , subq_0.ds__extract_year AS metric_time__extract_year
+                      , subq_0.ds__extract_quarter AS metric_time__extract_quarter
+                      , subq_0.ds__extract_month AS metric_time__extract_month
+                      , subq_0.ds__extract_day AS metric_time__extract_day
+                      , subq_0.ds__extract_dow AS metric_time__extract_dow
+                      , subq_0.ds__extract_doy AS metric_time__extract_doy
+                      , subq_0.listing
+                      , subq_0.guest
+                      , subq_0.host
+                      , subq_0.booking__listing
+                      , subq_0.booking__guest
+                      , subq_0.booking__host
+                      , subq_0.is_instant
+                      , subq_0.booking__is_instant
+                      , subq_0.bookings
+                      , subq_0.instant_bookings
+                      , subq_0.booking_value
+                      , subq_0.max_booking_value
+                      , subq_0.min_booking_value
+                      , subq_0.bookers
+                      , subq_0.average_booking_value
+                      , subq_0.referred_bookings
+                      , subq_0.median_booking_value
+                      , subq_0.booking_value_p99
+                      , subq_0.discrete_booking_value_p99
+                      , subq_0.approximate_continuous_booking_value_p99
+                      , subq_0.approximate_discrete_booking_value_p99
                     FROM (
                       -- Read Elements From Semantic Model 'bookings_source'
                       SELECT
@@ -750,87 +750,87 @@ FROM (
                         , bookings_source_src_28000.guest_id AS booking__guest
                         , bookings_source_src_28000.host_id AS booking__host
                       FROM ***************************.fct_bookings bookings_source_src_28000
-                    ) subq_12
-                  ) subq_13
+                    ) subq_0
+                  ) subq_12
                   ON
-                    DATEADD(day, -14, subq_14.metric_time__day) = subq_13.metric_time__day
-                ) subq_16
-              ) subq_17
+                    DATEADD(day, -14, subq_13.metric_time__day) = subq_12.metric_time__day
+                ) subq_15
+              ) subq_16
               LEFT OUTER JOIN (
                 -- Pass Only Elements: ['country_latest', 'listing']
                 SELECT
-                  subq_19.listing
-                  , subq_19.country_latest
+                  subq_17.listing
+                  , subq_17.country_latest
                 FROM (
                   -- Metric Time Dimension 'ds'
                   SELECT
-                    subq_18.ds__day
-                    , subq_18.ds__week
-                    , subq_18.ds__month
-                    , subq_18.ds__quarter
-                    , subq_18.ds__year
-                    , subq_18.ds__extract_year
-                    , subq_18.ds__extract_quarter
-                    , subq_18.ds__extract_month
-                    , subq_18.ds__extract_day
-                    , subq_18.ds__extract_dow
-                    , subq_18.ds__extract_doy
-                    , subq_18.created_at__day
-                    , subq_18.created_at__week
-                    , subq_18.created_at__month
-                    , subq_18.created_at__quarter
-                    , subq_18.created_at__year
-                    , subq_18.created_at__extract_year
-                    , subq_18.created_at__extract_quarter
-                    , subq_18.created_at__extract_month
-                    , subq_18.created_at__extract_day
-                    , subq_18.created_at__extract_dow
-                    , subq_18.created_at__extract_doy
-                    , subq_18.listing__ds__day
-                    , subq_18.listing__ds__week
-                    , subq_18.listing__ds__month
-                    , subq_18.listing__ds__quarter
-                    , subq_18.listing__ds__year
-                    , subq_18.listing__ds__extract_year
-                    , subq_18.listing__ds__extract_quarter
-                    , subq_18.listing__ds__extract_month
-                    , subq_18.listing__ds__extract_day
-                    , subq_18.listing__ds__extract_dow
-                    , subq_18.listing__ds__extract_doy
-                    , subq_18.listing__created_at__day
-                    , subq_18.listing__created_at__week
-                    , subq_18.listing__created_at__month
-                    , subq_18.listing__created_at__quarter
-                    , subq_18.listing__created_at__year
-                    , subq_18.listing__created_at__extract_year
-                    , subq_18.listing__created_at__extract_quarter
-                    , subq_18.listing__created_at__extract_month
-                    , subq_18.listing__created_at__extract_day
-                    , subq_18.listing__created_at__extract_dow
-                    , subq_18.listing__created_at__extract_doy
-                    , subq_18.ds__day AS metric_time__day
-                    , subq_18.ds__week AS metric_time__week
-                    , subq_18.ds__month AS metric_time__month
-                    , subq_18.ds__quarter AS metric_time__quarter
-                    , subq_18.ds__year AS metric_time__year
-                    , subq_18.ds__extract_year AS metric_time__extract_year
-                    , subq_18.ds__extract_quarter AS metric_time__extract_quarter
-                    , subq_18.ds__extract_month AS metric_time__extract_month
-                    , subq_18.ds__extract_day AS metric_time__extract_day
-                    , subq_18.ds__extract_dow AS metric_time__extract_dow
-                    , subq_18.ds__extract_doy AS metric_time__extract_doy
-                    , subq_18.listing
-                    , subq_18.user
-                    , subq_18.listing__user
-                    , subq_18.country_latest
-                    , subq_18.is_lux_latest
-                    , subq_18.capacity_latest
-                    , subq_18.listing__country_latest
-                    , subq_18.listing__is_lux_latest
-                    , subq_18.listing__capacity_latest
-                    , subq_18.listings
-                    , subq_18.largest_listing
-                    , subq_18.smallest_listing
+                    subq_3.ds__day
+                    , subq_3.ds__week
+                    , subq_3.ds__month
+                    , subq_3.ds__quarter
+                    , subq_3.ds__year
+                    , subq_3.ds__extract_year
+                    , subq_3.ds__extract_quarter
+                    , subq_3.ds__extract_month
+                    , subq_3.ds__extract_day
+                    , subq_3.ds__extract_dow
+                    , subq_3.ds__extract_doy
+                    , subq_3.created_at__day
+                    , subq_3.created_at__week
+                    , subq_3.created_at__month
+                    , subq_3.created_at__quarter
+                    , subq_3.created_at__year
+                    , subq_3.created_at__extract_year
+                    , subq_3.created_at__extract_quarter
+                    , subq_3.created_at__extract_month
+                    , subq_3.created_at__extract_day
+                    , subq_3.created_at__extract_dow
+                    , subq_3.created_at__extract_doy
+                    , subq_3.listing__ds__day
+                    , subq_3.listing__ds__week
+                    , subq_3.listing__ds__month
+                    , subq_3.listing__ds__quarter
+                    , subq_3.listing__ds__year
+                    , subq_3.listing__ds__extract_year
+                    , subq_3.listing__ds__extract_quarter
+                    , subq_3.listing__ds__extract_month
+                    , subq_3.listing__ds__extract_day
+                    , subq_3.listing__ds__extract_dow
+                    , subq_3.listing__ds__extract_doy
+                    , subq_3.listing__created_at__day
+                    , subq_3.listing__created_at__week
+                    , subq_3.listing__created_at__month
+                    , subq_3.listing__created_at__quarter
+                    , subq_3.listing__created_at__year
+                    , subq_3.listing__created_at__extract_year
+                    , subq_3.listing__created_at__extract_quarter
+                    , subq_3.listing__created_at__extract_month
+                    , subq_3.listing__created_at__extract_day
+                    , subq_3.listing__created_at__extract_dow
+                    , subq_3.listing__created_at__extract_doy
+                    , subq_3.ds__day AS metric_time__day
+                    , subq_3.ds__week AS metric_time__week
+                    , subq_3.ds__month AS metric_time__month
+                    , subq_3.ds__quarter AS metric_time__quarter
+                    , subq_3.ds__year AS metric_time__year
+                    , subq_3.ds__extract_year AS metric_time__extract_year
+                    , subq_3.ds__extract_quarter AS metric_time__extract_quarter
+                    , subq_3.ds__extract_month AS metric_time__extract_month
+                    , subq_3.ds__extract_day AS metric_time__extract_day
+                    , subq_3.ds__extract_dow AS metric_time__extract_dow
+                    , subq_3.ds__extract_doy AS metric_time__extract_doy
+                    , subq_3.listing
+                    , subq_3.user
+                    , subq_3.listing__user
+                    , subq_3.country_latest
+                    , subq_3.is_lux_latest
+                    , subq_3.capacity_latest
+                    , subq_3.listing__country_latest
+                    , subq_3.listing__is_lux_latest
+                    , subq_3.listing__capacity_latest
+                    , subq_3.listings
+                    , subq_3.largest_listing
+                    , subq_3.smallest_listing
                   FROM (
                     -- Read Elements From Semantic Model 'listings_latest'
                     SELECT
@@ -891,28 +891,28 @@ FROM (
                       , listings_latest_src_28000.user_id AS user
                       , listings_latest_src_28000.user_id AS listing__user
                     FROM ***************************.dim_listings_latest listings_latest_src_28000
-                  ) subq_18
-                ) subq_19
-              ) subq_20
+                  ) subq_3
+                ) subq_17
+              ) subq_18
               ON
-                subq_17.listing = subq_20.listing
-            ) subq_21
-          ) subq_22
+                subq_16.listing = subq_18.listing
+            ) subq_19
+          ) subq_20
           WHERE booking__is_instant
-        ) subq_23
-      ) subq_24
+        ) subq_21
+      ) subq_22
       GROUP BY
-        subq_24.metric_time__day
-        , subq_24.listing__country_latest
-    ) subq_25
-  ) subq_26
+        subq_22.metric_time__day
+        , subq_22.listing__country_latest
+    ) subq_23
+  ) subq_24
   ON
     (
-      subq_11.listing__country_latest = subq_26.listing__country_latest
+      subq_11.listing__country_latest = subq_24.listing__country_latest
     ) AND (
-      subq_11.metric_time__day = subq_26.metric_time__day
+      subq_11.metric_time__day = subq_24.metric_time__day
     )
   GROUP BY
-    COALESCE(subq_11.metric_time__day, subq_26.metric_time__day)
-    , COALESCE(subq_11.listing__country_latest, subq_26.listing__country_latest)
-) subq_27
+    COALESCE(subq_11.metric_time__day, subq_24.metric_time__day)
+    , COALESCE(subq_11.listing__country_latest, subq_24.listing__country_latest)
+) subq_25
@@ -5,10 +5,10 @@ SELECT
 FROM (
   -- Combine Aggregated Outputs
   SELECT
-    COALESCE(subq_41.metric_time__day, subq_46.metric_time__day) AS metric_time__day
-    , MAX(subq_41.average_booking_value) AS average_booking_value
-    , MAX(subq_41.bookings) AS bookings
-    , MAX(subq_46.booking_value) AS booking_value
+    COALESCE(subq_38.metric_time__day, subq_43.metric_time__day) AS metric_time__day
+    , MAX(subq_38.average_booking_value) AS average_booking_value
+    , MAX(subq_38.bookings) AS bookings
+    , MAX(subq_43.booking_value) AS booking_value
   FROM (
     -- Constrain Output with WHERE
     -- Pass Only Elements: ['average_booking_value', 'bookings', 'metric_time__day']
@@ -22,10 +22,10 @@ FROM (
       -- Join Standard Outputs
       -- Pass Only Elements: ['average_booking_value', 'bookings', 'listing__is_lux_latest', 'metric_time__day']
       SELECT
-        subq_32.metric_time__day AS metric_time__day
+        subq_29.metric_time__day AS metric_time__day
         , listings_latest_src_28000.is_lux AS listing__is_lux_latest
-        , subq_32.bookings AS bookings
-        , subq_32.average_booking_value AS average_booking_value
+        , subq_29.bookings AS bookings
+        , subq_29.average_booking_value AS average_booking_value
       FROM (
         -- Read Elements From Semantic Model 'bookings_source'
         -- Metric Time Dimension 'ds'
@@ -36,16 +36,16 @@ FROM (
           , 1 AS bookings
           , booking_value AS average_booking_value
         FROM ***************************.fct_bookings bookings_source_src_28000
-      ) subq_32
+      ) subq_29
       LEFT OUTER JOIN
         ***************************.dim_listings_latest listings_latest_src_28000
       ON
-        subq_32.listing = listings_latest_src_28000.listing_id
-    ) subq_37
+        subq_29.listing = listings_latest_src_28000.listing_id
+    ) subq_34
     WHERE listing__is_lux_latest
     GROUP BY
       metric_time__day
-  ) subq_41
+  ) subq_38
   FULL OUTER JOIN (
     -- Read Elements From Semantic Model 'bookings_source'
     -- Metric Time Dimension 'ds'
@@ -58,9 +58,9 @@ FROM (
     FROM ***************************.fct_bookings bookings_source_src_28000
     GROUP BY
       metric_time__day
-  ) subq_46
+  ) subq_43
   ON
-    subq_41.metric_time__day = subq_46.metric_time__day
+    subq_38.metric_time__day = subq_43.metric_time__day
   GROUP BY
     metric_time__day
-) subq_47
+) subq_44
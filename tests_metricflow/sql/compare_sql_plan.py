@@ -19,9 +19,14 @@ def assert_default_rendered_sql_equal(
     mf_test_configuration: MetricFlowTestConfiguration,
     plan_id: str,
     sql_plan_node: SqlQueryPlanNode,
+    render_common_table_expressions: bool = False,
 ) -> None:
     """Helper function to render a select statement and compare with the one saved as a file."""
-    sql_query_plan = SqlQueryPlan(render_node=sql_plan_node, plan_id=DagId.from_str(plan_id))
+    sql_query_plan = SqlQueryPlan(
+        render_node=sql_plan_node,
+        plan_id=DagId.from_str(plan_id),
+        render_common_table_expressions=render_common_table_expressions,
+    )
 
     rendered_sql = DefaultSqlQueryPlanRenderer().render_sql_query_plan(sql_query_plan).sql
 
@@ -924,3 +924,58 @@ def test_prune_distinct_select(
         sql_plan_node=select_node,
         plan_id="after_pruning",
     )
+
+
+def test_prune_shared_source(column_pruner: SqlColumnPrunerOptimizer) -> None:
+    """Tests that a source used in multiple places is pruned once when the same columns are required."""
+    shared_source = SqlSelectStatementNode.create(
+        description="shared_source",
+        select_columns=tuple(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression.create(
+                    col_ref=SqlColumnReference(table_alias="source_table", column_name=column_name)
+                ),
+                column_alias=column_name,
+            )
+            for column_name in ("col0", "col1", "join_col")
+        ),
+        from_source=SqlTableFromClauseNode.create(sql_table=SqlTable(schema_name="demo", table_name="source_table")),
+        from_source_alias="source_table",
+    )
+    select_node = SqlSelectStatementNode.create(
+        description="test0",
+        select_columns=tuple(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression.create(
+                    col_ref=SqlColumnReference(table_alias=table_alias, column_name="col0")
+                ),
+                column_alias=f"{table_alias}_col0",
+            )
+            for table_alias in ("a", "b")
+        ),
+        from_source=shared_source,
+        from_source_alias="a",
+        join_descs=(
+            SqlJoinDescription(
+                right_source=shared_source,
+                right_source_alias="b",
+                on_condition=SqlComparisonExpression.create(
+                    left_expr=SqlColumnReferenceExpression.create(
+                        col_ref=SqlColumnReference(table_alias="a", column_name="join_col")
+                    ),
+                    comparison=SqlComparison.EQUALS,
+                    right_expr=SqlColumnReferenceExpression.create(
+                        col_ref=SqlColumnReference(table_alias="b", column_name="join_col")
+                    ),
+                ),
+                join_type=SqlJoinType.INNER,
+            ),
+        ),
+    )
+
+    pruned_node = column_pruner.optimize(select_node).as_select_node
+    assert pruned_node is not None
+    assert pruned_node.from_source is pruned_node.join_descs[0].right_source
+    pruned_source = pruned_node.from_source.as_select_node
+    assert pruned_source is not None
+    assert [select_column.column_alias for select_column in pruned_source.select_columns] == ["col0", "join_col"]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from metricflow_semantics.sql.sql_join_type import SqlJoinType
+from metricflow_semantics.sql.sql_table import SqlTable
+from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
+
+from metricflow.sql.optimizer.common_sub_query_deduplicator import SqlCommonSubQueryDeduplicator
+from metricflow.sql.render.sql_plan_renderer import DefaultSqlQueryPlanRenderer, SqlQueryPlanRenderer
+from metricflow.sql.sql_exprs import (
+    SqlColumnReference,
+    SqlColumnReferenceExpression,
+    SqlComparison,
+    SqlComparisonExpression,
+    SqlExpressionNode,
+    SqlStringExpression,
+)
+from metricflow.sql.sql_plan import (
+    SqlJoinDescription,
+    SqlQueryPlan,
+    SqlQueryPlanNode,
+    SqlSelectColumn,
+    SqlSelectStatementNode,
+    SqlTableFromClauseNode,
+)
+from tests_metricflow.sql.compare_sql_plan import assert_default_rendered_sql_equal
+
+
+def _create_source_select_statement(
+    table_alias: str, where: Optional[SqlExpressionNode] = None
+) -> SqlSelectStatementNode:
+    """Returns a statement like `SELECT {table_alias}.col0 AS col0, ... FROM demo.source_table {table_alias}`."""
+    return SqlSelectStatementNode.create(
+        description="source",
+        select_columns=tuple(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression.from_table_and_column_names(
+                    table_alias=table_alias, column_name=column_name
+                ),
+                column_alias=column_name,
+            )
+            for column_name in ("col0", "join_col")
+        ),
+        from_source=SqlTableFromClauseNode.create(sql_table=SqlTable(schema_name="demo", table_name="source_table")),
+        from_source_alias=table_alias,
+        where=where,
+    )
+
+
+def _create_self_join_statement(
+    from_source: SqlSelectStatementNode, right_source: SqlSelectStatementNode
+) -> SqlSelectStatementNode:
+    return SqlSelectStatementNode.create(
+        description="self_join",
+        select_columns=(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression.from_table_and_column_names(table_alias="a", column_name="col0"),
+                column_alias="a_col0",
+            ),
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression.from_table_and_column_names(table_alias="b", column_name="col0"),
+                column_alias="b_col0",
+            ),
+        ),
+        from_source=from_source,
+        from_source_alias="a",
+        join_descs=(
+            SqlJoinDescription(
+                right_source=right_source,
+                right_source_alias="b",
+                on_condition=SqlComparisonExpression.create(
+                    left_expr=SqlColumnReferenceExpression.create(
+                        col_ref=SqlColumnReference(table_alias="a", column_name="join_col")
+                    ),
+                    comparison=SqlComparison.EQUALS,
+                    right_expr=SqlColumnReferenceExpression.create(
+                        col_ref=SqlColumnReference(table_alias="b", column_name="join_col")
+                    ),
+                ),
+                join_type=SqlJoinType.INNER,
+            ),
+        ),
+    )
+
+
+def _render_sql(
+    sql_plan_node: SqlQueryPlanNode,
+    render_common_table_expressions: bool = True,
+    sql_plan_renderer: SqlQueryPlanRenderer = DefaultSqlQueryPlanRenderer(),
+) -> str:
+    return sql_plan_renderer.render_sql_query_plan(
+        SqlQueryPlan(render_node=sql_plan_node, render_common_table_expressions=render_common_table_expressions)
+    ).sql
+
+
+def test_identical_sub_queries(
+    request: FixtureRequest,
+    mf_test_configuration: MetricFlowTestConfiguration,
+) -> None:
+    """Tests that sub-queries that only differ by alias are rendered once in a WITH clause."""
+    select_statement = _create_self_join_statement(
+        from_source=_create_source_select_statement(table_alias="source_table_0"),
+        right_source=_create_source_select_statement(table_alias="source_table_1"),
+    )
+    deduplicated_node = SqlCommonSubQueryDeduplicator().optimize(select_statement).as_select_node
+    assert deduplicated_node is not None
+    assert deduplicated_node.from_source is deduplicated_node.join_descs[0].right_source
+
+    assert_default_rendered_sql_equal(
+        request=request,
+        mf_test_configuration=mf_test_configuration,
+        sql_plan_node=deduplicated_node,
+        plan_id="after_deduplication",
+        render_common_table_expressions=True,
+    )
+
+
+def test_different_sub_queries() -> None:
+    """Tests that sub-queries that differ by more than the alias are not de-duplicated."""
+    select_statement = _create_self_join_statement(
+        from_source=_create_source_select_statement(table_alias="source_table_0"),
+        right_source=_create_source_select_statement(
+            table_alias="source_table_1", where=SqlStringExpression.create("col0 > 0")
+        ),
+    )
+    deduplicated_node = SqlCommonSubQueryDeduplicator().optimize(select_statement).as_select_node
+    assert deduplicated_node is not None
+    assert deduplicated_node.from_source is not deduplicated_node.join_descs[0].right_source
+
+    assert "WITH" not in _render_sql(deduplicated_node)
+
+
+def test_common_table_expressions_not_supported() -> None:
+    """Tests that shared sub-queries are rendered at each use if not enabled, or if the renderer doesn't support CTEs."""
+
+    class _RendererWithoutCommonTableExpressions(DefaultSqlQueryPlanRenderer):
+        SUPPORTS_COMMON_TABLE_EXPRESSIONS = False
+
+    source_select_statement = _create_source_select_statement(table_alias="source_table")
+    select_statement = _create_self_join_statement(
+        from_source=source_select_statement, right_source=source_select_statement
+    )
+    assert "WITH cte_0 AS" in _render_sql(select_statement)
+
+    for sql in (
+        _render_sql(select_statement, render_common_table_expressions=False),
+        _render_sql(select_statement, sql_plan_renderer=_RendererWithoutCommonTableExpressions()),
+    ):
+        assert "WITH" not in sql
+        assert sql.count("FROM demo.source_table source_table") == 2
+
+
+@pytest.mark.parametrize("use_deduplicator", (True, False))
+def test_plan_without_shared_sub_queries(use_deduplicator: bool) -> None:
+    """Tests that a plan without repeated sub-queries renders the same as before."""
+    select_statement = _create_source_select_statement(table_alias="source_table")
+    node = SqlCommonSubQueryDeduplicator().optimize(select_statement) if use_deduplicator else select_statement
+    assert _render_sql(node).startswith("-- source\nSELECT")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import logging
 from decimal import Decimal
 
@@ -122,3 +123,110 @@ def test_get_cell_value(example_table: MetricFlowDataTable) -> None:  # noqa: D1
 def test_column_values_iterator(example_table: MetricFlowDataTable) -> None:  # noqa: D103
     assert tuple(example_table.column_values_iterator(0)) == (0, 1)
     assert tuple(example_table.column_values_iterator(1)) == ("a", "b")
+
+
+def test_split_into_batches(example_table: MetricFlowDataTable) -> None:  # noqa: D103
+    batches = tuple(example_table.split_into_batches(batch_size=1))
+    assert tuple(batch.rows for batch in batches) == (((0, "a"),), ((1, "b"),))
+    assert all(batch.column_descriptions == example_table.column_descriptions for batch in batches)
+
+    assert tuple(example_table.split_into_batches(batch_size=2)) == (example_table,)
+
+
+def test_rows_are_cached(example_table: MetricFlowDataTable) -> None:  # noqa: D103
+    assert example_table.rows == ((0, "a"), (1, "b"))
+    assert example_table.rows is example_table.rows
+
+
+def test_deprecated_rows_initializer(example_table: MetricFlowDataTable) -> None:  # noqa: D103
+    with pytest.warns(DeprecationWarning):
+        table = MetricFlowDataTable(column_descriptions=example_table.column_descriptions, rows=example_table.rows)
+    check_data_tables_are_equal(expected_table=example_table, actual_table=table)
+
+
+@pytest.fixture
+def table_with_nulls() -> MetricFlowDataTable:  # noqa: D103
+    return MetricFlowDataTable.create_from_rows(
+        column_names=["int_col", "float_col", "bool_col", "datetime_col", "str_col"],
+        rows=[
+            (1, 1.5, True, datetime.datetime(2020, 1, 1), "a"),
+            (None, None, None, None, None),
+            (3, 3.5, False, datetime.datetime(2020, 1, 3, 12, 30), "c"),
+        ],
+    )
+
+
+def test_columnar_round_trip(table_with_nulls: MetricFlowDataTable) -> None:  # noqa: D103
+    assert table_with_nulls.rows == (
+        (1, 1.5, True, datetime.datetime(2020, 1, 1), "a"),
+        (None, None, None, None, None),
+        (3, 3.5, False, datetime.datetime(2020, 1, 3, 12, 30), "c"),
+    )
+    assert tuple(type(cell) for cell in table_with_nulls.rows[0]) == (int, float, bool, datetime.datetime, str)
+    assert tuple(column_data.null_count for column_data in table_with_nulls.column_data) == (1, 1, 1, 1, 1)
+
+    batches = tuple(table_with_nulls.split_into_batches(batch_size=2))
+    assert tuple(row for batch in batches for row in batch.rows) == table_with_nulls.rows
+
+    check_data_tables_are_equal(
+        expected_table=table_with_nulls,
+        actual_table=MetricFlowDataTable.create_from_rows(
+            column_names=table_with_nulls.column_names, rows=reversed(table_with_nulls.rows)
+        ),
+        ignore_order=True,
+    )
+
+
+def test_to_numpy(table_with_nulls: MetricFlowDataTable) -> None:  # noqa: D103
+    numpy = pytest.importorskip("numpy")
+
+    column_name_to_array = table_with_nulls.to_numpy()
+    int_array = column_name_to_array["int_col"]
+    assert int_array.dtype == numpy.int64
+    assert int_array.tolist() == [1, None, 3]
+    assert column_name_to_array["datetime_col"].dtype == numpy.dtype("datetime64[us]")
+    assert column_name_to_array["datetime_col"][2] == numpy.datetime64("2020-01-03T12:30")
+    assert column_name_to_array["str_col"].tolist() == ["a", None, "c"]
+
+
+def test_to_arrow(table_with_nulls: MetricFlowDataTable) -> None:  # noqa: D103
+    pyarrow = pytest.importorskip("pyarrow")
+
+    arrow_table = table_with_nulls.to_arrow()
+    assert arrow_table.column_names == list(table_with_nulls.column_names)
+    assert arrow_table.schema.field("int_col").type == pyarrow.int64()
+    assert arrow_table.schema.field("datetime_col").type == pyarrow.timestamp("us")
+    assert [tuple(row.values()) for row in arrow_table.to_pylist()] == list(table_with_nulls.rows)
+
+
+def test_create_from_trusted_rows() -> None:  # noqa: D103
+    column_names = ["int_col", "decimal_col", "date_col", "datetime_col", "str_col", "null_col"]
+    rows = [
+        (
+            1,
+            Decimal("1.5"),
+            datetime.date(2020, 1, 1),
+            datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+            "a",
+            None,
+        ),
+        (None, None, None, None, None, None),
+        (3, Decimal("3.5"), datetime.date(2020, 1, 3), datetime.datetime(2020, 1, 3), "c", None),
+    ]
+
+    expected_table = MetricFlowDataTable.create_from_rows(column_names=column_names, rows=rows)
+    actual_table = MetricFlowDataTable.create_from_trusted_rows(column_names=column_names, rows=iter(rows))
+    assert actual_table.column_descriptions == expected_table.column_descriptions
+    check_data_tables_are_equal(expected_table=expected_table, actual_table=actual_table, ignore_order=False)
+
+    empty_table = MetricFlowDataTable.create_from_trusted_rows(column_names=column_names, rows=[])
+    assert empty_table.row_count == 0
+    assert tuple(empty_table.column_names) == tuple(column_names)
+
+
+def test_create_from_invalid_trusted_rows() -> None:  # noqa: D103
+    with pytest.raises(ValueError):
+        MetricFlowDataTable.create_from_trusted_rows(column_names=["col_0", "col_1"], rows=[(1, "a"), (2,)])
+
+    with pytest.raises(ValueError):
+        MetricFlowDataTable.create_from_trusted_rows(column_names=["col_0", "col_1"], rows=[(1, "a"), (2, 1.0)])
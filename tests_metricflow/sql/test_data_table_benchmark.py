@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import datetime
+import logging
+from typing import List, Tuple
+
+import pytest
+from metricflow_semantics.test_helpers.benchmark_helpers import BenchmarkTimer
+
+from metricflow.data_table.column_types import InputCellValue
+from metricflow.data_table.mf_table import MetricFlowDataTable
+from tests_metricflow.sql.compare_data_table import check_data_tables_are_equal
+
+logger = logging.getLogger(__name__)
+
+_COLUMN_NAMES = ("metric_time__day", "listing__country_latest", "bookings", "booking_value", "is_instant")
+
+
+def _generate_rows(row_count: int) -> List[Tuple[InputCellValue, ...]]:
+    start_time = datetime.datetime(2020, 1, 1)
+    return [
+        (
+            start_time + datetime.timedelta(days=i % 3650),
+            ("us", "ca", "mx", None)[i % 4],
+            i,
+            i * 1.5 if i % 10 else None,
+            i % 2 == 0,
+        )
+        for i in range(row_count)
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("row_count", (10_000, 100_000, 1_000_000))
+def test_table_construction_benchmark(row_count: int) -> None:
+    """Compares the time to create a table with / without validation, and checks that the tables are the same."""
+    benchmark_timer = BenchmarkTimer("test_table_construction_benchmark")
+    rows = _generate_rows(row_count)
+
+    with benchmark_timer.time("create_with_validation"):
+        validated_table = MetricFlowDataTable.create_from_rows(column_names=_COLUMN_NAMES, rows=rows)
+
+    with benchmark_timer.time("create_without_validation"):
+        trusted_table = MetricFlowDataTable.create_from_trusted_rows(column_names=_COLUMN_NAMES, rows=rows)
+
+    benchmark_timer.log_results(f"Created a table with {row_count} rows.")
+    assert trusted_table.row_count == row_count
+    check_data_tables_are_equal(expected_table=validated_table, actual_table=trusted_table, ignore_order=False)
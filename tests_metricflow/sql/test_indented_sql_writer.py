@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameters
+
+from metricflow.sql.render.indented_sql_writer import IndentedSqlWriter
+
+
+def test_indentation_matches_textwrap() -> None:
+    """Tests that nested lines are indented in the same way as repeatedly applying `textwrap.indent()`."""
+    multi_line_text = "a\n\n  \nb\r\nc"
+    writer = IndentedSqlWriter()
+    writer.write_line("SELECT")
+    with writer.indented():
+        writer.write_line(multi_line_text)
+        with writer.indented():
+            writer.write_line(multi_line_text)
+        writer.write_line("")
+    writer.write_line(")")
+
+    expected_inner_sql = "\n".join(
+        (multi_line_text, textwrap.indent(multi_line_text, prefix="  "), ""),
+    )
+    assert writer.sql == "\n".join(("SELECT", textwrap.indent(expected_inner_sql, prefix="  "), ")"))
+
+
+def test_bind_parameters() -> None:  # noqa: D103
+    writer = IndentedSqlWriter()
+    writer.add_bind_parameters(SqlBindParameters.create_from_dict({"a": 1, "b": "2"}))
+    writer.add_bind_parameters(SqlBindParameters.create_from_dict({"c": 3.0, "a": 1}))
+    assert writer.bind_parameters == SqlBindParameters.create_from_dict({"a": 1, "b": "2", "c": 3.0})
+
+    with pytest.raises(RuntimeError):
+        writer.add_bind_parameters(SqlBindParameters.create_from_dict({"a": 2}))
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from metricflow_semantics.sql.sql_table import SqlTable
+from metricflow_semantics.test_helpers.benchmark_helpers import BenchmarkTimer
+
+from metricflow.sql.render.sql_plan_renderer import DefaultSqlQueryPlanRenderer
+from metricflow.sql.sql_exprs import SqlColumnReference, SqlColumnReferenceExpression
+from metricflow.sql.sql_plan import SqlQueryPlanNode, SqlSelectColumn, SqlSelectStatementNode, SqlTableFromClauseNode
+
+logger = logging.getLogger(__name__)
+
+
+def _build_nested_query(depth: int, column_count: int) -> SqlSelectStatementNode:
+    """Build a query that is nested `depth` levels deep with `column_count` columns selected at each level."""
+    assert depth > 0
+    source_node: SqlQueryPlanNode = SqlTableFromClauseNode.create(
+        sql_table=SqlTable(schema_name="demo", table_name="fct")
+    )
+    for i in range(depth):
+        select_node = SqlSelectStatementNode.create(
+            description=f"Level {i}",
+            select_columns=tuple(
+                SqlSelectColumn(
+                    expr=SqlColumnReferenceExpression.create(SqlColumnReference(f"subq_{i}", f"col_{j}")),
+                    column_alias=f"col_{j}",
+                )
+                for j in range(column_count)
+            ),
+            from_source=source_node,
+            from_source_alias=f"subq_{i}",
+        )
+        source_node = select_node
+    return select_node
+
+
+@pytest.mark.slow
+def test_nested_query_render_benchmark() -> None:
+    """Measures the time to render a deeply nested query."""
+    benchmark_timer = BenchmarkTimer("test_nested_query_render_benchmark")
+    depth = 100
+    node = _build_nested_query(depth=depth, column_count=20)
+    renderer = DefaultSqlQueryPlanRenderer()
+
+    with benchmark_timer.time("render"):
+        sql = renderer.visit_select_statement_node(node).sql
+
+    benchmark_timer.log_results(f"Rendered a query nested {depth} levels deep ({len(sql)} characters).")
+    assert sql.count("SELECT") == depth
+    # The innermost query is indented once for each enclosing query, and the columns are indented once more.
+    assert f"\n{'  ' * depth}subq_0.col_0\n" in sql
@@ -44,6 +44,20 @@ def test_query(sql_client: SqlClient) -> None:  # noqa: D103
     _check_1col(df)
 
 
+def test_query_iter(sql_client: SqlClient) -> None:  # noqa: D103
+    stmt = "SELECT y FROM ( SELECT 1 AS y UNION ALL SELECT 2 AS y UNION ALL SELECT 3 AS y ) source0 ORDER BY y"
+    data_tables = tuple(sql_client.query_iter(stmt, batch_size=2))
+    assert tuple(data_table.row_count for data_table in data_tables) == (2, 1)
+    _check_1col(data_tables[0], vals={1, 2})
+    _check_1col(data_tables[1], vals={3})
+
+    # An empty result should still return the columns.
+    data_tables = tuple(sql_client.query_iter(f"{stmt} LIMIT 0", batch_size=2))
+    assert len(data_tables) == 1
+    assert data_tables[0].row_count == 0
+    assert tuple(column_name.lower() for column_name in data_tables[0].column_names) == ("y",)
+
+
 def test_select_one_query(sql_client: SqlClient) -> None:  # noqa: D103
     sql_client.query("SELECT 1")
     with pytest.raises(Exception):
@@ -94,6 +108,21 @@ def example_df() -> MetricFlowDataTable:
     )
 
 
+def test_query_with_bind_parameters(sql_client: SqlClient) -> None:  # noqa: D103
+    stmt = f"SELECT {sql_client.render_bind_parameter_key('x')} AS y"
+    df = sql_client.query(stmt, sql_bind_parameters=SqlBindParameters.create_from_dict({"x": "it's"}))
+    _check_1col(df, vals={"it's"})
+
+
+def test_query_with_bind_parameter_placeholders_in_quotes(sql_client: SqlClient) -> None:
+    """Check that placeholder-like text in string literals and comments is not replaced."""
+    stmt = (
+        "-- Placeholder in a comment: :x\n" f"SELECT {sql_client.render_bind_parameter_key('x')} || ' :x' /* :x */ AS y"
+    )
+    df = sql_client.query(stmt, sql_bind_parameters=SqlBindParameters.create_from_dict({"x": "it's"}))
+    _check_1col(df, vals={"it's :x"})
+
+
 def test_dry_run(mf_test_configuration: MetricFlowTestConfiguration, sql_client: SqlClient) -> None:  # noqa: D103
     test_table = SqlTable(schema_name=mf_test_configuration.mf_system_schema, table_name=_random_table())
 
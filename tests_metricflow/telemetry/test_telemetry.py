@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from typing import Sequence
 
 import pytest
 
-from metricflow.telemetry.models import TelemetryLevel
-from metricflow.telemetry.reporter import TelemetryReporter, log_call
+from metricflow.telemetry.handlers.handlers import ToMemoryTelemetryHandler
+from metricflow.telemetry.models import FunctionEndEvent, FunctionStartEvent, TelemetryLevel
+from metricflow.telemetry.reporter import TelemetryReporter, log_async_call, log_call
 
 logger = logging.getLogger(__name__)
 
@@ -24,14 +28,16 @@ def test_function_call(telemetry_reporter: TelemetryReporter) -> None:  # noqa:
         return "foo"
 
     test_function()
+    telemetry_reporter.flush()
 
-    start_event = telemetry_reporter.test_handler.payloads[0].function_start_events[0]
+    start_event = telemetry_reporter.test_handler.function_start_events[0]
     assert start_event.module_name == "tests_metricflow.telemetry.test_telemetry"
     assert start_event.function_name == "test_function"
 
-    end_event = telemetry_reporter.test_handler.payloads[1].function_end_events[0]
+    end_event = telemetry_reporter.test_handler.function_end_events[0]
     assert end_event.module_name == "tests_metricflow.telemetry.test_telemetry"
     assert end_event.function_name == "test_function"
+    assert end_event.invocation_id == start_event.invocation_id
     assert not end_event.exception_trace
     assert end_event.runtime > 0
 
@@ -44,12 +50,13 @@ def test_function_exception(telemetry_reporter: TelemetryReporter) -> None:  # n
             raise ValueError("foo")
 
         test_function()
+    telemetry_reporter.flush()
 
-    start_event = telemetry_reporter.test_handler.payloads[0].function_start_events[0]
+    start_event = telemetry_reporter.test_handler.function_start_events[0]
     assert start_event.module_name == "tests_metricflow.telemetry.test_telemetry"
     assert start_event.function_name == "test_function"
 
-    end_event = telemetry_reporter.test_handler.payloads[1].function_end_events[0]
+    end_event = telemetry_reporter.test_handler.function_end_events[0]
     assert end_event.module_name == "tests_metricflow.telemetry.test_telemetry"
     assert end_event.function_name == "test_function"
     assert end_event.exception_trace
@@ -58,6 +65,23 @@ def test_function_exception(telemetry_reporter: TelemetryReporter) -> None:  # n
     assert end_event.runtime > 0
 
 
+def test_async_function_call(telemetry_reporter: TelemetryReporter) -> None:  # noqa: D103
+    @log_async_call(telemetry_reporter=telemetry_reporter, module_name=__name__)
+    async def test_function() -> str:
+        await asyncio.sleep(0.01)
+        return "foo"
+
+    assert asyncio.run(test_function()) == "foo"
+    telemetry_reporter.flush()
+
+    start_event = telemetry_reporter.test_handler.function_start_events[0]
+    assert start_event.function_name == "test_function"
+    end_event = telemetry_reporter.test_handler.function_end_events[0]
+    assert end_event.invocation_id == start_event.invocation_id
+    assert not end_event.exception_trace
+    assert end_event.runtime >= 0.01
+
+
 def test_telemetry_off() -> None:  # noqa: D103
     reporter = TelemetryReporter(report_levels_higher_or_equal_to=TelemetryLevel.OFF)
     reporter.add_python_log_handler()
@@ -77,4 +101,73 @@ def test_telemetry_off() -> None:  # noqa: D103
 
         test_exception_function()
 
+    reporter.flush()
     assert len(reporter.test_handler.payloads) == 0
+
+
+def test_events_reported_in_background_thread() -> None:
+    """Tests that the events are reported in batches by the background thread without calling `flush()`."""
+    reporter = TelemetryReporter(
+        report_levels_higher_or_equal_to=TelemetryLevel.USAGE, batch_size=4, flush_interval_seconds=0.01
+    )
+    reporter.add_test_handler()
+
+    @log_call(telemetry_reporter=reporter, module_name=__name__)
+    def test_function() -> str:
+        return "foo"
+
+    for _ in range(2):
+        test_function()
+
+    deadline = time.time() + 10
+    while len(reporter.test_handler.function_end_events) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    reporter.close()
+
+    assert len(reporter.test_handler.function_start_events) == 2
+    assert len(reporter.test_handler.function_end_events) == 2
+    assert all(
+        len(payload.function_start_events) + len(payload.function_end_events) <= 4
+        for payload in reporter.test_handler.payloads
+    )
+
+
+def test_events_dropped_when_queue_is_full() -> None:  # noqa: D103
+    reporter = TelemetryReporter(
+        report_levels_higher_or_equal_to=TelemetryLevel.USAGE, max_queued_event_count=3, flush_interval_seconds=60
+    )
+    reporter.add_test_handler()
+    # Hold the lock used for processing so that the background thread can't empty the queue.
+    with reporter._event_queue._process_lock:
+        for i in range(5):
+            reporter.log_function_start(invocation_id=f"call_{i}", module_name=__name__, function_name="test_function")
+    reporter.flush()
+
+    assert reporter.dropped_event_count == 2
+    assert [event.invocation_id for event in reporter.test_handler.function_start_events] == [
+        "call_0",
+        "call_1",
+        "call_2",
+    ]
+    reporter.close()
+
+
+def test_handler_exception_does_not_affect_caller(telemetry_reporter: TelemetryReporter) -> None:  # noqa: D103
+    class _FailingTelemetryHandler(ToMemoryTelemetryHandler):
+        def log_batch(
+            self,
+            client_id: str,
+            function_start_events: Sequence[FunctionStartEvent] = (),
+            function_end_events: Sequence[FunctionEndEvent] = (),
+        ) -> bool:
+            raise RuntimeError("Unable to report")
+
+    telemetry_reporter._handlers.insert(0, _FailingTelemetryHandler())
+
+    @log_call(telemetry_reporter=telemetry_reporter, module_name=__name__)
+    def test_function() -> str:
+        return "foo"
+
+    assert test_function() == "foo"
+    telemetry_reporter.flush()
+    assert len(telemetry_reporter.test_handler.function_end_events) == 1
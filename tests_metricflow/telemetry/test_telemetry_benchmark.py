@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from metricflow_semantics.test_helpers.benchmark_helpers import BenchmarkTimer
+
+from metricflow.telemetry.models import TelemetryLevel
+from metricflow.telemetry.reporter import TelemetryReporter, log_call
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.slow
+def test_log_call_overhead_benchmark() -> None:
+    """Measures the time that `log_call` adds to a function call in the calling thread."""
+    benchmark_timer = BenchmarkTimer("test_log_call_overhead_benchmark")
+    reporter = TelemetryReporter(report_levels_higher_or_equal_to=TelemetryLevel.USAGE)
+    reporter.add_python_log_handler()
+    call_count = 5000
+
+    def test_function() -> str:
+        return "foo"
+
+    logged_test_function = log_call(telemetry_reporter=reporter, module_name=__name__)(test_function)
+
+    with benchmark_timer.time("call_undecorated_function"):
+        for _ in range(call_count):
+            test_function()
+
+    with benchmark_timer.time("call_decorated_function"):
+        for _ in range(call_count):
+            logged_test_function()
+
+    with benchmark_timer.time("report_remaining_events"):
+        reporter.close()
+
+    overhead_us = (
+        (benchmark_timer.duration("call_decorated_function") - benchmark_timer.duration("call_undecorated_function"))
+        / call_count
+        * 1e6
+    )
+    benchmark_timer.log_results(
+        f"log_call added {overhead_us:.1f}us per call in the calling thread for {call_count} calls."
+    )
+    assert reporter.dropped_event_count == 0
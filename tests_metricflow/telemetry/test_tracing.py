@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from metricflow.telemetry.opentelemetry_exporter import OpenTelemetryTraceSpanExporter
+from metricflow.telemetry.tracing import TraceRecorder, add_trace_span_attributes, trace_span
+
+logger = logging.getLogger(__name__)
+
+
+def test_nested_spans() -> None:  # noqa: D103
+    with TraceRecorder("request", request_id="1") as trace_recorder:
+        with trace_span("phase_0"):
+            with trace_span("step", index="0"):
+                pass
+            with trace_span("step", index="1"):
+                add_trace_span_attributes(result="cached")
+        with trace_span("phase_1"):
+            pass
+
+    trace = trace_recorder.span
+    assert trace.name == "request"
+    assert trace.attribute_dict == {"request_id": "1"}
+    assert [span.name for span in trace.child_spans] == ["phase_0", "phase_1"]
+    assert [span.attribute_dict for span in trace.find_spans("step")] == [
+        {"index": "0"},
+        {"index": "1", "result": "cached"},
+    ]
+    assert [span.name for span in trace.walk()] == ["request", "phase_0", "step", "step", "phase_1"]
+    for span in trace.walk():
+        assert trace.start_time_ns <= span.start_time_ns <= span.end_time_ns <= trace.end_time_ns
+
+
+def test_spans_without_trace() -> None:
+    """Check that spans outside of a trace recorder are ignored."""
+    with trace_span("phase_0"):
+        add_trace_span_attributes(result="cached")
+
+    with TraceRecorder("request") as trace_recorder:
+        pass
+    assert trace_recorder.span.child_spans == ()
+
+
+def test_span_with_exception() -> None:  # noqa: D103
+    trace_recorder = TraceRecorder("request")
+    with pytest.raises(ValueError):
+        with trace_recorder:
+            with trace_span("phase_0"):
+                raise ValueError("foo")
+
+    trace = trace_recorder.span
+    assert trace.attribute_dict == {"exception": "ValueError"}
+    assert trace.child_spans[0].attribute_dict == {"exception": "ValueError"}
+
+
+def test_spans_in_other_threads() -> None:
+    """Check that spans in functions run with a copy of the context in other threads are added to the trace."""
+
+    def _run_step(index: int) -> None:
+        with trace_span("step", index=str(index)):
+            pass
+
+    with TraceRecorder("request") as trace_recorder:
+        with ThreadPoolExecutor(max_workers=2) as thread_pool:
+            futures = [thread_pool.submit(contextvars.copy_context().run, _run_step, index) for index in range(4)]
+            for future in futures:
+                future.result()
+
+    assert sorted(span.attribute_dict["index"] for span in trace_recorder.span.child_spans) == ["0", "1", "2", "3"]
+
+
+def test_nested_trace_recorders() -> None:
+    """Check that a trace recorded within another trace is also added to the outer trace."""
+    with TraceRecorder("outer_request") as outer_trace_recorder:
+        with TraceRecorder("inner_request") as inner_trace_recorder:
+            with trace_span("phase_0"):
+                pass
+
+    assert [span.name for span in inner_trace_recorder.span.walk()] == ["inner_request", "phase_0"]
+    assert outer_trace_recorder.span.child_spans == (inner_trace_recorder.span,)
+
+
+def test_opentelemetry_exporter() -> None:  # noqa: D103
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    in_memory_span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(in_memory_span_exporter))
+
+    with TraceRecorder("request", request_id="1") as trace_recorder:
+        with trace_span("phase_0", index="0"):
+            pass
+    OpenTelemetryTraceSpanExporter(tracer_provider.get_tracer(__name__)).export(trace_recorder.span)
+
+    otel_spans = {otel_span.name: otel_span for otel_span in in_memory_span_exporter.get_finished_spans()}
+    assert set(otel_spans) == {"request", "phase_0"}
+    phase_0_parent_span_context = otel_spans["phase_0"].parent
+    assert phase_0_parent_span_context is not None
+    assert phase_0_parent_span_context.span_id == otel_spans["request"].context.span_id
+    assert otel_spans["request"].attributes == {"request_id": "1"}
+    assert otel_spans["phase_0"].start_time == trace_recorder.span.child_spans[0].start_time_ns
+    assert otel_spans["phase_0"].end_time == trace_recorder.span.child_spans[0].end_time_ns